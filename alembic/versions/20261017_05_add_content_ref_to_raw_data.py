@@ -0,0 +1,30 @@
+"""Add content_ref to raw_data for blob-store offloaded payloads.
+
+Revision ID: 20261017_05
+Revises: 20250918_04
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_05"
+down_revision: str | None = "20250918_04"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "raw_data",
+        sa.Column("content_ref", sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("raw_data", "content_ref")
@@ -0,0 +1,72 @@
+"""Add conversation fingerprints for cross-payload conversation dedup.
+
+Revision ID: 20261017_06
+Revises: 20261017_05
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+from nexus_knowledge.db.base import GUID
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_06"
+down_revision: str | None = "20261017_05"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conversation_fingerprints",
+        sa.Column("fingerprint", sa.String(length=64), primary_key=True),
+        sa.Column("conversation_id", GUID(), nullable=False),
+        sa.Column(
+            "raw_data_id",
+            GUID(),
+            sa.ForeignKey("raw_data.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("turn_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_table(
+        "raw_data_conversations",
+        sa.Column(
+            "raw_data_id",
+            GUID(),
+            sa.ForeignKey("raw_data.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("conversation_id", GUID(), primary_key=True),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column(
+            "linked",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+    op.create_index(
+        "idx_raw_data_conversations_conversation",
+        "raw_data_conversations",
+        ["conversation_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_raw_data_conversations_conversation",
+        table_name="raw_data_conversations",
+    )
+    op.drop_table("raw_data_conversations")
+    op.drop_table("conversation_fingerprints")
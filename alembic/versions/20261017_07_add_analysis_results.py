@@ -0,0 +1,57 @@
+"""Add analysis results keyed by model version for incremental analysis.
+
+Revision ID: 20261017_07
+Revises: 20261017_06
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+from nexus_knowledge.db.base import GUID
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_07"
+down_revision: str | None = "20261017_06"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_results",
+        sa.Column(
+            "conversation_turn_id",
+            GUID(),
+            sa.ForeignKey("conversation_turns.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("analyzer", sa.String(length=50), primary_key=True),
+        sa.Column("model_version", sa.String(length=64), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "entity_id",
+            GUID(),
+            sa.ForeignKey("entities.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "analyzed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "idx_analysis_results_entity",
+        "analysis_results",
+        ["entity_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_analysis_results_entity", table_name="analysis_results")
+    op.drop_table("analysis_results")
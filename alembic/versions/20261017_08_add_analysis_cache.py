@@ -0,0 +1,47 @@
+"""Add a persisted sentiment result cache keyed by normalized text hash.
+
+Revision ID: 20261017_08
+Revises: 20261017_07
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_08"
+down_revision: str | None = "20261017_07"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_cache",
+        sa.Column("model_version", sa.String(length=64), primary_key=True),
+        sa.Column("text_hash", sa.String(length=64), primary_key=True),
+        sa.Column("label", sa.String(length=20), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("positive_matches", sa.Integer(), nullable=False),
+        sa.Column("negative_matches", sa.Integer(), nullable=False),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "idx_analysis_cache_last_used",
+        "analysis_cache",
+        ["last_used_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_analysis_cache_last_used", table_name="analysis_cache")
+    op.drop_table("analysis_cache")
@@ -0,0 +1,52 @@
+"""Track analysis results per analyzer instead of per entity.
+
+Analyzers may write any number of entities for a turn (or none), so
+``analysis_results`` no longer points at a single entity.
+
+Revision ID: 20261017_09
+Revises: 20261017_08
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+from nexus_knowledge.db.base import GUID
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_09"
+down_revision: str | None = "20261017_08"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_analysis_results_entity", table_name="analysis_results")
+    with op.batch_alter_table("analysis_results") as batch_op:
+        batch_op.drop_column("entity_id")
+
+
+def downgrade() -> None:
+    # Results recorded without an entity cannot be mapped back to one.
+    op.execute("DELETE FROM analysis_results")
+    with op.batch_alter_table("analysis_results") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "entity_id",
+                GUID(),
+                sa.ForeignKey(
+                    "entities.id",
+                    name="fk_analysis_results_entity_id",
+                    ondelete="CASCADE",
+                ),
+                nullable=False,
+            ),
+        )
+    op.create_index(
+        "idx_analysis_results_entity",
+        "analysis_results",
+        ["entity_id"],
+    )
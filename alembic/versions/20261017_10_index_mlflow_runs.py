@@ -0,0 +1,60 @@
+"""Add task columns and query indexes to the local MLflow run mirror.
+
+Revision ID: 20261017_10
+Revises: 20261017_09
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_10"
+down_revision: str | None = "20261017_09"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("mlflow_runs") as batch_op:
+        batch_op.add_column(sa.Column("task_name", sa.String(length=255)))
+        batch_op.add_column(sa.Column("duration_seconds", sa.Float()))
+        batch_op.add_column(
+            sa.Column(
+                "tracked",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.true(),
+            ),
+        )
+    op.create_index("idx_mlflow_runs_start_time", "mlflow_runs", ["start_time"])
+    op.create_index(
+        "idx_mlflow_runs_task_start",
+        "mlflow_runs",
+        ["task_name", "start_time"],
+    )
+    op.create_index(
+        "idx_mlflow_runs_status_start",
+        "mlflow_runs",
+        ["status", "start_time"],
+    )
+    op.create_index(
+        "idx_mlflow_runs_task_duration",
+        "mlflow_runs",
+        ["task_name", "duration_seconds"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_mlflow_runs_task_duration", table_name="mlflow_runs")
+    op.drop_index("idx_mlflow_runs_status_start", table_name="mlflow_runs")
+    op.drop_index("idx_mlflow_runs_task_start", table_name="mlflow_runs")
+    op.drop_index("idx_mlflow_runs_start_time", table_name="mlflow_runs")
+    with op.batch_alter_table("mlflow_runs") as batch_op:
+        batch_op.drop_column("tracked")
+        batch_op.drop_column("duration_seconds")
+        batch_op.drop_column("task_name")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Compile a tab-separated sentiment lexicon for ANALYSIS_LEXICON_PATH."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from nexus_knowledge.analysis.lexicon import (
+    LexiconError,
+    compile_lexicon,
+    parse_lexicon_source,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "source",
+        type=Path,
+        help="Lexicon source with 'term<TAB>weight[<TAB>kind]' lines.",
+    )
+    parser.add_argument("output", type=Path, help="Compiled lexicon file to write.")
+    args = parser.parse_args(argv)
+
+    try:
+        with args.source.open(encoding="utf-8") as handle:
+            entries = parse_lexicon_source(handle)
+        version = compile_lexicon(entries, args.output)
+    except (OSError, LexiconError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"{args.output}: {len(entries)} terms, version {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,15 @@ import argparse
 from pathlib import Path
 
 from nexus_knowledge.db.session import get_session_factory
+from nexus_knowledge.mlflow_utils import get_tracking_uri
 from nexus_knowledge.performance.benchmarks import (
     format_report,
+    format_throughput_report,
+    run_bulk_write_benchmark,
+    run_connector_parse_benchmark,
+    run_payload_preparation_benchmark,
     run_single_user_benchmark,
+    run_tracking_overhead_benchmark,
 )
 
 
@@ -32,6 +38,31 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional directory to use for MLflow tracking when analysis is enabled.",
     )
+    parser.add_argument(
+        "--bulk-rows",
+        type=int,
+        default=0,
+        help="Also compare ORM and bulk write throughput with this many turns.",
+    )
+    parser.add_argument(
+        "--prepare-conversations",
+        type=int,
+        default=0,
+        help="Also compare parsed and raw-bytes payload preparation at this size.",
+    )
+    parser.add_argument(
+        "--parse-conversations",
+        type=int,
+        default=0,
+        help="Also measure export connector parse throughput at this size.",
+    )
+    parser.add_argument(
+        "--tracking-tasks",
+        type=int,
+        default=0,
+        help="Also compare synchronous and buffered MLflow task logging "
+        "(uses --mlflow-dir or MLFLOW_TRACKING_URI).",
+    )
     return parser.parse_args()
 
 
@@ -52,6 +83,41 @@ def main() -> None:
         mlflow_uri_factory=_mlflow_uri_factory if args.include_analysis else None,
     )
     print(format_report(report.values()))
+    if args.bulk_rows > 0:
+        throughput = run_bulk_write_benchmark(session_factory, rows=args.bulk_rows)
+        print(format_throughput_report(throughput))
+    if args.prepare_conversations > 0:
+        preparation = run_payload_preparation_benchmark(
+            conversations=args.prepare_conversations,
+        )
+        print(
+            format_throughput_report(
+                preparation,
+                title="Payload Preparation Report",
+                baseline="parse_and_serialise",
+            ),
+        )
+    if args.parse_conversations > 0:
+        parsing = run_connector_parse_benchmark(conversations=args.parse_conversations)
+        print(
+            format_throughput_report(
+                parsing,
+                title="Connector Parse Report",
+                baseline="generic",
+            ),
+        )
+    if args.tracking_tasks > 0:
+        tracking = run_tracking_overhead_benchmark(
+            _mlflow_uri_factory() or get_tracking_uri(),
+            tasks=args.tracking_tasks,
+        )
+        print(
+            format_throughput_report(
+                tracking,
+                title="Tracking Overhead Report",
+                baseline="synchronous",
+            ),
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Import new or modified notes from a Markdown (e.g. Obsidian) vault."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from celery import group
+
+from nexus_knowledge.config import reload_settings
+from nexus_knowledge.db.session import get_session_factory
+from nexus_knowledge.ingestion import import_markdown_vault
+from nexus_knowledge.ingestion.vault import DEFAULT_VAULT_BATCH_SIZE
+from nexus_knowledge.tasks import normalize_raw_data_task
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root", type=Path, help="Vault directory to import.")
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Manifest path (default: <root>/.nexus-import-manifest.json).",
+    )
+    parser.add_argument("--dataset", default=None, help="Dataset label for notes.")
+    parser.add_argument(
+        "--tag",
+        action="append",
+        dest="tags",
+        default=None,
+        help="Tag to attach to imported notes (repeatable).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes used to read and hash notes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_VAULT_BATCH_SIZE,
+        help=f"Rows committed per transaction (default: {DEFAULT_VAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--enqueue-normalization",
+        action="store_true",
+        help="Queue Celery normalization tasks for imported notes.",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.root.is_dir():
+        sys.stderr.write(f"Vault directory not found: {args.root}\n")
+        return 1
+
+    reload_settings()
+    result = import_markdown_vault(
+        get_session_factory(),
+        args.root,
+        manifest_path=args.manifest,
+        dataset=args.dataset,
+        tags=args.tags,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+
+    sys.stdout.write(
+        f"Scanned {result.scanned} note(s): {result.imported} imported "
+        f"({len(result.created_ids)} new), {result.unchanged} unchanged, "
+        f"{result.removed} removed, {len(result.failed)} failed.\n",
+    )
+    for relative in result.failed:
+        sys.stderr.write(f"Failed to import {relative}\n")
+
+    if args.enqueue_normalization and result.pending_normalization:
+        group(
+            normalize_raw_data_task.s(str(raw_data_id))
+            for raw_data_id in result.pending_normalization
+        ).apply_async()
+        sys.stdout.write(
+            f"Queued normalization for {len(result.pending_normalization)} note(s).\n",
+        )
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    raise SystemExit(main())
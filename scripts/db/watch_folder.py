@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Watch drop directories and ingest exports as they finish arriving."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+
+from celery import group
+
+from nexus_knowledge.config import reload_settings
+from nexus_knowledge.db.session import get_session_factory
+from nexus_knowledge.ingestion import FolderWatcher
+from nexus_knowledge.ingestion.watcher import DEFAULT_WATCH_SOURCE_TYPE
+from nexus_knowledge.tasks import normalize_raw_data_task, run_full_pipeline_task
+
+
+def main(argv: list[str] | None = None) -> int:
+    settings = reload_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directories",
+        type=Path,
+        nargs="*",
+        help="Directories to watch (default: WATCH_DIRECTORIES).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=settings.watch_checkpoint_path,
+        help="Checkpoint path (default: <first dir>/.nexus-watch-checkpoint.json).",
+    )
+    parser.add_argument(
+        "--source-type",
+        default=DEFAULT_WATCH_SOURCE_TYPE,
+        help=f"Source type stored for JSON exports (default: {DEFAULT_WATCH_SOURCE_TYPE}).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.watch_poll_seconds,
+        help="Seconds between polls (default: WATCH_POLL_SECONDS).",
+    )
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=settings.watch_settle_seconds,
+        help="Quiet period before a file is ingested (default: WATCH_SETTLE_SECONDS).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.watch_batch_size,
+        help="Files committed per transaction (default: WATCH_BATCH_SIZE).",
+    )
+    parser.add_argument(
+        "--full-pipeline",
+        action="store_true",
+        help="Queue the fused pipeline task instead of normalization only.",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Poll a single time and exit (settling files are left for next run).",
+    )
+    args = parser.parse_args(argv)
+
+    directories = args.directories or [
+        Path(entry.strip())
+        for entry in settings.watch_directories.split(",")
+        if entry.strip()
+    ]
+    if not directories:
+        sys.stderr.write("No directories to watch (set WATCH_DIRECTORIES).\n")
+        return 1
+    missing = [directory for directory in directories if not directory.is_dir()]
+    if missing:
+        sys.stderr.write(f"Watch directory not found: {missing[0]}\n")
+        return 1
+
+    task = run_full_pipeline_task if args.full_pipeline else normalize_raw_data_task
+
+    def _dispatch(raw_data_ids: Sequence[uuid.UUID]) -> None:
+        group(task.s(str(raw_data_id)) for raw_data_id in raw_data_ids).apply_async()
+
+    logging.basicConfig(level=settings.log_level)
+    watcher = FolderWatcher(
+        get_session_factory(),
+        directories,
+        checkpoint_path=args.checkpoint,
+        source_type=args.source_type,
+        settle_seconds=args.settle_seconds,
+        batch_size=args.batch_size,
+        dispatch=_dispatch,
+    )
+    if args.once:
+        result = watcher.poll()
+        sys.stdout.write(
+            f"Scanned {result.scanned} file(s): {result.ingested} ingested "
+            f"({len(result.created_ids)} new), {result.unchanged} unchanged, "
+            f"{result.settling} settling, {len(result.failed)} failed.\n",
+        )
+        return 1 if result.failed else 0
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    watcher.run(poll_interval=args.poll_interval, stop=stop)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    raise SystemExit(main())
@@ -1,6 +1,18 @@
 """Analysis pipeline components for NexusKnowledge."""
 
+from .analyzers import Analyzer, SentimentAnalyzer, get_analyzers, register_analyzer
+from .lexicon import LexiconSentimentModel, compile_lexicon, get_sentiment_model
 from .model import HeuristicSentimentModel
 from .pipeline import run_analysis_for_raw_data
 
-__all__ = ["HeuristicSentimentModel", "run_analysis_for_raw_data"]
+__all__ = [
+    "Analyzer",
+    "HeuristicSentimentModel",
+    "LexiconSentimentModel",
+    "SentimentAnalyzer",
+    "compile_lexicon",
+    "get_analyzers",
+    "get_sentiment_model",
+    "register_analyzer",
+    "run_analysis_for_raw_data",
+]
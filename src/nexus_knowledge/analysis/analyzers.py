@@ -0,0 +1,289 @@
+"""Analyzers run over conversation turns in a single streamed pass.
+
+Every enabled analyzer sees the same :class:`TurnText` objects, which
+tokenize a turn at most once however many analyzers read its tokens, and
+returns entity rows per turn. The pipeline writes all analyzers' entities in
+one bulk insert per chunk, so enabling another analyzer costs its own compute
+but no further scan of ``conversation_turns``.
+
+Analyzers are looked up by name, also inside analysis pool processes, so
+custom analyzers must be registered at import time of a module those
+processes import as well.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from functools import cached_property
+from typing import Any
+
+from nexus_knowledge.analysis.lexicon import SentimentModel, get_sentiment_model
+from nexus_knowledge.analysis.model import HeuristicSentimentModel, SentimentResult
+
+EntityRow = dict[str, Any]
+
+SENTIMENT_ANALYZER = "sentiment"
+
+KEYWORD_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "about",
+        "after",
+        "again",
+        "also",
+        "been",
+        "before",
+        "being",
+        "could",
+        "does",
+        "doing",
+        "from",
+        "have",
+        "here",
+        "into",
+        "just",
+        "like",
+        "more",
+        "much",
+        "only",
+        "other",
+        "over",
+        "should",
+        "some",
+        "such",
+        "than",
+        "that",
+        "their",
+        "them",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "very",
+        "want",
+        "were",
+        "what",
+        "when",
+        "where",
+        "which",
+        "while",
+        "will",
+        "with",
+        "would",
+        "your",
+    },
+)
+
+_URL_PATTERN = re.compile(r"https?://[^\s<>()\"'`]+")
+_URL_TRAILING = ".,;:!?"
+_CODE_FENCE = re.compile(r"```[ \t]*([\w+#.-]*)[^\n]*\n(.*?)```", re.DOTALL)
+
+
+class TurnText:
+    """A turn's text plus the tokenization shared by every analyzer."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        """Lowercased word tokens, computed on first access."""
+        return HeuristicSentimentModel.tokenize(self.text)
+
+
+class Analyzer(ABC):
+    """Base class for analyzers.
+
+    ``name`` keys the analyzer in the registry and in ``analysis_results``;
+    ``entity_types`` lists every entity type it writes, so stale output can be
+    replaced. ``version`` must change whenever the output for the same text
+    would, which makes re-runs recompute stored results.
+    """
+
+    name: str = ""
+    entity_types: frozenset[str] = frozenset()
+
+    @property
+    def version(self) -> str:
+        return f"{self.name}-1"
+
+    @abstractmethod
+    def analyze(self, turns: Sequence[TurnText]) -> list[list[EntityRow]]:
+        """Return the entity rows (without ``conversation_turn_id``) per turn."""
+
+
+class SentimentAnalyzer(Analyzer):
+    """One ``SENTIMENT`` entity per turn from a sentiment model.
+
+    Without an explicit ``model`` the process-wide one from
+    :func:`~nexus_knowledge.analysis.lexicon.get_sentiment_model` is used, so
+    a recompiled lexicon takes effect without restarting workers.
+    """
+
+    name = SENTIMENT_ANALYZER
+    entity_types = frozenset({"SENTIMENT"})
+
+    def __init__(self, model: SentimentModel | None = None) -> None:
+        self._model = model
+
+    @property
+    def model(self) -> SentimentModel:
+        return self._model or get_sentiment_model()
+
+    @property
+    def version(self) -> str:
+        return self.model.version
+
+    def analyze(self, turns: Sequence[TurnText]) -> list[list[EntityRow]]:
+        results = self.model.predict_tokens([turn.tokens for turn in turns])
+        return [[sentiment_entity(result)] for result in results]
+
+
+class KeywordAnalyzer(Analyzer):
+    """``KEYWORD`` entities for the most frequent content words of a turn."""
+
+    name = "keywords"
+    entity_types = frozenset({"KEYWORD"})
+
+    def __init__(
+        self,
+        *,
+        limit: int = 3,
+        min_length: int = 4,
+        stopwords: Iterable[str] = KEYWORD_STOPWORDS,
+    ) -> None:
+        self.limit = limit
+        self.min_length = min_length
+        self.stopwords = frozenset(stopwords)
+
+    @property
+    def version(self) -> str:
+        digest = hashlib.sha256("\n".join(sorted(self.stopwords)).encode())
+        return f"{self.name}-1-{self.limit}-{self.min_length}-{digest.hexdigest()[:12]}"
+
+    def analyze(self, turns: Sequence[TurnText]) -> list[list[EntityRow]]:
+        return [self._keywords(turn.tokens) for turn in turns]
+
+    def _keywords(self, tokens: list[str]) -> list[EntityRow]:
+        counts = Counter(
+            token
+            for token in tokens
+            if len(token) >= self.min_length
+            and token not in self.stopwords
+            and not token.isdigit()
+        )
+        # Counter.most_common keeps first-seen order among equal counts.
+        return [
+            {
+                "type": "KEYWORD",
+                "value": token,
+                "relevance": count / len(tokens),
+                "metadata_": {"count": count},
+            }
+            for token, count in counts.most_common(self.limit)
+        ]
+
+
+class ReferenceAnalyzer(Analyzer):
+    """``URL`` and ``CODE_BLOCK`` entities for links and fenced code in a turn."""
+
+    name = "references"
+    entity_types = frozenset({"URL", "CODE_BLOCK"})
+
+    def analyze(self, turns: Sequence[TurnText]) -> list[list[EntityRow]]:
+        return [self._references(turn.text) for turn in turns]
+
+    @staticmethod
+    def _references(text: str) -> list[EntityRow]:
+        rows: list[EntityRow] = []
+        if "```" in text:
+            rows.extend(
+                {
+                    "type": "CODE_BLOCK",
+                    "value": match.group(1).lower() or "text",
+                    "metadata_": {"lines": match.group(2).count("\n")},
+                }
+                for match in _CODE_FENCE.finditer(text)
+            )
+        if "://" in text:
+            urls = (url.rstrip(_URL_TRAILING) for url in _URL_PATTERN.findall(text))
+            rows.extend(
+                {"type": "URL", "value": url, "metadata_": {}}
+                for url in dict.fromkeys(urls)
+            )
+        return rows
+
+
+def sentiment_entity(result: SentimentResult) -> EntityRow:
+    """Entity row for a sentiment result."""
+    return {
+        "type": "SENTIMENT",
+        "value": result.label,
+        "sentiment": result.label,
+        "relevance": result.score,
+        "metadata_": {
+            "positive_matches": result.positive_matches,
+            "negative_matches": result.negative_matches,
+        },
+    }
+
+
+def sentiment_result(row: EntityRow) -> SentimentResult:
+    """Inverse of :func:`sentiment_entity`."""
+    return SentimentResult(
+        label=row["value"],
+        score=row["relevance"],
+        positive_matches=row["metadata_"]["positive_matches"],
+        negative_matches=row["metadata_"]["negative_matches"],
+    )
+
+
+_ANALYZERS: dict[str, Analyzer] = {}
+
+
+def register_analyzer(analyzer: Analyzer, *, replace: bool = False) -> Analyzer:
+    """Add ``analyzer`` to the registry under its ``name``."""
+    if not analyzer.name:
+        raise ValueError("Analyzers need a name")
+    if analyzer.name in _ANALYZERS and not replace:
+        raise ValueError(f"Analyzer '{analyzer.name}' is already registered")
+    _ANALYZERS[analyzer.name] = analyzer
+    return analyzer
+
+
+def get_analyzers(names: Iterable[str] | None = None) -> tuple[Analyzer, ...]:
+    """Return the named analyzers in order, or every registered analyzer."""
+    if names is None:
+        return tuple(_ANALYZERS.values())
+    analyzers = []
+    for name in dict.fromkeys(names):
+        analyzer = _ANALYZERS.get(name)
+        if analyzer is None:
+            raise ValueError(f"Unknown analyzer '{name}'")
+        analyzers.append(analyzer)
+    return tuple(analyzers)
+
+
+register_analyzer(SentimentAnalyzer())
+register_analyzer(KeywordAnalyzer())
+register_analyzer(ReferenceAnalyzer())
+
+
+__all__ = [
+    "SENTIMENT_ANALYZER",
+    "Analyzer",
+    "EntityRow",
+    "KeywordAnalyzer",
+    "ReferenceAnalyzer",
+    "SentimentAnalyzer",
+    "TurnText",
+    "get_analyzers",
+    "register_analyzer",
+    "sentiment_entity",
+    "sentiment_result",
+]
@@ -0,0 +1,170 @@
+"""Sentiment result cache shared across payloads.
+
+Chat exports repeat many short turns ("Thanks!", "Continue", pasted
+boilerplate). The heuristic model's result only depends on the lowercased
+token stream, so turns are keyed by a hash of their whitespace-normalized,
+lowercased text together with the model version. Lookups go through a bounded
+per-process LRU first and then the persisted ``analysis_cache`` table, which is
+pruned back to ``ANALYSIS_CACHE_ROWS`` least recently used rows after each run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from sqlalchemy.orm import Session
+
+from nexus_knowledge.analysis.model import SentimentResult
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.db.repository import (
+    get_analysis_cache_entries,
+    prune_analysis_cache,
+    store_analysis_cache_entries,
+)
+from nexus_knowledge.observability import observe_analysis_cache_lookups
+
+
+def sentiment_cache_key(text: str) -> str:
+    """Hash of ``text`` as the model sees it: lowercased, whitespace collapsed."""
+    return hashlib.sha256(" ".join(text.lower().split()).encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """Bounded LRU of ``(model version, text key)`` backed by ``analysis_cache``."""
+
+    def __init__(self, max_rows: int, *, memory_entries: int = 0) -> None:
+        self.max_rows = max_rows
+        self.memory_entries = memory_entries
+        self._entries: OrderedDict[tuple[str, str], SentimentResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(
+        self,
+        session: Session,
+        model_version: str,
+        keys: Sequence[str],
+    ) -> dict[str, SentimentResult]:
+        """Return the cached results among ``keys``, recording hit metrics.
+
+        ``keys`` may repeat; metrics count every occurrence so they reflect the
+        share of turns answered by each layer.
+        """
+        unique = dict.fromkeys(keys)
+        found: dict[str, SentimentResult] = {}
+        with self._lock:
+            for key in unique:
+                result = self._entries.get((model_version, key))
+                if result is not None:
+                    self._entries.move_to_end((model_version, key))
+                    found[key] = result
+        in_memory = set(found)
+
+        stored = get_analysis_cache_entries(
+            session,
+            [key for key in unique if key not in found],
+            model_version=model_version,
+        )
+        for key, entry in stored.items():
+            found[key] = SentimentResult(
+                label=entry.label,
+                score=entry.score,
+                positive_matches=entry.positive_matches,
+                negative_matches=entry.negative_matches,
+            )
+        self._remember(model_version, {key: found[key] for key in stored})
+
+        memory_hits = sum(key in in_memory for key in keys)
+        database_hits = sum(key in stored for key in keys)
+        observe_analysis_cache_lookups("memory", memory_hits)
+        observe_analysis_cache_lookups("database", database_hits)
+        observe_analysis_cache_lookups(
+            "miss",
+            len(keys) - memory_hits - database_hits,
+        )
+        return found
+
+    def put_many(
+        self,
+        session: Session,
+        model_version: str,
+        results: dict[str, SentimentResult],
+    ) -> None:
+        """Store freshly scored results in both layers."""
+        store_analysis_cache_entries(
+            session,
+            [
+                {
+                    "model_version": model_version,
+                    "text_hash": key,
+                    "label": result.label,
+                    "score": result.score,
+                    "positive_matches": result.positive_matches,
+                    "negative_matches": result.negative_matches,
+                }
+                for key, result in results.items()
+            ],
+        )
+        self._remember(model_version, results)
+
+    def prune(self, session: Session) -> int:
+        """Trim the persisted table to ``max_rows``; returns the rows deleted."""
+        return prune_analysis_cache(session, self.max_rows)
+
+    def clear(self) -> None:
+        """Drop the in-memory layer."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(
+        self,
+        model_version: str,
+        results: dict[str, SentimentResult],
+    ) -> None:
+        if self.memory_entries <= 0 or not results:
+            return
+        with self._lock:
+            for key, result in results.items():
+                self._entries[(model_version, key)] = result
+                self._entries.move_to_end((model_version, key))
+            while len(self._entries) > self.memory_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: SentimentCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_sentiment_cache() -> SentimentCache | None:
+    """Return the process-wide cache, or None when ``ANALYSIS_CACHE_ROWS`` is 0."""
+    global _cache  # noqa: PLW0603
+    settings = get_settings()
+    if settings.analysis_cache_rows <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SentimentCache(
+                settings.analysis_cache_rows,
+                memory_entries=settings.analysis_cache_memory_entries,
+            )
+        return _cache
+
+
+def reset_sentiment_cache() -> None:
+    """Drop the process-wide cache (useful for tests)."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        _cache = None
+
+
+__all__ = [
+    "SentimentCache",
+    "get_sentiment_cache",
+    "reset_sentiment_cache",
+    "sentiment_cache_key",
+]
@@ -0,0 +1,331 @@
+"""Compiled, memory-mapped sentiment lexicons.
+
+A lexicon source is a tab-separated file of ``term<TAB>weight[<TAB>kind]``
+lines, where ``kind`` is ``term`` (default), ``negation`` or ``intensifier``.
+Terms carry a signed sentiment weight, negations flip the polarity of a term
+up to :data:`NEGATION_WINDOW` tokens later, and an intensifier multiplies the
+weight of the term right after it.
+
+:func:`compile_lexicon` turns the source into a flat binary file: a fixed
+header followed by three arrays sorted by a stable 64-bit hash of each term
+(term hashes, weights and kinds). :class:`Lexicon` maps the file read-only
+with ``numpy.memmap`` and looks tokens up with a vectorised binary search, so
+Celery prefork workers analyzing with the same file share its pages through
+the page cache instead of each building its own dictionaries. The header
+records a content version used as the model version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from nexus_knowledge.analysis.model import HeuristicSentimentModel, SentimentResult
+from nexus_knowledge.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+LEXICON_MAGIC = b"NXLEXCN\0"
+LEXICON_FORMAT_VERSION = 1
+# magic, format version, term count, content version (hex digest prefix); 32
+# bytes, so the hash and weight arrays that follow stay 8-byte aligned.
+_HEADER = struct.Struct("<8sII16s")
+
+KIND_TERM = 0
+KIND_NEGATION = 1
+KIND_INTENSIFIER = 2
+_KINDS = {
+    "term": KIND_TERM,
+    "negation": KIND_NEGATION,
+    "intensifier": KIND_INTENSIFIER,
+}
+
+# A negation flips terms up to this many tokens after it ("not really good").
+NEGATION_WINDOW = 2
+
+
+class LexiconError(RuntimeError):
+    """Raised when a lexicon cannot be compiled or loaded."""
+
+
+LexiconEntry = tuple[float, int]
+
+
+def term_hash(term: str) -> int:
+    """Stable 64-bit hash of a lowercased term (``hash()`` is salted per process)."""
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def parse_lexicon_source(lines: Iterable[str]) -> dict[str, LexiconEntry]:
+    """Parse ``term<TAB>weight[<TAB>kind]`` lines; ``#`` starts a comment."""
+    entries: dict[str, LexiconEntry] = {}
+    for number, raw in enumerate(lines, start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = line.split("\t")
+        if len(fields) not in (2, 3):
+            raise LexiconError(f"Line {number}: expected term, weight and kind")
+        term, weight, *rest = (field.strip() for field in fields)
+        term, kind = term.lower(), rest[0].lower() if rest else "term"
+        if kind not in _KINDS:
+            raise LexiconError(f"Line {number}: unknown kind '{kind}'")
+        try:
+            entries[term] = (float(weight), _KINDS[kind])
+        except ValueError as exc:
+            raise LexiconError(f"Line {number}: invalid weight '{weight}'") from exc
+    return entries
+
+
+def compile_lexicon(entries: Mapping[str, LexiconEntry], path: Path | str) -> str:
+    """Write ``entries`` as a compiled lexicon file and return its version.
+
+    The version is derived from the content, so recompiling an unchanged source
+    keeps it. The file is replaced atomically; processes that mapped the old
+    file keep reading it until they load the new one.
+    """
+    if not entries:
+        raise LexiconError("Cannot compile an empty lexicon")
+    hashes = {term_hash(term): term for term in entries}
+    if len(hashes) != len(entries):
+        raise LexiconError("Term hash collision; rename one of the colliding terms")
+    order = sorted(hashes)
+    keys = np.array(order, dtype="<u8")
+    weights = np.array([entries[hashes[key]][0] for key in order], dtype="<f8")
+    kinds = np.array([entries[hashes[key]][1] for key in order], dtype="u1")
+
+    digest = hashlib.sha256(LEXICON_MAGIC)
+    for array in (keys, weights, kinds):
+        digest.update(array.tobytes())
+    version = digest.hexdigest()[:16]
+
+    header = _HEADER.pack(
+        LEXICON_MAGIC,
+        LEXICON_FORMAT_VERSION,
+        len(order),
+        version.encode("ascii"),
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            for array in (keys, weights, kinds):
+                handle.write(array.tobytes())
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return version
+
+
+def read_lexicon_version(path: Path | str) -> str:
+    """Return the version recorded in a compiled lexicon's header."""
+    with open(path, "rb") as handle:
+        return _parse_header(handle.read(_HEADER.size), path)[1]
+
+
+def _parse_header(data: bytes, path: Path | str) -> tuple[int, str]:
+    if len(data) < _HEADER.size:
+        raise LexiconError(f"{path} is not a compiled lexicon")
+    magic, format_version, count, version = _HEADER.unpack(data)
+    if magic != LEXICON_MAGIC:
+        raise LexiconError(f"{path} is not a compiled lexicon")
+    if format_version != LEXICON_FORMAT_VERSION:
+        raise LexiconError(
+            f"{path} uses lexicon format {format_version}, "
+            f"expected {LEXICON_FORMAT_VERSION}",
+        )
+    return count, version.decode("ascii")
+
+
+class Lexicon:
+    """Read-only view of a compiled lexicon file."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            count, self.version = _parse_header(handle.read(_HEADER.size), path)
+        expected = _HEADER.size + count * (8 + 8 + 1)
+        if self.path.stat().st_size != expected:
+            raise LexiconError(f"{path} is truncated or corrupt")
+        offset = _HEADER.size
+        self.keys = np.memmap(self.path, "<u8", "r", offset, (count,))
+        offset += count * 8
+        self.weights = np.memmap(self.path, "<f8", "r", offset, (count,))
+        offset += count * 8
+        self.kinds = np.memmap(self.path, "u1", "r", offset, (count,))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, terms: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Return the weights and kinds of ``terms``; unknown terms are weight 0."""
+        hashes = np.fromiter(map(term_hash, terms), dtype="<u8", count=len(terms))
+        positions = np.searchsorted(self.keys, hashes)
+        positions[positions == len(self.keys)] = 0
+        found = self.keys[positions] == hashes
+        weights = np.where(found, self.weights[positions], 0.0)
+        kinds = np.where(found, self.kinds[positions], KIND_TERM).astype("u1")
+        return weights, kinds
+
+
+class LexiconSentimentModel:
+    """Sentiment model scoring with a weighted, compiled :class:`Lexicon`.
+
+    A turn's score is the sum of its term weights, after negation and
+    intensifiers, divided by its token count. Positive and negative matches
+    count the terms that ended up with a positive or negative weight.
+    """
+
+    tokenize = staticmethod(HeuristicSentimentModel.tokenize)
+
+    def __init__(self, lexicon: Lexicon) -> None:
+        self.lexicon = lexicon
+
+    @property
+    def version(self) -> str:
+        return f"lexicon-{self.lexicon.version}"
+
+    def predict(self, text: str) -> SentimentResult:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: Sequence[str]) -> list[SentimentResult]:
+        return self.predict_tokens([self.tokenize(text) for text in texts])
+
+    def predict_tokens(
+        self,
+        token_lists: Sequence[Sequence[str]],
+    ) -> list[SentimentResult]:
+        """Score tokenized texts; each distinct token is looked up once."""
+        if not token_lists:
+            return []
+        lengths = np.fromiter(map(len, token_lists), dtype=np.int64)
+        vocabulary: dict[str, int] = {}
+        positions = np.fromiter(
+            (
+                vocabulary.setdefault(token, len(vocabulary))
+                for tokens in token_lists
+                for token in tokens
+            ),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        vocab_weights, vocab_kinds = self.lexicon.lookup(list(vocabulary))
+        weights = vocab_weights[positions] if len(positions) else np.zeros(0)
+        kinds = vocab_kinds[positions] if len(positions) else np.zeros(0, "u1")
+        rows = np.repeat(np.arange(len(token_lists)), lengths)
+
+        effective = np.where(kinds == KIND_TERM, weights, 0.0)
+        for distance in range(1, NEGATION_WINDOW + 1):
+            negated = (kinds[:-distance] == KIND_NEGATION) & (
+                rows[:-distance] == rows[distance:]
+            )
+            effective[distance:][negated] *= -1
+        intensified = (kinds[:-1] == KIND_INTENSIFIER) & (rows[:-1] == rows[1:])
+        effective[1:][intensified] *= weights[:-1][intensified]
+
+        size = len(token_lists)
+        totals = np.bincount(rows, weights=effective, minlength=size)
+        positive = np.bincount(rows, weights=effective > 0, minlength=size)
+        negative = np.bincount(rows, weights=effective < 0, minlength=size)
+        scores = totals / np.maximum(lengths, 1)
+        labels = HeuristicSentimentModel.LABELS[np.sign(totals).astype(np.int64) + 1]
+        return [
+            SentimentResult(
+                label=label,
+                score=score,
+                positive_matches=pos_matches,
+                negative_matches=neg_matches,
+            )
+            for label, score, pos_matches, neg_matches in zip(
+                labels.tolist(),
+                scores.tolist(),
+                positive.astype(np.int64).tolist(),
+                negative.astype(np.int64).tolist(),
+                strict=True,
+            )
+        ]
+
+
+SentimentModel = HeuristicSentimentModel | LexiconSentimentModel
+
+_model: SentimentModel | None = None
+# (path, inode, mtime, size) of the lexicon file ``_model`` was checked against.
+_model_source: tuple[str, int, int, int] | None = None
+_model_lock = threading.Lock()
+
+
+def get_sentiment_model() -> SentimentModel:
+    """Return this process's sentiment model, reloading it on version changes.
+
+    Without ``ANALYSIS_LEXICON_PATH`` the built-in heuristic model is used.
+    Otherwise the compiled lexicon is memory-mapped once per process; a
+    cheap ``stat`` per call notices a replaced file, and the model is swapped
+    only when the header version differs, so recompiling an unchanged source
+    keeps the loaded model (and the analysis results stored under it).
+    """
+    global _model, _model_source  # noqa: PLW0603
+    path = get_settings().analysis_lexicon_path
+    with _model_lock:
+        if not path:
+            if not isinstance(_model, HeuristicSentimentModel):
+                _model, _model_source = HeuristicSentimentModel(), None
+            return _model
+        stat = os.stat(path)
+        source = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if source == _model_source and _model is not None:
+            return _model
+        if (
+            not isinstance(_model, LexiconSentimentModel)
+            or _model.lexicon.path != Path(path)
+            or _model.lexicon.version != read_lexicon_version(path)
+        ):
+            previous = _model.version if _model is not None else None
+            _model = LexiconSentimentModel(Lexicon(path))
+            logger.info(
+                "Loaded sentiment lexicon %s (%s, previously %s)",
+                path,
+                _model.version,
+                previous,
+            )
+        _model_source = source
+        return _model
+
+
+def reset_sentiment_model() -> None:
+    """Drop the cached model (useful for tests)."""
+    global _model, _model_source
+    with _model_lock:
+        _model, _model_source = None, None
+
+
+__all__ = [
+    "KIND_INTENSIFIER",
+    "KIND_NEGATION",
+    "KIND_TERM",
+    "LEXICON_FORMAT_VERSION",
+    "NEGATION_WINDOW",
+    "Lexicon",
+    "LexiconError",
+    "LexiconSentimentModel",
+    "SentimentModel",
+    "compile_lexicon",
+    "get_sentiment_model",
+    "parse_lexicon_source",
+    "read_lexicon_version",
+    "reset_sentiment_model",
+    "term_hash",
+]
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from itertools import repeat
+
+import numpy as np
 
 POSITIVE_WORDS: set[str] = {
     "good",
@@ -40,6 +44,9 @@ class SentimentResult:
 class HeuristicSentimentModel:
     """Simple rule-based sentiment classifier for local/offline analysis."""
 
+    # Bump when the scoring rules change so stored results are recomputed.
+    ALGORITHM_VERSION = 1
+
     def __init__(
         self,
         positive: Iterable[str] | None = None,
@@ -47,26 +54,90 @@ class HeuristicSentimentModel:
     ) -> None:
         self.positive = {word.lower() for word in (positive or POSITIVE_WORDS)}
         self.negative = {word.lower() for word in (negative or NEGATIVE_WORDS)}
+        # Lexicon word -> class bit mask (1 positive, 2 negative); a word listed
+        # in both lexicons counts towards both.
+        self._classes: dict[str, int] = {
+            word: (word in self.positive) | (word in self.negative) << 1
+            for word in self.positive | self.negative
+        }
 
     WORD_PATTERN = re.compile(r"[\w']+")
+    LABELS = np.array(["NEGATIVE", "NEUTRAL", "POSITIVE"])
+
+    @property
+    def version(self) -> str:
+        """Fingerprint of the scoring rules and lexicons.
+
+        Two models with the same version produce identical results, so results
+        stored under it stay valid until the lexicons or algorithm change.
+        """
+        digest = hashlib.sha256(str(self.ALGORITHM_VERSION).encode())
+        for lexicon in (self.positive, self.negative):
+            digest.update(b"\0" + "\n".join(sorted(lexicon)).encode())
+        return f"heuristic-sentiment-{digest.hexdigest()[:16]}"
 
     def predict(self, text: str) -> SentimentResult:
-        tokens = [token.lower() for token in self.WORD_PATTERN.findall(text)]
-        pos_matches = sum(1 for token in tokens if token in self.positive)
-        neg_matches = sum(1 for token in tokens if token in self.negative)
-
-        if pos_matches == neg_matches:
-            label = "NEUTRAL"
-        elif pos_matches > neg_matches:
-            label = "POSITIVE"
-        else:
-            label = "NEGATIVE"
-
-        total = max(len(tokens), 1)
-        score = (pos_matches - neg_matches) / total
-        return SentimentResult(
-            label=label,
-            score=score,
-            positive_matches=pos_matches,
-            negative_matches=neg_matches,
-        )
+        return self.predict_batch([text])[0]
+
+    @classmethod
+    def tokenize(cls, text: str) -> list[str]:
+        """Lowercased word tokens, as scored by :meth:`predict_tokens`."""
+        return cls.WORD_PATTERN.findall(text.lower())
+
+    def predict_batch(self, texts: Sequence[str]) -> list[SentimentResult]:
+        """Score many texts at once; see :meth:`predict_tokens`."""
+        return self.predict_tokens([self.tokenize(text) for text in texts])
+
+    def predict_tokens(
+        self,
+        token_lists: Sequence[Sequence[str]],
+    ) -> list[SentimentResult]:
+        """Score already tokenized texts at once.
+
+        Tokens are mapped to class bit masks without a Python-level loop. The
+        masks of the whole batch are then counted per text into an ``(n, 2)``
+        positive/negative matrix with ``np.bincount``, from which labels and
+        scores are derived in array form. Results match :meth:`predict`
+        exactly.
+        """
+        if not token_lists:
+            return []
+        classify = self._classes.get
+        lengths = np.empty(len(token_lists), dtype=np.int64)
+        masks: list[int] = []
+        for row, tokens in enumerate(token_lists):
+            lengths[row] = len(tokens)
+            masks.extend(map(classify, tokens, repeat(0)))
+
+        token_rows = np.repeat(np.arange(len(token_lists)), lengths)
+        token_masks = np.asarray(masks, dtype=np.int64)
+        counts = np.stack(
+            [
+                np.bincount(
+                    token_rows,
+                    weights=(token_masks >> bit) & 1,
+                    minlength=len(token_lists),
+                )
+                for bit in (0, 1)
+            ],
+            axis=1,
+        ).astype(np.int64)
+        positive, negative = counts[:, 0], counts[:, 1]
+        difference = positive - negative
+        scores = difference / np.maximum(lengths, 1)
+        labels = self.LABELS[np.sign(difference) + 1]
+        return [
+            SentimentResult(
+                label=label,
+                score=score,
+                positive_matches=pos_matches,
+                negative_matches=neg_matches,
+            )
+            for label, score, pos_matches, neg_matches in zip(
+                labels.tolist(),
+                scores.tolist(),
+                positive.tolist(),
+                negative.tolist(),
+                strict=True,
+            )
+        ]
@@ -2,96 +2,183 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import uuid
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import chain, islice
+from typing import Any
 
-import mlflow
+from billiard import Pool
+from billiard.pool import ApplyResult
 from sqlalchemy.orm import Session
 
-from nexus_knowledge.analysis.model import HeuristicSentimentModel
-from nexus_knowledge.db.models import Entity
+from nexus_knowledge.analysis.analyzers import (
+    SENTIMENT_ANALYZER,
+    Analyzer,
+    EntityRow,
+    TurnText,
+    get_analyzers,
+    sentiment_entity,
+    sentiment_result,
+)
+from nexus_knowledge.analysis.cache import (
+    SentimentCache,
+    get_sentiment_cache,
+    sentiment_cache_key,
+)
+from nexus_knowledge.config import get_settings
 from nexus_knowledge.db.repository import (
+    contains_only_linked_conversations,
     create_entities,
+    delete_analyzer_output,
+    get_analysis_results,
     get_raw_data,
     iter_turns_for_raw,
+    record_analysis_results,
     update_raw_data_status,
 )
-from nexus_knowledge.mlflow_utils import configure_mlflow
+from nexus_knowledge.experiment_tracking import buffered_run
+
+# Turns analyzed per analyzer call and written per bulk insert.
+ANALYSIS_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+TurnChunk = list[tuple[uuid.UUID, str]]
+# Analyzer name -> entity rows for each chunk index it was asked to analyze.
+AnalyzerOutput = dict[str, list[list[EntityRow]]]
 
 
 class AnalysisError(RuntimeError):
     """Raised when the analysis pipeline cannot proceed."""
 
 
-def run_analysis_for_raw_data(session: Session, raw_data_id: uuid.UUID) -> int:
-    """Analyze normalized conversation turns and persist sentiment entities."""
-    record = get_raw_data(session, raw_data_id)
+def run_analysis_for_raw_data(
+    session: Session,
+    raw_data_id: uuid.UUID,
+    *,
+    workers: int | None = None,
+    analyzers: Sequence[str] | None = None,
+) -> int:
+    """Analyze normalized conversation turns and persist their entities."""
+    record = get_raw_data(session, raw_data_id, include_content=False)
     if record is None:
         raise AnalysisError(f"raw_data {raw_data_id} not found")
 
-    model = HeuristicSentimentModel()
+    turns = iter_turns_for_raw(
+        session,
+        raw_data_id=raw_data_id,
+        chunk_size=ANALYSIS_BATCH_SIZE,
+    )
+    return analyze_turns(
+        session,
+        raw_data_id,
+        ((turn.id, turn.text) for turn in turns),
+        source_type=record.source_type,
+        workers=workers,
+        analyzers=analyzers,
+    )
+
+
+def analyze_turns(  # noqa: PLR0913
+    session: Session,
+    raw_data_id: uuid.UUID,
+    turns: Iterable[tuple[uuid.UUID, str]],
+    *,
+    source_type: str,
+    entity_sink: list[dict[str, Any]] | None = None,
+    workers: int | None = None,
+    analyzers: Sequence[str] | None = None,
+) -> int:
+    """Persist analyzer entities for ``(turn_id, text)`` pairs of a raw payload.
+
+    Used by :func:`run_analysis_for_raw_data` with turns streamed from the
+    database, and by the fused pipeline with turns still held in memory. Created
+    entities are appended to ``entity_sink`` (including their ``id``) when given.
+
+    Every analyzer named in ``analyzers`` (default ``ANALYSIS_ANALYZERS``) runs
+    in this single pass: turns are read in chunks of ``ANALYSIS_BATCH_SIZE``,
+    each turn is tokenized at most once for all analyzers, and the entities of
+    all analyzers are written with one bulk insert per chunk. With more than
+    one worker (default ``ANALYSIS_WORKERS``) and more than one chunk, chunks
+    are analyzed in a process pool while this process stays the single writer;
+    results are consumed in submission order, so the output is identical to
+    analyzing serially.
 
-    configure_mlflow()
-    mlflow.set_experiment("Analysis")
+    Each analyzed turn records an ``analysis_results`` row per analyzer with
+    the analyzer version and a hash of the text. An analyzer skips turns whose
+    stored result matches both; its stale output is deleted before the turn is
+    analyzed again, so re-runs only do new work and never duplicate entities.
+    Sentiment is first looked up in the shared sentiment cache by normalized
+    text, so only texts never seen under the model version reach the model.
+    Returns the number of turns that needed at least one analyzer. A payload
+    whose conversations were all linked to earlier payloads has no turns of
+    its own; it is marked ``ANALYZED`` without doing any work.
+    """
+    if workers is None:
+        workers = get_settings().analysis_workers
+    if analyzers is None:
+        analyzers = get_settings().analysis_analyzers.split(",")
+    run = _AnalysisRun(session, get_analyzers(analyzers), get_sentiment_cache())
 
-    turn_iterator = iter_turns_for_raw(session, raw_data_id=raw_data_id, chunk_size=200)
-    positive = negative = neutral = 0
-    processed = 0
-    batch: list[Entity] = []
-    batch_size = 100
+    labels = dict.fromkeys(("POSITIVE", "NEGATIVE", "NEUTRAL"), 0)
 
-    with mlflow.start_run(run_name=f"analysis-{raw_data_id}", nested=True):
-        mlflow.log_params(
+    with buffered_run("Analysis", f"analysis-{raw_data_id}") as tracking:
+        tracking.log_params(
             {
                 "raw_data_id": str(raw_data_id),
-                "source_type": record.source_type,
+                "source_type": source_type,
+                **{
+                    f"{name}_version": version for name, version in run.versions.items()
+                },
             },
         )
 
-        for turn in turn_iterator:
-            processed += 1
-            sentiment = model.predict(turn.text)
-            if sentiment.label == "POSITIVE":
-                positive += 1
-            elif sentiment.label == "NEGATIVE":
-                negative += 1
-            else:
-                neutral += 1
-
-            batch.append(
-                Entity(
-                    conversation_turn_id=turn.id,
-                    type="SENTIMENT",
-                    value=sentiment.label,
-                    sentiment=sentiment.label,
-                    relevance=sentiment.score,
-                    metadata_={
-                        "positive_matches": sentiment.positive_matches,
-                        "negative_matches": sentiment.negative_matches,
-                    },
-                ),
-            )
+        for plan, output in _analyze_chunks(iter(turns), workers, run):
+            entities, results = run.collect(plan, output)
+            for entity in entities:
+                if entity["type"] == "SENTIMENT":
+                    labels[entity["value"]] += 1
+            _write_entities(session, entities, entity_sink)
+            record_analysis_results(session, results)
 
-            if len(batch) >= batch_size:
-                create_entities(session, batch)
-                batch.clear()
-
-        if processed == 0:
-            mlflow.log_params({"turn_count": 0})
+        if run.seen == 0 and not contains_only_linked_conversations(
+            session,
+            raw_data_id,
+        ):
+            tracking.log_params({"turn_count": 0})
             update_raw_data_status(session, raw_data_id, status="ANALYSIS_FAILED")
             raise AnalysisError("No normalized turns available for analysis")
 
-        if batch:
-            create_entities(session, batch)
-
-        mlflow.log_params({"turn_count": processed})
-        mlflow.log_metrics(
+        tracking.log_params({"turn_count": run.seen})
+        tracking.log_metrics(
             {
-                "positive_ratio": positive / processed,
-                "negative_ratio": negative / processed,
-                "neutral_ratio": neutral / processed,
+                "turns_analyzed": run.analyzed,
+                "turns_skipped": run.seen - run.analyzed,
+                "stale_results": run.stale,
+                "cache_hits": run.cache_hits,
+                **{
+                    f"{name}_turns": count for name, count in run.analyzer_turns.items()
+                },
             },
         )
+        if run.cache_lookups:
+            tracking.log_metric("cache_hit_ratio", run.cache_hits / run.cache_lookups)
+        if run.cache is not None and run.cache_stored:
+            run.cache.prune(session)
+        scored = sum(labels.values())
+        if scored:
+            tracking.log_metrics(
+                {
+                    "positive_ratio": labels["POSITIVE"] / scored,
+                    "negative_ratio": labels["NEGATIVE"] / scored,
+                    "neutral_ratio": labels["NEUTRAL"] / scored,
+                },
+            )
 
     update_raw_data_status(
         session,
@@ -99,4 +186,259 @@ def run_analysis_for_raw_data(session: Session, raw_data_id: uuid.UUID) -> int:
         status="ANALYZED",
         processed_at=datetime.now(UTC),
     )
-    return processed
+    return run.analyzed
+
+
+def _write_entities(
+    session: Session,
+    entities: list[dict[str, Any]],
+    entity_sink: list[dict[str, Any]] | None,
+) -> None:
+    entity_ids = create_entities(session, entities)
+    if entity_sink is not None:
+        entity_sink.extend(
+            {**entity, "id": entity_id}
+            for entity, entity_id in zip(entities, entity_ids, strict=True)
+        )
+
+
+@dataclass
+class _ChunkPlan:
+    """Which analyzers still have to look at which turns of a chunk."""
+
+    chunk: TurnChunk
+    text_hashes: list[str]
+    # Analyzer -> chunk indices that get fresh output from it.
+    needed: dict[str, list[int]] = field(default_factory=dict)
+    # Analyzer -> chunk indices actually sent to it (cache misses only).
+    compute: dict[str, list[int]] = field(default_factory=dict)
+    # Sentiment cache key per index in ``needed[SENTIMENT_ANALYZER]``.
+    sentiment_keys: dict[int, str] = field(default_factory=dict)
+    cached_sentiment: dict[str, EntityRow] = field(default_factory=dict)
+
+    @property
+    def texts(self) -> dict[int, str]:
+        """Texts of the turns sent to at least one analyzer, by chunk index."""
+        indices = sorted(set(chain.from_iterable(self.compute.values())))
+        return {index: self.chunk[index][1] for index in indices}
+
+
+class _AnalysisRun:
+    """Plans chunks against stored results and the cache, and collects output."""
+
+    def __init__(
+        self,
+        session: Session,
+        analyzers: Sequence[Analyzer],
+        cache: SentimentCache | None,
+    ) -> None:
+        self.session = session
+        self.analyzers = analyzers
+        self.versions = {analyzer.name: analyzer.version for analyzer in analyzers}
+        self.cache = cache if SENTIMENT_ANALYZER in self.versions else None
+        self.seen = 0
+        self.analyzed = 0
+        self.stale = 0
+        self.analyzer_turns = dict.fromkeys(self.versions, 0)
+        self.cache_lookups = 0
+        self.cache_hits = 0
+        self.cache_stored = 0
+
+    def plan(self, chunk: TurnChunk) -> _ChunkPlan:
+        """Drop stale output for the chunk and decide what to analyze.
+
+        Entities of turns without a stored result are dropped as well; they
+        predate result tracking or belong to an interrupted run.
+        """
+        self.seen += len(chunk)
+        plan = _ChunkPlan(
+            chunk,
+            [hashlib.sha256(text.encode("utf-8")).hexdigest() for _, text in chunk],
+        )
+        current = get_analysis_results(
+            self.session,
+            [turn_id for turn_id, _ in chunk],
+            analyzers=list(self.versions),
+        )
+        for analyzer in self.analyzers:
+            version = self.versions[analyzer.name]
+            needed = []
+            for index, (turn_id, _) in enumerate(chunk):
+                result = current.get((turn_id, analyzer.name))
+                if result is None:
+                    needed.append(index)
+                elif (result.model_version, result.text_hash) != (
+                    version,
+                    plan.text_hashes[index],
+                ):
+                    self.stale += 1
+                    needed.append(index)
+            if not needed:
+                continue
+            delete_analyzer_output(
+                self.session,
+                [chunk[index][0] for index in needed],
+                analyzer=analyzer.name,
+                entity_types=analyzer.entity_types,
+            )
+            plan.needed[analyzer.name] = needed
+            plan.compute[analyzer.name] = needed
+            self.analyzer_turns[analyzer.name] += len(needed)
+        self.analyzed += len(set(chain.from_iterable(plan.needed.values())))
+        if self.cache is not None and SENTIMENT_ANALYZER in plan.needed:
+            self._plan_sentiment_cache(plan, self.cache)
+        return plan
+
+    def _plan_sentiment_cache(self, plan: _ChunkPlan, cache: SentimentCache) -> None:
+        needed = plan.needed[SENTIMENT_ANALYZER]
+        plan.sentiment_keys = {
+            index: sentiment_cache_key(plan.chunk[index][1]) for index in needed
+        }
+        keys = list(plan.sentiment_keys.values())
+        cached = cache.get_many(
+            self.session,
+            self.versions[SENTIMENT_ANALYZER],
+            keys,
+        )
+        self.cache_lookups += len(keys)
+        self.cache_hits += sum(key in cached for key in keys)
+        plan.cached_sentiment = {
+            key: sentiment_entity(result) for key, result in cached.items()
+        }
+        # Texts repeated within the chunk are analyzed once.
+        first_index: dict[str, int] = {}
+        for index, key in plan.sentiment_keys.items():
+            if key not in cached:
+                first_index.setdefault(key, index)
+        plan.compute[SENTIMENT_ANALYZER] = list(first_index.values())
+
+    def collect(
+        self,
+        plan: _ChunkPlan,
+        output: AnalyzerOutput,
+    ) -> tuple[list[EntityRow], list[dict[str, Any]]]:
+        """Return the chunk's entity rows and analysis result rows, turn by turn."""
+        by_index = {
+            name: dict(zip(plan.compute[name], output.get(name, []), strict=True))
+            for name in plan.needed
+        }
+        if plan.sentiment_keys:
+            by_index[SENTIMENT_ANALYZER] = self._merge_sentiment(
+                plan,
+                by_index[SENTIMENT_ANALYZER],
+            )
+
+        entities: list[EntityRow] = []
+        results: list[dict[str, Any]] = []
+        for index, (turn_id, _) in enumerate(plan.chunk):
+            for name, rows_by_index in by_index.items():
+                rows = rows_by_index.get(index)
+                if rows is None:
+                    continue
+                entities.extend(
+                    {"conversation_turn_id": turn_id, **row} for row in rows
+                )
+                results.append(
+                    {
+                        "conversation_turn_id": turn_id,
+                        "analyzer": name,
+                        "model_version": self.versions[name],
+                        "text_hash": plan.text_hashes[index],
+                    },
+                )
+        return entities, results
+
+    def _merge_sentiment(
+        self,
+        plan: _ChunkPlan,
+        computed: dict[int, list[EntityRow]],
+    ) -> dict[int, list[EntityRow]]:
+        fresh = {
+            plan.sentiment_keys[index]: rows[0] for index, rows in computed.items()
+        }
+        if fresh and self.cache is not None:
+            self.cache.put_many(
+                self.session,
+                self.versions[SENTIMENT_ANALYZER],
+                {key: sentiment_result(row) for key, row in fresh.items()},
+            )
+            self.cache_stored += len(fresh)
+        known = {**plan.cached_sentiment, **fresh}
+        return {index: [known[key]] for index, key in plan.sentiment_keys.items()}
+
+
+def _analyze_chunks(
+    turns: Iterator[tuple[uuid.UUID, str]],
+    workers: int,
+    run: _AnalysisRun,
+) -> Iterator[tuple[_ChunkPlan, AnalyzerOutput]]:
+    chunks: Iterator[TurnChunk] = iter(
+        lambda: list(islice(turns, ANALYSIS_BATCH_SIZE)),
+        [],
+    )
+    head = list(islice(chunks, 2))
+    if workers <= 1 or len(head) <= 1:
+        for chunk in chain(head, chunks):
+            plan = run.plan(chunk)
+            yield plan, _run_analyzers(plan.texts, plan.compute, run.versions)
+        return
+
+    # billiard's pool (not concurrent.futures) because Celery prefork children
+    # are daemonic, and only billiard lets daemonic processes start children.
+    with Pool(processes=workers) as pool:
+        # Keep a bounded window of chunks in flight so a large payload is never
+        # held in memory at once; results are taken in submission order.
+        # Chunks with nothing left to compute (e.g. re-runs) never reach the pool.
+        pending: deque[tuple[_ChunkPlan, ApplyResult | None]] = deque()
+        for chunk in chain(head, chunks):
+            plan = run.plan(chunk)
+            texts = plan.texts
+            result = (
+                pool.apply_async(_run_analyzers, (texts, plan.compute, run.versions))
+                if texts
+                else None
+            )
+            pending.append((plan, result))
+            if len(pending) >= workers * 2:
+                yield _pool_output(*pending.popleft())
+        while pending:
+            yield _pool_output(*pending.popleft())
+        # Let idle workers exit on their sentinel: the terminate() in __exit__
+        # can leave a worker blocked on the task-queue lock, and join() on it
+        # then never returns.
+        pool.close()
+        pool.join()
+
+
+def _pool_output(
+    plan: _ChunkPlan,
+    result: ApplyResult | None,
+) -> tuple[_ChunkPlan, AnalyzerOutput]:
+    return plan, result.get() if result is not None else {}
+
+
+def _run_analyzers(
+    texts: dict[int, str],
+    compute: dict[str, list[int]],
+    versions: dict[str, str],
+) -> AnalyzerOutput:
+    """Run each analyzer on its chunk indices, sharing one tokenization per text.
+
+    Runs in pool processes too, where analyzers come from that process's
+    registry, so models are loaded once per process rather than per chunk.
+    Output is checked against the versions the run was planned with, since a
+    model may be swapped (e.g. a recompiled lexicon) while the run is going.
+    """
+    turns: dict[int, TurnText] = {}
+    output: AnalyzerOutput = {}
+    for analyzer in get_analyzers(compute):
+        indices = compute[analyzer.name]
+        if indices:
+            output[analyzer.name] = analyzer.analyze(
+                [turns.setdefault(index, TurnText(texts[index])) for index in indices],
+            )
+            if analyzer.version != versions[analyzer.name]:
+                raise AnalysisError(
+                    f"Analyzer '{analyzer.name}' changed version during the run",
+                )
+    return output
@@ -0,0 +1,202 @@
+"""Queue-depth-aware admission control for endpoints that enqueue Celery work."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal, cast
+
+import redis
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.observability import observe_admission_rejection, set_queue_depth
+
+Workload = Literal["ingest", "analysis"]
+DEFAULT_QUEUE = "default"
+
+logger = logging.getLogger(__name__)
+
+
+class QueueDepthProbe:
+    """Sample a broker queue's length, caching the result for ``ttl_seconds``.
+
+    Failures to reach the broker are cached as well and reported as ``None``,
+    so an unavailable broker costs one attempt per interval and admission
+    fails open instead of rejecting every request.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[], int],
+        *,
+        queue: str = DEFAULT_QUEUE,
+        ttl_seconds: float = 2.0,
+    ) -> None:
+        self._reader = reader
+        self.queue = queue
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._depth: int | None = None
+        self._sampled_at: float | None = None
+
+    def cached(self) -> tuple[bool, int | None]:
+        """Return ``(fresh, depth)`` without touching the broker."""
+        with self._lock:
+            fresh = (
+                self._sampled_at is not None
+                and time.monotonic() - self._sampled_at < self.ttl_seconds
+            )
+            return fresh, self._depth
+
+    def depth(self) -> int | None:
+        """Return the queue depth, sampling the broker when the cache is stale."""
+        fresh, depth = self.cached()
+        if fresh:
+            return depth
+        try:
+            depth = int(self._reader())
+        except (redis.RedisError, OSError) as exc:
+            logger.warning(
+                "admission.queue_depth_unavailable",
+                extra={"queue": self.queue, "error": str(exc)},
+            )
+            depth = None
+        else:
+            set_queue_depth(self.queue, depth)
+        with self._lock:
+            self._depth = depth
+            self._sampled_at = time.monotonic()
+        return depth
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    """Outcome of an admission check."""
+
+    admitted: bool
+    depth: int | None
+    watermark: int
+    retry_after_seconds: int = 0
+
+
+class AdmissionController:
+    """Reject new work for a workload while the queue is above its watermark.
+
+    A watermark of 0 disables the check for that workload. ``Retry-After``
+    scales with how far the queue is above the watermark.
+    """
+
+    def __init__(
+        self,
+        probe: QueueDepthProbe,
+        watermarks: dict[str, int],
+        *,
+        retry_after_seconds: int = 30,
+    ) -> None:
+        self.probe = probe
+        self.watermarks = dict(watermarks)
+        self.retry_after_seconds = retry_after_seconds
+
+    def evaluate(self, workload: Workload, depth: int | None) -> AdmissionDecision:
+        """Decide whether ``workload`` may enqueue more tasks at ``depth``."""
+        watermark = self.watermarks.get(workload, 0)
+        if watermark <= 0 or depth is None or depth < watermark:
+            return AdmissionDecision(admitted=True, depth=depth, watermark=watermark)
+        retry_after = self.retry_after_seconds * math.ceil((depth + 1) / watermark)
+        return AdmissionDecision(
+            admitted=False,
+            depth=depth,
+            watermark=watermark,
+            retry_after_seconds=retry_after,
+        )
+
+    async def check(self, workload: Workload) -> AdmissionDecision:
+        """Evaluate admission, sampling the broker off the event loop if needed."""
+        fresh, depth = self.probe.cached()
+        if not fresh:
+            depth = await run_in_threadpool(self.probe.depth)
+        return self.evaluate(workload, depth)
+
+
+def _redis_length_reader(redis_url: str, queue: str) -> Callable[[], int]:
+    client = redis.Redis.from_url(
+        redis_url,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+    )
+    # redis-py types command results as int | Awaitable[int] for both the sync
+    # and asyncio clients; this one is synchronous.
+    return lambda: cast(int, client.llen(queue))
+
+
+_CONTROLLER: AdmissionController | None = None
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController | None:
+    """Return the configured controller, or None when admission control is off."""
+    global _CONTROLLER  # noqa: PLW0603
+    settings = get_settings()
+    if not settings.admission_control_enabled:
+        return None
+    with _CONTROLLER_LOCK:
+        if _CONTROLLER is None:
+            _CONTROLLER = AdmissionController(
+                QueueDepthProbe(
+                    _redis_length_reader(settings.redis_url, DEFAULT_QUEUE),
+                    queue=DEFAULT_QUEUE,
+                    ttl_seconds=settings.admission_depth_cache_seconds,
+                ),
+                {
+                    "ingest": settings.admission_ingest_watermark,
+                    "analysis": settings.admission_analysis_watermark,
+                },
+                retry_after_seconds=settings.admission_retry_after_seconds,
+            )
+        return _CONTROLLER
+
+
+def reset_admission_controller() -> None:
+    """Drop the cached controller (useful for tests)."""
+    global _CONTROLLER  # noqa: PLW0603
+    with _CONTROLLER_LOCK:
+        _CONTROLLER = None
+
+
+def require_admission(workload: Workload) -> Callable[[], Awaitable[None]]:
+    """Build a FastAPI dependency that answers 429 when ``workload`` is shed."""
+
+    async def _dependency() -> None:
+        controller = get_admission_controller()
+        if controller is None:
+            return
+        decision = await controller.check(workload)
+        if decision.admitted:
+            return
+        observe_admission_rejection(workload)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=(
+                f"Task queue is saturated ({decision.depth} queued, limit "
+                f"{decision.watermark}); retry later"
+            ),
+            headers={"Retry-After": str(decision.retry_after_seconds)},
+        )
+
+    return _dependency
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionDecision",
+    "QueueDepthProbe",
+    "get_admission_controller",
+    "require_admission",
+    "reset_admission_controller",
+]
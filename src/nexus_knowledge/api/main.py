@@ -6,25 +6,65 @@ including all API endpoints for chat, knowledge management, and data ingestion.
 
 from __future__ import annotations
 
+import hashlib
 import importlib.metadata
+import json
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, status
+from celery import group
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
 from fastapi.responses import HTMLResponse, JSONResponse, Response
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
+from nexus_knowledge.api.admission import require_admission
 from nexus_knowledge.config import get_settings
-from nexus_knowledge.db.repository import (
-    get_raw_data,
+from nexus_knowledge.db.async_repository import (
+    get_mlflow_run_duration_percentiles,
+    get_raw_data_status,
     get_user_feedback,
     list_correlation_candidates,
     list_feedback,
+    list_mlflow_runs,
     update_feedback_status,
 )
-from nexus_knowledge.db.session import get_session_dependency, get_session_factory
-from nexus_knowledge.ingestion import ingest_raw_payload
+from nexus_knowledge.db.session import (
+    get_async_session_dependency,
+    get_session_factory,
+)
+from nexus_knowledge.ingestion import (
+    PreparedPayload,
+    RawPayload,
+    UploadError,
+    UploadManifest,
+    get_upload_spool,
+    ingest_prepared_payload,
+    ingest_prepared_payloads,
+    prepare_raw_bytes,
+    prepare_raw_payload,
+    store_prepared_content,
+)
+from nexus_knowledge.ingestion.service import IngestionError
+from nexus_knowledge.ingestion.uploads import (
+    UPLOAD_COMPLETE,
+    UploadConflictError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+)
 
 try:
     from nexus_knowledge.integrations.api import router as integrations_router
@@ -38,7 +78,11 @@ from nexus_knowledge.observability import (
 from nexus_knowledge.observability.context import get_correlation_id
 from nexus_knowledge.observability.health import liveness_summary, readiness_summary
 from nexus_knowledge.observability.middleware import RequestContextMiddleware
-from nexus_knowledge.search import hybrid_search
+from nexus_knowledge.search import (
+    load_search_candidates,
+    rank_search_candidates,
+    search_tokens,
+)
 from nexus_knowledge.search.service import SearchError
 from nexus_knowledge.tasks import (
     analyze_raw_data_task,
@@ -46,8 +90,10 @@ from nexus_knowledge.tasks import (
     export_obsidian_task,
     fuse_correlation_candidates_task,
     generate_correlation_candidates_task,
+    ingest_upload_task,
     normalize_raw_data_task,
     persist_feedback,
+    run_full_pipeline_task,
 )
 
 
@@ -66,6 +112,9 @@ configure_logging()
 settings = get_settings()
 API_VERSION = _resolve_version()
 API_PREFIX = settings.api_root
+MAX_BATCH_INGEST_ITEMS = 1000
+# Upload chunks are buffered up to this size before each write to the spool.
+UPLOAD_WRITE_BUFFER_BYTES = 1024 * 1024
 
 app = FastAPI(
     title="NexusKnowledge API",
@@ -76,7 +125,7 @@ app.add_middleware(RequestContextMiddleware)
 api_router = APIRouter(prefix=API_PREFIX)
 
 
-SessionDependency = Annotated[Session, Depends(get_session_dependency)]
+SessionDependency = Annotated[AsyncSession, Depends(get_async_session_dependency)]
 
 
 UI_HTML = """<!DOCTYPE html>
@@ -244,6 +293,14 @@ class IngestionRequest(BaseModel):
         alias="sourceId",
         description="Provider-specific conversation identifier.",
     )
+    run_full_pipeline: bool = Field(
+        default=False,
+        alias="runFullPipeline",
+        description=(
+            "Run normalization, analysis, correlation and fusion in one worker "
+            "task instead of scheduling normalization only."
+        ),
+    )
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -255,6 +312,61 @@ class IngestionResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class UploadCreateRequest(BaseModel):
+    source_type: str = Field(
+        ...,
+        alias="sourceType",
+        description="Identifier for the data source.",
+    )
+    metadata: dict[str, Any] | None = Field(
+        default=None,
+        description="Optional metadata for the payload.",
+    )
+    source_id: str | None = Field(
+        default=None,
+        alias="sourceId",
+        description="Provider-specific conversation identifier.",
+    )
+    total_bytes: int | None = Field(
+        default=None,
+        alias="totalBytes",
+        ge=1,
+        description="Expected payload size; completion fails if it differs.",
+    )
+    run_full_pipeline: bool = Field(default=False, alias="runFullPipeline")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class UploadCompleteRequest(BaseModel):
+    sha256: str | None = Field(
+        default=None,
+        pattern="^[0-9a-fA-F]{64}$",
+        description="Expected SHA-256 of the full payload.",
+    )
+
+
+class UploadStatusResponse(BaseModel):
+    upload_id: uuid.UUID = Field(..., alias="uploadId")
+    status: str
+    offset: int
+    total_bytes: int | None = Field(None, alias="totalBytes")
+    content_hash: str | None = Field(None, alias="contentHash")
+    raw_data_id: uuid.UUID | None = Field(None, alias="rawDataId")
+    error: str | None = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class BatchIngestionResponse(BaseModel):
+    message: str = Field(default="Batch accepted and normalization scheduled.")
+    raw_data_ids: list[uuid.UUID] = Field(..., alias="rawDataIds")
+    created: int
+    duplicates: int
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class IngestionStatusResponse(BaseModel):
     raw_data_id: uuid.UUID = Field(..., alias="rawDataId")
     status: str
@@ -340,6 +452,35 @@ class ObsidianExportResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class TaskRunResponse(BaseModel):
+    run_id: str = Field(..., alias="runId")
+    experiment_id: str = Field(..., alias="experimentId")
+    run_name: str | None = Field(None, alias="runName")
+    task_name: str | None = Field(None, alias="taskName")
+    status: str | None = None
+    start_time: str = Field(..., alias="startTime")
+    end_time: str | None = Field(None, alias="endTime")
+    duration_seconds: float | None = Field(None, alias="durationSeconds")
+    tracked: bool = Field(..., description="False when the run was sampled out.")
+    params: dict[str, Any]
+    metrics: dict[str, Any]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TaskRunDurationsResponse(BaseModel):
+    task_name: str | None = Field(None, alias="taskName")
+    status: str | None = None
+    runs: int
+    percentiles: dict[str, float | None]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+Percentile = Annotated[float, Field(gt=0, le=100)]
+DEFAULT_DURATION_PERCENTILES = (50.0, 90.0, 99.0)
+
+
 @api_router.get("/status", response_model=StatusResponse, tags=["System"])
 async def get_status() -> StatusResponse:
     """Return the API's operational status."""
@@ -355,7 +496,9 @@ async def get_liveness() -> dict[str, str]:
 @api_router.get("/health/ready", tags=["System"])
 async def get_readiness() -> JSONResponse:
     """Return readiness information including dependency health."""
-    summary = readiness_summary(
+    # The dependency probes are blocking, so keep them off the event loop.
+    summary = await run_in_threadpool(
+        readiness_summary,
         session_factory=get_session_factory(),
         redis_url=settings.redis_url,
         celery_app=celery_app,
@@ -416,7 +559,7 @@ async def get_feedback_status(
     session: SessionDependency,
 ) -> FeedbackResponse:
     """Retrieve persisted feedback details after the Celery task completes."""
-    record = get_user_feedback(session, feedback_id)
+    record = await get_user_feedback(session, feedback_id)
     if record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -438,7 +581,7 @@ async def list_feedback_items(
     session: SessionDependency,
 ) -> list[FeedbackListItem]:
     """Return stored feedback items."""
-    records = list_feedback(session, status=status, limit=limit)
+    records = await list_feedback(session, status=status, limit=limit)
     return [
         FeedbackListItem(
             feedback_id=record.id,
@@ -463,12 +606,13 @@ async def update_feedback(
     session: SessionDependency,
 ) -> FeedbackListItem:
     """Update feedback status for triage workflows."""
-    record = update_feedback_status(session, feedback_id, status=payload.status)
+    record = await update_feedback_status(session, feedback_id, status=payload.status)
     if record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Feedback not found",
         )
+    await session.commit()
 
     return FeedbackListItem(
         feedback_id=record.id,
@@ -482,6 +626,7 @@ async def update_feedback(
 
 @api_router.post(
     "/ingest",
+    dependencies=[Depends(require_admission("ingest"))],
     response_model=IngestionResponse,
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Ingestion"],
@@ -490,19 +635,376 @@ async def ingest_payload(
     payload: IngestionRequest,
     session: SessionDependency,
 ) -> IngestionResponse:
-    """Persist a raw payload and schedule normalization via Celery."""
-    raw_data_id = ingest_raw_payload(
-        session,
-        source_type=payload.source_type,
-        content=payload.content,
-        metadata=payload.metadata,
-        source_id=payload.source_id,
+    """Persist a raw payload and schedule normalization via Celery.
+
+    With ``runFullPipeline`` set, all processing stages run in a single fused
+    task instead.
+    """
+    (prepared,) = await run_in_threadpool(
+        _prepare_payloads,
+        [
+            RawPayload(
+                source_type=payload.source_type,
+                content=payload.content,
+                metadata=payload.metadata,
+                source_id=payload.source_id,
+            ),
+        ],
     )
-    session.commit()
+    raw_data_id = await session.run_sync(ingest_prepared_payload, prepared)
+    await session.commit()
+    if payload.run_full_pipeline:
+        run_full_pipeline_task.delay(
+            str(raw_data_id),
+            correlation_id=get_correlation_id(),
+        )
+        return IngestionResponse(
+            message="Ingestion accepted and full pipeline scheduled.",
+            raw_data_id=raw_data_id,
+        )
     normalize_raw_data_task.delay(str(raw_data_id), correlation_id=get_correlation_id())
     return IngestionResponse(raw_data_id=raw_data_id)
 
 
+@api_router.post(
+    "/ingest/raw",
+    dependencies=[Depends(require_admission("ingest"))],
+    response_model=IngestionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Ingestion"],
+)
+async def ingest_raw_body(
+    request: Request,
+    session: SessionDependency,
+    source_type: Annotated[str, Query(alias="sourceType")],
+    source_id: Annotated[str | None, Query(alias="sourceId")] = None,
+    run_full_pipeline: Annotated[bool, Query(alias="runFullPipeline")] = False,
+) -> IngestionResponse:
+    """Store the request body, a JSON document, exactly as received.
+
+    The body is hashed while it streams in and copied into one buffer sized
+    from ``Content-Length``, then validated in a single scanner pass off the
+    event loop; it is never parsed into a Pydantic model or re-serialised.
+    Normalization is only scheduled while the payload has not been normalized
+    yet.
+    """
+    limit = get_settings().ingest_raw_max_bytes
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Body exceeds {limit} bytes; use /ingest/uploads instead",
+    )
+    try:
+        declared = int(request.headers.get("content-length", 0))
+    except ValueError:
+        declared = 0
+    if declared > limit:
+        raise too_large
+    hasher = hashlib.sha256()
+    body = bytearray(declared)
+    received = 0
+    async for chunk in request.stream():
+        end = received + len(chunk)
+        if end > limit:
+            raise too_large
+        hasher.update(chunk)
+        # Grows the buffer in place when the body outruns Content-Length.
+        body[received:end] = chunk
+        received = end
+    del body[received:]
+
+    try:
+        prepared = await run_in_threadpool(
+            _prepare_raw_body,
+            body,
+            source_type=source_type,
+            source_id=source_id,
+            content_hash=hasher.hexdigest(),
+        )
+    except IngestionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    del body
+
+    result = await session.run_sync(ingest_prepared_payloads, [prepared])
+    await session.commit()
+    (raw_data_id,) = result.raw_data_ids
+    if result.pending_normalization:
+        task = run_full_pipeline_task if run_full_pipeline else normalize_raw_data_task
+        task.delay(str(raw_data_id), correlation_id=get_correlation_id())
+    return IngestionResponse(raw_data_id=raw_data_id)
+
+
+_BATCH_ITEMS_ADAPTER = TypeAdapter(list[IngestionRequest])
+
+
+def _prepare_payloads(payloads: Sequence[RawPayload]) -> list[PreparedPayload]:
+    """Serialise, hash and (when large) store payloads; run off the event loop."""
+    return [store_prepared_content(prepare_raw_payload(item)) for item in payloads]
+
+
+def _prepare_raw_body(
+    body: bytes | bytearray,
+    *,
+    source_type: str,
+    source_id: str | None,
+    content_hash: str,
+) -> PreparedPayload:
+    """Validate and (when large) store a raw body; run off the event loop."""
+    return store_prepared_content(
+        prepare_raw_bytes(
+            body,
+            source_type=source_type,
+            source_id=source_id,
+            content_hash=content_hash,
+        ),
+    )
+
+
+def _parse_batch_items(body: bytes, content_type: str) -> list[IngestionRequest]:
+    try:
+        if "ndjson" in content_type or "jsonl" in content_type:
+            raw_items: Any = [
+                json.loads(line) for line in body.splitlines() if line.strip()
+            ]
+        else:
+            raw_items = json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed batch body: {exc}",
+        ) from exc
+
+    if not isinstance(raw_items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch body must be a JSON array or NDJSON stream",
+        )
+    if len(raw_items) > MAX_BATCH_INGEST_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {MAX_BATCH_INGEST_ITEMS} items",
+        )
+
+    try:
+        return _BATCH_ITEMS_ADAPTER.validate_python(raw_items)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=exc.errors(include_url=False, include_context=False),
+        ) from exc
+
+
+@api_router.post(
+    "/ingest/batch",
+    dependencies=[Depends(require_admission("ingest"))],
+    response_model=BatchIngestionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Ingestion"],
+)
+async def ingest_batch(
+    request: Request,
+    session: SessionDependency,
+) -> BatchIngestionResponse:
+    """Persist many payloads (JSON array or NDJSON) and schedule normalization."""
+    items = await run_in_threadpool(
+        _parse_batch_items,
+        await request.body(),
+        request.headers.get("content-type", ""),
+    )
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch must contain at least one payload",
+        )
+
+    prepared = await run_in_threadpool(
+        _prepare_payloads,
+        [
+            RawPayload(
+                source_type=item.source_type,
+                content=item.content,
+                metadata=item.metadata,
+                source_id=item.source_id,
+            )
+            for item in items
+        ],
+    )
+    result = await session.run_sync(ingest_prepared_payloads, prepared)
+    await session.commit()
+
+    if result.pending_normalization:
+        correlation_id = get_correlation_id()
+        full_pipeline = {
+            raw_data_id
+            for item, raw_data_id in zip(items, result.raw_data_ids, strict=True)
+            if item.run_full_pipeline
+        }
+        group(
+            (
+                run_full_pipeline_task
+                if raw_data_id in full_pipeline
+                else normalize_raw_data_task
+            ).s(str(raw_data_id), correlation_id=correlation_id)
+            for raw_data_id in result.pending_normalization
+        ).apply_async()
+
+    return BatchIngestionResponse(
+        raw_data_ids=result.raw_data_ids,
+        created=len(result.created_ids),
+        duplicates=len(result.raw_data_ids) - len(result.created_ids),
+    )
+
+
+def _upload_status(manifest: UploadManifest) -> UploadStatusResponse:
+    return UploadStatusResponse(
+        upload_id=uuid.UUID(manifest.upload_id),
+        status=manifest.status,
+        offset=manifest.received_bytes,
+        total_bytes=manifest.total_bytes,
+        content_hash=manifest.content_hash,
+        raw_data_id=manifest.raw_data_id,
+        error=manifest.error,
+    )
+
+
+def _upload_http_error(exc: UploadError) -> HTTPException:
+    if isinstance(exc, UploadNotFoundError):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if isinstance(exc, UploadConflictError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+            headers={"Upload-Offset": str(exc.offset)},
+        )
+    if isinstance(exc, UploadTooLargeError):
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(exc),
+        )
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@api_router.post(
+    "/ingest/uploads",
+    dependencies=[Depends(require_admission("ingest"))],
+    response_model=UploadStatusResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Ingestion"],
+)
+async def create_upload(payload: UploadCreateRequest) -> UploadStatusResponse:
+    """Start a resumable chunked upload for a payload too large for ``/ingest``."""
+    try:
+        manifest = await run_in_threadpool(
+            get_upload_spool().create,
+            source_type=payload.source_type,
+            metadata=payload.metadata,
+            source_id=payload.source_id,
+            total_bytes=payload.total_bytes,
+            run_full_pipeline=payload.run_full_pipeline,
+        )
+    except UploadError as exc:
+        raise _upload_http_error(exc) from exc
+    return _upload_status(manifest)
+
+
+@api_router.put(
+    "/ingest/uploads/{upload_id}",
+    response_model=UploadStatusResponse,
+    tags=["Ingestion"],
+)
+async def append_upload_chunk(
+    upload_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    upload_offset: Annotated[int, Header(alias="Upload-Offset", ge=0)],
+) -> UploadStatusResponse:
+    """Append the request body to an upload at ``Upload-Offset``.
+
+    The body is streamed to the spool file and hashed as it arrives, so only
+    one write buffer is held in memory. A chunk that fails part-way is rolled
+    back; the client resumes from the offset reported by ``GET``.
+    """
+    try:
+        writer = await run_in_threadpool(
+            get_upload_spool().open_chunk,
+            str(upload_id),
+            upload_offset,
+        )
+    except UploadError as exc:
+        raise _upload_http_error(exc) from exc
+
+    buffer = bytearray()
+    try:
+        async for chunk in request.stream():
+            buffer += chunk
+            if len(buffer) >= UPLOAD_WRITE_BUFFER_BYTES:
+                await run_in_threadpool(writer.write, buffer)
+                buffer = bytearray()
+        if buffer:
+            await run_in_threadpool(writer.write, buffer)
+    except UploadError as exc:
+        await run_in_threadpool(writer.abort)
+        raise _upload_http_error(exc) from exc
+    except BaseException:
+        await run_in_threadpool(writer.abort)
+        raise
+    manifest = await run_in_threadpool(writer.commit)
+    response.headers["Upload-Offset"] = str(manifest.received_bytes)
+    return _upload_status(manifest)
+
+
+@api_router.get(
+    "/ingest/uploads/{upload_id}",
+    response_model=UploadStatusResponse,
+    tags=["Ingestion"],
+)
+async def get_upload_status(
+    upload_id: uuid.UUID,
+    response: Response,
+) -> UploadStatusResponse:
+    """Return the offset to resume from and, once ingested, the raw_data id."""
+    try:
+        manifest = await run_in_threadpool(get_upload_spool().get, str(upload_id))
+    except UploadError as exc:
+        raise _upload_http_error(exc) from exc
+    response.headers["Upload-Offset"] = str(manifest.received_bytes)
+    return _upload_status(manifest)
+
+
+@api_router.post(
+    "/ingest/uploads/{upload_id}/complete",
+    dependencies=[Depends(require_admission("ingest"))],
+    response_model=UploadStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Ingestion"],
+)
+async def complete_upload(
+    upload_id: uuid.UUID,
+    payload: Annotated[UploadCompleteRequest | None, Body()] = None,
+) -> UploadStatusResponse:
+    """Seal an upload and schedule ingestion of the spooled payload.
+
+    Repeating the call while ingestion is pending schedules it again, which is
+    safe because ingestion deduplicates on the content hash.
+    """
+    try:
+        manifest = await run_in_threadpool(
+            get_upload_spool().complete,
+            str(upload_id),
+            expected_sha256=payload.sha256 if payload is not None else None,
+        )
+    except UploadError as exc:
+        raise _upload_http_error(exc) from exc
+    if manifest.status == UPLOAD_COMPLETE:
+        ingest_upload_task.delay(
+            manifest.upload_id,
+            correlation_id=get_correlation_id(),
+        )
+    return _upload_status(manifest)
+
+
 @api_router.get(
     "/ingest/{raw_data_id}",
     response_model=IngestionStatusResponse,
@@ -513,17 +1015,18 @@ async def get_ingestion_status(
     session: SessionDependency,
 ) -> IngestionStatusResponse:
     """Return the current status of an ingested payload."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ingestion not found",
         )
-    return IngestionStatusResponse(raw_data_id=record.id, status=record.status)
+    return IngestionStatusResponse(raw_data_id=raw_data_id, status=record_status)
 
 
 @api_router.post(
     "/analysis",
+    dependencies=[Depends(require_admission("analysis"))],
     response_model=AnalysisResponse,
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Analysis"],
@@ -533,13 +1036,13 @@ async def queue_analysis(
     session: SessionDependency,
 ) -> AnalysisResponse:
     """Queue an analysis job for a previously normalized payload."""
-    record = get_raw_data(session, payload.raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, payload.raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ingestion not found",
         )
-    if record.status not in {"NORMALIZED", "ANALYZED"}:
+    if record_status not in {"NORMALIZED", "ANALYZED"}:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Raw data must be normalized before analysis",
@@ -562,17 +1065,18 @@ async def get_analysis_status(
     session: SessionDependency,
 ) -> AnalysisStatusResponse:
     """Return the status of the analysis job for the specified payload."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Analysis target not found",
         )
-    return AnalysisStatusResponse(raw_data_id=record.id, status=record.status)
+    return AnalysisStatusResponse(raw_data_id=raw_data_id, status=record_status)
 
 
 @api_router.post(
     "/correlation",
+    dependencies=[Depends(require_admission("analysis"))],
     response_model=CorrelationQueuedResponse,
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Correlation"],
@@ -582,13 +1086,13 @@ async def queue_correlation(
     session: SessionDependency,
 ) -> CorrelationQueuedResponse:
     """Queue correlation candidate generation after analysis."""
-    record = get_raw_data(session, payload.raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, payload.raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ingestion not found",
         )
-    if record.status not in {
+    if record_status not in {
         "ANALYZED",
         "CORRELATION_GENERATED",
         "CORRELATION_SKIPPED",
@@ -622,14 +1126,14 @@ async def list_correlation(
     session: SessionDependency,
 ) -> list[CorrelationCandidateResponse]:
     """Return generated correlation candidates for the given payload."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Correlation target not found",
         )
 
-    candidates = list_correlation_candidates(
+    candidates = await list_correlation_candidates(
         session,
         raw_data_id,
         status=status_filter,
@@ -651,6 +1155,7 @@ async def list_correlation(
 
 @api_router.post(
     "/correlation/{raw_data_id}/fuse",
+    dependencies=[Depends(require_admission("analysis"))],
     response_model=CorrelationFusionResponse,
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Correlation"],
@@ -660,13 +1165,13 @@ async def fuse_correlation(
     session: SessionDependency,
 ) -> CorrelationFusionResponse:
     """Queue evidence fusion and relationship creation for a dataset."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Correlation target not found",
         )
-    if record.status not in {"CORRELATION_GENERATED", "CORRELATED", "ANALYZED"}:
+    if record_status not in {"CORRELATION_GENERATED", "CORRELATED", "ANALYZED"}:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Correlation candidates must be generated first",
@@ -690,14 +1195,30 @@ async def search_knowledge(
     *,
     session: SessionDependency,
 ) -> list[SearchResult]:
-    """Perform hybrid search over conversation turns."""
+    """Perform hybrid search over conversation turns.
+
+    Candidates are fetched on the async session; tokenising and scoring them
+    runs in the threadpool.
+    """
     try:
-        results = hybrid_search(session, q, limit=limit)
+        query_tokens = search_tokens(q)
     except SearchError as exc:  # pragma: no cover - defensive guard
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
+    turns, sentiments = await session.run_sync(
+        load_search_candidates,
+        query_tokens,
+        limit=limit,
+    )
+    results = await run_in_threadpool(
+        rank_search_candidates,
+        query_tokens,
+        turns,
+        sentiments,
+        limit=limit,
+    )
 
     return [
         SearchResult(
@@ -724,8 +1245,8 @@ async def queue_obsidian_export(
     session: SessionDependency,
 ) -> ObsidianExportResponse:
     """Queue an Obsidian export task for the provided dataset."""
-    record = get_raw_data(session, payload.raw_data_id)
-    if record is None:
+    record_status = await get_raw_data_status(session, payload.raw_data_id)
+    if record_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ingestion not found",
@@ -739,6 +1260,91 @@ async def queue_obsidian_export(
     return ObsidianExportResponse(raw_data_id=payload.raw_data_id)
 
 
+@api_router.get(
+    "/runs",
+    response_model=list[TaskRunResponse],
+    tags=["Tracking"],
+)
+async def list_task_runs(
+    task_name: str | None = Query(None, alias="task", description="Task name."),
+    status_filter: str | None = Query(
+        None,
+        alias="status",
+        description="MLflow run status (e.g. FINISHED, FAILED).",
+    ),
+    since: Annotated[
+        datetime | None,
+        Query(description="Earliest start time."),
+    ] = None,
+    limit: int = Query(50, ge=1, le=500),
+    *,
+    session: SessionDependency,
+) -> list[TaskRunResponse]:
+    """Return recent task runs from the local MLflow run mirror."""
+    records = await list_mlflow_runs(
+        session,
+        task_name=task_name,
+        status=status_filter,
+        since=since,
+        limit=limit,
+    )
+    return [
+        TaskRunResponse(
+            run_id=record.run_id.hex,
+            experiment_id=record.experiment_id,
+            run_name=record.run_name,
+            task_name=record.task_name,
+            status=record.status,
+            start_time=record.start_time.isoformat(),
+            end_time=record.end_time.isoformat() if record.end_time else None,
+            duration_seconds=record.duration_seconds,
+            tracked=record.tracked,
+            params=record.params,
+            metrics=record.metrics,
+        )
+        for record in records
+    ]
+
+
+@api_router.get(
+    "/runs/durations",
+    response_model=TaskRunDurationsResponse,
+    tags=["Tracking"],
+)
+async def get_task_run_durations(
+    task_name: str | None = Query(None, alias="task", description="Task name."),
+    status_filter: str | None = Query(
+        None,
+        alias="status",
+        description="MLflow run status (e.g. FINISHED, FAILED).",
+    ),
+    since: Annotated[
+        datetime | None,
+        Query(description="Earliest start time."),
+    ] = None,
+    percentile: Annotated[
+        list[Percentile] | None,
+        Query(description="Percentiles to compute (default 50, 90 and 99)."),
+    ] = None,
+    *,
+    session: SessionDependency,
+) -> TaskRunDurationsResponse:
+    """Return nearest-rank duration percentiles of mirrored task runs."""
+    runs, values = await get_mlflow_run_duration_percentiles(
+        session,
+        percentile or DEFAULT_DURATION_PERCENTILES,
+        task_name=task_name,
+        status=status_filter,
+        since=since,
+    )
+    return TaskRunDurationsResponse(
+        task_name=task_name,
+        status=status_filter,
+        runs=runs,
+        percentiles={f"p{key:g}": value for key, value in values.items()},
+    )
+
+
 app.include_router(api_router)
 app.include_router(integrations_router)
 
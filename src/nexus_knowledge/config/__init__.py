@@ -1,6 +1,7 @@
 """Public interface for the configuration subsystem."""
 
 from .settings import (
+    BLOB_CODEC_MAX_LEVELS,
     ConfigurationError,
     Settings,
     clear_settings_cache,
@@ -9,6 +10,7 @@ from .settings import (
 )
 
 __all__ = [
+    "BLOB_CODEC_MAX_LEVELS",
     "ConfigurationError",
     "Settings",
     "clear_settings_cache",
@@ -12,6 +12,10 @@ from sqlalchemy.engine import make_url
 from sqlalchemy.exc import ArgumentError
 
 AppEnv = Literal["local", "test", "prod"]
+BlobCodec = Literal["zstd", "zlib"]
+# Highest compression level each blob codec accepts.
+BLOB_CODEC_MAX_LEVELS: dict[str, int] = {"zstd": 22, "zlib": 9}
+PIPELINE_STAGES = ("normalize", "analyze", "correlate", "fuse")
 
 _ALLOWED_LOG_LEVELS = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"}
 _DEFAULT_SECRET_PLACEHOLDER = os.getenv(
@@ -76,6 +80,114 @@ class Settings(BaseSettings):
         alias="CELERY_BROKER_CONN_TIMEOUT",
         ge=0,
     )
+    ingest_dedup_cache_size: int = Field(
+        10000,
+        alias="INGEST_DEDUP_CACHE_SIZE",
+        ge=0,
+    )
+    ingest_dedup_cache_ttl_seconds: float = Field(
+        30.0,
+        alias="INGEST_DEDUP_CACHE_TTL_SECONDS",
+        ge=0,
+    )
+    ingest_dedup_bloom_capacity: int = Field(
+        0,
+        alias="INGEST_DEDUP_BLOOM_CAPACITY",
+        ge=0,
+    )
+    raw_content_store_path: str | None = Field(None, alias="RAW_CONTENT_STORE_PATH")
+    raw_content_store_codec: BlobCodec = Field("zstd", alias="RAW_CONTENT_STORE_CODEC")
+    raw_content_store_level: int = Field(
+        3,
+        alias="RAW_CONTENT_STORE_LEVEL",
+        ge=1,
+        le=22,
+    )
+    raw_content_store_min_bytes: int = Field(
+        1024,
+        alias="RAW_CONTENT_STORE_MIN_BYTES",
+        ge=0,
+    )
+    upload_spool_path: str | None = Field(None, alias="UPLOAD_SPOOL_PATH")
+    upload_max_bytes: int = Field(
+        8 * 1024**3,
+        alias="UPLOAD_MAX_BYTES",
+        ge=1,
+    )
+    upload_ttl_seconds: float = Field(86_400.0, alias="UPLOAD_TTL_SECONDS", ge=0)
+    ingest_raw_max_bytes: int = Field(
+        256 * 1024**2,
+        alias="INGEST_RAW_MAX_BYTES",
+        ge=1,
+    )
+    normalize_incremental: bool = Field(False, alias="NORMALIZE_INCREMENTAL")
+    watch_directories: str = Field("", alias="WATCH_DIRECTORIES")
+    watch_checkpoint_path: str | None = Field(None, alias="WATCH_CHECKPOINT_PATH")
+    watch_poll_seconds: float = Field(5.0, alias="WATCH_POLL_SECONDS", gt=0)
+    watch_settle_seconds: float = Field(2.0, alias="WATCH_SETTLE_SECONDS", ge=0)
+    watch_batch_size: int = Field(50, alias="WATCH_BATCH_SIZE", ge=1)
+    analysis_workers: int = Field(1, alias="ANALYSIS_WORKERS", ge=1)
+    analysis_cache_rows: int = Field(
+        1_000_000,
+        alias="ANALYSIS_CACHE_ROWS",
+        ge=0,
+    )
+    analysis_cache_memory_entries: int = Field(
+        50_000,
+        alias="ANALYSIS_CACHE_MEMORY_ENTRIES",
+        ge=0,
+    )
+    analysis_analyzers: str = Field("sentiment", alias="ANALYSIS_ANALYZERS")
+    analysis_lexicon_path: str | None = Field(None, alias="ANALYSIS_LEXICON_PATH")
+    tracking_buffer_size: int = Field(10_000, alias="TRACKING_BUFFER_SIZE", ge=1)
+    tracking_flush_seconds: float = Field(
+        1.0,
+        alias="TRACKING_FLUSH_SECONDS",
+        gt=0,
+    )
+    tracking_shutdown_timeout_seconds: float = Field(
+        10.0,
+        alias="TRACKING_SHUTDOWN_TIMEOUT_SECONDS",
+        ge=0,
+    )
+    tracking_sample_every: int = Field(1, alias="TRACKING_SAMPLE_EVERY", ge=1)
+    tracking_sample_overrides: str = Field("", alias="TRACKING_SAMPLE_OVERRIDES")
+    tracking_slow_task_seconds: float = Field(
+        60.0,
+        alias="TRACKING_SLOW_TASK_SECONDS",
+        ge=0,
+    )
+    tracking_summary_seconds: float = Field(
+        300.0,
+        alias="TRACKING_SUMMARY_SECONDS",
+        gt=0,
+    )
+    tracking_mirror_runs: bool = Field(True, alias="TRACKING_MIRROR_RUNS")
+    pipeline_checkpoints: str = Field(
+        "normalize,analyze,correlate",
+        alias="PIPELINE_CHECKPOINTS",
+    )
+    admission_control_enabled: bool = Field(True, alias="ADMISSION_CONTROL_ENABLED")
+    admission_ingest_watermark: int = Field(
+        1000,
+        alias="ADMISSION_INGEST_WATERMARK",
+        ge=0,
+    )
+    admission_analysis_watermark: int = Field(
+        5000,
+        alias="ADMISSION_ANALYSIS_WATERMARK",
+        ge=0,
+    )
+    admission_depth_cache_seconds: float = Field(
+        2.0,
+        alias="ADMISSION_DEPTH_CACHE_SECONDS",
+        ge=0,
+    )
+    admission_retry_after_seconds: int = Field(
+        30,
+        alias="ADMISSION_RETRY_AFTER_SECONDS",
+        ge=1,
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -87,6 +199,41 @@ class Settings(BaseSettings):
             )
         return upper
 
+    @field_validator("analysis_analyzers")
+    @classmethod
+    def _validate_analysis_analyzers(cls, value: str) -> str:
+        names = [name.strip().lower() for name in value.split(",") if name.strip()]
+        if not names:
+            raise ValueError("ANALYSIS_ANALYZERS must name at least one analyzer.")
+        return ",".join(dict.fromkeys(names))
+
+    @field_validator("tracking_sample_overrides")
+    @classmethod
+    def _validate_tracking_sample_overrides(cls, value: str) -> str:
+        items = []
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            name, _, rate = item.partition("=")
+            if not name.strip() or not rate.strip().isdigit() or int(rate) < 1:
+                raise ValueError(
+                    "TRACKING_SAMPLE_OVERRIDES expects 'task=N' items with N >= 1, "
+                    f"got '{item.strip()}'.",
+                )
+            items.append(f"{name.strip()}={int(rate)}")
+        return ",".join(items)
+
+    @field_validator("pipeline_checkpoints")
+    @classmethod
+    def _validate_pipeline_checkpoints(cls, value: str) -> str:
+        stages = [stage.strip().lower() for stage in value.split(",") if stage.strip()]
+        unknown = sorted(set(stages) - set(PIPELINE_STAGES))
+        if unknown:
+            raise ValueError(
+                f"PIPELINE_CHECKPOINTS accepts {list(PIPELINE_STAGES)}, got {unknown}.",
+            )
+        return ",".join(stage for stage in PIPELINE_STAGES if stage in stages)
+
     @field_validator("api_root")
     @classmethod
     def _validate_api_root(cls, value: str) -> str:
@@ -108,6 +255,16 @@ class Settings(BaseSettings):
                 raise ValueError(f"{label} is invalid: {exc}") from exc
         return self
 
+    @model_validator(mode="after")
+    def _validate_blob_level(self) -> Settings:
+        max_level = BLOB_CODEC_MAX_LEVELS[self.raw_content_store_codec]
+        if self.raw_content_store_level > max_level:
+            raise ValueError(
+                f"RAW_CONTENT_STORE_LEVEL must be at most {max_level} for the "
+                f"'{self.raw_content_store_codec}' codec",
+            )
+        return self
+
     def validate_for_environment(self) -> None:
         """Perform environment-specific validation (e.g. production hardening)."""
         errors: list[str] = []
@@ -122,6 +279,11 @@ class Settings(BaseSettings):
                 errors.append("DATABASE_URL cannot use SQLite in production.")
             if self.log_level == "DEBUG":
                 errors.append("LOG_LEVEL must not be DEBUG in production.")
+            if not self.upload_spool_path:
+                errors.append(
+                    "UPLOAD_SPOOL_PATH must point at a directory shared by the API "
+                    "and workers in production.",
+                )
         if errors:
             raise ConfigurationError(errors)
 
@@ -158,6 +320,7 @@ def clear_settings_cache() -> None:
 
 
 __all__ = [
+    "BLOB_CODEC_MAX_LEVELS",
     "ConfigurationError",
     "Settings",
     "clear_settings_cache",
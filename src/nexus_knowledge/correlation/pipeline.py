@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import itertools
 import uuid
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
+from typing import Any, NamedTuple
 
 from sqlalchemy.orm import Session
 
-from nexus_knowledge.db.models import CorrelationCandidate, Relationship
 from nexus_knowledge.db.repository import (
+    contains_only_linked_conversations,
     create_correlation_candidates,
     create_relationships,
-    get_raw_data,
+    get_raw_data_status,
     iter_turns_for_raw,
     list_correlation_candidates,
     list_entities_for_raw,
@@ -30,30 +32,90 @@ def _pair_key(entity_a: uuid.UUID, entity_b: uuid.UUID) -> tuple[uuid.UUID, uuid
     return tuple(sorted((entity_a, entity_b)))  # type: ignore[return-value]
 
 
+class EntityRef(NamedTuple):
+    """Columns of a sentiment entity needed to pair it with others."""
+
+    id: uuid.UUID
+    conversation_turn_id: uuid.UUID
+    value: str
+    relevance: float | None
+
+
+class CandidateRef(NamedTuple):
+    """Columns of a correlation candidate needed to fuse it."""
+
+    id: uuid.UUID
+    raw_data_id: uuid.UUID
+    source_entity_id: uuid.UUID
+    target_entity_id: uuid.UUID
+    score: float
+    rationale: str | None
+
+
 def generate_candidates_for_raw(
     session: Session,
     raw_data_id: uuid.UUID,
     *,
     min_score: float = 0.05,
 ) -> int:
-    """Produce correlation candidates from analyzed entities."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    """Produce correlation candidates from analyzed entities.
+
+    Payloads made only of already-known conversations are skipped rather than
+    failed, since they have no entities of their own.
+    """
+    if get_raw_data_status(session, raw_data_id) is None:
         raise CorrelationError(f"raw_data {raw_data_id} not found")
 
     entities = [
-        entity
+        EntityRef(
+            entity.id,
+            entity.conversation_turn_id,
+            entity.value,
+            entity.relevance,
+        )
         for entity in list_entities_for_raw(session, raw_data_id)
         if entity.type == "SENTIMENT"
     ]
+    turn_conversations = (
+        {
+            turn.id: turn.conversation_id
+            for turn in iter_turns_for_raw(session, raw_data_id=raw_data_id)
+        }
+        if entities
+        else {}
+    )
+    if not entities and contains_only_linked_conversations(session, raw_data_id):
+        # Duplicate conversations were correlated with the payload that had them.
+        update_raw_data_status(session, raw_data_id, status="CORRELATION_SKIPPED")
+        return 0
+    return generate_candidates(
+        session,
+        raw_data_id,
+        entities,
+        turn_conversations,
+        min_score=min_score,
+    )
+
+
+def generate_candidates(  # noqa: PLR0913
+    session: Session,
+    raw_data_id: uuid.UUID,
+    entities: Sequence[EntityRef],
+    turn_conversations: Mapping[uuid.UUID, uuid.UUID],
+    *,
+    min_score: float = 0.05,
+    candidate_sink: list[CandidateRef] | None = None,
+) -> int:
+    """Pair sentiment ``entities`` of a raw payload into correlation candidates.
+
+    ``turn_conversations`` maps each conversation turn id to its conversation
+    id. Pairs already stored as candidates are skipped. New candidates are
+    appended to ``candidate_sink`` when given.
+    """
     if not entities:
         update_raw_data_status(session, raw_data_id, status="CORRELATION_SKIPPED")
         raise CorrelationError("No sentiment entities available for correlation")
-
-    turns = {
-        turn.id: turn for turn in iter_turns_for_raw(session, raw_data_id=raw_data_id)
-    }
-    if not turns:
+    if not turn_conversations:
         update_raw_data_status(session, raw_data_id, status="CORRELATION_SKIPPED")
         raise CorrelationError("No normalized turns available for correlation")
 
@@ -66,7 +128,7 @@ def generate_candidates_for_raw(
         )
     }
 
-    new_candidates: list[CorrelationCandidate] = []
+    new_candidates: list[dict[str, Any]] = []
 
     for entity_a, entity_b in itertools.combinations(entities, 2):
         if entity_a.value != entity_b.value:
@@ -76,9 +138,9 @@ def generate_candidates_for_raw(
         if pair in existing_pairs:
             continue
 
-        turn_a = turns.get(entity_a.conversation_turn_id)
-        turn_b = turns.get(entity_b.conversation_turn_id)
-        if turn_a is None or turn_b is None:
+        conversation_a = turn_conversations.get(entity_a.conversation_turn_id)
+        conversation_b = turn_conversations.get(entity_b.conversation_turn_id)
+        if conversation_a is None or conversation_b is None:
             continue
 
         score = _compute_score(entity_a.relevance or 0.0, entity_b.relevance or 0.0)
@@ -87,27 +149,43 @@ def generate_candidates_for_raw(
 
         rationale = (
             f"Both turns share {entity_a.value} sentiment in conversations "
-            f"{turn_a.conversation_id} and {turn_b.conversation_id}."
+            f"{conversation_a} and {conversation_b}."
         )
         metadata = {
-            "turn_a": str(turn_a.conversation_id),
-            "turn_b": str(turn_b.conversation_id),
+            "turn_a": str(conversation_a),
+            "turn_b": str(conversation_b),
             "sentiment": entity_a.value,
         }
 
         new_candidates.append(
-            CorrelationCandidate(
-                raw_data_id=raw_data_id,
-                source_entity_id=entity_a.id,
-                target_entity_id=entity_b.id,
-                score=score,
-                rationale=rationale,
-                metadata_=metadata,
-            ),
+            {
+                "raw_data_id": raw_data_id,
+                "source_entity_id": entity_a.id,
+                "target_entity_id": entity_b.id,
+                "score": score,
+                "rationale": rationale,
+                "metadata_": metadata,
+            },
         )
         existing_pairs.add(pair)
 
-    create_correlation_candidates(session, new_candidates)
+    candidate_ids = create_correlation_candidates(session, new_candidates)
+    if candidate_sink is not None:
+        candidate_sink.extend(
+            CandidateRef(
+                candidate_id,
+                raw_data_id,
+                candidate["source_entity_id"],
+                candidate["target_entity_id"],
+                candidate["score"],
+                candidate["rationale"],
+            )
+            for candidate, candidate_id in zip(
+                new_candidates,
+                candidate_ids,
+                strict=True,
+            )
+        )
     update_raw_data_status(
         session,
         raw_data_id,
@@ -129,35 +207,60 @@ def fuse_candidates_for_raw(
     min_score: float = 0.2,
 ) -> dict[str, int]:
     """Fuse correlation candidates into confirmed relationships."""
-    record = get_raw_data(session, raw_data_id)
-    if record is None:
+    if get_raw_data_status(session, raw_data_id) is None:
         raise CorrelationError(f"raw_data {raw_data_id} not found")
 
-    pending_candidates = list_correlation_candidates(
+    pending_candidates = [
+        CandidateRef(
+            candidate.id,
+            candidate.raw_data_id,
+            candidate.source_entity_id,
+            candidate.target_entity_id,
+            candidate.score,
+            candidate.rationale,
+        )
+        for candidate in list_correlation_candidates(
+            session,
+            raw_data_id,
+            status="PENDING",
+        )
+    ]
+    return fuse_candidates(
         session,
         raw_data_id,
-        status="PENDING",
+        pending_candidates,
+        min_score=min_score,
     )
+
+
+def fuse_candidates(
+    session: Session,
+    raw_data_id: uuid.UUID,
+    pending_candidates: Sequence[CandidateRef],
+    *,
+    min_score: float = 0.2,
+) -> dict[str, int]:
+    """Confirm or reject ``pending_candidates`` of a raw payload."""
     if not pending_candidates:
         return {"confirmed": 0, "rejected": 0}
 
-    confirmed: list[Relationship] = []
+    confirmed: list[dict[str, Any]] = []
     confirm_ids: list[uuid.UUID] = []
     reject_ids: list[uuid.UUID] = []
 
     for candidate in pending_candidates:
         if candidate.score >= min_score:
             confirmed.append(
-                Relationship(
-                    source_entity_id=candidate.source_entity_id,
-                    target_entity_id=candidate.target_entity_id,
-                    type="SENTIMENT_LINK",
-                    strength=candidate.score,
-                    metadata_={
+                {
+                    "source_entity_id": candidate.source_entity_id,
+                    "target_entity_id": candidate.target_entity_id,
+                    "type": "SENTIMENT_LINK",
+                    "strength": candidate.score,
+                    "metadata_": {
                         "raw_data_id": str(candidate.raw_data_id),
                         "rationale": candidate.rationale,
                     },
-                ),
+                },
             )
             confirm_ids.append(candidate.id)
         else:
@@ -0,0 +1,133 @@
+"""Async counterparts of the repository functions used by API request handlers.
+
+Statements come from :mod:`nexus_knowledge.db.statements`, shared with
+:mod:`nexus_knowledge.db.repository`, so the sync and async paths cannot drift
+apart. Heavier service code (ingestion, search)
+is not duplicated here; handlers run it through ``AsyncSession.run_sync``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import CorrelationCandidate, MLflowRun, UserFeedback
+from .statements import (
+    correlation_candidates_stmt,
+    duration_percentiles_from_row,
+    feedback_stmt,
+    mlflow_run_duration_percentiles_stmt,
+    mlflow_run_filters,
+    mlflow_runs_stmt,
+    raw_data_status_stmt,
+)
+
+
+async def get_raw_data_status(
+    session: AsyncSession,
+    record_id: uuid.UUID,
+) -> str | None:
+    """Return only the status of a raw_data entry, or None when it does not exist."""
+    result = await session.execute(raw_data_status_stmt(record_id))
+    return result.scalar_one_or_none()
+
+
+async def get_user_feedback(
+    session: AsyncSession,
+    feedback_id: uuid.UUID,
+) -> UserFeedback | None:
+    """Fetch a user_feedback record by its identifier."""
+    return await session.get(UserFeedback, feedback_id)
+
+
+async def list_feedback(
+    session: AsyncSession,
+    *,
+    status: str | None = None,
+    limit: int = 50,
+) -> Sequence[UserFeedback]:
+    """Return feedback entries optionally filtered by status."""
+    result = await session.scalars(feedback_stmt(status=status, limit=limit))
+    return result.all()
+
+
+async def update_feedback_status(
+    session: AsyncSession,
+    feedback_id: uuid.UUID,
+    *,
+    status: str,
+) -> UserFeedback | None:
+    """Update the status of a feedback entry."""
+    record = await get_user_feedback(session, feedback_id)
+    if record is None:
+        return None
+    record.status = status
+    await session.flush()
+    return record
+
+
+async def list_correlation_candidates(
+    session: AsyncSession,
+    raw_data_id: uuid.UUID,
+    *,
+    status: str | None = None,
+    limit: int | None = None,
+    order_by_score: bool = True,
+) -> Sequence[CorrelationCandidate]:
+    """Fetch correlation candidates scoped to a raw payload."""
+    stmt = correlation_candidates_stmt(
+        raw_data_id,
+        status=status,
+        limit=limit,
+        order_by_score=order_by_score,
+    )
+    result = await session.scalars(stmt)
+    return result.all()
+
+
+async def list_mlflow_runs(
+    session: AsyncSession,
+    *,
+    task_name: str | None = None,
+    status: str | None = None,
+    since: datetime | None = None,
+    limit: int = 50,
+) -> Sequence[MLflowRun]:
+    """Return the most recently started mirrored runs matching the filters."""
+    stmt = mlflow_runs_stmt(
+        task_name=task_name,
+        status=status,
+        since=since,
+        limit=limit,
+    )
+    result = await session.scalars(stmt)
+    return result.all()
+
+
+async def get_mlflow_run_duration_percentiles(
+    session: AsyncSession,
+    percentiles: Sequence[float],
+    *,
+    task_name: str | None = None,
+    status: str | None = None,
+    since: datetime | None = None,
+) -> tuple[int, dict[float, float | None]]:
+    """Return the matching run count and its nearest-rank duration percentiles."""
+    filters = mlflow_run_filters(task_name=task_name, status=status, since=since)
+    stmt = mlflow_run_duration_percentiles_stmt(percentiles, filters)
+    result = await session.execute(stmt)
+    return duration_percentiles_from_row(percentiles, result.one())
+
+
+__all__ = [
+    "get_mlflow_run_duration_percentiles",
+    "get_raw_data_status",
+    "get_user_feedback",
+    "list_correlation_candidates",
+    "list_feedback",
+    "list_mlflow_runs",
+    "update_feedback_status",
+]
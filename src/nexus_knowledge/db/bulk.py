@@ -0,0 +1,255 @@
+"""Core-level bulk insert path that bypasses ORM unit-of-work bookkeeping.
+
+Rows are converted to plain tuples once, using the bind processors SQLAlchemy
+would apply anyway (``GUID`` and ``JSONBType`` included), and handed to the
+driver in a single round trip: ``executemany`` on SQLite and other dialects,
+``COPY ... FROM STDIN`` on PostgreSQL when the driver supports it.
+"""
+
+from __future__ import annotations
+
+import io
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Literal, cast
+
+from sqlalchemy import Column, Table, inspect
+from sqlalchemy.engine import Connection, Dialect, ExecutionContext
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.schema import (
+    CallableColumnDefault,
+    DefaultGenerator,
+    ScalarElementColumnDefault,
+)
+
+from .base import Base
+
+BulkMethod = Literal["auto", "executemany", "copy"]
+BulkRow = Mapping[str, Any] | Base
+
+
+@dataclass(frozen=True)
+class _ColumnPlan:
+    key: str
+    column: Column[Any]
+    default: Callable[[], Any] | None
+    process: Callable[[Any], Any] | None
+
+
+class BulkWriter(ABC):
+    """Write pre-converted tuples for ``columns`` of ``table`` in one batch."""
+
+    name: str
+
+    @abstractmethod
+    def write(
+        self,
+        connection: Connection,
+        table: Table,
+        columns: Sequence[Column[Any]],
+        rows: Sequence[tuple[Any, ...]],
+    ) -> None:
+        """Insert ``rows`` (ordered like ``columns``) into ``table``."""
+
+
+class ExecutemanyWriter(BulkWriter):
+    """Issue one parameterised ``INSERT`` through the driver's ``executemany``."""
+
+    name = "executemany"
+
+    def write(
+        self,
+        connection: Connection,
+        table: Table,
+        columns: Sequence[Column[Any]],
+        rows: Sequence[tuple[Any, ...]],
+    ) -> None:
+        dialect = connection.dialect
+        preparer = dialect.identifier_preparer
+        placeholder = _placeholder(dialect)
+        column_sql = ", ".join(preparer.quote(column.name) for column in columns)
+        values_sql = ", ".join(placeholder(i) for i in range(len(columns)))
+        statement = (
+            f"INSERT INTO {preparer.format_table(table)} "  # noqa: S608
+            f"({column_sql}) VALUES ({values_sql})"
+        )
+        connection.exec_driver_sql(statement, list(rows))
+
+
+class CopyWriter(BulkWriter):
+    """Stream rows into PostgreSQL with ``COPY ... FROM STDIN`` (text format)."""
+
+    name = "copy"
+
+    def write(
+        self,
+        connection: Connection,
+        table: Table,
+        columns: Sequence[Column[Any]],
+        rows: Sequence[tuple[Any, ...]],
+    ) -> None:
+        preparer = connection.dialect.identifier_preparer
+        column_sql = ", ".join(preparer.quote(column.name) for column in columns)
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_text(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {preparer.format_table(table)} ({column_sql}) FROM STDIN",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+
+def bulk_insert(
+    session: Session,
+    model: type[Base],
+    rows: Iterable[BulkRow],
+    *,
+    method: BulkMethod = "auto",
+) -> list[uuid.UUID]:
+    """Insert ``rows`` into ``model``'s table without tracking ORM state.
+
+    ``rows`` may be mappings keyed by ORM attribute name (``metadata_`` rather
+    than ``metadata``) or transient model instances. Missing columns receive
+    their Python-side defaults, including a fresh ``id``; instances get that
+    ``id`` assigned so callers can reference them afterwards. Inserted rows are
+    not added to the session's identity map. Returns the primary keys in input
+    order.
+    """
+    materialised = list(rows)
+    if not materialised:
+        return []
+
+    # Pending ORM objects (for example the parent raw_data row) must reach the
+    # database before rows referencing them.
+    session.flush()
+    connection = session.connection()
+    table = model.metadata.tables[model.__tablename__]
+    plans = _column_plans(model, table, connection.dialect)
+    key_index = next(i for i, plan in enumerate(plans) if plan.column.primary_key)
+
+    ids: list[uuid.UUID] = []
+    tuples: list[tuple[Any, ...]] = []
+    for row in materialised:
+        values = _row_values(row, plans)
+        ids.append(values[key_index])
+        if isinstance(row, Base) and getattr(row, plans[key_index].key) is None:
+            setattr(row, plans[key_index].key, values[key_index])
+        tuples.append(
+            tuple(
+                plan.process(value) if plan.process is not None else value
+                for plan, value in zip(plans, values, strict=True)
+            ),
+        )
+
+    writer = get_bulk_writer(connection, method)
+    writer.write(connection, table, [plan.column for plan in plans], tuples)
+    return ids
+
+
+def get_bulk_writer(connection: Connection, method: BulkMethod = "auto") -> BulkWriter:
+    """Return the writer for ``method``; ``auto`` prefers COPY on PostgreSQL."""
+    dialect = connection.dialect
+    # COPY goes through the raw driver cursor, so only drivers exposing
+    # ``copy_expert`` qualify.
+    supports_copy = dialect.name == "postgresql" and dialect.driver == "psycopg2"
+    if method == "copy":
+        if not supports_copy:
+            raise ValueError(
+                f"COPY is not available for the '{dialect.name}' dialect "
+                f"with driver '{dialect.driver}'",
+            )
+        return CopyWriter()
+    if method == "auto" and supports_copy:
+        return CopyWriter()
+    return ExecutemanyWriter()
+
+
+def _column_plans(
+    model: type[Base],
+    table: Table,
+    dialect: Dialect,
+) -> list[_ColumnPlan]:
+    plans: list[_ColumnPlan] = []
+    for attribute in inspect(model).column_attrs:
+        column = table.c[attribute.columns[0].key]
+        plans.append(
+            _ColumnPlan(
+                key=attribute.key,
+                column=column,
+                default=_default_factory(column.default),
+                process=column.type.dialect_impl(dialect).bind_processor(dialect),
+            ),
+        )
+    return plans
+
+
+def _default_factory(default: DefaultGenerator | None) -> Callable[[], Any] | None:
+    if isinstance(default, ScalarElementColumnDefault):
+        value = default.arg
+        return lambda: value
+    if isinstance(default, CallableColumnDefault):
+        # SQLAlchemy wraps zero-argument callables so they accept an execution
+        # context; none of the model defaults rely on it, so none is passed.
+        arg = default.arg
+        return lambda: arg(cast(ExecutionContext, None))
+    return None
+
+
+def _row_values(row: BulkRow, plans: Sequence[_ColumnPlan]) -> list[Any]:
+    values: list[Any] = []
+    for plan in plans:
+        value = getattr(row, plan.key) if isinstance(row, Base) else row.get(plan.key)
+        if value is None and plan.default is not None:
+            value = plan.default()
+        values.append(value)
+    return values
+
+
+def _placeholder(dialect: Dialect) -> Callable[[int], str]:
+    style = dialect.paramstyle
+    if style == "qmark":
+        return lambda _index: "?"
+    if style == "numeric":
+        return lambda index: f":{index + 1}"
+    if style == "numeric_dollar":
+        return lambda index: f"${index + 1}"
+    return lambda _index: "%s"
+
+
+def _copy_text(value: object) -> str:
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        # COPY's text format spells booleans as t/f.
+        return "t" if value else "f"
+    if isinstance(value, datetime | date):
+        text = value.isoformat()
+    elif isinstance(value, float):
+        text = repr(value)
+    else:
+        text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+__all__ = [
+    "BulkMethod",
+    "BulkWriter",
+    "CopyWriter",
+    "ExecutemanyWriter",
+    "bulk_insert",
+    "get_bulk_writer",
+]
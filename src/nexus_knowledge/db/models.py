@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
     Float,
     ForeignKey,
@@ -35,6 +36,7 @@ class RawData(Base):
     source_id: Mapped[str | None] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text, nullable=False)
     content_hash: Mapped[str | None] = mapped_column(String(64), unique=True)
+    content_ref: Mapped[str | None] = mapped_column(String(255))
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
         JSONBType(),
@@ -72,6 +74,44 @@ class ConversationTurn(Base):
     )
 
 
+class ConversationFingerprint(Base):
+    """Content fingerprint of a normalized conversation.
+
+    Lets later payloads that contain the same conversation link to the turns
+    that already exist instead of normalizing and analyzing them again.
+    """
+
+    __tablename__ = "conversation_fingerprints"
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    conversation_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    raw_data_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        ForeignKey("raw_data.id", ondelete="SET NULL"),
+    )
+    turn_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
+class RawDataConversation(Base):
+    """Conversations contained in a raw payload, including linked duplicates."""
+
+    __tablename__ = "raw_data_conversations"
+
+    raw_data_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("raw_data.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    conversation_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    linked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+
 class Entity(Base):
     """Entities extracted during analysis."""
 
@@ -93,6 +133,49 @@ class Entity(Base):
     )
 
 
+class AnalysisResult(Base):
+    """Marks a conversation turn as analyzed by one analyzer.
+
+    Keyed by turn and analyzer so a turn holds at most one result per analyzer;
+    ``model_version`` and ``text_hash`` tell re-runs whether it is still current.
+    The analyzer's entities are found by turn and entity type.
+    """
+
+    __tablename__ = "analysis_results"
+
+    conversation_turn_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("conversation_turns.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    analyzer: Mapped[str] = mapped_column(String(50), primary_key=True)
+    model_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    text_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    analyzed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
+class AnalysisCacheEntry(Base):
+    """Sentiment result shared by every turn with the same normalized text."""
+
+    __tablename__ = "analysis_cache"
+
+    model_version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    label: Mapped[str] = mapped_column(String(20), nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    positive_matches: Mapped[int] = mapped_column(Integer, nullable=False)
+    negative_matches: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
 class Relationship(Base):
     """Links between entities for correlation and pairing."""
 
@@ -191,6 +274,10 @@ class MLflowRun(Base):
     params: Mapped[dict[str, Any]] = mapped_column(JSONBType(), default=default_dict)
     metrics: Mapped[dict[str, Any]] = mapped_column(JSONBType(), default=default_dict)
     artifacts_uri: Mapped[str | None] = mapped_column(Text)
+    task_name: Mapped[str | None] = mapped_column(String(255))
+    duration_seconds: Mapped[float | None] = mapped_column(Float)
+    # False for task runs the tracking policy sampled out of MLflow.
+    tracked: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
 
 class DVCDataAsset(Base):
@@ -3,21 +3,51 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Iterator, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
+
+from sqlalchemy import (
+    CursorResult,
+    Insert,
+    Row,
+    Select,
+    delete,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, defer
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.storage import BlobStoreError, get_blob_store
 
+from .bulk import BulkRow, bulk_insert
 from .models import (
+    AnalysisCacheEntry,
+    AnalysisResult,
+    ConversationFingerprint,
     ConversationTurn,
     CorrelationCandidate,
     Entity,
+    MLflowRun,
     RawData,
+    RawDataConversation,
     Relationship,
     UserFeedback,
 )
+from .statements import (
+    correlation_candidates_stmt,
+    duration_percentiles_from_row,
+    feedback_stmt,
+    mlflow_run_duration_percentiles_stmt,
+    mlflow_run_filters,
+    mlflow_runs_stmt,
+    raw_data_status_stmt,
+)
 
 
 def create_raw_data(  # noqa: PLR0913
@@ -31,9 +61,11 @@ def create_raw_data(  # noqa: PLR0913
     content_hash: str | None = None,
 ) -> RawData:
     """Insert a raw_data record and return the persisted instance."""
+    content, content_ref = offload_raw_content(content, content_hash)
     record = RawData(
         source_type=source_type,
         content=content,
+        content_ref=content_ref,
         source_id=source_id,
         metadata_=metadata or {},
         status=status,
@@ -44,48 +76,486 @@ def create_raw_data(  # noqa: PLR0913
     return record
 
 
-def get_raw_data(session: Session, record_id: uuid.UUID) -> RawData | None:
-    """Fetch a raw_data entry by its identifier."""
-    stmt = select(RawData).where(RawData.id == record_id)
+def read_raw_content(record: RawData) -> str:
+    """Return the serialized payload of ``record``, loading it from the blob store.
+
+    Raises ``BlobStoreError`` when the payload was offloaded but the store is
+    not configured or the blob is missing.
+    """
+    if not record.content_ref:
+        return record.content
+    store = get_blob_store()
+    if store is None:
+        raise BlobStoreError(
+            f"raw_data {record.id} references blob {record.content_ref} but "
+            "RAW_CONTENT_STORE_PATH is not configured",
+        )
+    return store.get(record.content_ref)
+
+
+def offload_raw_content(
+    content: str,
+    content_hash: str | None,
+) -> tuple[str, str | None]:
+    """Move large payloads to the blob store, returning ``(content, content_ref)``."""
+    if content_hash is None:
+        return content, None
+    store = get_blob_store()
+    if store is None or len(content) < get_settings().raw_content_store_min_bytes:
+        return content, None
+    # Blobs are written before the row commits; a rolled back insert leaves an
+    # orphaned but harmless blob that the next ingest of the payload reuses.
+    return "", store.put(content_hash, content)
+
+
+def get_raw_data(
+    session: Session,
+    record_id: uuid.UUID,
+    *,
+    include_content: bool = True,
+) -> RawData | None:
+    """Fetch a raw_data entry by its identifier.
+
+    With ``include_content=False`` the payload column is not loaded and any
+    access to ``record.content`` raises instead of issuing a second query.
+    """
+    stmt = _select_raw_data(include_content).where(RawData.id == record_id)
     return session.execute(stmt).scalar_one_or_none()
 
 
-def get_raw_data_by_hash(session: Session, content_hash: str) -> RawData | None:
+def get_raw_data_status(session: Session, record_id: uuid.UUID) -> str | None:
+    """Return only the status of a raw_data entry, or None when it does not exist."""
+    return session.execute(raw_data_status_stmt(record_id)).scalar_one_or_none()
+
+
+def get_raw_data_by_hash(
+    session: Session,
+    content_hash: str,
+    *,
+    include_content: bool = True,
+) -> RawData | None:
     """Fetch a raw_data entry by its content hash."""
-    stmt = select(RawData).where(RawData.content_hash == content_hash)
+    stmt = _select_raw_data(include_content).where(
+        RawData.content_hash == content_hash,
+    )
     return session.execute(stmt).scalar_one_or_none()
 
 
+def get_raw_data_by_hashes(
+    session: Session,
+    content_hashes: Collection[str],
+    *,
+    include_content: bool = True,
+) -> dict[str, RawData]:
+    """Fetch raw_data entries for many content hashes with a single query."""
+    if not content_hashes:
+        return {}
+    stmt = _select_raw_data(include_content).where(
+        RawData.content_hash.in_(list(content_hashes)),
+    )
+    return {
+        record.content_hash: record
+        for record in session.scalars(stmt)
+        if record.content_hash
+    }
+
+
+def _select_raw_data(include_content: bool) -> Select[RawData]:
+    stmt = select(RawData)
+    if not include_content:
+        stmt = stmt.options(defer(RawData.content, raiseload=True))
+    return stmt
+
+
+def insert_raw_data_ignore_conflicts(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> dict[str, uuid.UUID]:
+    """Bulk insert raw_data rows, skipping any whose content hash already exists.
+
+    Rows use ``RawData`` attribute names as keys and must carry a ``content_hash``.
+    Rows that already carry a ``content_ref`` were written to the blob store by
+    the caller and are inserted as given.
+    Returns the identifiers of the rows that were actually inserted, keyed by
+    hash; hashes missing from the result were inserted concurrently by another
+    transaction and should be resolved with ``get_raw_data_by_hashes``.
+    """
+    if not rows:
+        return {}
+
+    stmt = _insert_ignoring_conflicts(session, RawData, ["content_hash"])
+    params = []
+    for row in rows:
+        values = dict(row)
+        if values.get("content_ref") is None:
+            values["content"], values["content_ref"] = offload_raw_content(
+                values["content"],
+                values["content_hash"],
+            )
+        params.append(values)
+    result = session.execute(
+        stmt.returning(RawData.id, RawData.content_hash),
+        params,
+    )
+    return {
+        content_hash: record_id
+        for record_id, content_hash in result
+        if content_hash is not None
+    }
+
+
+def _insert_ignoring_conflicts(
+    session: Session,
+    model: type[Any],
+    index_elements: Sequence[str],
+) -> Insert:
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(
+            index_elements=index_elements,
+        )
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing(
+            index_elements=index_elements,
+        )
+    return insert(model)  # pragma: no cover - other dialects insert plainly
+
+
 def update_raw_data_status(
     session: Session,
     record_id: uuid.UUID,
     *,
     status: str,
     processed_at: datetime | None = None,
-) -> RawData | None:
-    """Update the status (and optional processed timestamp) of a raw_data record."""
-    record = get_raw_data(session, record_id)
-    if record is None:
-        return None
-
-    record.status = status
+) -> str | None:
+    """Update the status (and optional processed timestamp) of a raw_data record.
+
+    Issues a single ``UPDATE ... RETURNING`` without loading the row and
+    returns the new status, or None when the record does not exist. Instances
+    already present in the session are updated in place.
+    """
+    values: dict[str, Any] = {"status": status}
     if processed_at is not None:
-        record.processed_at = processed_at
+        values["processed_at"] = processed_at
     elif status.upper() == "NORMALIZED":
-        record.processed_at = datetime.now(UTC)
+        values["processed_at"] = datetime.now(UTC)
 
-    session.flush()
-    return record
+    stmt = (
+        update(RawData)
+        .where(RawData.id == record_id)
+        .values(values)
+        .returning(RawData.status)
+    )
+    return session.execute(stmt).scalar_one_or_none()
 
 
 def create_conversation_turns(
     session: Session,
-    turns: Sequence[ConversationTurn],
-) -> Sequence[ConversationTurn]:
-    """Persist a batch of conversation turns."""
-    session.add_all(turns)
-    session.flush()
-    return turns
+    turns: Sequence[BulkRow],
+) -> list[uuid.UUID]:
+    """Persist a batch of conversation turns and return their identifiers.
+
+    Turns may be column mappings or transient ``ConversationTurn`` instances;
+    they are written through :func:`bulk_insert` and are not attached to the
+    session.
+    """
+    return bulk_insert(session, ConversationTurn, turns)
+
+
+def get_turns_by_conversation(
+    session: Session,
+    conversation_ids: Collection[uuid.UUID],
+) -> dict[tuple[uuid.UUID, int], Row[Any]]:
+    """Return stored turn columns keyed by ``(conversation_id, turn_index)``.
+
+    Rows are plain column tuples (``id``, ``speaker``, ``text``, ``timestamp``,
+    ``metadata_``) rather than ORM instances, so diffing large conversations
+    does not populate the identity map.
+    """
+    if not conversation_ids:
+        return {}
+    stmt = select(
+        ConversationTurn.id,
+        ConversationTurn.conversation_id,
+        ConversationTurn.turn_index,
+        ConversationTurn.speaker,
+        ConversationTurn.text,
+        ConversationTurn.timestamp,
+        ConversationTurn.metadata_,
+    ).where(ConversationTurn.conversation_id.in_(list(conversation_ids)))
+    return {(row.conversation_id, row.turn_index): row for row in session.execute(stmt)}
+
+
+def get_conversation_fingerprints(
+    session: Session,
+    fingerprints: Collection[str],
+) -> dict[str, uuid.UUID]:
+    """Map the already recorded ``fingerprints`` to their conversation ids."""
+    if not fingerprints:
+        return {}
+    stmt = select(
+        ConversationFingerprint.fingerprint,
+        ConversationFingerprint.conversation_id,
+    ).where(ConversationFingerprint.fingerprint.in_(list(fingerprints)))
+    return dict(session.execute(stmt).all())
+
+
+def record_conversation_fingerprints(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> set[str]:
+    """Insert fingerprint rows, skipping fingerprints that already exist.
+
+    Returns the fingerprints that were inserted; the others were recorded
+    concurrently by another transaction.
+    """
+    if not rows:
+        return set()
+    stmt = _insert_ignoring_conflicts(
+        session,
+        ConversationFingerprint,
+        ["fingerprint"],
+    ).returning(ConversationFingerprint.fingerprint)
+    return set(session.scalars(stmt, [dict(row) for row in rows]))
+
+
+def link_raw_data_conversations(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """Record which conversations a raw payload contains."""
+    if not rows:
+        return
+    stmt = _insert_ignoring_conflicts(
+        session,
+        RawDataConversation,
+        ["raw_data_id", "conversation_id"],
+    )
+    session.execute(stmt, [dict(row) for row in rows])
+
+
+def list_raw_data_conversations(
+    session: Session,
+    raw_data_id: uuid.UUID,
+) -> Sequence[RawDataConversation]:
+    """Return the conversations contained in a raw payload."""
+    stmt = select(RawDataConversation).where(
+        RawDataConversation.raw_data_id == raw_data_id,
+    )
+    return session.scalars(stmt).all()
+
+
+def contains_only_linked_conversations(
+    session: Session,
+    raw_data_id: uuid.UUID,
+) -> bool:
+    """Whether every conversation of a raw payload was already known.
+
+    Such payloads are normalized without turns of their own, so later stages
+    have nothing to do for them.
+    """
+    stmt = select(RawDataConversation.linked).where(
+        RawDataConversation.raw_data_id == raw_data_id,
+    )
+    linked = session.scalars(stmt).all()
+    return bool(linked) and all(linked)
+
+
+def update_conversation_turns(
+    session: Session,
+    changes: Sequence[Mapping[str, Any]],
+) -> None:
+    """Apply bulk updates to conversation turns keyed by their ``id``."""
+    if changes:
+        session.execute(update(ConversationTurn), [dict(change) for change in changes])
+
+
+def delete_analysis_for_turns(session: Session, turn_ids: Collection[uuid.UUID]) -> int:
+    """Delete entities derived from the given turns and everything built on them.
+
+    Relationships and correlation candidates referencing those entities are
+    removed explicitly so the cleanup does not depend on database-level
+    ``ON DELETE CASCADE`` enforcement, and the turns' analysis results are
+    cleared so the next analysis recomputes them. Returns the number of
+    deleted entities.
+    """
+    if not turn_ids:
+        return 0
+    session.execute(
+        delete(AnalysisResult).where(
+            AnalysisResult.conversation_turn_id.in_(list(turn_ids)),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    return _delete_entities(session, turn_ids, None)
+
+
+def delete_analyzer_output(
+    session: Session,
+    turn_ids: Collection[uuid.UUID],
+    *,
+    analyzer: str,
+    entity_types: Collection[str],
+) -> int:
+    """Delete one analyzer's results and entities for the given turns.
+
+    Returns the number of deleted entities.
+    """
+    if not turn_ids:
+        return 0
+    session.execute(
+        delete(AnalysisResult).where(
+            AnalysisResult.analyzer == analyzer,
+            AnalysisResult.conversation_turn_id.in_(list(turn_ids)),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    return _delete_entities(session, turn_ids, entity_types)
+
+
+def _delete_entities(
+    session: Session,
+    turn_ids: Collection[uuid.UUID],
+    entity_types: Collection[str] | None,
+) -> int:
+    entity_ids = select(Entity.id).where(
+        Entity.conversation_turn_id.in_(list(turn_ids)),
+    )
+    if entity_types is not None:
+        entity_ids = entity_ids.where(Entity.type.in_(list(entity_types)))
+    options = {"synchronize_session": False}
+    session.execute(
+        delete(Relationship).where(
+            or_(
+                Relationship.source_entity_id.in_(entity_ids),
+                Relationship.target_entity_id.in_(entity_ids),
+            ),
+        ),
+        execution_options=options,
+    )
+    session.execute(
+        delete(CorrelationCandidate).where(
+            or_(
+                CorrelationCandidate.source_entity_id.in_(entity_ids),
+                CorrelationCandidate.target_entity_id.in_(entity_ids),
+            ),
+        ),
+        execution_options=options,
+    )
+    result = cast(
+        CursorResult[Any],
+        session.execute(
+            delete(Entity).where(Entity.id.in_(entity_ids)),
+            execution_options=options,
+        ),
+    )
+    return result.rowcount or 0
+
+
+def get_analysis_results(
+    session: Session,
+    turn_ids: Collection[uuid.UUID],
+    *,
+    analyzers: Collection[str],
+) -> dict[tuple[uuid.UUID, str], Row[uuid.UUID, str, str, str]]:
+    """Map ``(turn_id, analyzer)`` to the stored model version and text hash."""
+    if not turn_ids or not analyzers:
+        return {}
+    stmt = select(
+        AnalysisResult.conversation_turn_id,
+        AnalysisResult.analyzer,
+        AnalysisResult.model_version,
+        AnalysisResult.text_hash,
+    ).where(
+        AnalysisResult.analyzer.in_(list(analyzers)),
+        AnalysisResult.conversation_turn_id.in_(list(turn_ids)),
+    )
+    return {
+        (row.conversation_turn_id, row.analyzer): row for row in session.execute(stmt)
+    }
+
+
+def record_analysis_results(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """Insert analysis result rows.
+
+    The ``(conversation_turn_id, analyzer)`` primary key makes a second result
+    for the same turn fail instead of duplicating its entities, so callers must
+    delete stale output first (see :func:`delete_analyzer_output`).
+    """
+    if rows:
+        session.execute(insert(AnalysisResult), [dict(row) for row in rows])
+
+
+def get_analysis_cache_entries(
+    session: Session,
+    text_hashes: Collection[str],
+    *,
+    model_version: str,
+) -> dict[str, AnalysisCacheEntry]:
+    """Return cached sentiment results for ``text_hashes`` and mark them used."""
+    if not text_hashes:
+        return {}
+    keys = list(text_hashes)
+    stmt = select(AnalysisCacheEntry).where(
+        AnalysisCacheEntry.model_version == model_version,
+        AnalysisCacheEntry.text_hash.in_(keys),
+    )
+    entries = {entry.text_hash: entry for entry in session.scalars(stmt)}
+    if entries:
+        session.execute(
+            update(AnalysisCacheEntry)
+            .where(
+                AnalysisCacheEntry.model_version == model_version,
+                AnalysisCacheEntry.text_hash.in_(list(entries)),
+            )
+            .values(last_used_at=datetime.now(UTC)),
+            execution_options={"synchronize_session": False},
+        )
+    return entries
+
+
+def store_analysis_cache_entries(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """Insert cache rows, skipping keys another transaction stored first."""
+    if not rows:
+        return
+    stmt = _insert_ignoring_conflicts(
+        session,
+        AnalysisCacheEntry,
+        ["model_version", "text_hash"],
+    )
+    session.execute(stmt, [dict(row) for row in rows])
+
+
+def prune_analysis_cache(session: Session, max_rows: int) -> int:
+    """Delete the least recently used cache rows beyond ``max_rows``.
+
+    Rows are ranked by ``last_used_at`` with the primary key breaking ties, so
+    exactly the rows past ``max_rows`` are removed even when timestamps tie.
+    """
+    key = tuple_(AnalysisCacheEntry.model_version, AnalysisCacheEntry.text_hash)
+    expired = (
+        select(AnalysisCacheEntry.model_version, AnalysisCacheEntry.text_hash)
+        .order_by(
+            AnalysisCacheEntry.last_used_at.desc(),
+            AnalysisCacheEntry.model_version.desc(),
+            AnalysisCacheEntry.text_hash.desc(),
+        )
+        .offset(max_rows)
+    )
+    result = cast(
+        CursorResult[Any],
+        session.execute(
+            delete(AnalysisCacheEntry).where(key.in_(expired)),
+            execution_options={"synchronize_session": False},
+        ),
+    )
+    return result.rowcount or 0
 
 
 def list_conversation_turns(
@@ -142,11 +612,9 @@ def iter_turns_for_raw(
     return session.execute(stmt).scalars()
 
 
-def create_entities(session: Session, entities: Sequence[Entity]) -> Sequence[Entity]:
-    """Persist a batch of entity records."""
-    session.add_all(entities)
-    session.flush()
-    return entities
+def create_entities(session: Session, entities: Sequence[BulkRow]) -> list[uuid.UUID]:
+    """Persist a batch of entity records and return their identifiers."""
+    return bulk_insert(session, Entity, entities)
 
 
 def list_entities_for_raw(session: Session, raw_data_id: uuid.UUID) -> Sequence[Entity]:
@@ -161,15 +629,10 @@ def list_entities_for_raw(session: Session, raw_data_id: uuid.UUID) -> Sequence[
 
 def create_correlation_candidates(
     session: Session,
-    candidates: Sequence[CorrelationCandidate],
-) -> Sequence[CorrelationCandidate]:
-    """Persist correlation candidates in bulk."""
-    if not candidates:
-        return []
-
-    session.add_all(candidates)
-    session.flush()
-    return candidates
+    candidates: Sequence[BulkRow],
+) -> list[uuid.UUID]:
+    """Persist correlation candidates in bulk and return their identifiers."""
+    return bulk_insert(session, CorrelationCandidate, candidates)
 
 
 def list_correlation_candidates(
@@ -181,15 +644,12 @@ def list_correlation_candidates(
     order_by_score: bool = True,
 ) -> Sequence[CorrelationCandidate]:
     """Fetch correlation candidates scoped to a raw payload."""
-    stmt = select(CorrelationCandidate).where(
-        CorrelationCandidate.raw_data_id == raw_data_id,
+    stmt = correlation_candidates_stmt(
+        raw_data_id,
+        status=status,
+        limit=limit,
+        order_by_score=order_by_score,
     )
-    if status is not None:
-        stmt = stmt.where(CorrelationCandidate.status == status)
-    if order_by_score:
-        stmt = stmt.order_by(CorrelationCandidate.score.desc())
-    if limit is not None:
-        stmt = stmt.limit(limit)
     return session.scalars(stmt).all()
 
 
@@ -201,27 +661,20 @@ def update_candidate_status(
     """Bulk update candidate status values."""
     if not candidate_ids:
         return
-    stmt = (
-        select(CorrelationCandidate)
-        .where(CorrelationCandidate.id.in_(candidate_ids))
-        .execution_options(populate_existing=True)
+    session.execute(
+        update(CorrelationCandidate)
+        .where(CorrelationCandidate.id.in_(list(candidate_ids)))
+        .values(status=status),
+        execution_options={"synchronize_session": "fetch"},
     )
-    for candidate in session.scalars(stmt):
-        candidate.status = status
-    session.flush()
 
 
 def create_relationships(
     session: Session,
-    relationships: Sequence[Relationship],
-) -> Sequence[Relationship]:
-    """Persist relationship records."""
-    if not relationships:
-        return []
-
-    session.add_all(relationships)
-    session.flush()
-    return relationships
+    relationships: Sequence[BulkRow],
+) -> list[uuid.UUID]:
+    """Persist relationship records in bulk and return their identifiers."""
+    return bulk_insert(session, Relationship, relationships)
 
 
 def list_relationships_for_raw(
@@ -276,10 +729,7 @@ def list_feedback(
     limit: int = 50,
 ) -> Sequence[UserFeedback]:
     """Return feedback entries optionally filtered by status."""
-    stmt = select(UserFeedback).order_by(UserFeedback.submitted_at.desc()).limit(limit)
-    if status:
-        stmt = stmt.where(UserFeedback.status == status)
-    return session.scalars(stmt).all()
+    return session.scalars(feedback_stmt(status=status, limit=limit)).all()
 
 
 def update_feedback_status(
@@ -295,3 +745,50 @@ def update_feedback_status(
     record.status = status
     session.flush()
     return record
+
+
+def store_mlflow_runs(session: Session, rows: Sequence[Mapping[str, Any]]) -> None:
+    """Insert mirrored MLflow runs, skipping runs that are already mirrored."""
+    if not rows:
+        return
+    stmt = _insert_ignoring_conflicts(session, MLflowRun, ["run_id"])
+    session.execute(stmt, [dict(row) for row in rows])
+
+
+def list_mlflow_runs(
+    session: Session,
+    *,
+    task_name: str | None = None,
+    status: str | None = None,
+    since: datetime | None = None,
+    limit: int = 50,
+) -> Sequence[MLflowRun]:
+    """Return the most recently started mirrored runs matching the filters."""
+    stmt = mlflow_runs_stmt(
+        task_name=task_name,
+        status=status,
+        since=since,
+        limit=limit,
+    )
+    return session.scalars(stmt).all()
+
+
+def get_mlflow_run_duration_percentiles(
+    session: Session,
+    percentiles: Sequence[float],
+    *,
+    task_name: str | None = None,
+    status: str | None = None,
+    since: datetime | None = None,
+) -> tuple[int, dict[float, float | None]]:
+    """Return the matching run count and its nearest-rank duration percentiles.
+
+    ``percentiles`` are given in the 0-100 range. All of them are computed
+    in one query over the matching durations (see
+    :func:`~nexus_knowledge.db.statements.mlflow_run_duration_percentiles_stmt`),
+    so no durations are loaded into Python.
+    """
+    filters = mlflow_run_filters(task_name=task_name, status=status, since=since)
+    stmt = mlflow_run_duration_percentiles_stmt(percentiles, filters)
+    result = session.execute(stmt)
+    return duration_percentiles_from_row(percentiles, result.one())
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from nexus_knowledge.config import get_settings, reload_settings
 
 _ENGINE: Engine | None = None
 _SESSION_FACTORY: sessionmaker[Session] | None = None
+_ASYNC_ENGINE: AsyncEngine | None = None
+_ASYNC_SESSION_FACTORY: async_sessionmaker[AsyncSession] | None = None
+
+# Async drivers substituted for the configured (synchronous) driver.
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
 
 
 def get_database_url() -> str:
@@ -71,11 +82,57 @@ def session_scope(
         session.close()
 
 
+def get_async_database_url(url: str | None = None) -> str:
+    """Return ``url`` (default: the configured URL) rewritten for an async driver.
+
+    ``postgresql`` URLs use asyncpg and ``sqlite`` URLs use aiosqlite; URLs that
+    already name an async driver are returned unchanged.
+    """
+    parsed = make_url(url or get_database_url())
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.get_driver_name() == driver:
+        return parsed.render_as_string(hide_password=False)
+    return parsed.set(
+        drivername=f"{parsed.get_backend_name()}+{driver}",
+    ).render_as_string(hide_password=False)
+
+
+def get_async_engine(echo: bool = False, url: str | None = None) -> AsyncEngine:
+    """Create (or return a cached) async engine for the configured database."""
+    global _ASYNC_ENGINE  # noqa: PLW0603
+    if url is not None or _ASYNC_ENGINE is None:
+        _ASYNC_ENGINE = create_async_engine(get_async_database_url(url), echo=echo)
+    return _ASYNC_ENGINE
+
+
+def get_async_session_factory(
+    engine: AsyncEngine | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """Return an async session factory bound to the configured async engine."""
+    global _ASYNC_SESSION_FACTORY  # noqa: PLW0603
+    if engine is not None or _ASYNC_SESSION_FACTORY is None:
+        _ASYNC_SESSION_FACTORY = async_sessionmaker(
+            bind=engine or get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _ASYNC_SESSION_FACTORY
+
+
+async def get_async_session_dependency() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async SQLAlchemy session for FastAPI dependencies."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
 def reset_session_factory() -> None:
     """Reset cached engine/session factory (useful for tests)."""
     global _ENGINE, _SESSION_FACTORY  # noqa: PLW0603
+    global _ASYNC_ENGINE, _ASYNC_SESSION_FACTORY  # noqa: PLW0603
     _ENGINE = None
     _SESSION_FACTORY = None
+    _ASYNC_ENGINE = None
+    _ASYNC_SESSION_FACTORY = None
     reload_settings()
 
 
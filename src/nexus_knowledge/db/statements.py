@@ -0,0 +1,142 @@
+"""SQL statement builders shared by the sync and async repositories.
+
+Each builder returns an unexecuted ``Select`` so :mod:`.repository` and
+:mod:`.async_repository` issue exactly the same queries and cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select, case, func, select
+
+from .models import CorrelationCandidate, MLflowRun, RawData, UserFeedback
+
+
+def raw_data_status_stmt(record_id: uuid.UUID) -> Select[str]:
+    """Select only the status column of one raw_data row."""
+    return select(RawData.status).where(RawData.id == record_id)
+
+
+def correlation_candidates_stmt(
+    raw_data_id: uuid.UUID,
+    *,
+    status: str | None,
+    limit: int | None,
+    order_by_score: bool,
+) -> Select[CorrelationCandidate]:
+    """Select the correlation candidates of a raw payload."""
+    stmt = select(CorrelationCandidate).where(
+        CorrelationCandidate.raw_data_id == raw_data_id,
+    )
+    if status is not None:
+        stmt = stmt.where(CorrelationCandidate.status == status)
+    if order_by_score:
+        stmt = stmt.order_by(CorrelationCandidate.score.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def feedback_stmt(*, status: str | None, limit: int) -> Select[UserFeedback]:
+    """Select the most recent feedback entries, optionally filtered by status."""
+    stmt = select(UserFeedback).order_by(UserFeedback.submitted_at.desc()).limit(limit)
+    if status:
+        stmt = stmt.where(UserFeedback.status == status)
+    return stmt
+
+
+def mlflow_run_filters(
+    *,
+    task_name: str | None,
+    status: str | None,
+    since: datetime | None,
+) -> list[ColumnElement[bool]]:
+    """Return the WHERE clauses for the mirrored-run query filters."""
+    filters: list[ColumnElement[bool]] = []
+    if task_name:
+        filters.append(MLflowRun.task_name == task_name)
+    if status:
+        filters.append(MLflowRun.status == status)
+    if since is not None:
+        if since.tzinfo is not None:
+            since = since.astimezone(UTC)
+        filters.append(MLflowRun.start_time >= since)
+    return filters
+
+
+def mlflow_runs_stmt(
+    *,
+    task_name: str | None,
+    status: str | None,
+    since: datetime | None,
+    limit: int,
+) -> Select[MLflowRun]:
+    """Select the most recently started mirrored runs matching the filters."""
+    filters = mlflow_run_filters(task_name=task_name, status=status, since=since)
+    return (
+        select(MLflowRun)
+        .where(*filters)
+        .order_by(MLflowRun.start_time.desc())
+        .limit(limit)
+    )
+
+
+def mlflow_run_duration_percentiles_stmt(
+    percentiles: Sequence[float],
+    filters: Sequence[ColumnElement[bool]],
+) -> Select[*tuple[Any, ...]]:
+    """Select the run count followed by one nearest-rank duration per percentile.
+
+    Matching durations are numbered once with window functions; the
+    nearest-rank value for ``p`` is the smallest duration whose position
+    satisfies ``position * 100 >= p * count``. Every percentile comes out of
+    the same sorted pass, and the query runs unchanged on SQLite and
+    PostgreSQL. With no matching runs the count is 0 and every value is NULL.
+    """
+    ranked = (
+        select(
+            MLflowRun.duration_seconds.label("duration"),
+            func.row_number().over(order_by=MLflowRun.duration_seconds).label("pos"),
+            func.count().over().label("total"),
+        )
+        .where(MLflowRun.duration_seconds.is_not(None), *filters)
+        .subquery()
+    )
+    return select(
+        func.count(),
+        *(
+            func.min(
+                case(
+                    (
+                        ranked.c.pos * 100 >= percentile * ranked.c.total,
+                        ranked.c.duration,
+                    ),
+                ),
+            )
+            for percentile in percentiles
+        ),
+    ).select_from(ranked)
+
+
+def duration_percentiles_from_row(
+    percentiles: Sequence[float],
+    row: Row[*tuple[Any, ...]],
+) -> tuple[int, dict[float, float | None]]:
+    """Unpack a :func:`mlflow_run_duration_percentiles_stmt` result row."""
+    count, *values = row
+    return int(count or 0), dict(zip(percentiles, values, strict=True))
+
+
+__all__ = [
+    "correlation_candidates_stmt",
+    "duration_percentiles_from_row",
+    "feedback_stmt",
+    "mlflow_run_duration_percentiles_stmt",
+    "mlflow_run_filters",
+    "mlflow_runs_stmt",
+    "raw_data_status_stmt",
+]
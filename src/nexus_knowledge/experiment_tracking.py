@@ -1,18 +1,61 @@
-"""Experiment tracking helpers for Celery tasks."""
+"""Experiment tracking helpers for Celery tasks.
+
+:func:`mlflow_task_run` wraps a task in a regular (fluent) MLflow run and
+talks to the tracking server synchronously. :func:`buffered_task_run` and
+:func:`buffered_run` instead hand run creation, params, metrics, tags and run
+termination to a per-process :class:`TrackingSink`. Its background thread
+groups whatever is pending into ``log_batch`` calls, so tasks never wait on
+the tracking server and a tracking-server outage only delays (or, once the
+buffer is full, drops) tracking data instead of failing the task.
+
+When ``TRACKING_MIRROR_RUNS`` is on, the same thread also writes every
+finished task run, with its params, metrics and duration, into the local
+``mlflow_runs`` table, so dashboards can query recent runs without going
+through the tracking server.
+"""
 
 from __future__ import annotations
 
+import atexit
+import logging
+import os
+import threading
 import time
 import uuid
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import mlflow
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import MlflowClient
+
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.db.repository import store_mlflow_runs
+from nexus_knowledge.db.session import session_scope
+from nexus_knowledge.mlflow_utils import configure_mlflow, get_tracking_uri
+from nexus_knowledge.observability import (
+    get_celery_task_id,
+    get_correlation_id,
+    observe_tracking_flush_failure,
+    observe_tracking_mirrored_runs,
+    observe_tracking_records,
+    observe_tracking_task_run,
+)
 
-from nexus_knowledge.mlflow_utils import configure_mlflow
-from nexus_knowledge.observability import get_celery_task_id, get_correlation_id
+logger = logging.getLogger(__name__)
+
+# Per-request limits of the MLflow ``log_batch`` API.
+MAX_BATCH_PARAMS_TAGS = 100
+MAX_BATCH_ENTITIES = 1000
+# Longest pause between retries while the tracking server is unreachable.
+MAX_RETRY_SECONDS = 30.0
 
 
 @contextmanager
@@ -28,6 +71,8 @@ def mlflow_task_run(
     """Start an MLflow run for a Celery task and log basic metadata.
 
     Yields the run identifier so callers can associate artifacts or metrics.
+    Every call blocks on the tracking server; prefer :func:`buffered_task_run`
+    unless the task logs artifacts.
     """
     configure_mlflow(tracking_uri)
     active_run = mlflow.active_run()
@@ -38,6 +83,39 @@ def mlflow_task_run(
         start_kwargs["nested"] = True
     start = time.perf_counter()
 
+    all_tags, all_params = _task_metadata(
+        task_name,
+        raw_data_id=raw_data_id,
+        correlation_id=correlation_id,
+        tags=tags,
+        params=params,
+    )
+
+    with mlflow.start_run(**start_kwargs) as active_run:
+        if all_tags:
+            mlflow.set_tags(all_tags)
+        if all_params:
+            mlflow.log_params(all_params)
+        try:
+            yield active_run.info.run_id
+        except Exception:
+            mlflow.set_tag("status", "failed")
+            raise
+        else:
+            mlflow.set_tag("status", "succeeded")
+        finally:
+            duration = time.perf_counter() - start
+            mlflow.log_metric("duration_seconds", duration)
+
+
+def _task_metadata(
+    task_name: str,
+    *,
+    raw_data_id: uuid.UUID | None,
+    correlation_id: str | None,
+    tags: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
     base_tags: dict[str, Any] = {
         "component": "celery_task",
         "task_name": task_name,
@@ -54,26 +132,10 @@ def mlflow_task_run(
     if raw_data_id is not None:
         base_tags["raw_data_id"] = str(raw_data_id)
 
-    all_tags = {**base_tags, **(tags or {})}
     all_params = dict(params or {})
     if raw_data_id is not None:
         all_params.setdefault("raw_data_id", str(raw_data_id))
-
-    with mlflow.start_run(**start_kwargs) as active_run:
-        if all_tags:
-            mlflow.set_tags(all_tags)
-        if all_params:
-            mlflow.log_params(all_params)
-        try:
-            yield active_run.info.run_id
-        except Exception:
-            mlflow.set_tag("status", "failed")
-            raise
-        else:
-            mlflow.set_tag("status", "succeeded")
-        finally:
-            duration = time.perf_counter() - start
-            mlflow.log_metric("duration_seconds", duration)
+    return {**base_tags, **(tags or {})}, all_params
 
 
 def log_task_artifact(path: str | Path) -> None:
@@ -85,4 +147,826 @@ def log_task_artifact(path: str | Path) -> None:
         mlflow.log_artifact(str(path_obj))
 
 
-__all__ = ["log_task_artifact", "mlflow_task_run"]
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+@dataclass(eq=False)
+class BufferedRun:
+    """Handle of a run tracked through a :class:`TrackingSink`.
+
+    Logging methods only queue records. ``run_id`` stays None until the
+    sink's background thread has created the run. While ``held`` is set, the
+    run's operations collect there instead, until the tracking policy
+    releases or discards them. ``mirror`` accumulates what the background
+    thread has sent for a task run that will be mirrored locally.
+    """
+
+    sink: TrackingSink
+    experiment: str
+    run_name: str
+    tracking_uri: str
+    parent: BufferedRun | str | None = None
+    start_time: int = field(default_factory=_now_ms)
+    run_id: str | None = None
+    held: list[_Operation] | None = None
+    mirror: _MirroredRun | None = None
+
+    def log_param(self, key: str, value: object) -> None:
+        self.sink.log(self, params={key: value})
+
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        self.sink.log(self, params=params)
+
+    def log_metric(self, key: str, value: float, *, step: int = 0) -> None:
+        self.sink.log(self, metrics={key: value}, step=step)
+
+    def log_metrics(self, metrics: Mapping[str, float], *, step: int = 0) -> None:
+        self.sink.log(self, metrics=metrics, step=step)
+
+    def set_tag(self, key: str, value: object) -> None:
+        self.sink.log(self, tags={key: value})
+
+    def set_tags(self, tags: Mapping[str, Any]) -> None:
+        self.sink.log(self, tags=tags)
+
+
+@dataclass(eq=False)
+class _Operation:
+    kind: str  # "start", "log", "end" or "mirror"
+    run: BufferedRun
+    params: list[Param] = field(default_factory=list)
+    metrics: list[Metric] = field(default_factory=list)
+    tags: list[RunTag] = field(default_factory=list)
+    status: str | None = None
+    timestamp: int = 0
+
+    @property
+    def records(self) -> int:
+        return len(self.params) + len(self.metrics) + len(self.tags)
+
+
+@dataclass
+class _MirroredRun:
+    experiment_id: str
+    task_name: str | None
+    artifacts_uri: str | None = None
+    params: dict[str, str] = field(default_factory=dict)
+    metrics: dict[str, float] = field(default_factory=dict)
+
+    def update(self, operations: list[_Operation]) -> None:
+        for operation in operations:
+            self.params.update((param.key, param.value) for param in operation.params)
+            self.metrics.update((m.key, m.value) for m in operation.metrics)
+
+    def row(
+        self,
+        run: BufferedRun,
+        run_id: uuid.UUID,
+        end: _Operation,
+        *,
+        tracked: bool,
+    ) -> dict[str, Any]:
+        duration = self.metrics.get(
+            "duration_seconds",
+            (end.timestamp - run.start_time) / 1000,
+        )
+        return {
+            "run_id": run_id,
+            "experiment_id": self.experiment_id,
+            "run_name": run.run_name,
+            "start_time": _datetime(run.start_time),
+            "end_time": _datetime(end.timestamp),
+            "status": end.status,
+            "params": dict(self.params),
+            "metrics": dict(self.metrics),
+            "artifacts_uri": self.artifacts_uri,
+            "task_name": self.task_name,
+            "duration_seconds": duration,
+            "tracked": tracked,
+        }
+
+
+class TrackingSink:
+    """Buffers MLflow runs and records and sends them from a background thread.
+
+    Records are grouped per run into ``log_batch`` calls every
+    ``flush_seconds`` (or on :meth:`flush`). When the tracking server fails,
+    pending operations are kept in order and retried with a growing delay;
+    params, metrics and tags beyond ``max_pending`` are dropped rather than
+    blocking the caller. Requests the server rejects outright (4xx) are
+    dropped as well, so one bad value cannot wedge the queue.
+
+    Finished task runs are mirrored into ``mlflow_runs`` after each send,
+    including runs the tracking policy kept out of MLflow (``tracked`` is
+    False for those). A failed mirror write is logged and not retried; the
+    tracking server stays the source of truth.
+    """
+
+    def __init__(self, *, max_pending: int, flush_seconds: float) -> None:
+        self.max_pending = max_pending
+        self.flush_seconds = flush_seconds
+        self._pending: deque[_Operation] = deque()
+        self._pending_records = 0
+        self._busy = False
+        self._closed = False
+        self._flush_requested = False
+        self._retry_seconds = 0.0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._clients: dict[str, MlflowClient] = {}
+        self._experiments: dict[tuple[str, str], str] = {}
+        self._mirror_rows: list[dict[str, Any]] = []
+
+    def start_run(  # noqa: PLR0913
+        self,
+        experiment: str,
+        run_name: str,
+        *,
+        tags: Mapping[str, Any] | None = None,
+        parent: BufferedRun | str | None = None,
+        tracking_uri: str | None = None,
+        start_time: int | None = None,
+        held: list[_Operation] | None = None,
+    ) -> BufferedRun:
+        """Queue the creation of a run and return its handle.
+
+        With ``held``, the run's operations are collected in that list
+        instead of being queued; see :meth:`release`.
+        """
+        run = BufferedRun(
+            self,
+            experiment,
+            run_name,
+            tracking_uri or get_tracking_uri(),
+            parent,
+            start_time=start_time or _now_ms(),
+            held=held,
+        )
+        self._submit(_Operation("start", run, tags=_run_tags(tags or {})))
+        return run
+
+    def log(
+        self,
+        run: BufferedRun,
+        *,
+        params: Mapping[str, Any] | None = None,
+        metrics: Mapping[str, float] | None = None,
+        tags: Mapping[str, Any] | None = None,
+        step: int = 0,
+    ) -> None:
+        """Queue params, metrics and tags for ``run``."""
+        timestamp = _now_ms()
+        operation = _Operation(
+            "log",
+            run,
+            params=[Param(key, str(value)) for key, value in (params or {}).items()],
+            metrics=[
+                Metric(key, float(value), timestamp, step)
+                for key, value in (metrics or {}).items()
+            ],
+            tags=_run_tags(tags or {}),
+        )
+        if operation.records:
+            self._submit(operation)
+
+    def end_run(self, run: BufferedRun, status: str = "FINISHED") -> None:
+        """Queue the termination of ``run`` with ``status``."""
+        self._submit(_Operation("end", run, status=status, timestamp=_now_ms()))
+
+    def release(self, held: list[_Operation]) -> None:
+        """Queue operations held back by :meth:`start_run` in their order."""
+        for operation in held:
+            operation.run.held = None
+        for operation in held:
+            self._submit(operation)
+
+    def mirror(self, held: list[_Operation]) -> None:
+        """Queue mirror rows for the task runs in ``held`` without tracking them."""
+        if not get_settings().tracking_mirror_runs:
+            return
+        by_run: dict[BufferedRun, list[_Operation]] = {}
+        for operation in held:
+            by_run.setdefault(operation.run, []).append(operation)
+        for run, operations in by_run.items():
+            ends = [op for op in operations if op.kind == "end"]
+            if not ends or not _is_task_run(operations[0].tags):
+                continue
+            run.held = None
+            self._submit(
+                _Operation(
+                    "mirror",
+                    run,
+                    params=[p for op in operations for p in op.params],
+                    metrics=[m for op in operations for m in op.metrics],
+                    tags=[t for op in operations for t in op.tags],
+                    status=ends[-1].status,
+                    timestamp=ends[-1].timestamp,
+                ),
+            )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything queued so far; False if ``timeout`` expired first."""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(self._idle, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush and stop the background thread; later records are ignored."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            return self._condition.wait_for(self._idle, timeout)
+
+    def _idle(self) -> bool:
+        return not self._pending and not self._busy
+
+    def _submit(self, operation: _Operation) -> None:
+        if operation.run.held is not None:
+            operation.run.held.append(operation)
+            return
+        with self._condition:
+            if self._closed:
+                return
+            if self._pending_records + operation.records > self.max_pending:
+                observe_tracking_records("dropped", operation.records)
+                return
+            self._pending.append(operation)
+            self._pending_records += operation.records
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="mlflow-tracking-sink",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                if self._retry_seconds:
+                    delay = self._retry_seconds
+                elif self._flush_requested or self._closed:
+                    delay = 0
+                else:
+                    delay = self.flush_seconds
+                if delay:
+                    self._condition.wait(delay)
+                operations = list(self._pending)
+                self._pending.clear()
+                self._flush_requested = False
+                self._busy = True
+            unsent = self._send(operations)
+            self._write_mirror()
+            with self._condition:
+                self._pending.extendleft(reversed(unsent))
+                self._pending_records = sum(op.records for op in self._pending)
+                self._busy = False
+                self._condition.notify_all()
+
+    def _send(self, operations: list[_Operation]) -> list[_Operation]:
+        """Send ``operations`` run by run; returns those still to be retried."""
+        by_run: dict[BufferedRun, list[_Operation]] = {}
+        for operation in operations:
+            by_run.setdefault(operation.run, []).append(operation)
+        sent: set[int] = set()
+        try:
+            for run, run_operations in by_run.items():
+                self._send_run(run, run_operations, sent)
+        except Exception:
+            observe_tracking_flush_failure()
+            self._retry_seconds = min(
+                max(self._retry_seconds * 2, self.flush_seconds, 0.1),
+                MAX_RETRY_SECONDS,
+            )
+            logger.warning(
+                "MLflow tracking unavailable; retrying in %.1fs",
+                self._retry_seconds,
+                exc_info=True,
+            )
+            return [op for op in operations if id(op) not in sent]
+        self._retry_seconds = 0.0
+        return []
+
+    def _send_run(
+        self,
+        run: BufferedRun,
+        operations: list[_Operation],
+        sent: set[int],
+    ) -> None:
+        client = self._client(run.tracking_uri)
+        batch: list[_Operation] = []
+        for operation in operations:
+            if operation.kind == "log":
+                batch.append(operation)
+                continue
+            self._log_batch(client, run, batch, sent)
+            batch = []
+            if operation.kind == "start":
+                self._create_run(client, operation)
+            elif operation.kind == "mirror":
+                self._mirror_untracked(client, operation)
+            elif run.run_id is not None:
+                _unless_rejected(
+                    client.set_terminated,
+                    run.run_id,
+                    status=operation.status,
+                    end_time=operation.timestamp,
+                )
+                if run.mirror is not None and (run_id := _mirror_run_id(run.run_id)):
+                    self._mirror_rows.append(
+                        run.mirror.row(run, run_id, operation, tracked=True),
+                    )
+            sent.add(id(operation))
+        self._log_batch(client, run, batch, sent)
+
+    def _experiment_id(self, client: MlflowClient, run: BufferedRun) -> str:
+        key = (run.tracking_uri, run.experiment)
+        if key not in self._experiments:
+            experiment = client.get_experiment_by_name(run.experiment)
+            self._experiments[key] = (
+                experiment.experiment_id
+                if experiment is not None
+                else client.create_experiment(run.experiment)
+            )
+        return self._experiments[key]
+
+    def _create_run(self, client: MlflowClient, operation: _Operation) -> None:
+        run = operation.run
+        experiment_id = self._experiment_id(client, run)
+        tags = {tag.key: tag.value for tag in operation.tags}
+        if _is_task_run(operation.tags) and get_settings().tracking_mirror_runs:
+            run.mirror = _MirroredRun(experiment_id, tags.get("task_name"))
+        parent = (
+            run.parent.run_id if isinstance(run.parent, BufferedRun) else run.parent
+        )
+        if parent:
+            tags["mlflow.parentRunId"] = parent
+
+        def create() -> None:
+            info = client.create_run(
+                experiment_id,
+                start_time=run.start_time,
+                tags=tags,
+                run_name=run.run_name,
+            ).info
+            run.run_id = info.run_id
+            if run.mirror is not None:
+                run.mirror.artifacts_uri = info.artifact_uri
+
+        _unless_rejected(create)
+
+    def _mirror_untracked(self, client: MlflowClient, operation: _Operation) -> None:
+        run = operation.run
+        tags = {tag.key: tag.value for tag in operation.tags}
+        mirror = _MirroredRun(self._experiment_id(client, run), tags.get("task_name"))
+        mirror.update([operation])
+        self._mirror_rows.append(
+            mirror.row(run, uuid.uuid4(), operation, tracked=False),
+        )
+
+    def _write_mirror(self) -> None:
+        rows, self._mirror_rows = self._mirror_rows, []
+        if not rows:
+            return
+        try:
+            with session_scope() as session:
+                store_mlflow_runs(session, rows)
+        except Exception:
+            observe_tracking_mirrored_runs("failed", len(rows))
+            logger.warning(
+                "Could not mirror %d MLflow runs locally",
+                len(rows),
+                exc_info=True,
+            )
+        else:
+            observe_tracking_mirrored_runs("written", len(rows))
+
+    def _log_batch(
+        self,
+        client: MlflowClient,
+        run: BufferedRun,
+        operations: list[_Operation],
+        sent: set[int],
+    ) -> None:
+        if not operations:
+            return
+        # A key may only appear once per request; the latest value wins.
+        params = list({p.key: p for op in operations for p in op.params}.values())
+        tags = list({t.key: t for op in operations for t in op.tags}.values())
+        metrics = [metric for op in operations for metric in op.metrics]
+        records = sum(op.records for op in operations)
+        if run.mirror is not None:
+            run.mirror.update(operations)
+        delivered = run.run_id is not None
+        for batch in _batches(params, metrics, tags):
+            if not delivered:
+                break
+            delivered = _unless_rejected(client.log_batch, run.run_id, **batch)
+        observe_tracking_records("sent" if delivered else "rejected", records)
+        sent.update(id(op) for op in operations)
+
+    def _client(self, tracking_uri: str) -> MlflowClient:
+        if tracking_uri not in self._clients:
+            self._clients[tracking_uri] = MlflowClient(tracking_uri=tracking_uri)
+        return self._clients[tracking_uri]
+
+
+def _run_tags(tags: Mapping[str, Any]) -> list[RunTag]:
+    return [RunTag(key, str(value)) for key, value in tags.items()]
+
+
+def _is_task_run(tags: list[RunTag]) -> bool:
+    return any(tag.key == "component" and tag.value == "celery_task" for tag in tags)
+
+
+def _mirror_run_id(run_id: str) -> uuid.UUID | None:
+    """Parse an MLflow run id (32 hex digits) for the ``mlflow_runs`` key."""
+    try:
+        return uuid.UUID(hex=run_id)
+    except ValueError:
+        logger.debug("Not mirroring MLflow run with non-UUID id %s", run_id)
+        return None
+
+
+def _datetime(timestamp_ms: int) -> datetime:
+    return datetime.fromtimestamp(timestamp_ms / 1000, UTC)
+
+
+def _batches(
+    params: list[Param],
+    metrics: list[Metric],
+    tags: list[RunTag],
+) -> Iterator[dict[str, list[Any]]]:
+    """Split records into ``log_batch`` requests within the API limits."""
+    while params or metrics or tags:
+        batch_params, params = (
+            params[:MAX_BATCH_PARAMS_TAGS],
+            params[MAX_BATCH_PARAMS_TAGS:],
+        )
+        batch_tags, tags = tags[:MAX_BATCH_PARAMS_TAGS], tags[MAX_BATCH_PARAMS_TAGS:]
+        room = MAX_BATCH_ENTITIES - len(batch_params) - len(batch_tags)
+        batch_metrics, metrics = metrics[:room], metrics[room:]
+        yield {"metrics": batch_metrics, "params": batch_params, "tags": batch_tags}
+
+
+def _unless_rejected(
+    func: Callable[..., object],
+    *args: object,
+    **kwargs: object,
+) -> bool:
+    """Call ``func``; returns False if the server rejected the request (4xx).
+
+    Other failures propagate so the operation is retried.
+    """
+    try:
+        func(*args, **kwargs)
+    except MlflowException as exc:
+        if not 400 <= exc.get_http_status_code() < 500:  # noqa: PLR2004
+            raise
+        logger.warning("MLflow rejected tracking data: %s", exc)
+        return False
+    return True
+
+
+@dataclass
+class _TaskSummary:
+    started: int
+    tracking_uri: str
+    runs: int = 0
+    duration_total: float = 0.0
+    duration_max: float = 0.0
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+class TrackingPolicy:
+    """Decides which task runs reach MLflow.
+
+    Tracks one in ``sample_every`` runs per task type (``overrides`` maps a
+    task name, or its last dotted part, to its own rate). Runs sampled out
+    are still tracked when they fail or take at least ``slow_seconds`` (0
+    disables the threshold). The rest are counted, together with their
+    duration and the sum of each metric they logged, into one
+    ``summary::<task>`` run per task type and ``summary_seconds`` window.
+    A window is logged by the first run after it ends, or at shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_every: int = 1,
+        overrides: Mapping[str, int] | None = None,
+        slow_seconds: float = 0.0,
+        summary_seconds: float = 300.0,
+    ) -> None:
+        self.sample_every = sample_every
+        self.overrides = dict(overrides or {})
+        self.slow_seconds = slow_seconds
+        self.summary_seconds = summary_seconds
+        self._counters: dict[str, int] = {}
+        self._summaries: dict[str, _TaskSummary] = {}
+        self._lock = threading.Lock()
+
+    def rate_for(self, task_name: str) -> int:
+        """Return the ``N`` of "track 1 in N" for ``task_name``."""
+        short_name = task_name.rsplit(".", 1)[-1]
+        return self.overrides.get(
+            task_name,
+            self.overrides.get(short_name, self.sample_every),
+        )
+
+    def should_track(self, task_name: str) -> bool:
+        """Whether the next run of ``task_name`` is sampled in."""
+        rate = self.rate_for(task_name)
+        if rate <= 1:
+            return True
+        with self._lock:
+            count = self._counters.get(task_name, 0)
+            self._counters[task_name] = count + 1
+        return count % rate == 0
+
+    def settle(
+        self,
+        run: BufferedRun,
+        held: list[_Operation],
+        task_name: str,
+        *,
+        failed: bool,
+        duration: float,
+    ) -> None:
+        """Release a sampled-out run if it must be tracked, else summarize it."""
+        if failed or (self.slow_seconds and duration >= self.slow_seconds):
+            observe_tracking_task_run(task_name, "failed" if failed else "slow")
+            run.sink.release(held)
+            return
+        observe_tracking_task_run(task_name, "summarized")
+        run.sink.mirror(held)
+        metrics = {
+            metric.key: metric.value
+            for operation in held
+            if operation.run is run
+            for metric in operation.metrics
+        }
+        metrics.pop("duration_seconds", None)
+        now = _now_ms()
+        with self._lock:
+            summary = self._summaries.get(task_name)
+            if summary is None:
+                summary = self._summaries[task_name] = _TaskSummary(
+                    now,
+                    run.tracking_uri,
+                )
+            summary.runs += 1
+            summary.duration_total += duration
+            summary.duration_max = max(summary.duration_max, duration)
+            for key, value in metrics.items():
+                summary.metrics[key] = summary.metrics.get(key, 0.0) + value
+            if now - summary.started < self.summary_seconds * 1000:
+                return
+            del self._summaries[task_name]
+        self._log_summary(run.sink, task_name, summary)
+
+    def flush_summaries(self, sink: TrackingSink) -> None:
+        """Log every open summary window (used at shutdown)."""
+        with self._lock:
+            summaries, self._summaries = self._summaries, {}
+        for task_name, summary in summaries.items():
+            self._log_summary(sink, task_name, summary)
+
+    def _log_summary(
+        self,
+        sink: TrackingSink,
+        task_name: str,
+        summary: _TaskSummary,
+    ) -> None:
+        run = sink.start_run(
+            "CeleryTasks",
+            f"summary::{task_name}",
+            tags={
+                "component": "celery_task_summary",
+                "task_name": task_name,
+                "sample_every": self.rate_for(task_name),
+            },
+            tracking_uri=summary.tracking_uri,
+            start_time=summary.started,
+        )
+        run.log_metrics(
+            {
+                "runs": summary.runs,
+                "duration_seconds_mean": summary.duration_total / summary.runs,
+                "duration_seconds_max": summary.duration_max,
+                **{f"{key}_sum": value for key, value in summary.metrics.items()},
+            },
+        )
+        sink.end_run(run)
+
+
+def parse_sample_overrides(value: str) -> dict[str, int]:
+    """Parse ``TRACKING_SAMPLE_OVERRIDES`` (``task=N,other_task=M``)."""
+    overrides: dict[str, int] = {}
+    for item in value.split(","):
+        if item.strip():
+            name, _, rate = item.partition("=")
+            overrides[name.strip()] = int(rate)
+    return overrides
+
+
+_current_run: ContextVar[BufferedRun | None] = ContextVar(
+    "nexus_buffered_run",
+    default=None,
+)
+_sink: TrackingSink | None = None
+_sink_pid: int | None = None
+_sink_lock = threading.Lock()
+_policy: TrackingPolicy | None = None
+
+
+def get_tracking_sink() -> TrackingSink:
+    """Return this process's sink, creating a fresh one after a fork."""
+    global _sink, _sink_pid  # noqa: PLW0603
+    with _sink_lock:
+        if _sink is None or _sink_pid != os.getpid():
+            settings = get_settings()
+            _sink = TrackingSink(
+                max_pending=settings.tracking_buffer_size,
+                flush_seconds=settings.tracking_flush_seconds,
+            )
+            _sink_pid = os.getpid()
+        return _sink
+
+
+def flush_tracking(timeout: float | None = None) -> bool:
+    """Wait until buffered tracking data is sent; False if ``timeout`` expired."""
+    with _sink_lock:
+        sink = _sink if _sink_pid == os.getpid() else None
+    return sink.flush(timeout) if sink is not None else True
+
+
+def shutdown_tracking_sink(timeout: float | None = None) -> bool:
+    """Flush and stop this process's sink (``TRACKING_SHUTDOWN_TIMEOUT_SECONDS``)."""
+    global _sink  # noqa: PLW0603
+    with _sink_lock:
+        sink = _sink if _sink_pid == os.getpid() else None
+        _sink = None
+    if sink is None:
+        return True
+    if _policy is not None:
+        _policy.flush_summaries(sink)
+    if timeout is None:
+        timeout = get_settings().tracking_shutdown_timeout_seconds
+    return sink.close(timeout)
+
+
+def get_tracking_policy() -> TrackingPolicy:
+    """Return the process-wide policy built from the ``TRACKING_*`` settings."""
+    global _policy  # noqa: PLW0603
+    with _sink_lock:
+        if _policy is None:
+            settings = get_settings()
+            _policy = TrackingPolicy(
+                sample_every=settings.tracking_sample_every,
+                overrides=parse_sample_overrides(settings.tracking_sample_overrides),
+                slow_seconds=settings.tracking_slow_task_seconds,
+                summary_seconds=settings.tracking_summary_seconds,
+            )
+        return _policy
+
+
+def reset_tracking_policy() -> None:
+    """Drop the process-wide policy and its counters (useful for tests)."""
+    global _policy  # noqa: PLW0603
+    with _sink_lock:
+        _policy = None
+
+
+atexit.register(shutdown_tracking_sink)
+
+
+@contextmanager
+def buffered_run(  # noqa: PLR0913
+    experiment: str,
+    run_name: str,
+    *,
+    tags: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+    tracking_uri: str | None = None,
+    hold: bool = False,
+) -> Iterator[BufferedRun]:
+    """Track a run through the process's :class:`TrackingSink`.
+
+    The run is nested under the enclosing buffered run, or else under an
+    active fluent MLflow run, and ends as ``FAILED`` when the block raises.
+    With ``hold`` (or inside a held run) its operations are kept in
+    ``run.held`` until released through the sink.
+    """
+    parent: BufferedRun | str | None = _current_run.get()
+    if parent is None and (active := mlflow.active_run()) is not None:
+        parent = active.info.run_id
+    held = parent.held if isinstance(parent, BufferedRun) else None
+    if hold and held is None:
+        held = []
+    sink = get_tracking_sink()
+    run = sink.start_run(
+        experiment,
+        run_name,
+        tags=tags,
+        parent=parent,
+        tracking_uri=tracking_uri,
+        held=held,
+    )
+    if params:
+        run.log_params(params)
+    token = _current_run.set(run)
+    try:
+        yield run
+    except BaseException:
+        sink.end_run(run, "FAILED")
+        raise
+    else:
+        sink.end_run(run, "FINISHED")
+    finally:
+        _current_run.reset(token)
+
+
+@contextmanager
+def buffered_task_run(  # noqa: PLR0913
+    task_name: str,
+    *,
+    raw_data_id: uuid.UUID | None = None,
+    correlation_id: str | None = None,
+    tracking_uri: str | None = None,
+    tags: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+) -> Iterator[BufferedRun]:
+    """Buffered counterpart of :func:`mlflow_task_run`.
+
+    Logs the same tags, params, status and duration, but yields a
+    :class:`BufferedRun` to log through instead of activating a fluent run.
+    Runs the :class:`TrackingPolicy` samples out are held back and only
+    reach MLflow when they fail or run slow; otherwise they are folded into
+    the task's summary run.
+    """
+    all_tags, all_params = _task_metadata(
+        task_name,
+        raw_data_id=raw_data_id,
+        correlation_id=correlation_id,
+        tags=tags,
+        params=params,
+    )
+    policy = get_tracking_policy()
+    parent = _current_run.get()
+    # A task run inside a held run shares that run's fate.
+    sampled = (
+        isinstance(parent, BufferedRun) and parent.held is not None
+    ) or policy.should_track(task_name)
+    held: list[_Operation] | None = None
+    failed = False
+    duration = 0.0
+    try:
+        with buffered_run(
+            "CeleryTasks",
+            f"task::{task_name}",
+            tags=all_tags,
+            params=all_params,
+            tracking_uri=tracking_uri,
+            hold=not sampled,
+        ) as run:
+            held = run.held
+            start = time.perf_counter()
+            try:
+                yield run
+            except BaseException:
+                failed = True
+                run.set_tag("status", "failed")
+                raise
+            else:
+                run.set_tag("status", "succeeded")
+            finally:
+                duration = time.perf_counter() - start
+                run.log_metric("duration_seconds", duration)
+    finally:
+        if sampled:
+            observe_tracking_task_run(task_name, "sampled")
+        elif held is not None:
+            policy.settle(run, held, task_name, failed=failed, duration=duration)
+
+
+__all__ = [
+    "BufferedRun",
+    "TrackingPolicy",
+    "TrackingSink",
+    "buffered_run",
+    "buffered_task_run",
+    "flush_tracking",
+    "get_tracking_policy",
+    "get_tracking_sink",
+    "log_task_artifact",
+    "mlflow_task_run",
+    "parse_sample_overrides",
+    "reset_tracking_policy",
+    "shutdown_tracking_sink",
+]
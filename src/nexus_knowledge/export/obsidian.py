@@ -27,7 +27,7 @@ def export_to_obsidian(
 
     Returns a list of created files (currently a single note).
     """
-    record = get_raw_data(session, raw_data_id)
+    record = get_raw_data(session, raw_data_id, include_content=False)
     if record is None:
         raise ExportError(f"raw_data {raw_data_id} not found")
 
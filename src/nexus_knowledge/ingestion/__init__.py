@@ -1,15 +1,59 @@
 """Ingestion utilities for NexusKnowledge."""
 
+from .connectors import ExportConnector, detect_connector, register_connector
 from .service import (
+    BatchIngestionResult,
+    ContentLoader,
     IngestionError,
+    PreparedPayload,
+    RawPayload,
     ingest_markdown_file,
+    ingest_prepared_payload,
+    ingest_prepared_payloads,
     ingest_raw_payload,
+    ingest_raw_payloads,
+    ingest_serialized,
     normalize_raw_data,
+    prepare_raw_bytes,
+    prepare_raw_payload,
+    store_prepared_content,
 )
+from .uploads import (
+    UploadError,
+    UploadManifest,
+    UploadSpool,
+    get_upload_spool,
+    ingest_spooled_upload,
+)
+from .vault import VaultImportResult, import_markdown_vault
+from .watcher import FolderWatcher, WatchCycleResult
 
 __all__ = [
+    "BatchIngestionResult",
+    "ContentLoader",
+    "ExportConnector",
+    "FolderWatcher",
     "IngestionError",
+    "PreparedPayload",
+    "RawPayload",
+    "UploadError",
+    "UploadManifest",
+    "UploadSpool",
+    "VaultImportResult",
+    "WatchCycleResult",
+    "detect_connector",
+    "get_upload_spool",
+    "import_markdown_vault",
     "ingest_markdown_file",
+    "ingest_prepared_payload",
+    "ingest_prepared_payloads",
     "ingest_raw_payload",
+    "ingest_raw_payloads",
+    "ingest_serialized",
+    "ingest_spooled_upload",
     "normalize_raw_data",
+    "prepare_raw_bytes",
+    "prepare_raw_payload",
+    "register_connector",
+    "store_prepared_content",
 ]
@@ -0,0 +1,454 @@
+"""Export-format connectors that stream conversations out of raw payloads.
+
+Each known export (ChatGPT, Claude, Gemini Takeout) is a list of
+conversation records, or a single record. A connector recognises one record
+and converts it into a :class:`ConversationPayload`. Records are decoded one
+at a time from the scanned document, so memory use is bounded by the
+largest conversation rather than the export. Payloads that no connector
+recognises fall back to the generic walker, which looks for ``messages`` and
+``conversations`` keys anywhere in the document.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+from collections.abc import Callable, Generator, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from nexus_knowledge.ingestion.jsonstream import (
+    container_end,
+    decode_value,
+    ensure_document_end,
+    iter_array_items,
+    iter_array_values,
+    iter_object_members,
+    skip_value,
+    skip_whitespace,
+)
+from nexus_knowledge.ingestion.payloads import (
+    ConversationPayload,
+    IngestionError,
+    JSONDict,
+    JSONValue,
+    MessagePayload,
+)
+
+GENERIC_CONNECTOR = "generic"
+_GENERIC_KEYS = frozenset({"messages", "conversations"})
+_HTML_TAG = re.compile(r"<[^>]+>")
+_HTML_BREAK = re.compile(r"<br\s*/?>|</p>|</li>|</h[1-6]>", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class ExportConnector:
+    """A known export format and how to convert one of its records.
+
+    ``required_keys`` are checked against an object's member names before it
+    is decoded, so a top-level object is only materialised when it can match.
+    ``matches`` refines detection on a decoded record. ``convert`` returns
+    None for records that are not conversations (e.g. non-prompt activity).
+    """
+
+    name: str
+    required_keys: frozenset[str]
+    convert: Callable[[JSONDict], ConversationPayload | None]
+    matches: Callable[[JSONDict], bool] | None = None
+
+    def accepts(self, record: JSONValue) -> bool:
+        return (
+            isinstance(record, dict)
+            and self.required_keys.issubset(record)
+            and (self.matches is None or self.matches(record))
+        )
+
+
+_CONNECTORS: dict[str, ExportConnector] = {}
+
+
+def register_connector(
+    connector: ExportConnector,
+    *,
+    replace: bool = False,
+) -> ExportConnector:
+    """Add ``connector`` to the registry; detection tries connectors in order."""
+    if connector.name == GENERIC_CONNECTOR or (
+        connector.name in _CONNECTORS and not replace
+    ):
+        raise ValueError(f"Connector '{connector.name}' is already registered")
+    _CONNECTORS[connector.name] = connector
+    return connector
+
+
+def get_connectors() -> tuple[ExportConnector, ...]:
+    """Return the registered connectors in detection order."""
+    return tuple(_CONNECTORS.values())
+
+
+def detect_connector(content: str) -> ExportConnector | None:
+    """Return the connector for ``content``, or None for the generic walker.
+
+    Only the first record of a top-level list is decoded to decide.
+    """
+    start = skip_whitespace(content, 0)
+    if start >= len(content):
+        raise json.JSONDecodeError("Expecting value", content, start)
+    if content[start] == "[":
+        first = next(iter_array_items(content, start), None)
+        if first is None or content[first[0]] != "{":
+            return None
+        return _detect_record(content, first[0])
+    if content[start] == "{":
+        return _detect_record(content, start)
+    return None
+
+
+def iter_conversations(content: str) -> Iterator[ConversationPayload]:
+    """Stream the conversations of a serialized payload using its connector."""
+    connector = detect_connector(content)
+    if connector is None:
+        yield from iter_generic_conversations(content)
+        return
+
+    start = skip_whitespace(content, 0)
+    if content[start] == "{":
+        record, end = decode_value(content, start)
+        conversation = connector.convert(record)
+        if conversation is not None:
+            yield conversation
+    else:
+        end = yield from _convert_records(connector, content, start)
+    ensure_document_end(content, end)
+
+
+def _convert_records(
+    connector: ExportConnector,
+    content: str,
+    index: int,
+) -> Generator[ConversationPayload, None, int]:
+    last_end: int | None = None
+    for record, record_end in iter_array_values(content, index):
+        last_end = record_end
+        if connector.accepts(record):
+            conversation = connector.convert(record)
+            if conversation is not None:
+                yield conversation
+    return container_end(content, index, last_end)
+
+
+def _detect_record(content: str, index: int) -> ExportConnector | None:
+    keys: set[str] = set()
+    for key, _, _ in iter_object_members(content, index):
+        if key in _GENERIC_KEYS:
+            # The repo's own payload shape; stop before scanning the rest.
+            return None
+        keys.add(key)
+    candidates = [
+        connector
+        for connector in _CONNECTORS.values()
+        if connector.required_keys.issubset(keys)
+    ]
+    if not candidates:
+        return None
+    record, _ = decode_value(content, index)
+    return next(
+        (connector for connector in candidates if connector.accepts(record)),
+        None,
+    )
+
+
+def iter_generic_conversations(content: str) -> Iterator[ConversationPayload]:
+    """Find conversations anywhere in a payload of unknown structure.
+
+    Every object with a ``messages`` list is a conversation. Members of an
+    object holding a ``conversations`` list are inherited as metadata by the
+    conversations below it. Values that can never contain a conversation are
+    skipped without decoding.
+    """
+    start = skip_whitespace(content, 0)
+    if start >= len(content):
+        raise json.JSONDecodeError("Expecting value", content, start)
+    end = yield from _stream_node(content, start, {})
+    ensure_document_end(content, end)
+
+
+def _stream_node(
+    text: str,
+    index: int,
+    inherited: JSONDict,
+) -> Generator[ConversationPayload, None, int]:
+    char = text[index]
+    if char == "[":
+        last_end: int | None = None
+        for item_start, item_end in iter_array_items(text, index):
+            yield from _stream_node(text, item_start, inherited)
+            last_end = item_end
+        return container_end(text, index, last_end)
+    if char != "{":
+        return skip_value(text, index)
+
+    members = {
+        key: (start, end) for key, start, end in iter_object_members(text, index)
+    }
+    last_member_end = max((end for _, end in members.values()), default=None)
+
+    messages_span = members.get("messages")
+    if messages_span is not None and text[messages_span[0]] == "[":
+        metadata = {
+            **inherited,
+            **_decode_members(text, members, exclude={"messages", "conversations"}),
+        }
+        messages, _ = decode_value(text, messages_span[0])
+        message_payloads: list[MessagePayload] = [
+            message for message in messages if isinstance(message, dict)
+        ]
+        if len(message_payloads) != len(messages):
+            raise IngestionError("Conversation messages must be objects")
+        yield ConversationPayload(metadata=metadata, messages=message_payloads)
+
+    conversations_span = members.get("conversations")
+    if conversations_span is not None and text[conversations_span[0]] == "[":
+        parent_meta = {
+            **inherited,
+            **_decode_members(text, members, exclude={"conversations"}),
+        }
+        for item_start, _ in iter_array_items(text, conversations_span[0]):
+            yield from _stream_node(text, item_start, parent_meta)
+    else:
+        for start, _ in members.values():
+            if text[start] in "[{":
+                yield from _stream_node(text, start, inherited)
+
+    return container_end(text, index, last_member_end)
+
+
+def _decode_members(
+    text: str,
+    members: dict[str, tuple[int, int]],
+    *,
+    exclude: set[str],
+) -> JSONDict:
+    return {
+        key: decode_value(text, start)[0]
+        for key, (start, _) in members.items()
+        if key not in exclude
+    }
+
+
+def _epoch_to_iso(value: JSONValue) -> str | None:
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, tz=UTC).isoformat()
+    return None
+
+
+def _without_none(values: JSONDict) -> JSONDict:
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def _chatgpt_text(content: JSONValue) -> str:
+    if not isinstance(content, dict):
+        return ""
+    parts = content.get("parts")
+    if isinstance(parts, list):
+        # Non-string parts are attachments (image pointers, audio) without text.
+        return "\n".join(part for part in parts if isinstance(part, str)).strip()
+    text = content.get("text")
+    return text.strip() if isinstance(text, str) else ""
+
+
+def _chatgpt_conversation(record: JSONDict) -> ConversationPayload | None:
+    """Linearise the active branch of a ChatGPT ``mapping`` tree.
+
+    The branch is followed from ``current_node`` up through ``parent`` links,
+    so regenerated answers on abandoned branches are left out and the walk
+    is iterative regardless of conversation length.
+    """
+    mapping = record.get("mapping")
+    if not isinstance(mapping, dict):
+        return None
+    node_id = record.get("current_node")
+    if not isinstance(node_id, str) or node_id not in mapping:
+        node_id = next(
+            (
+                key
+                for key, node in reversed(mapping.items())
+                if isinstance(node, dict) and not node.get("children")
+            ),
+            None,
+        )
+
+    branch: list[JSONDict] = []
+    visited: set[str] = set()
+    while isinstance(node_id, str) and node_id not in visited:
+        node = mapping.get(node_id)
+        if not isinstance(node, dict):
+            break
+        visited.add(node_id)
+        branch.append(node)
+        node_id = node.get("parent")
+
+    messages: list[MessagePayload] = []
+    for node in reversed(branch):
+        message = node.get("message")
+        if not isinstance(message, dict):
+            continue
+        text = _chatgpt_text(message.get("content"))
+        if not text:
+            continue
+        author = message.get("author")
+        role = author.get("role") if isinstance(author, dict) else None
+        messages.append(
+            {
+                "role": role or "unknown",
+                "content": text,
+                "timestamp": _epoch_to_iso(message.get("create_time")),
+                "metadata": _without_none({"message_id": message.get("id")}),
+            },
+        )
+    source_id = record.get("conversation_id") or record.get("id")
+    return ConversationPayload(
+        metadata=_without_none(
+            {
+                "source_platform": "chatgpt",
+                "source_id": source_id if isinstance(source_id, str) else None,
+                "title": record.get("title"),
+                "created_at": _epoch_to_iso(record.get("create_time")),
+                "updated_at": _epoch_to_iso(record.get("update_time")),
+            },
+        ),
+        messages=messages,
+    )
+
+
+def _claude_text(message: JSONDict) -> str:
+    text = message.get("text")
+    if isinstance(text, str) and text.strip():
+        return text.strip()
+    blocks = message.get("content")
+    if not isinstance(blocks, list):
+        return ""
+    texts = (
+        block.get("text")
+        for block in blocks
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+    return "\n".join(text for text in texts if isinstance(text, str)).strip()
+
+
+def _claude_conversation(record: JSONDict) -> ConversationPayload | None:
+    chat_messages = record.get("chat_messages")
+    if not isinstance(chat_messages, list):
+        return None
+    messages: list[MessagePayload] = []
+    for message in chat_messages:
+        if not isinstance(message, dict):
+            raise IngestionError("Conversation messages must be objects")
+        text = _claude_text(message)
+        if not text:
+            continue
+        sender = message.get("sender")
+        messages.append(
+            {
+                "role": "user" if sender == "human" else sender or "unknown",
+                "content": text,
+                "timestamp": message.get("created_at"),
+                "metadata": _without_none({"message_id": message.get("uuid")}),
+            },
+        )
+    return ConversationPayload(
+        metadata=_without_none(
+            {
+                "source_platform": "claude",
+                "source_id": record.get("uuid"),
+                "title": record.get("name"),
+                "created_at": record.get("created_at"),
+                "updated_at": record.get("updated_at"),
+            },
+        ),
+        messages=messages,
+    )
+
+
+def _is_gemini_activity(record: JSONDict) -> bool:
+    header = record.get("header")
+    products = record.get("products")
+    return (isinstance(header, str) and "Gemini" in header) or (
+        isinstance(products, list) and any("Gemini" in str(p) for p in products)
+    )
+
+
+def _html_to_text(markup: str) -> str:
+    text = _HTML_TAG.sub("", _HTML_BREAK.sub("\n", markup))
+    return html.unescape(text).strip()
+
+
+def _gemini_conversation(record: JSONDict) -> ConversationPayload | None:
+    """Convert one Takeout "My Activity" entry into a prompt/response pair.
+
+    Takeout does not group Gemini activity into threads, so every prompt
+    becomes its own conversation, identified by its activity timestamp.
+    """
+    title = record.get("title")
+    if not isinstance(title, str) or not title.startswith("Prompted "):
+        return None
+    timestamp = record.get("time")
+    messages: list[MessagePayload] = [
+        {"role": "user", "content": title.removeprefix("Prompted ").strip()},
+    ]
+    items = record.get("safeHtmlItem")
+    if isinstance(items, list):
+        fragments = (item.get("html") for item in items if isinstance(item, dict))
+        response = "\n".join(
+            _html_to_text(html) for html in fragments if isinstance(html, str)
+        ).strip()
+        if response:
+            messages.append({"role": "assistant", "content": response})
+    for message in messages:
+        message["timestamp"] = timestamp
+    return ConversationPayload(
+        metadata=_without_none(
+            {
+                "source_platform": "gemini",
+                "source_id": f"gemini-activity:{timestamp}" if timestamp else None,
+                "created_at": timestamp,
+            },
+        ),
+        messages=messages,
+    )
+
+
+register_connector(
+    ExportConnector(
+        name="chatgpt",
+        required_keys=frozenset({"mapping"}),
+        convert=_chatgpt_conversation,
+    ),
+)
+register_connector(
+    ExportConnector(
+        name="claude",
+        required_keys=frozenset({"chat_messages"}),
+        convert=_claude_conversation,
+    ),
+)
+register_connector(
+    ExportConnector(
+        name="gemini",
+        required_keys=frozenset({"title", "time"}),
+        convert=_gemini_conversation,
+        matches=_is_gemini_activity,
+    ),
+)
+
+
+__all__ = [
+    "GENERIC_CONNECTOR",
+    "ExportConnector",
+    "detect_connector",
+    "get_connectors",
+    "iter_conversations",
+    "iter_generic_conversations",
+    "register_connector",
+]
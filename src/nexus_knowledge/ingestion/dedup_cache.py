@@ -0,0 +1,289 @@
+"""In-process content-hash cache used to short-circuit ingestion dedup lookups.
+
+Each database engine gets its own cache holding a bounded LRU map of known
+``content_hash`` values to ``raw_data`` identifiers plus an optional Bloom
+filter. Entries are only published once the inserting transaction commits,
+and ORM deletes of ``raw_data`` rows evict them immediately, so a hit is
+trusted without a database round trip. Deletes the cache cannot observe (raw
+SQL, cascades, other processes) are bounded by the entry TTL.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import (
+    Mapper,
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    object_session,
+)
+
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.db.models import RawData
+from nexus_knowledge.observability import observe_dedup_cache_lookup
+
+_PENDING_KEY = "nexus_dedup_cache_pending"
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CachedRawData:
+    """Committed state of a raw_data row as last written by this process."""
+
+    record_id: uuid.UUID
+    metadata: dict[str, Any] = field(default_factory=dict)
+    source_id: str | None = None
+
+    @classmethod
+    def from_record(cls, record: RawData) -> CachedRawData:
+        return cls(
+            record_id=record.id,
+            metadata=dict(record.metadata_ or {}),
+            source_id=record.source_id,
+        )
+
+    def covers(self, metadata: dict[str, Any], source_id: str | None) -> bool:
+        """Return True when merging ``metadata``/``source_id`` would be a no-op."""
+        if source_id and not self.source_id:
+            return False
+        return all(
+            self.metadata.get(key, _MISSING) == value for key, value in metadata.items()
+        )
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter keyed by hex SHA-256 digests."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.size = max(bits, 8)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, content_hash: str) -> list[int]:
+        # The key is already a uniformly distributed digest, so two slices of
+        # it are enough for double hashing.
+        first = int(content_hash[:16], 16)
+        second = int(content_hash[16:32], 16) | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, content_hash: str) -> None:
+        for position in self._positions(content_hash):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(content_hash)
+        )
+
+
+class ContentHashCache:
+    """Bounded LRU of content hashes to raw_data ids with an optional Bloom filter."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        *,
+        ttl_seconds: float = 0,
+        bloom_capacity: int = 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[CachedRawData, float]] = OrderedDict()
+        self._bloom = BloomFilter(bloom_capacity) if bloom_capacity > 0 else None
+        self._bloom_ready = False
+        self._lock = threading.Lock()
+
+    def get(self, content_hash: str) -> CachedRawData | None:
+        """Return the cached row state for ``content_hash`` if present and fresh."""
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None and self.ttl_seconds and entry[1] < time.monotonic():
+                del self._entries[content_hash]
+                entry = None
+            if entry is None:
+                observe_dedup_cache_lookup("miss")
+                return None
+            self._entries.move_to_end(content_hash)
+        observe_dedup_cache_lookup("hit")
+        return entry[0]
+
+    def put(self, content_hash: str, cached: CachedRawData) -> None:
+        """Record committed row state, evicting the least recently used entry."""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[content_hash] = (cached, expires_at)
+            self._entries.move_to_end(content_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._bloom is not None:
+                self._bloom.add(content_hash)
+
+    def discard(self, content_hash: str) -> None:
+        """Forget a hash, e.g. after its row was deleted."""
+        with self._lock:
+            self._entries.pop(content_hash, None)
+
+    def mark_stale(self, content_hash: str) -> None:
+        """Forget a hash whose cached row no longer exists in the database."""
+        observe_dedup_cache_lookup("stale")
+        self.discard(content_hash)
+
+    def clear(self) -> None:
+        """Drop every LRU entry (the Bloom filter only yields false positives)."""
+        with self._lock:
+            self._entries.clear()
+
+    def is_known_absent(self, session: Session, content_hash: str) -> bool:
+        """Return True when the Bloom filter proves the hash was never stored.
+
+        The filter is seeded from ``raw_data`` on first use. Rows inserted by
+        other processes afterwards are not reflected, so callers must still
+        tolerate a conflicting insert.
+        """
+        if self._bloom is None:
+            return False
+        if not self._bloom_ready:
+            self._warm_bloom(session)
+        with self._lock:
+            absent = content_hash not in self._bloom
+        if absent:
+            observe_dedup_cache_lookup("bloom_absent")
+        return absent
+
+    def _warm_bloom(self, session: Session) -> None:
+        stmt = (
+            select(RawData.content_hash)
+            .where(RawData.content_hash.is_not(None))
+            .execution_options(yield_per=5000)
+        )
+        hashes = session.scalars(stmt)
+        with self._lock:
+            if self._bloom_ready or self._bloom is None:
+                return
+            for content_hash in hashes:
+                if content_hash is not None:
+                    self._bloom.add(content_hash)
+            self._bloom_ready = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_CACHES: weakref.WeakKeyDictionary[Engine, ContentHashCache] = (
+    weakref.WeakKeyDictionary()
+)
+_CACHES_LOCK = threading.Lock()
+
+
+def _engine_for(session: Session) -> Engine:
+    bind = session.get_bind()
+    return bind if isinstance(bind, Engine) else bind.engine
+
+
+def get_dedup_cache(session: Session) -> ContentHashCache | None:
+    """Return the cache for the session's engine, or None when disabled."""
+    engine = _engine_for(session)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(engine)
+        if cache is None:
+            settings = get_settings()
+            if settings.ingest_dedup_cache_size <= 0:
+                return None
+            cache = ContentHashCache(
+                settings.ingest_dedup_cache_size,
+                ttl_seconds=settings.ingest_dedup_cache_ttl_seconds,
+                bloom_capacity=settings.ingest_dedup_bloom_capacity,
+            )
+            _CACHES[engine] = cache
+        return cache
+
+
+def reset_dedup_caches() -> None:
+    """Drop every per-engine cache (useful for tests)."""
+    with _CACHES_LOCK:
+        _CACHES.clear()
+
+
+def remember(
+    session: Session,
+    cache: ContentHashCache,
+    content_hash: str,
+    cached: CachedRawData,
+) -> None:
+    """Stage row state to be published once the session commits."""
+    pending: dict[str, tuple[ContentHashCache, CachedRawData]] = (
+        session.info.setdefault(_PENDING_KEY, {})
+    )
+    pending[content_hash] = (cache, cached)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for content_hash, (cache, cached) in pending.items():
+        cache.put(content_hash, cached)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(
+    session: Session,
+    previous_transaction: SessionTransaction,
+) -> None:
+    # Any rollback, including a savepoint, may undo a staged insert; dropping
+    # the staged entries only costs a later cache miss.
+    session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(RawData, "after_delete")
+def _evict_deleted(
+    mapper: Mapper[RawData],
+    connection: Connection,
+    target: RawData,
+) -> None:
+    if not target.content_hash:
+        return
+    session = object_session(target)
+    if session is not None:
+        session.info.get(_PENDING_KEY, {}).pop(target.content_hash, None)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(connection.engine)
+    if cache is not None:
+        cache.discard(target.content_hash)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _evict_bulk_deletes(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_delete:
+        return
+    if not any(mapper.class_ is RawData for mapper in orm_execute_state.all_mappers):
+        return
+    orm_execute_state.session.info.pop(_PENDING_KEY, None)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(_engine_for(orm_execute_state.session))
+    if cache is not None:
+        cache.clear()
+
+
+__all__ = [
+    "BloomFilter",
+    "CachedRawData",
+    "ContentHashCache",
+    "get_dedup_cache",
+    "remember",
+    "reset_dedup_caches",
+]
@@ -0,0 +1,171 @@
+"""Incremental JSON scanning helpers for large serialized payloads.
+
+The helpers operate on positions within an already loaded JSON document and
+only decode the values a caller asks for, so the full object graph is never
+materialised at once.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from _json import scanstring
+from collections.abc import Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]', re.DOTALL)
+_SCALAR_END = re.compile(r"[^,\]}\s]*")
+_DECODER = json.JSONDecoder()
+
+
+def _discard_object(_pairs: list[tuple[str, Any]]) -> None:
+    return None
+
+
+# Objects decode to None as soon as they close, so validating a document only
+# ever holds the members of the objects currently open.
+_VALIDATOR = json.JSONDecoder(object_pairs_hook=_discard_object)
+
+
+def skip_whitespace(text: str, index: int) -> int:
+    """Return the first non-whitespace position at or after ``index``."""
+    match = _WHITESPACE.match(text, index)
+    return match.end() if match else index
+
+
+def decode_value(text: str, index: int) -> tuple[Any, int]:
+    """Decode the JSON value starting at ``index`` and return it with its end."""
+    return _DECODER.raw_decode(text, index)
+
+
+def skip_value(text: str, index: int) -> int:
+    """Return the end position of the JSON value at ``index`` without decoding it."""
+    if index >= len(text):
+        raise json.JSONDecodeError("Expecting value", text, index)
+    char = text[index]
+    if char == '"':
+        return scanstring(text, index + 1)[1]
+    if char not in "[{":
+        match = _SCALAR_END.match(text, index)
+        end = match.end() if match else index
+        if end == index:
+            raise json.JSONDecodeError("Expecting value", text, index)
+        return end
+
+    depth = 0
+    for match in _STRUCTURE_TOKEN.finditer(text, index):
+        symbol = match.group()
+        if symbol in "[{":
+            depth += 1
+        elif symbol in "]}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise json.JSONDecodeError("Unterminated container", text, index)
+
+
+def iter_array_items(text: str, index: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(item_start, item_end)`` for each element of the array at ``index``."""
+    if text[index] != "[":
+        raise json.JSONDecodeError("Expecting '['", text, index)
+    position = skip_whitespace(text, index + 1)
+    if text[position : position + 1] == "]":
+        return
+    while True:
+        item_end = skip_value(text, position)
+        yield position, item_end
+        position = skip_whitespace(text, item_end)
+        delimiter = text[position : position + 1]
+        if delimiter == "]":
+            return
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = skip_whitespace(text, position + 1)
+
+
+def iter_array_values(text: str, index: int) -> Iterator[tuple[Any, int]]:
+    """Decode and yield ``(value, value_end)`` for each element of an array.
+
+    Each element is decoded once by the C scanner, which is cheaper than
+    locating it with :func:`skip_value` and decoding it afterwards.
+    """
+    if text[index] != "[":
+        raise json.JSONDecodeError("Expecting '['", text, index)
+    position = skip_whitespace(text, index + 1)
+    if text[position : position + 1] == "]":
+        return
+    while True:
+        value, value_end = decode_value(text, position)
+        yield value, value_end
+        position = skip_whitespace(text, value_end)
+        delimiter = text[position : position + 1]
+        if delimiter == "]":
+            return
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = skip_whitespace(text, position + 1)
+
+
+def iter_object_members(text: str, index: int) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(key, value_start, value_end)`` for each member of an object."""
+    if text[index] != "{":
+        raise json.JSONDecodeError("Expecting '{'", text, index)
+    position = skip_whitespace(text, index + 1)
+    if text[position : position + 1] == "}":
+        return
+    while True:
+        if text[position : position + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name", text, position)
+        key, position = scanstring(text, position + 1)
+        position = skip_whitespace(text, position)
+        if text[position : position + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+        value_start = skip_whitespace(text, position + 1)
+        value_end = skip_value(text, value_start)
+        yield key, value_start, value_end
+        position = skip_whitespace(text, value_end)
+        delimiter = text[position : position + 1]
+        if delimiter == "}":
+            return
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = skip_whitespace(text, position + 1)
+
+
+def container_end(text: str, index: int, last_value_end: int | None) -> int:
+    """Return the position just past the container opened at ``index``."""
+    position = skip_whitespace(
+        text,
+        index + 1 if last_value_end is None else last_value_end,
+    )
+    return position + 1
+
+
+def ensure_document_end(text: str, index: int) -> None:
+    """Raise if anything other than whitespace follows the top-level value."""
+    position = skip_whitespace(text, index)
+    if position != len(text):
+        raise json.JSONDecodeError("Extra data", text, position)
+
+
+def validate_document(text: str) -> None:
+    """Raise ``JSONDecodeError`` unless ``text`` is exactly one JSON value.
+
+    Runs the C scanner once over the text without materialising the document.
+    """
+    _, end = _VALIDATOR.raw_decode(text, skip_whitespace(text, 0))
+    ensure_document_end(text, end)
+
+
+__all__ = [
+    "container_end",
+    "decode_value",
+    "ensure_document_end",
+    "iter_array_items",
+    "iter_array_values",
+    "iter_object_members",
+    "skip_value",
+    "skip_whitespace",
+    "validate_document",
+]
@@ -0,0 +1,35 @@
+"""Payload types shared by the ingestion service and export connectors."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from typing import TypeAlias
+
+JSONPrimitive = str | int | float | bool | None
+JSONValue: TypeAlias = JSONPrimitive | dict[str, "JSONValue"] | list["JSONValue"]
+JSONDict: TypeAlias = dict[str, JSONValue]
+MessagePayload: TypeAlias = dict[str, JSONValue]
+
+
+class IngestionError(RuntimeError):
+    """Raised when ingestion or normalization fails."""
+
+
+@dataclass
+class ConversationPayload:
+    """Flattened representation of a conversation ready for normalization."""
+
+    metadata: JSONDict
+    messages: list[MessagePayload]
+    conversation_id: uuid.UUID | None = None
+
+
+__all__ = [
+    "ConversationPayload",
+    "IngestionError",
+    "JSONDict",
+    "JSONPrimitive",
+    "JSONValue",
+    "MessagePayload",
+]
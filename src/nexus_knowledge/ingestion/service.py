@@ -5,39 +5,92 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
-from typing import TypeAlias
+from typing import Any, TypeAlias
 
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from nexus_knowledge.db.models import ConversationTurn
+from nexus_knowledge.db.models import RawData
 from nexus_knowledge.db.repository import (
     create_conversation_turns,
-    create_raw_data,
+    delete_analysis_for_turns,
+    get_conversation_fingerprints,
     get_raw_data,
     get_raw_data_by_hash,
+    get_raw_data_by_hashes,
+    get_turns_by_conversation,
+    insert_raw_data_ignore_conflicts,
+    link_raw_data_conversations,
+    offload_raw_content,
+    read_raw_content,
+    record_conversation_fingerprints,
+    update_conversation_turns,
     update_raw_data_status,
 )
+from nexus_knowledge.ingestion.connectors import iter_conversations
+from nexus_knowledge.ingestion.dedup_cache import (
+    CachedRawData,
+    ContentHashCache,
+    get_dedup_cache,
+    remember,
+)
+from nexus_knowledge.ingestion.jsonstream import validate_document
+from nexus_knowledge.ingestion.payloads import (
+    ConversationPayload,
+    IngestionError,
+    JSONDict,
+    JSONValue,
+)
+from nexus_knowledge.storage import BlobStoreError
+
+# Column values for a ``conversation_turns`` row, keyed by ORM attribute name.
+TurnRow: TypeAlias = dict[str, Any]
+# Produces ``(content, content_ref)`` for a new raw_data row on demand, so a
+# payload is only read when it is not a duplicate.
+ContentLoader: TypeAlias = Callable[[], tuple[str, str | None]]
 
-JSONPrimitive = str | int | float | bool | None
-JSONValue: TypeAlias = JSONPrimitive | dict[str, "JSONValue"] | list["JSONValue"]
-JSONDict: TypeAlias = dict[str, JSONValue]
-MessagePayload: TypeAlias = dict[str, JSONValue]
+DEFAULT_NORMALIZE_BATCH_SIZE = 500
+FINGERPRINT_CHUNK_SIZE = 200
 
 
-class IngestionError(RuntimeError):
-    """Raised when ingestion or normalization fails."""
+@dataclass
+class RawPayload:
+    """A single payload submitted for ingestion."""
+
+    source_type: str
+    content: JSONValue
+    metadata: JSONDict | None = None
+    source_id: str | None = None
 
 
 @dataclass
-class ConversationPayload:
-    """Flattened representation of a conversation ready for normalization."""
+class PreparedPayload:
+    """A serialised, hashed payload ready to be written to ``raw_data``.
+
+    ``content_ref`` is set once the content has been moved to the raw content
+    store (see :func:`store_prepared_content`); ``content`` is empty then.
+    """
 
+    source_type: str
+    content: str
+    content_hash: str
     metadata: JSONDict
-    messages: list[MessagePayload]
+    source_id: str | None = None
+    content_ref: str | None = None
+
+
+@dataclass
+class BatchIngestionResult:
+    """Outcome of a batch ingestion, aligned with the submitted payload order."""
+
+    raw_data_ids: list[uuid.UUID]
+    created_ids: list[uuid.UUID]
+    pending_normalization: list[uuid.UUID]
 
 
 def ingest_raw_payload(
@@ -48,32 +101,330 @@ def ingest_raw_payload(
     metadata: JSONDict | None = None,
     source_id: str | None = None,
 ) -> uuid.UUID:
-    """Persist raw ingestion payload and return its identifier."""
+    """Persist raw ingestion payload and return its identifier.
+
+    Re-ingesting a payload this process has already committed is answered from
+    the in-process dedup cache without a query, as long as the supplied
+    metadata is already recorded on the row.
+    """
     serialized = _serialise_content(content)
-    content_hash = _compute_content_hash(serialized)
+    return ingest_serialized(
+        session,
+        source_type=source_type,
+        serialized=serialized,
+        content_hash=_compute_content_hash(serialized),
+        metadata=metadata,
+        source_id=source_id,
+    )
+
+
+def ingest_serialized(  # noqa: PLR0913
+    session: Session,
+    *,
+    source_type: str,
+    serialized: str | ContentLoader,
+    content_hash: str,
+    metadata: JSONDict | None,
+    source_id: str | None,
+) -> uuid.UUID:
+    """Persist an already serialised and hashed payload and return its id.
+
+    ``content_hash`` is trusted as given and is the deduplication key.
+    ``serialized`` may be a :data:`ContentLoader`, which is called only when no
+    row with that hash exists, so a duplicate is resolved without reading the
+    payload.
+    """
     metadata_payload = dict(metadata or {})
     if source_id:
         metadata_payload.setdefault("source_id", source_id)
 
-    existing = get_raw_data_by_hash(session, content_hash)
-    if existing is not None:
-        merged_metadata = {**(existing.metadata_ or {}), **metadata_payload}
-        if merged_metadata != existing.metadata_:
-            existing.metadata_ = merged_metadata
-        if source_id and not existing.source_id:
-            existing.source_id = source_id
-        session.flush()
-        return existing.id
-
-    record = create_raw_data(
+    cache = get_dedup_cache(session)
+    cached = cache.get(content_hash) if cache is not None else None
+    if cached is not None and cached.covers(metadata_payload, source_id):
+        return cached.record_id
+
+    existing = _find_existing(session, cache, content_hash, cached)
+    if existing is None:
+        content, content_ref = (
+            (serialized, None) if isinstance(serialized, str) else serialized()
+        )
+        row = _raw_data_row(
+            source_type=source_type,
+            content=content,
+            content_ref=content_ref,
+            content_hash=content_hash,
+            metadata=metadata_payload,
+            source_id=source_id,
+        )
+        inserted = insert_raw_data_ignore_conflicts(session, [row])
+        if content_hash in inserted:
+            record_id = inserted[content_hash]
+            _cache_on_commit(
+                session,
+                cache,
+                content_hash,
+                CachedRawData(record_id, metadata_payload, source_id),
+            )
+            return record_id
+        # Lost a race with a concurrent ingest of the same payload.
+        existing = get_raw_data_by_hash(session, content_hash, include_content=False)
+        if existing is None:  # pragma: no cover - row vanished mid-transaction
+            raise IngestionError(f"raw_data with hash {content_hash} disappeared")
+
+    _merge_existing(existing, metadata_payload, source_id)
+    session.flush()
+    _cache_on_commit(session, cache, content_hash, CachedRawData.from_record(existing))
+    return existing.id
+
+
+def ingest_prepared_payload(session: Session, prepared: PreparedPayload) -> uuid.UUID:
+    """Persist one prepared payload, deduplicating like :func:`ingest_raw_payload`.
+
+    Lets callers serialise, hash and store the content elsewhere (for example
+    in a thread pool) and keep only the database work on the calling thread.
+    """
+    return ingest_serialized(
         session,
+        source_type=prepared.source_type,
+        serialized=lambda: (prepared.content, prepared.content_ref),
+        content_hash=prepared.content_hash,
+        metadata=prepared.metadata,
+        source_id=prepared.source_id,
+    )
+
+
+def ingest_raw_payloads(
+    session: Session,
+    payloads: Sequence[RawPayload],
+) -> BatchIngestionResult:
+    """Persist many raw payloads with one dedup lookup and one bulk insert."""
+    return ingest_prepared_payloads(
+        session,
+        [prepare_raw_payload(payload) for payload in payloads],
+    )
+
+
+def prepare_raw_payload(payload: RawPayload) -> PreparedPayload:
+    """Serialise and hash a payload without touching the database.
+
+    The result is picklable, so expensive preparation can run in worker
+    processes before the rows are written by :func:`ingest_prepared_payloads`.
+    """
+    serialized = _serialise_content(payload.content)
+    metadata_payload = dict(payload.metadata or {})
+    if payload.source_id:
+        metadata_payload.setdefault("source_id", payload.source_id)
+    return PreparedPayload(
+        source_type=payload.source_type,
+        content=serialized,
+        content_hash=_compute_content_hash(serialized),
+        metadata=metadata_payload,
+        source_id=payload.source_id,
+    )
+
+
+def store_prepared_content(prepared: PreparedPayload) -> PreparedPayload:
+    """Move a prepared payload's content to the raw content store when eligible.
+
+    Blob writes are fsynced, so callers on an event loop run this in a thread
+    pool before handing the payload to the database. Payloads below
+    ``RAW_CONTENT_STORE_MIN_BYTES``, or without a configured store, are
+    returned unchanged.
+    """
+    if prepared.content_ref is not None:
+        return prepared
+    content, content_ref = offload_raw_content(prepared.content, prepared.content_hash)
+    if content_ref is None:
+        return prepared
+    return replace(prepared, content=content, content_ref=content_ref)
+
+
+def prepare_raw_bytes(
+    body: bytes | bytearray,
+    *,
+    source_type: str,
+    metadata: JSONDict | None = None,
+    source_id: str | None = None,
+    content_hash: str | None = None,
+) -> PreparedPayload:
+    """Validate a JSON document received as bytes and prepare it unchanged.
+
+    Unlike :func:`prepare_raw_payload` the document is never parsed into Python
+    objects or re-serialised: it is decoded, checked in one scanner pass and
+    stored exactly as received. The content hash is taken over those bytes
+    (``content_hash`` may carry one computed while the body was received), so
+    it matches ingesting the same text as string content, but not the sorted
+    re-serialisation used for object content.
+    """
+    try:
+        serialized = body.decode("utf-8")
+        validate_document(serialized)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise IngestionError(f"Payload is not a valid JSON document: {exc}") from exc
+    metadata_payload = dict(metadata or {})
+    if source_id:
+        metadata_payload.setdefault("source_id", source_id)
+    return PreparedPayload(
         source_type=source_type,
         content=serialized,
-        source_id=source_id,
+        content_hash=content_hash or hashlib.sha256(body).hexdigest(),
         metadata=metadata_payload,
-        content_hash=content_hash,
+        source_id=source_id,
+    )
+
+
+def ingest_prepared_payloads(
+    session: Session,
+    payloads: Sequence[PreparedPayload],
+) -> BatchIngestionResult:
+    """Persist prepared payloads with one dedup lookup and one bulk insert.
+
+    Payloads repeated within the batch collapse onto a single row. Hashes the
+    dedup Bloom filter proves absent are left out of the lookup, and hashes
+    that are inserted concurrently by another transaction are resolved after
+    the insert instead of failing on the unique ``content_hash`` constraint.
+    """
+    hashes = [payload.content_hash for payload in payloads]
+    prepared: dict[str, PreparedPayload] = {}
+    for payload in payloads:
+        entry = prepared.get(payload.content_hash)
+        if entry is None:
+            prepared[payload.content_hash] = payload
+            continue
+        prepared[payload.content_hash] = replace(
+            entry,
+            metadata={**entry.metadata, **payload.metadata},
+            source_id=entry.source_id or payload.source_id,
+        )
+
+    cache = get_dedup_cache(session)
+    lookup = [
+        content_hash
+        for content_hash in prepared
+        if cache is None or not cache.is_known_absent(session, content_hash)
+    ]
+    existing = get_raw_data_by_hashes(session, lookup, include_content=False)
+    new_rows = [
+        _raw_data_row(
+            source_type=entry.source_type,
+            content=entry.content,
+            content_ref=entry.content_ref,
+            content_hash=content_hash,
+            metadata=entry.metadata,
+            source_id=entry.source_id,
+        )
+        for content_hash, entry in prepared.items()
+        if content_hash not in existing
+    ]
+    inserted = insert_raw_data_ignore_conflicts(session, new_rows)
+
+    raced = [
+        content_hash
+        for content_hash in prepared
+        if content_hash not in existing and content_hash not in inserted
+    ]
+    if raced:
+        existing.update(get_raw_data_by_hashes(session, raced, include_content=False))
+
+    resolved: dict[str, uuid.UUID] = dict(inserted)
+    pending: list[uuid.UUID] = list(inserted.values())
+    for content_hash, record in existing.items():
+        entry = prepared[content_hash]
+        _merge_existing(record, entry.metadata, entry.source_id)
+        resolved[content_hash] = record.id
+        if record.status == "INGESTED":
+            pending.append(record.id)
+    session.flush()
+
+    for content_hash, record_id in inserted.items():
+        entry = prepared[content_hash]
+        _cache_on_commit(
+            session,
+            cache,
+            content_hash,
+            CachedRawData(record_id, entry.metadata, entry.source_id),
+        )
+    for content_hash, record in existing.items():
+        _cache_on_commit(
+            session,
+            cache,
+            content_hash,
+            CachedRawData.from_record(record),
+        )
+
+    missing = set(prepared) - set(resolved)
+    if missing:  # pragma: no cover - rows vanished mid-transaction
+        raise IngestionError(f"Unable to resolve {len(missing)} ingested payload(s)")
+
+    return BatchIngestionResult(
+        raw_data_ids=[resolved[content_hash] for content_hash in hashes],
+        created_ids=list(inserted.values()),
+        pending_normalization=pending,
     )
-    return record.id
+
+
+def _raw_data_row(  # noqa: PLR0913
+    *,
+    source_type: str,
+    content: str,
+    content_hash: str,
+    metadata: JSONDict,
+    source_id: str | None,
+    content_ref: str | None = None,
+) -> dict[str, object]:
+    return {
+        "source_type": source_type,
+        "content": content,
+        "content_ref": content_ref,
+        "content_hash": content_hash,
+        "metadata_": metadata,
+        "source_id": source_id,
+        "status": "INGESTED",
+    }
+
+
+def _find_existing(
+    session: Session,
+    cache: ContentHashCache | None,
+    content_hash: str,
+    cached: CachedRawData | None,
+) -> RawData | None:
+    if cache is None:
+        return get_raw_data_by_hash(session, content_hash, include_content=False)
+    if cached is not None:
+        existing = get_raw_data(
+            session,
+            cached.record_id,
+            include_content=False,
+        )
+        if existing is not None:
+            return existing
+        cache.mark_stale(content_hash)
+    elif cache.is_known_absent(session, content_hash):
+        return None
+    return get_raw_data_by_hash(session, content_hash, include_content=False)
+
+
+def _cache_on_commit(
+    session: Session,
+    cache: ContentHashCache | None,
+    content_hash: str,
+    cached: CachedRawData,
+) -> None:
+    if cache is not None:
+        remember(session, cache, content_hash, cached)
+
+
+def _merge_existing(
+    existing: RawData,
+    metadata_payload: JSONDict,
+    source_id: str | None,
+) -> None:
+    merged_metadata = {**(existing.metadata_ or {}), **metadata_payload}
+    if merged_metadata != existing.metadata_:
+        existing.metadata_ = merged_metadata
+    if source_id and not existing.source_id:
+        existing.source_id = source_id
 
 
 def ingest_markdown_file(
@@ -86,13 +437,39 @@ def ingest_markdown_file(
     """Ingest a Markdown document as a single-turn conversation."""
     file_path = Path(path)
     content = file_path.read_text(encoding="utf-8")
-    title = _extract_markdown_title(content) or file_path.stem
-    mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC)
+    payload = build_markdown_payload(
+        file_path,
+        content,
+        file_path.stat().st_mtime,
+        dataset=dataset,
+        tags=tags,
+    )
+    return ingest_raw_payload(
+        session,
+        source_type=payload.source_type,
+        content=payload.content,
+        metadata=payload.metadata,
+        source_id=payload.source_id,
+    )
+
+
+def build_markdown_payload(
+    path: Path,
+    content: str,
+    modified_at: float,
+    *,
+    dataset: str | None = None,
+    tags: Sequence[str] | None = None,
+) -> RawPayload:
+    """Describe a Markdown note as a single-turn conversation payload."""
+    resolved = str(path.resolve())
+    title = _extract_markdown_title(content) or path.stem
+    mtime = datetime.fromtimestamp(modified_at, tz=UTC)
 
     metadata: JSONDict = {
         "title": title,
-        "source_path": str(file_path.resolve()),
-        "source_filename": file_path.name,
+        "source_path": resolved,
+        "source_filename": path.name,
         "source_modified_at": mtime.isoformat(),
         "imported_at": datetime.now(UTC).isoformat(),
     }
@@ -101,10 +478,10 @@ def ingest_markdown_file(
     if tags:
         metadata["tags"] = list(tags)
 
-    payload: JSONDict = {
+    content_payload: JSONDict = {
         "version": "1.0",
         "source_platform": "markdown",
-        "source_id": str(file_path.resolve()),
+        "source_id": resolved,
         "messages": [
             {
                 "role": "user",
@@ -113,67 +490,85 @@ def ingest_markdown_file(
             },
         ],
     }
-
-    return ingest_raw_payload(
-        session,
+    return RawPayload(
         source_type="markdown",
-        content=payload,
+        content=content_payload,
         metadata=metadata,
-        source_id=str(file_path.resolve()),
+        source_id=resolved,
     )
 
 
-def normalize_raw_data(session: Session, record_id: uuid.UUID) -> int:
-    """Transform raw data entry into normalized conversation turns."""
+def normalize_raw_data(  # noqa: PLR0913
+    session: Session,
+    record_id: uuid.UUID,
+    *,
+    streaming: bool = False,
+    incremental: bool = False,
+    batch_size: int = DEFAULT_NORMALIZE_BATCH_SIZE,
+    turn_sink: list[TurnRow] | None = None,
+) -> int:
+    """Transform raw data entry into normalized conversation turns.
+
+    With ``streaming`` enabled the payload is scanned incrementally: conversations
+    are decoded one at a time and turns are flushed every ``batch_size`` rows, so
+    memory use no longer grows with the number of conversations in the export.
+
+    With ``incremental`` enabled the payload is diffed against turns already
+    stored for the same conversations: appended turns are inserted, changed
+    turns are updated in place (dropping their stale analysis) and unchanged
+    turns are left alone. Inserted and updated turns are re-parented to this
+    record (their ``raw_data_id`` moves away from the earlier import), so
+    downstream stages only see the delta. Returns the number of
+    turns written. Incremental mode always scans the payload in streaming
+    fashion.
+
+    When ``turn_sink`` is given, every written turn is appended to it as a
+    column mapping including its ``id``, so later stages can consume the turns
+    without reading them back from the database.
+    """
     record = get_raw_data(session, record_id)
     if record is None:
         raise IngestionError(f"raw_data {record_id} not found")
 
     try:
-        payload = json.loads(record.content)
+        content = read_raw_content(record)
+    except BlobStoreError as exc:
+        raise IngestionError(f"Unable to load raw_data {record_id}: {exc}") from exc
+
+    if incremental:
+        return _normalize_incremental(
+            session,
+            record.id,
+            content,
+            batch_size,
+            turn_sink,
+        )
+    if streaming:
+        return _normalize_streaming(
+            session,
+            record.id,
+            content,
+            batch_size,
+            turn_sink,
+        )
+
+    try:
+        conversations = list(iter_conversations(content))
     except json.JSONDecodeError as exc:
         update_raw_data_status(session, record_id, status="FAILED")
         raise IngestionError("Failed to decode raw content") from exc
 
-    conversations = _flatten_conversations(payload)
     if not conversations:
         update_raw_data_status(session, record_id, status="FAILED")
         raise IngestionError("No conversations found in payload")
 
-    turns: list[ConversationTurn] = []
-
-    for conversation in conversations:
-        conversation_id = _resolve_conversation_id(conversation.metadata)
-        source_platform_value = conversation.metadata.get("source_platform")
-        if source_platform_value is None:
-            source_platform_value = conversation.metadata.get("sourcePlatform")
-        source_platform = (
-            str(source_platform_value)
-            if isinstance(source_platform_value, str)
-            else None
-        )
-        for index, message in enumerate(conversation.messages):
-            speaker = str(message.get("role", "unknown")).upper()
-            text = str(message.get("content", "")).strip()
-            timestamp = _parse_timestamp(message.get("timestamp"))
-            message_metadata = {
-                "source_platform": source_platform,
-                "role": message.get("role"),
-                "metadata": message.get("metadata", {}),
-            }
-            turns.append(
-                ConversationTurn(
-                    raw_data_id=record.id,
-                    conversation_id=conversation_id,
-                    turn_index=index,
-                    speaker=speaker,
-                    text=text,
-                    timestamp=timestamp,
-                    metadata_=message_metadata,
-                ),
-            )
+    turns: list[TurnRow] = []
+    for conversation in _ConversationDeduplicator(session, record.id).filter(
+        conversations,
+    ):
+        turns.extend(_build_turns(record.id, conversation))
 
-    create_conversation_turns(session, turns)
+    _write_turns(session, turns, turn_sink)
     update_raw_data_status(
         session,
         record_id,
@@ -183,6 +578,312 @@ def normalize_raw_data(session: Session, record_id: uuid.UUID) -> int:
     return len(turns)
 
 
+def _normalize_streaming(
+    session: Session,
+    record_id: uuid.UUID,
+    content: str,
+    batch_size: int,
+    turn_sink: list[TurnRow] | None,
+) -> int:
+    processed = 0
+    batch: list[TurnRow] = []
+    deduplicator = _ConversationDeduplicator(session, record_id)
+
+    try:
+        for conversation in deduplicator.filter(iter_conversations(content)):
+            for turn in _build_turns(record_id, conversation):
+                batch.append(turn)
+                if len(batch) >= batch_size:
+                    # Turns are written as plain rows and never enter the
+                    # session's identity map, so clearing the batch frees them.
+                    _write_turns(session, batch, turn_sink)
+                    processed += len(batch)
+                    batch.clear()
+    except json.JSONDecodeError as exc:
+        update_raw_data_status(session, record_id, status="FAILED")
+        raise IngestionError("Failed to decode raw content") from exc
+
+    if not deduplicator.seen:
+        update_raw_data_status(session, record_id, status="FAILED")
+        raise IngestionError("No conversations found in payload")
+
+    if batch:
+        _write_turns(session, batch, turn_sink)
+        processed += len(batch)
+
+    update_raw_data_status(
+        session,
+        record_id,
+        status="NORMALIZED",
+        processed_at=datetime.now(UTC),
+    )
+    return processed
+
+
+def _normalize_incremental(
+    session: Session,
+    record_id: uuid.UUID,
+    content: str,
+    batch_size: int,
+    turn_sink: list[TurnRow] | None,
+) -> int:
+    written = 0
+    pending: dict[tuple[uuid.UUID, int], tuple[TurnRow, bool]] = {}
+    deduplicator = _ConversationDeduplicator(session, record_id)
+
+    try:
+        for conversation in deduplicator.filter(iter_conversations(content)):
+            turns = _build_turns(record_id, conversation)
+            for turn, message in zip(turns, conversation.messages, strict=True):
+                # Messages without a usable timestamp get "now" on every run,
+                # so their timestamps must not count as a change.
+                has_timestamp = (
+                    _parse_source_timestamp(message.get("timestamp")) is not None
+                )
+                key = (turn["conversation_id"], turn["turn_index"])
+                pending[key] = (turn, has_timestamp)
+            if len(pending) >= batch_size:
+                written += _apply_turn_delta(session, record_id, pending, turn_sink)
+                pending = {}
+    except json.JSONDecodeError as exc:
+        update_raw_data_status(session, record_id, status="FAILED")
+        raise IngestionError("Failed to decode raw content") from exc
+
+    if not deduplicator.seen:
+        update_raw_data_status(session, record_id, status="FAILED")
+        raise IngestionError("No conversations found in payload")
+
+    written += _apply_turn_delta(session, record_id, pending, turn_sink)
+    update_raw_data_status(
+        session,
+        record_id,
+        status="NORMALIZED",
+        processed_at=datetime.now(UTC),
+    )
+    return written
+
+
+def _apply_turn_delta(
+    session: Session,
+    record_id: uuid.UUID,
+    incoming: dict[tuple[uuid.UUID, int], tuple[TurnRow, bool]],
+    turn_sink: list[TurnRow] | None,
+) -> int:
+    if not incoming:
+        return 0
+    stored = get_turns_by_conversation(
+        session,
+        {conversation_id for conversation_id, _ in incoming},
+    )
+
+    inserts: list[TurnRow] = []
+    updates: list[dict[str, Any]] = []
+    updated_keys: list[tuple[uuid.UUID, int]] = []
+    for key, (turn, has_timestamp) in incoming.items():
+        existing = stored.get(key)
+        if existing is None:
+            inserts.append(turn)
+        elif _turn_changed(existing, turn, compare_timestamp=has_timestamp):
+            updated_keys.append(key)
+            updates.append(
+                {
+                    "id": existing.id,
+                    "raw_data_id": record_id,
+                    "speaker": turn["speaker"],
+                    "text": turn["text"],
+                    "timestamp": (
+                        turn["timestamp"] if has_timestamp else existing.timestamp
+                    ),
+                    "metadata_": turn["metadata_"],
+                },
+            )
+
+    if updates:
+        delete_analysis_for_turns(session, [change["id"] for change in updates])
+        update_conversation_turns(session, updates)
+        if turn_sink is not None:
+            turn_sink.extend(
+                {**incoming[key][0], **change}
+                for key, change in zip(updated_keys, updates, strict=True)
+            )
+    if inserts:
+        _write_turns(session, inserts, turn_sink)
+    return len(inserts) + len(updates)
+
+
+def _write_turns(
+    session: Session,
+    turns: Sequence[TurnRow],
+    turn_sink: list[TurnRow] | None,
+) -> None:
+    turn_ids = create_conversation_turns(session, turns)
+    if turn_sink is not None:
+        turn_sink.extend(
+            {**turn, "id": turn_id}
+            for turn, turn_id in zip(turns, turn_ids, strict=True)
+        )
+
+
+def _turn_changed(
+    stored: Row[Any],
+    turn: TurnRow,
+    *,
+    compare_timestamp: bool,
+) -> bool:
+    if (
+        stored.speaker != turn["speaker"]
+        or stored.text != turn["text"]
+        or stored.metadata_ != turn["metadata_"]
+    ):
+        return True
+    return compare_timestamp and _as_utc(stored.timestamp) != _as_utc(turn["timestamp"])
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+class _ConversationDeduplicator:
+    """Drop conversations whose content was already normalized from any payload.
+
+    Conversations are fingerprinted in chunks, so each chunk costs one lookup.
+    Every conversation, new or not, is linked to the payload being normalized;
+    known ones are linked to the existing conversation and never reach
+    ``_build_turns``, so their turns stay attached to the payload that first
+    contained them and later stages (analysis, correlation) do not see them.
+    New conversations get their id resolved here, so the recorded fingerprint
+    and the written turns agree even when the id is random.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        record_id: uuid.UUID,
+        *,
+        chunk_size: int = FINGERPRINT_CHUNK_SIZE,
+    ) -> None:
+        self.session = session
+        self.record_id = record_id
+        self.chunk_size = chunk_size
+        self.seen = 0
+        self.linked = 0
+
+    def filter(
+        self,
+        conversations: Iterable[ConversationPayload],
+    ) -> Iterator[ConversationPayload]:
+        iterator = iter(conversations)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            self.seen += len(chunk)
+            yield from self._filter_chunk(chunk)
+
+    def _filter_chunk(
+        self,
+        chunk: list[ConversationPayload],
+    ) -> list[ConversationPayload]:
+        fingerprints = [_conversation_fingerprint(item) for item in chunk]
+        known = get_conversation_fingerprints(self.session, set(fingerprints))
+        fresh: dict[str, ConversationPayload] = {}
+        for conversation, fingerprint in zip(chunk, fingerprints, strict=True):
+            if fingerprint in known or fingerprint in fresh:
+                continue
+            conversation.conversation_id = _resolve_conversation_id(
+                conversation.metadata,
+            )
+            fresh[fingerprint] = conversation
+
+        inserted = record_conversation_fingerprints(
+            self.session,
+            [
+                {
+                    "fingerprint": fingerprint,
+                    "conversation_id": conversation.conversation_id,
+                    "raw_data_id": self.record_id,
+                    "turn_count": len(conversation.messages),
+                }
+                for fingerprint, conversation in fresh.items()
+            ],
+        )
+        # Fingerprints another transaction recorded first are linked as well.
+        raced = set(fresh) - inserted
+        if raced:
+            known.update(get_conversation_fingerprints(self.session, raced))
+            for fingerprint in raced:
+                del fresh[fingerprint]
+
+        links = {
+            conversation.conversation_id: (fingerprint, False)
+            for fingerprint, conversation in fresh.items()
+        }
+        for fingerprint in set(fingerprints) - set(fresh):
+            links.setdefault(known[fingerprint], (fingerprint, True))
+        link_raw_data_conversations(
+            self.session,
+            [
+                {
+                    "raw_data_id": self.record_id,
+                    "conversation_id": conversation_id,
+                    "fingerprint": fingerprint,
+                    "linked": linked,
+                }
+                for conversation_id, (fingerprint, linked) in links.items()
+            ],
+        )
+        self.linked += sum(linked for _, linked in links.values())
+        return list(fresh.values())
+
+
+def _conversation_fingerprint(conversation: ConversationPayload) -> str:
+    """Hash a conversation's identity and messages, ignoring payload metadata."""
+    source_id = conversation.metadata.get("source_id") or conversation.metadata.get(
+        "sourceId",
+    )
+    canonical = json.dumps(
+        {"source_id": source_id or None, "messages": conversation.messages},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _build_turns(
+    raw_data_id: uuid.UUID,
+    conversation: ConversationPayload,
+) -> Iterator[TurnRow]:
+    conversation_id = conversation.conversation_id or _resolve_conversation_id(
+        conversation.metadata,
+    )
+    source_platform_value = conversation.metadata.get("source_platform")
+    if source_platform_value is None:
+        source_platform_value = conversation.metadata.get("sourcePlatform")
+    source_platform = (
+        str(source_platform_value) if isinstance(source_platform_value, str) else None
+    )
+    for index, message in enumerate(conversation.messages):
+        speaker = str(message.get("role", "unknown")).upper()
+        text = str(message.get("content", "")).strip()
+        timestamp = _parse_timestamp(message.get("timestamp"))
+        message_metadata = {
+            "source_platform": source_platform,
+            "role": message.get("role"),
+            "metadata": message.get("metadata", {}),
+        }
+        yield {
+            "raw_data_id": raw_data_id,
+            "conversation_id": conversation_id,
+            "turn_index": index,
+            "speaker": speaker,
+            "text": text,
+            "timestamp": timestamp,
+            "metadata_": message_metadata,
+        }
+
+
 def _serialise_content(content: JSONValue) -> str:
     if isinstance(content, str):
         return content
@@ -201,59 +902,6 @@ def _extract_markdown_title(content: str) -> str | None:
     return None
 
 
-def _flatten_conversations(  # noqa: C901
-    payload: JSONValue,
-) -> Sequence[ConversationPayload]:
-    """Extract conversations + messages from heterogeneous payloads."""
-    conversations: list[ConversationPayload] = []
-
-    def _walk(node: JSONValue, inherited: JSONDict | None = None) -> None:
-        inherited_metadata: JSONDict = dict(inherited or {})
-
-        if isinstance(node, dict):
-            # Direct conversation structure
-            messages = node.get("messages")
-            if isinstance(messages, list):
-                metadata = {
-                    key: value
-                    for key, value in node.items()
-                    if key not in {"messages", "conversations"}
-                }
-                metadata = {**inherited_metadata, **metadata}
-                message_payloads: list[MessagePayload] = [
-                    message for message in messages if isinstance(message, dict)
-                ]
-                if len(message_payloads) != len(messages):
-                    raise IngestionError("Conversation messages must be objects")
-                conversations.append(
-                    ConversationPayload(
-                        metadata=metadata,
-                        messages=message_payloads,
-                    ),
-                )
-
-            # Nested conversations list
-            nested_conversations = node.get("conversations")
-            if isinstance(nested_conversations, list):
-                parent_meta = {
-                    key: value for key, value in node.items() if key != "conversations"
-                }
-                parent_meta = {**inherited_metadata, **parent_meta}
-                for child in nested_conversations:
-                    _walk(child, parent_meta)
-            else:
-                for value in node.values():
-                    if isinstance(value, dict | list):
-                        _walk(value, inherited_metadata)
-
-        elif isinstance(node, list):
-            for item in node:
-                _walk(item, inherited_metadata)
-
-    _walk(payload)
-    return conversations
-
-
 def _resolve_conversation_id(metadata: JSONDict) -> uuid.UUID:
     source_id = metadata.get("source_id") or metadata.get("sourceId")
     if isinstance(source_id, str) and source_id:
@@ -262,8 +910,12 @@ def _resolve_conversation_id(metadata: JSONDict) -> uuid.UUID:
 
 
 def _parse_timestamp(value: JSONValue) -> datetime:
+    return _parse_source_timestamp(value) or datetime.now(UTC)
+
+
+def _parse_source_timestamp(value: JSONValue) -> datetime | None:
     if not value:
-        return datetime.now(UTC)
+        return None
 
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=UTC)
@@ -271,7 +923,7 @@ def _parse_timestamp(value: JSONValue) -> datetime:
     try:
         parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
     except ValueError:
-        return datetime.now(UTC)
+        return None
 
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=UTC)
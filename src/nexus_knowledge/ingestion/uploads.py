@@ -0,0 +1,543 @@
+"""Resumable chunked uploads spooled to disk ahead of ingestion.
+
+Large exports are uploaded as a sequence of chunks, each appended to a spool
+file at an explicit byte offset. The SHA-256 of the payload is updated as the
+bytes arrive, so completing an upload never re-reads the file, and an upload
+interrupted mid-way can be resumed from the last acknowledged offset. Once an
+upload is complete a worker ingests the spooled file and removes it. Uploads
+left untouched for longer than the spool's TTL are swept away.
+"""
+
+from __future__ import annotations
+
+import codecs
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from sqlalchemy.orm import Session
+
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.ingestion.service import (
+    IngestionError,
+    JSONDict,
+    ingest_serialized,
+)
+from nexus_knowledge.storage import get_blob_store
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
+UPLOAD_UPLOADING = "UPLOADING"
+UPLOAD_COMPLETE = "COMPLETE"
+UPLOAD_INGESTED = "INGESTED"
+UPLOAD_FAILED = "FAILED"
+
+_READ_BLOCK_SIZE = 1024 * 1024
+_HASHER_CACHE_SIZE = 1024
+_SWEEP_INTERVAL_SECONDS = 300.0
+
+
+class UploadError(RuntimeError):
+    """Raised when an upload request cannot be applied."""
+
+
+class UploadNotFoundError(UploadError):
+    """Raised when an upload identifier is unknown to the spool."""
+
+
+class UploadConflictError(UploadError):
+    """Raised when a chunk does not continue the upload at its current offset."""
+
+    def __init__(self, message: str, *, offset: int) -> None:
+        super().__init__(message)
+        self.offset = offset
+
+
+class UploadTooLargeError(UploadError):
+    """Raised when an upload would exceed its declared or configured size."""
+
+
+@dataclass
+class UploadManifest:
+    """Persisted state of a single upload."""
+
+    upload_id: str
+    source_type: str
+    metadata: JSONDict = field(default_factory=dict)
+    source_id: str | None = None
+    total_bytes: int | None = None
+    run_full_pipeline: bool = False
+    status: str = UPLOAD_UPLOADING
+    received_bytes: int = 0
+    content_hash: str | None = None
+    raw_data_id: str | None = None
+    error: str | None = None
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+
+class ChunkWriter:
+    """Append one chunk to an upload while holding its spool lock.
+
+    Bytes are hashed as they are written. :meth:`commit` makes the chunk
+    durable and advances the recorded offset; :meth:`abort` truncates the spool
+    back to where the chunk started, so a chunk is applied entirely or not at
+    all.
+    """
+
+    def __init__(
+        self,
+        spool: UploadSpool,
+        manifest: UploadManifest,
+        handle: BinaryIO,
+        hasher: _Hash,
+        limit: int,
+    ) -> None:
+        self._spool = spool
+        self._manifest = manifest
+        self._handle = handle
+        self._hasher = hasher
+        self._start_hasher = hasher.copy()
+        self._start = manifest.received_bytes
+        self._limit = limit
+        self.offset = manifest.received_bytes
+
+    def write(self, data: bytes | bytearray) -> None:
+        """Append ``data`` to the spool file."""
+        if self.offset + len(data) > self._limit:
+            raise UploadTooLargeError(
+                f"Upload {self._manifest.upload_id} exceeds {self._limit} bytes",
+            )
+        self._handle.write(data)
+        self._hasher.update(data)
+        self.offset += len(data)
+
+    def commit(self) -> UploadManifest:
+        """Flush the chunk to disk, record the new offset and release the lock."""
+        try:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._manifest.received_bytes = self.offset
+            self._spool._save(self._manifest)
+            self._spool._remember_hasher(
+                self._manifest.upload_id,
+                self.offset,
+                self._hasher,
+            )
+        finally:
+            self._handle.close()
+        return self._manifest
+
+    def abort(self) -> None:
+        """Discard the bytes written by this chunk and release the lock."""
+        try:
+            self._handle.truncate(self._start)
+            self._spool._remember_hasher(
+                self._manifest.upload_id,
+                self._start,
+                self._start_hasher,
+            )
+        finally:
+            self._handle.close()
+
+
+class UploadSpool:
+    """Directory of in-progress uploads shared by API processes and workers.
+
+    Each upload is a ``<id>.part`` data file plus a ``<id>.json`` manifest.
+    Writers take an exclusive ``flock`` on the data file, so concurrent chunks
+    for the same upload are rejected instead of interleaved, across processes.
+    Uploads whose manifest has not changed for ``ttl_seconds`` are removed by
+    :meth:`sweep`, which :meth:`create` runs at most every few minutes; a TTL
+    of zero keeps uploads forever.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int,
+        ttl_seconds: float = 0,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._hashers: OrderedDict[str, tuple[int, _Hash]] = OrderedDict()
+        self._hashers_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def create(
+        self,
+        *,
+        source_type: str,
+        metadata: JSONDict | None = None,
+        source_id: str | None = None,
+        total_bytes: int | None = None,
+        run_full_pipeline: bool = False,
+    ) -> UploadManifest:
+        """Register a new, empty upload."""
+        if total_bytes is not None and total_bytes > self.max_bytes:
+            raise UploadTooLargeError(
+                f"Declared size {total_bytes} exceeds {self.max_bytes} bytes",
+            )
+        if self.ttl_seconds and time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + _SWEEP_INTERVAL_SECONDS
+            self.sweep()
+        manifest = UploadManifest(
+            upload_id=str(uuid.uuid4()),
+            source_type=source_type,
+            metadata=dict(metadata or {}),
+            source_id=source_id,
+            total_bytes=total_bytes,
+            run_full_pipeline=run_full_pipeline,
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.data_path(manifest.upload_id).touch(exist_ok=False)
+        self._save(manifest)
+        return manifest
+
+    def get(self, upload_id: str) -> UploadManifest:
+        """Load the manifest of ``upload_id``."""
+        try:
+            data = json.loads(self._manifest_path(upload_id).read_text("utf-8"))
+        except FileNotFoundError as exc:
+            raise UploadNotFoundError(f"Upload {upload_id} not found") from exc
+        return UploadManifest(**data)
+
+    def open_chunk(self, upload_id: str, offset: int) -> ChunkWriter:
+        """Lock the upload and return a writer positioned at ``offset``."""
+        handle = self._lock(upload_id)
+        try:
+            manifest = self.get(upload_id)
+            if manifest.status != UPLOAD_UPLOADING:
+                raise UploadConflictError(
+                    f"Upload {upload_id} is {manifest.status}",
+                    offset=manifest.received_bytes,
+                )
+            if offset != manifest.received_bytes:
+                raise UploadConflictError(
+                    f"Upload {upload_id} is at offset {manifest.received_bytes}, "
+                    f"not {offset}",
+                    offset=manifest.received_bytes,
+                )
+            # Bytes past the recorded offset belong to a chunk that never
+            # committed (e.g. the process died mid-write).
+            handle.truncate(offset)
+            handle.seek(offset)
+            limit = min(self.max_bytes, manifest.total_bytes or self.max_bytes)
+            hasher = self._hasher_at(upload_id, offset, handle)
+            handle.seek(offset)
+        except BaseException:
+            handle.close()
+            raise
+        return ChunkWriter(self, manifest, handle, hasher, limit)
+
+    def complete(
+        self,
+        upload_id: str,
+        *,
+        expected_sha256: str | None = None,
+    ) -> UploadManifest:
+        """Seal an upload, recording its content hash.
+
+        Completing an already completed upload returns its manifest unchanged.
+        """
+        manifest = self.get(upload_id)
+        if manifest.status != UPLOAD_UPLOADING:
+            return manifest
+        handle = self._lock(upload_id)
+        try:
+            manifest = self.get(upload_id)
+            if manifest.status != UPLOAD_UPLOADING:
+                return manifest
+            size = manifest.received_bytes
+            if size == 0:
+                raise UploadError(f"Upload {upload_id} is empty")
+            if manifest.total_bytes is not None and size != manifest.total_bytes:
+                raise UploadConflictError(
+                    f"Upload {upload_id} received {size} of "
+                    f"{manifest.total_bytes} bytes",
+                    offset=size,
+                )
+            digest = self._hasher_at(upload_id, size, handle).hexdigest()
+            if expected_sha256 is not None and expected_sha256.lower() != digest:
+                raise UploadError(
+                    f"Upload {upload_id} has SHA-256 {digest}, "
+                    f"expected {expected_sha256}",
+                )
+            manifest.status = UPLOAD_COMPLETE
+            manifest.content_hash = digest
+            self._save(manifest)
+        finally:
+            handle.close()
+        self._forget_hasher(upload_id)
+        return manifest
+
+    def mark_ingested(self, upload_id: str, raw_data_id: uuid.UUID) -> UploadManifest:
+        """Record the ingested ``raw_data`` row and delete the spooled bytes."""
+        manifest = self.get(upload_id)
+        manifest.status = UPLOAD_INGESTED
+        manifest.raw_data_id = str(raw_data_id)
+        self._save(manifest)
+        self.data_path(upload_id).unlink(missing_ok=True)
+        return manifest
+
+    def mark_failed(self, upload_id: str, error: str) -> UploadManifest:
+        """Record why a completed upload could not be ingested."""
+        manifest = self.get(upload_id)
+        manifest.status = UPLOAD_FAILED
+        manifest.error = error
+        self._save(manifest)
+        return manifest
+
+    def sweep(self, now: float | None = None) -> int:
+        """Remove uploads untouched for longer than the TTL and return how many.
+
+        Every manifest write (a committed chunk, completion, ingestion or a
+        failure) refreshes an upload's age. Uploads locked by an in-flight chunk
+        are skipped, as are stray temporary manifests younger than the TTL.
+        """
+        if not self.ttl_seconds or not self.root.is_dir():
+            return 0
+        cutoff = (time.time() if now is None else now) - self.ttl_seconds
+        removed = 0
+        for path in self.root.glob("*.json"):
+            if _modified_before(path, cutoff) and self._remove_upload(path.stem):
+                removed += 1
+        for path in self.root.glob(".*.tmp"):
+            if _modified_before(path, cutoff):
+                path.unlink(missing_ok=True)
+        return removed
+
+    def data_path(self, upload_id: str) -> Path:
+        """Return the spool file holding the bytes of ``upload_id``."""
+        return self.root / f"{upload_id}.part"
+
+    def _manifest_path(self, upload_id: str) -> Path:
+        return self.root / f"{upload_id}.json"
+
+    def _remove_upload(self, upload_id: str) -> bool:
+        data_path = self.data_path(upload_id)
+        try:
+            handle = data_path.open("r+b")
+        except FileNotFoundError:
+            # Ingested uploads only keep their manifest.
+            self._manifest_path(upload_id).unlink(missing_ok=True)
+            return True
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        else:
+            data_path.unlink(missing_ok=True)
+            self._manifest_path(upload_id).unlink(missing_ok=True)
+        finally:
+            handle.close()
+        self._forget_hasher(upload_id)
+        return True
+
+    def _lock(self, upload_id: str) -> BinaryIO:
+        try:
+            handle = self.data_path(upload_id).open("r+b")
+        except FileNotFoundError as exc:
+            # The spool file is removed once an upload has been ingested.
+            manifest = self.get(upload_id)
+            raise UploadConflictError(
+                f"Upload {upload_id} is {manifest.status}",
+                offset=manifest.received_bytes,
+            ) from exc
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            handle.close()
+            raise UploadConflictError(
+                f"Upload {upload_id} is being written by another request",
+                offset=self.get(upload_id).received_bytes,
+            ) from exc
+        return handle
+
+    def _save(self, manifest: UploadManifest) -> None:
+        path = self._manifest_path(manifest.upload_id)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.root,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(asdict(manifest), handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _hasher_at(self, upload_id: str, offset: int, handle: BinaryIO) -> _Hash:
+        """Return a SHA-256 state covering the first ``offset`` spooled bytes.
+
+        The state is normally carried over from the previous chunk; after a
+        restart, or when another process took the previous chunk, the prefix
+        is re-hashed from disk in fixed-size blocks.
+        """
+        with self._hashers_lock:
+            cached = self._hashers.pop(upload_id, None)
+        if cached is not None and cached[0] == offset:
+            return cached[1]
+        hasher = hashlib.sha256()
+        handle.seek(0)
+        remaining = offset
+        while remaining:
+            block = handle.read(min(_READ_BLOCK_SIZE, remaining))
+            if not block:
+                raise UploadError(f"Spool file of upload {upload_id} is truncated")
+            hasher.update(block)
+            remaining -= len(block)
+        return hasher
+
+    def _remember_hasher(self, upload_id: str, offset: int, hasher: _Hash) -> None:
+        with self._hashers_lock:
+            self._hashers[upload_id] = (offset, hasher)
+            self._hashers.move_to_end(upload_id)
+            while len(self._hashers) > _HASHER_CACHE_SIZE:
+                self._hashers.popitem(last=False)
+
+    def _forget_hasher(self, upload_id: str) -> None:
+        with self._hashers_lock:
+            self._hashers.pop(upload_id, None)
+
+
+def ingest_spooled_upload(
+    session: Session,
+    spool: UploadSpool,
+    upload_id: str,
+) -> uuid.UUID:
+    """Persist a completed upload as a ``raw_data`` row and return its id.
+
+    The hash recorded when the upload completed, taken over the raw uploaded
+    bytes, is reused as the content hash, and a duplicate upload is resolved
+    without reading the spool file. Deduplication is therefore by raw bytes:
+    it matches re-uploads and ``/ingest/raw`` bodies with the same bytes, but
+    not ``/ingest`` object content, which is hashed after re-serialisation.
+
+    When the payload is large enough for the raw content store it is streamed
+    into the store in fixed-size blocks; only payloads kept inline in
+    ``raw_data`` are read into memory.
+    """
+    manifest = spool.get(upload_id)
+    if manifest.status == UPLOAD_INGESTED and manifest.raw_data_id:
+        return uuid.UUID(manifest.raw_data_id)
+    if manifest.status != UPLOAD_COMPLETE or manifest.content_hash is None:
+        raise IngestionError(f"Upload {upload_id} is {manifest.status}, not complete")
+    path = spool.data_path(upload_id)
+    if not path.exists():
+        raise IngestionError(f"Spool file of upload {upload_id} is missing")
+    content_hash = manifest.content_hash
+
+    def load_content() -> tuple[str, str | None]:
+        try:
+            store = get_blob_store()
+            if (
+                store is not None
+                and path.stat().st_size >= get_settings().raw_content_store_min_bytes
+            ):
+                return "", store.put_chunks(content_hash, _iter_utf8_blocks(path))
+            return path.read_text(encoding="utf-8"), None
+        except FileNotFoundError as exc:
+            raise IngestionError(
+                f"Spool file of upload {upload_id} is missing",
+            ) from exc
+        except UnicodeDecodeError as exc:
+            raise IngestionError(f"Upload {upload_id} is not valid UTF-8") from exc
+
+    return ingest_serialized(
+        session,
+        source_type=manifest.source_type,
+        serialized=load_content,
+        content_hash=content_hash,
+        metadata=manifest.metadata,
+        source_id=manifest.source_id,
+    )
+
+
+def _iter_utf8_blocks(path: Path) -> Iterator[bytes]:
+    """Yield the bytes of ``path`` block by block, checking they decode as UTF-8."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with path.open("rb") as handle:
+        while block := handle.read(_READ_BLOCK_SIZE):
+            decoder.decode(block)
+            yield block
+    decoder.decode(b"", final=True)
+
+
+def _modified_before(path: Path, cutoff: float) -> bool:
+    try:
+        return path.stat().st_mtime < cutoff
+    except FileNotFoundError:
+        return False
+
+
+_SPOOL: UploadSpool | None = None
+_SPOOL_LOCK = threading.Lock()
+
+
+def get_upload_spool() -> UploadSpool:
+    """Return the configured upload spool.
+
+    Without ``UPLOAD_SPOOL_PATH`` uploads are spooled under the system temp
+    directory, which only works when the API and workers share a host; the
+    setting is therefore required in production.
+    """
+    global _SPOOL  # noqa: PLW0603
+    settings = get_settings()
+    root = Path(
+        settings.upload_spool_path
+        or Path(tempfile.gettempdir()) / "nexus_knowledge_uploads",
+    )
+    with _SPOOL_LOCK:
+        if (
+            _SPOOL is None
+            or _SPOOL.root != root
+            or _SPOOL.max_bytes != settings.upload_max_bytes
+            or _SPOOL.ttl_seconds != settings.upload_ttl_seconds
+        ):
+            _SPOOL = UploadSpool(
+                root,
+                max_bytes=settings.upload_max_bytes,
+                ttl_seconds=settings.upload_ttl_seconds,
+            )
+        return _SPOOL
+
+
+def reset_upload_spool() -> None:
+    """Drop the cached spool (useful for tests)."""
+    global _SPOOL  # noqa: PLW0603
+    with _SPOOL_LOCK:
+        _SPOOL = None
+
+
+__all__ = [
+    "UPLOAD_COMPLETE",
+    "UPLOAD_FAILED",
+    "UPLOAD_INGESTED",
+    "UPLOAD_UPLOADING",
+    "ChunkWriter",
+    "UploadConflictError",
+    "UploadError",
+    "UploadManifest",
+    "UploadNotFoundError",
+    "UploadSpool",
+    "UploadTooLargeError",
+    "get_upload_spool",
+    "ingest_spooled_upload",
+    "reset_upload_spool",
+]
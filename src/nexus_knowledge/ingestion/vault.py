@@ -0,0 +1,315 @@
+"""Incremental, parallel import of Markdown vaults (e.g. Obsidian)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus_knowledge.ingestion.service import (
+    PreparedPayload,
+    build_markdown_payload,
+    ingest_prepared_payloads,
+    prepare_raw_payload,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".nexus-import-manifest.json"
+MANIFEST_VERSION = 1
+DEFAULT_VAULT_BATCH_SIZE = 500
+_MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
+_POOL_CHUNKSIZE = 32
+_CHECKPOINT_INTERVAL_SECONDS = 5.0
+
+
+@dataclass
+class ManifestEntry:
+    """Last imported state of a single vault file."""
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+    raw_data_id: str
+
+
+@dataclass
+class VaultManifest:
+    """Relative path to :class:`ManifestEntry` map persisted between imports."""
+
+    path: Path
+    entries: dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> VaultManifest:
+        """Read a manifest, starting empty if it is missing or unreadable."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable vault manifest %s", path)
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            logger.warning("Ignoring vault manifest %s with unknown version", path)
+            return cls(path)
+        # Entries are stored as [size, mtime_ns, content_hash, raw_data_id]
+        # arrays to keep manifests of large vaults small and quick to parse.
+        entries = {
+            relative: ManifestEntry(*entry)
+            for relative, entry in data.get("files", {}).items()
+        }
+        return cls(path, entries)
+
+    def save(self) -> None:
+        """Atomically replace the manifest file with the current entries."""
+        payload = {
+            "version": MANIFEST_VERSION,
+            "files": {
+                relative: [
+                    entry.size,
+                    entry.mtime_ns,
+                    entry.content_hash,
+                    entry.raw_data_id,
+                ]
+                for relative, entry in self.entries.items()
+            },
+        }
+        serialized = json.dumps(payload, separators=(",", ":"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(serialized)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def is_unchanged(self, relative: str, size: int, mtime_ns: int) -> bool:
+        entry = self.entries.get(relative)
+        return entry is not None and entry.size == size and entry.mtime_ns == mtime_ns
+
+
+@dataclass
+class VaultImportResult:
+    """Summary of a vault import run."""
+
+    scanned: int = 0
+    unchanged: int = 0
+    imported: int = 0
+    removed: int = 0
+    created_ids: list[uuid.UUID] = field(default_factory=list)
+    pending_normalization: list[uuid.UUID] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _VaultFile:
+    relative: str
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class _PreparedFile:
+    file: _VaultFile
+    payload: PreparedPayload | None
+    error: str | None = None
+
+
+def import_markdown_vault(  # noqa: PLR0913
+    session_factory: sessionmaker[Session],
+    root: str | Path,
+    *,
+    manifest_path: str | Path | None = None,
+    dataset: str | None = None,
+    tags: Sequence[str] | None = None,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_VAULT_BATCH_SIZE,
+) -> VaultImportResult:
+    """Import every new or modified Markdown note below ``root``.
+
+    Files whose size and modification time match the manifest are skipped
+    without being opened. Changed files are read, rendered and hashed in a
+    process pool, and the resulting rows are committed ``batch_size`` at a
+    time. The manifest is checkpointed every few seconds after a commit, so
+    an interrupted run only re-reads the files of its last few batches.
+    Hidden files and directories (including ``.obsidian``) are ignored.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    vault_root = Path(root).resolve()
+    if not vault_root.is_dir():
+        raise NotADirectoryError(f"Vault root is not a directory: {vault_root}")
+    manifest = VaultManifest.load(
+        Path(manifest_path) if manifest_path else vault_root / MANIFEST_FILENAME,
+    )
+
+    result = VaultImportResult()
+    seen: set[str] = set()
+    changed: list[_VaultFile] = []
+    for vault_file in _scan_vault(vault_root):
+        result.scanned += 1
+        seen.add(vault_file.relative)
+        if manifest.is_unchanged(
+            vault_file.relative,
+            vault_file.size,
+            vault_file.mtime_ns,
+        ):
+            result.unchanged += 1
+        else:
+            changed.append(vault_file)
+
+    removed = set(manifest.entries) - seen
+    for relative in removed:
+        del manifest.entries[relative]
+    result.removed = len(removed)
+
+    options = (dataset, tuple(tags) if tags else None)
+    pool_size = min(workers or os.cpu_count() or 1, len(changed))
+    if pool_size > 1:
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            _import_prepared(
+                session_factory,
+                manifest,
+                _prepare_in_pool(executor, changed, options),
+                batch_size,
+                result,
+            )
+    else:
+        prepared = (_prepare_file(vault_file, options) for vault_file in changed)
+        _import_prepared(session_factory, manifest, prepared, batch_size, result)
+
+    if removed or changed:
+        manifest.save()
+    return result
+
+
+def _scan_vault(root: Path) -> Iterator[_VaultFile]:
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif (
+                        entry.is_file()
+                        and Path(entry.name).suffix.lower() in _MARKDOWN_SUFFIXES
+                    ):
+                        stat = entry.stat()
+                        path = Path(entry.path)
+                        yield _VaultFile(
+                            relative=path.relative_to(root).as_posix(),
+                            path=path,
+                            size=stat.st_size,
+                            mtime_ns=stat.st_mtime_ns,
+                        )
+        except OSError as exc:
+            logger.warning("Skipping unreadable vault directory %s: %s", directory, exc)
+
+
+def _prepare_in_pool(
+    executor: Executor,
+    files: Sequence[_VaultFile],
+    options: tuple[str | None, tuple[str, ...] | None],
+) -> Iterator[_PreparedFile]:
+    yield from executor.map(
+        _prepare_file,
+        files,
+        [options] * len(files),
+        chunksize=_POOL_CHUNKSIZE,
+    )
+
+
+def _prepare_file(
+    vault_file: _VaultFile,
+    options: tuple[str | None, tuple[str, ...] | None],
+) -> _PreparedFile:
+    dataset, tags = options
+    try:
+        content = vault_file.path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        return _PreparedFile(vault_file, None, f"{type(exc).__name__}: {exc}")
+    payload = build_markdown_payload(
+        vault_file.path,
+        content,
+        vault_file.mtime_ns / 1_000_000_000,
+        dataset=dataset,
+        tags=tags,
+    )
+    return _PreparedFile(vault_file, prepare_raw_payload(payload))
+
+
+def _import_prepared(
+    session_factory: sessionmaker[Session],
+    manifest: VaultManifest,
+    prepared: Iterable[_PreparedFile],
+    batch_size: int,
+    result: VaultImportResult,
+) -> None:
+    iterator = iter(prepared)
+    last_checkpoint = time.monotonic()
+    while batch := list(islice(iterator, batch_size)):
+        ready: list[tuple[_VaultFile, PreparedPayload]] = []
+        for item in batch:
+            if item.payload is None:
+                logger.warning("Failed to read %s: %s", item.file.path, item.error)
+                result.failed.append(item.file.relative)
+            else:
+                ready.append((item.file, item.payload))
+        if not ready:
+            continue
+
+        with session_factory.begin() as session:
+            outcome = ingest_prepared_payloads(
+                session,
+                [payload for _, payload in ready],
+            )
+
+        for (vault_file, payload), raw_data_id in zip(
+            ready,
+            outcome.raw_data_ids,
+            strict=True,
+        ):
+            manifest.entries[vault_file.relative] = ManifestEntry(
+                size=vault_file.size,
+                mtime_ns=vault_file.mtime_ns,
+                content_hash=payload.content_hash,
+                raw_data_id=str(raw_data_id),
+            )
+        if time.monotonic() - last_checkpoint >= _CHECKPOINT_INTERVAL_SECONDS:
+            manifest.save()
+            last_checkpoint = time.monotonic()
+        result.imported += len(ready)
+        result.created_ids.extend(outcome.created_ids)
+        result.pending_normalization.extend(outcome.pending_normalization)
+
+
+__all__ = [
+    "DEFAULT_VAULT_BATCH_SIZE",
+    "MANIFEST_FILENAME",
+    "ManifestEntry",
+    "VaultImportResult",
+    "VaultManifest",
+    "import_markdown_vault",
+]
@@ -0,0 +1,272 @@
+"""Watch-folder daemon that ingests exports dropped into configured directories."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus_knowledge.ingestion.service import (
+    IngestionError,
+    PreparedPayload,
+    build_markdown_payload,
+    ingest_prepared_payloads,
+    prepare_raw_bytes,
+    prepare_raw_payload,
+)
+from nexus_knowledge.ingestion.vault import ManifestEntry, VaultManifest
+
+logger = logging.getLogger(__name__)
+
+WATCH_CHECKPOINT_FILENAME = ".nexus-watch-checkpoint.json"
+DEFAULT_WATCH_SOURCE_TYPE = "watch_folder"
+DEFAULT_WATCH_BATCH_SIZE = 50
+DEFAULT_WATCH_SETTLE_SECONDS = 2.0
+DEFAULT_WATCH_POLL_SECONDS = 5.0
+_MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
+# Downloads in flight (``export.json.part``, ``.crdownload``) never match.
+_WATCHED_SUFFIXES = frozenset({".json"}) | _MARKDOWN_SUFFIXES
+
+Dispatcher = Callable[[Sequence[uuid.UUID]], None]
+
+
+@dataclass
+class WatchCycleResult:
+    """Summary of a single poll of the watched directories."""
+
+    scanned: int = 0
+    unchanged: int = 0
+    settling: int = 0
+    ingested: int = 0
+    removed: int = 0
+    created_ids: list[uuid.UUID] = field(default_factory=list)
+    pending_normalization: list[uuid.UUID] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _DropFile:
+    key: str
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @property
+    def signature(self) -> tuple[int, int]:
+        return self.size, self.mtime_ns
+
+
+class FolderWatcher:
+    """Poll drop directories and ingest settled export files in batches.
+
+    A file is picked up once its size and modification time are unchanged
+    since the previous poll and it has not been modified for
+    ``settle_seconds``, so exports that are still being copied in are left
+    alone. Settled files are committed ``batch_size`` at a time through the
+    bulk dedup path, and ``dispatch`` receives the ids awaiting normalization
+    after each commit. A checkpoint (the vault manifest format, keyed by
+    absolute path) records every ingested file, so a restarted watcher only
+    stats the directories instead of re-reading their contents.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session_factory: sessionmaker[Session],
+        directories: Sequence[str | Path],
+        *,
+        checkpoint_path: str | Path | None = None,
+        source_type: str = DEFAULT_WATCH_SOURCE_TYPE,
+        settle_seconds: float = DEFAULT_WATCH_SETTLE_SECONDS,
+        batch_size: int = DEFAULT_WATCH_BATCH_SIZE,
+        dispatch: Dispatcher | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not directories:
+            raise ValueError("At least one directory must be watched")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.session_factory = session_factory
+        self.directories = [Path(directory).resolve() for directory in directories]
+        self.checkpoint = VaultManifest.load(
+            (
+                Path(checkpoint_path)
+                if checkpoint_path
+                else self.directories[0] / WATCH_CHECKPOINT_FILENAME
+            ),
+        )
+        self.source_type = source_type
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+        self.dispatch = dispatch
+        self._clock = clock
+        self._observed: dict[str, tuple[int, int]] = {}
+        self._failed: dict[str, tuple[int, int]] = {}
+
+    def poll(self) -> WatchCycleResult:
+        """Scan the directories once and ingest every settled file."""
+        result = WatchCycleResult()
+        now_ns = int(self._clock() * 1_000_000_000)
+        settle_ns = int(self.settle_seconds * 1_000_000_000)
+        observed: dict[str, tuple[int, int]] = {}
+        ready: list[_DropFile] = []
+        for drop_file in self._scan():
+            result.scanned += 1
+            observed[drop_file.key] = drop_file.signature
+            if self.checkpoint.is_unchanged(drop_file.key, *drop_file.signature):
+                result.unchanged += 1
+            elif self._failed.get(drop_file.key) == drop_file.signature:
+                continue
+            elif (
+                self._observed.get(drop_file.key) != drop_file.signature
+                or now_ns - drop_file.mtime_ns < settle_ns
+            ):
+                result.settling += 1
+            else:
+                ready.append(drop_file)
+        self._observed = observed
+
+        removed = set(self.checkpoint.entries) - set(observed)
+        for key in removed:
+            del self.checkpoint.entries[key]
+        result.removed = len(removed)
+        self._failed = {
+            key: signature for key, signature in self._failed.items() if key in observed
+        }
+
+        for start in range(0, len(ready), self.batch_size):
+            self._ingest_batch(ready[start : start + self.batch_size], result)
+
+        if removed and not result.ingested:
+            self.checkpoint.save()
+        return result
+
+    def run(
+        self,
+        *,
+        poll_interval: float = DEFAULT_WATCH_POLL_SECONDS,
+        stop: threading.Event | None = None,
+        max_cycles: int | None = None,
+    ) -> None:
+        """Poll until ``stop`` is set (or ``max_cycles`` polls have run)."""
+        stop = stop or threading.Event()
+        cycles = 0
+        while not stop.is_set():
+            try:
+                result = self.poll()
+            except Exception:
+                logger.exception("Watch-folder poll failed")
+            else:
+                if result.ingested or result.failed:
+                    logger.info(
+                        "Watch-folder ingested %d file(s), %d failed, %d settling",
+                        result.ingested,
+                        len(result.failed),
+                        result.settling,
+                    )
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                return
+            stop.wait(poll_interval)
+
+    def _scan(self) -> Iterator[_DropFile]:
+        stack = list(self.directories)
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif (
+                            entry.is_file()
+                            and Path(entry.name).suffix.lower() in _WATCHED_SUFFIXES
+                        ):
+                            stat = entry.stat()
+                            yield _DropFile(
+                                key=entry.path,
+                                path=Path(entry.path),
+                                size=stat.st_size,
+                                mtime_ns=stat.st_mtime_ns,
+                            )
+            except OSError as exc:
+                logger.warning("Skipping unreadable directory %s: %s", directory, exc)
+
+    def _ingest_batch(
+        self,
+        batch: Sequence[_DropFile],
+        result: WatchCycleResult,
+    ) -> None:
+        prepared: list[tuple[_DropFile, PreparedPayload]] = []
+        for drop_file in batch:
+            try:
+                prepared.append((drop_file, self._prepare(drop_file)))
+            except (OSError, UnicodeDecodeError, IngestionError) as exc:
+                logger.warning("Failed to ingest %s: %s", drop_file.path, exc)
+                self._failed[drop_file.key] = drop_file.signature
+                result.failed.append(drop_file.key)
+        if not prepared:
+            return
+
+        with self.session_factory.begin() as session:
+            outcome = ingest_prepared_payloads(
+                session,
+                [payload for _, payload in prepared],
+            )
+
+        # Dispatch before checkpointing: if dispatch fails or the process dies
+        # in between, the files are picked up again on the next poll, where
+        # ingestion deduplicates them and re-reports the rows still awaiting
+        # normalization. Checkpointing first could drop those rows for good.
+        if self.dispatch is not None and outcome.pending_normalization:
+            self.dispatch(outcome.pending_normalization)
+        for (drop_file, payload), raw_data_id in zip(
+            prepared,
+            outcome.raw_data_ids,
+            strict=True,
+        ):
+            self.checkpoint.entries[drop_file.key] = ManifestEntry(
+                size=drop_file.size,
+                mtime_ns=drop_file.mtime_ns,
+                content_hash=payload.content_hash,
+                raw_data_id=str(raw_data_id),
+            )
+        self.checkpoint.save()
+        result.ingested += len(prepared)
+        result.created_ids.extend(outcome.created_ids)
+        result.pending_normalization.extend(outcome.pending_normalization)
+
+    def _prepare(self, drop_file: _DropFile) -> PreparedPayload:
+        modified_at = drop_file.mtime_ns / 1_000_000_000
+        if drop_file.path.suffix.lower() in _MARKDOWN_SUFFIXES:
+            content = drop_file.path.read_text(encoding="utf-8")
+            return prepare_raw_payload(
+                build_markdown_payload(drop_file.path, content, modified_at),
+            )
+        return prepare_raw_bytes(
+            drop_file.path.read_bytes(),
+            source_type=self.source_type,
+            metadata={
+                "source_path": drop_file.key,
+                "source_filename": drop_file.path.name,
+            },
+        )
+
+
+__all__ = [
+    "DEFAULT_WATCH_BATCH_SIZE",
+    "DEFAULT_WATCH_POLL_SECONDS",
+    "DEFAULT_WATCH_SETTLE_SECONDS",
+    "DEFAULT_WATCH_SOURCE_TYPE",
+    "WATCH_CHECKPOINT_FILENAME",
+    "FolderWatcher",
+    "WatchCycleResult",
+]
@@ -13,9 +13,17 @@ from .logging import configure_logging
 from .metrics import (
     CONTENT_TYPE_LATEST,
     collect_metrics,
+    observe_admission_rejection,
+    observe_analysis_cache_lookups,
     observe_api_error,
     observe_api_request,
+    observe_dedup_cache_lookup,
     observe_task_failure,
+    observe_tracking_flush_failure,
+    observe_tracking_mirrored_runs,
+    observe_tracking_records,
+    observe_tracking_task_run,
+    set_queue_depth,
     track_task_execution,
 )
 
@@ -26,12 +34,20 @@ __all__ = [
     "get_celery_task_id",
     "get_correlation_id",
     "get_request_id",
+    "observe_admission_rejection",
+    "observe_analysis_cache_lookups",
     "observe_api_error",
     "observe_api_request",
+    "observe_dedup_cache_lookup",
     "observe_task_failure",
+    "observe_tracking_flush_failure",
+    "observe_tracking_mirrored_runs",
+    "observe_tracking_records",
+    "observe_tracking_task_run",
     "pop_celery_context",
     "pop_request_context",
     "push_celery_context",
     "push_request_context",
+    "set_queue_depth",
     "track_task_execution",
 ]
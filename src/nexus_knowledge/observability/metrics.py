@@ -6,7 +6,13 @@ import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 
 REQUEST_COUNTER = Counter(
     "nexus_api_requests_total",
@@ -40,6 +46,46 @@ TASK_FAILURES = Counter(
     "Celery task failures grouped by task and exception type",
     labelnames=("task_name", "exception"),
 )
+DEDUP_CACHE_LOOKUPS = Counter(
+    "nexus_ingest_dedup_cache_lookups_total",
+    "Ingestion content-hash cache lookups grouped by result",
+    labelnames=("result",),
+)
+ANALYSIS_CACHE_LOOKUPS = Counter(
+    "nexus_analysis_cache_lookups_total",
+    "Sentiment result cache lookups grouped by result (memory, database, miss)",
+    labelnames=("result",),
+)
+TRACKING_RECORDS = Counter(
+    "nexus_tracking_records_total",
+    "Buffered MLflow params, metrics and tags grouped by outcome "
+    "(sent, rejected, dropped)",
+    labelnames=("result",),
+)
+TRACKING_FLUSH_FAILURES = Counter(
+    "nexus_tracking_flush_failures_total",
+    "Buffered MLflow flushes that failed and will be retried",
+)
+TRACKING_MIRRORED_RUNS = Counter(
+    "nexus_tracking_mirrored_runs_total",
+    "Task runs written to the local mlflow_runs mirror by outcome (written, failed)",
+    labelnames=("result",),
+)
+TRACKING_TASK_RUNS = Counter(
+    "nexus_tracking_task_runs_total",
+    "Task runs by tracking policy decision (sampled, failed, slow, summarized)",
+    labelnames=("task_name", "decision"),
+)
+QUEUE_DEPTH = Gauge(
+    "nexus_celery_queue_depth",
+    "Messages waiting in a Celery broker queue, as last sampled by the API",
+    labelnames=("queue",),
+)
+ADMISSION_REJECTIONS = Counter(
+    "nexus_api_admission_rejections_total",
+    "Requests rejected by queue-depth admission control",
+    labelnames=("workload",),
+)
 
 
 def _normalise_route(route: str) -> str:
@@ -101,6 +147,48 @@ def observe_task_failure(task_name: str, exception_type: str) -> None:
     TASK_FAILURES.labels(task_name=task_name, exception=exception_type).inc()
 
 
+def observe_dedup_cache_lookup(result: str) -> None:
+    """Record an ingestion dedup cache lookup (hit, miss, bloom_absent, stale)."""
+    DEDUP_CACHE_LOOKUPS.labels(result=result).inc()
+
+
+def observe_analysis_cache_lookups(result: str, count: int) -> None:
+    """Record ``count`` sentiment cache lookups answered by ``result``."""
+    if count:
+        ANALYSIS_CACHE_LOOKUPS.labels(result=result).inc(count)
+
+
+def observe_tracking_records(result: str, count: int) -> None:
+    """Record ``count`` buffered tracking records that ended up as ``result``."""
+    if count:
+        TRACKING_RECORDS.labels(result=result).inc(count)
+
+
+def observe_tracking_flush_failure() -> None:
+    """Record a failed attempt to send buffered tracking data."""
+    TRACKING_FLUSH_FAILURES.inc()
+
+
+def observe_tracking_mirrored_runs(result: str, count: int) -> None:
+    """Record ``count`` task runs whose local mirror write ended up as ``result``."""
+    TRACKING_MIRRORED_RUNS.labels(result=result).inc(count)
+
+
+def observe_tracking_task_run(task_name: str, decision: str) -> None:
+    """Record how the tracking policy handled a task run."""
+    TRACKING_TASK_RUNS.labels(task_name=task_name, decision=decision).inc()
+
+
+def set_queue_depth(queue: str, depth: int) -> None:
+    """Publish the most recently sampled depth of a broker queue."""
+    QUEUE_DEPTH.labels(queue=queue).set(depth)
+
+
+def observe_admission_rejection(workload: str) -> None:
+    """Record a request rejected because the task queue is too deep."""
+    ADMISSION_REJECTIONS.labels(workload=workload).inc()
+
+
 def collect_metrics() -> bytes:
     """Return the Prometheus metrics exposition payload."""
     return generate_latest()
@@ -109,8 +197,16 @@ def collect_metrics() -> bytes:
 __all__ = [
     "CONTENT_TYPE_LATEST",
     "collect_metrics",
+    "observe_admission_rejection",
+    "observe_analysis_cache_lookups",
     "observe_api_error",
     "observe_api_request",
+    "observe_dedup_cache_lookup",
     "observe_task_failure",
+    "observe_tracking_flush_failure",
+    "observe_tracking_mirrored_runs",
+    "observe_tracking_records",
+    "observe_tracking_task_run",
+    "set_queue_depth",
     "track_task_execution",
 ]
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import json
 import statistics
 import time
+import uuid
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
+from datetime import UTC, datetime
 
+import mlflow
 from sqlalchemy.orm import Session, sessionmaker
 
 from nexus_knowledge.analysis.pipeline import run_analysis_for_raw_data
-from nexus_knowledge.ingestion import ingest_raw_payload
+from nexus_knowledge.db.models import ConversationTurn, Entity
+from nexus_knowledge.db.repository import create_conversation_turns, create_entities
+from nexus_knowledge.experiment_tracking import (
+    buffered_run,
+    buffered_task_run,
+    flush_tracking,
+    mlflow_task_run,
+)
+from nexus_knowledge.ingestion import (
+    RawPayload,
+    ingest_raw_payload,
+    prepare_raw_bytes,
+    prepare_raw_payload,
+)
+from nexus_knowledge.ingestion.connectors import iter_conversations
 from nexus_knowledge.ingestion.service import normalize_raw_data
+from nexus_knowledge.mlflow_utils import configure_mlflow
 from nexus_knowledge.performance import default_benchmark_thresholds
 from nexus_knowledge.search import hybrid_search
 
@@ -41,6 +60,19 @@ class BenchmarkResult:
         return self.average_ms <= self.threshold_ms
 
 
+@dataclass
+class ThroughputResult:
+    """Rows written per second for one write strategy."""
+
+    name: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
 def _sample_payload(iteration: int) -> dict[str, object]:
     message_template = {
         "role": "user" if iteration % 2 == 0 else "assistant",
@@ -139,6 +171,272 @@ def run_single_user_benchmark(
     return report
 
 
+def _turn_rows(count: int) -> list[dict[str, object]]:
+    conversation_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    return [
+        {
+            "conversation_id": conversation_id,
+            "turn_index": index,
+            "speaker": "USER" if index % 2 == 0 else "ASSISTANT",
+            "text": f"Bulk benchmark message {index}",
+            "timestamp": now,
+            "metadata_": {"source_platform": "benchmark", "role": "user"},
+        }
+        for index in range(count)
+    ]
+
+
+def _entity_rows(turn_ids: Iterable[uuid.UUID]) -> list[dict[str, object]]:
+    return [
+        {
+            "conversation_turn_id": turn_id,
+            "type": "SENTIMENT",
+            "value": "NEUTRAL",
+            "sentiment": "NEUTRAL",
+            "relevance": 0.5,
+            "metadata_": {"positive_matches": 0, "negative_matches": 0},
+        }
+        for turn_id in turn_ids
+    ]
+
+
+def _write_with_orm(session: Session, rows: int) -> None:
+    turns = [ConversationTurn(**row) for row in _turn_rows(rows)]
+    session.add_all(turns)
+    session.flush()
+    session.add_all(Entity(**row) for row in _entity_rows(t.id for t in turns))
+    session.flush()
+
+
+def _write_with_bulk(session: Session, rows: int) -> None:
+    turn_ids = create_conversation_turns(session, _turn_rows(rows))
+    create_entities(session, _entity_rows(turn_ids))
+
+
+def run_bulk_write_benchmark(
+    session_factory: sessionmaker[Session],
+    *,
+    rows: int = 2000,
+) -> dict[str, ThroughputResult]:
+    """Compare ORM unit-of-work inserts with the Core bulk writer.
+
+    Each strategy writes ``rows`` conversation turns plus one entity per turn
+    inside a transaction that is rolled back, so the database is left untouched.
+    """
+    strategies: dict[str, Callable[[Session, int], None]] = {
+        "orm_add_all": _write_with_orm,
+        "bulk_insert": _write_with_bulk,
+    }
+    report: dict[str, ThroughputResult] = {}
+    for name, write in strategies.items():
+        with session_factory() as session:
+            start = time.perf_counter()
+            write(session, rows)
+            elapsed = time.perf_counter() - start
+            session.rollback()
+        report[name] = ThroughputResult(name=name, rows=rows * 2, seconds=elapsed)
+    return report
+
+
+def run_payload_preparation_benchmark(
+    *,
+    conversations: int = 2000,
+) -> dict[str, ThroughputResult]:
+    """Compare the two ways of preparing a JSON request body for ingestion.
+
+    ``parse_and_serialise`` is the ``/ingest`` path: the body is parsed into
+    Python objects, re-serialised with sorted keys and hashed.
+    ``raw_bytes`` is the ``/ingest/raw`` path: the body is validated and
+    hashed as received. Throughput is reported in conversations per second.
+    """
+    body = json.dumps(
+        {"conversations": [_sample_payload(index) for index in range(conversations)]},
+    ).encode("utf-8")
+    strategies: dict[str, Callable[[], object]] = {
+        "parse_and_serialise": lambda: prepare_raw_payload(
+            RawPayload(source_type="benchmark", content=json.loads(body)),
+        ),
+        "raw_bytes": lambda: prepare_raw_bytes(body, source_type="benchmark"),
+    }
+    return {
+        name: ThroughputResult(
+            name=name,
+            rows=conversations,
+            seconds=_time_call(prepare) / 1000,
+        )
+        for name, prepare in strategies.items()
+    }
+
+
+def _log_synchronously(tracking_uri: str) -> None:
+    with mlflow_task_run("benchmark", tracking_uri=tracking_uri, params={"n": 1}):
+        mlflow.log_metric("turns_analyzed", 1)
+        with mlflow.start_run(run_name="benchmark-nested", nested=True):
+            mlflow.log_params({"turn_count": 1})
+            mlflow.log_metrics({"turns_analyzed": 1, "cache_hits": 0})
+
+
+def _log_buffered(tracking_uri: str) -> None:
+    with buffered_task_run(
+        "benchmark",
+        tracking_uri=tracking_uri,
+        params={"n": 1},
+    ) as task_run:
+        task_run.log_metric("turns_analyzed", 1)
+        with buffered_run("Benchmark", "benchmark-nested") as nested:
+            nested.log_params({"turn_count": 1})
+            nested.log_metrics({"turns_analyzed": 1, "cache_hits": 0})
+
+
+def run_tracking_overhead_benchmark(
+    tracking_uri: str,
+    *,
+    tasks: int = 20,
+) -> dict[str, ThroughputResult]:
+    """Compare the MLflow logging a task waits on, synchronous vs buffered.
+
+    Each simulated task logs what an analysis task does: a task run with
+    params, tags and a metric, plus a nested run. ``synchronous`` uses
+    :func:`mlflow_task_run` and fluent MLflow calls; ``buffered`` uses
+    :func:`buffered_task_run` and only measures the time spent in the task.
+    ``buffered_flushed`` adds the wait until the background sink has sent
+    everything. Throughput is reported in tasks per second.
+    """
+    configure_mlflow(tracking_uri)
+    report: dict[str, ThroughputResult] = {}
+    start = time.perf_counter()
+    for _ in range(tasks):
+        _log_synchronously(tracking_uri)
+    report["synchronous"] = ThroughputResult(
+        name="synchronous",
+        rows=tasks,
+        seconds=time.perf_counter() - start,
+    )
+
+    start = time.perf_counter()
+    for _ in range(tasks):
+        _log_buffered(tracking_uri)
+    in_task = time.perf_counter() - start
+    flush_tracking()
+    report["buffered"] = ThroughputResult(name="buffered", rows=tasks, seconds=in_task)
+    report["buffered_flushed"] = ThroughputResult(
+        name="buffered_flushed",
+        rows=tasks,
+        seconds=time.perf_counter() - start,
+    )
+    return report
+
+
+def _chatgpt_export(conversations: int, messages: int) -> list[dict[str, object]]:
+    export: list[dict[str, object]] = []
+    for index in range(conversations):
+        mapping: dict[str, object] = {}
+        parent: str | None = None
+        for turn in range(messages):
+            node_id = f"c{index}-m{turn}"
+            mapping[node_id] = {
+                "id": node_id,
+                "parent": parent,
+                "children": [f"c{index}-m{turn + 1}"] if turn + 1 < messages else [],
+                "message": {
+                    "id": node_id,
+                    "author": {"role": "user" if turn % 2 == 0 else "assistant"},
+                    "create_time": 1735689600.0 + turn,
+                    "content": {
+                        "content_type": "text",
+                        "parts": [f"Benchmark message {index}/{turn}"],
+                    },
+                    "metadata": {},
+                },
+            }
+            parent = node_id
+        export.append(
+            {
+                "title": f"Benchmark {index}",
+                "create_time": 1735689600.0,
+                "conversation_id": f"chatgpt-{index}",
+                "current_node": parent,
+                "mapping": mapping,
+            },
+        )
+    return export
+
+
+def _claude_export(conversations: int, messages: int) -> list[dict[str, object]]:
+    return [
+        {
+            "uuid": f"claude-{index}",
+            "name": f"Benchmark {index}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "chat_messages": [
+                {
+                    "uuid": f"c{index}-m{turn}",
+                    "sender": "human" if turn % 2 == 0 else "assistant",
+                    "text": f"Benchmark message {index}/{turn}",
+                    "created_at": "2025-01-01T00:00:00Z",
+                }
+                for turn in range(messages)
+            ],
+        }
+        for index in range(conversations)
+    ]
+
+
+def _gemini_export(conversations: int) -> list[dict[str, object]]:
+    return [
+        {
+            "header": "Gemini Apps",
+            "title": f"Prompted Benchmark message {index}",
+            "time": f"2025-01-01T00:00:00.{index:06d}Z",
+            "products": ["Gemini Apps"],
+            "safeHtmlItem": [{"html": f"<p>Response to message {index}</p>"}],
+        }
+        for index in range(conversations)
+    ]
+
+
+def run_connector_parse_benchmark(
+    *,
+    conversations: int = 1000,
+    messages: int = 10,
+) -> dict[str, ThroughputResult]:
+    """Measure how fast each export connector streams conversations out of text.
+
+    ``generic`` is the fallback walker over the repo's own payload shape; the
+    other entries are the dedicated ChatGPT, Claude and Gemini Takeout
+    connectors (Takeout entries hold one prompt and response each). Throughput
+    is reported in conversations per second.
+    """
+    generic = {
+        "conversations": [
+            {
+                "source_platform": "benchmark",
+                "source_id": f"benchmark-{index}",
+                "messages": [
+                    {"role": "user", "content": f"Benchmark message {index}/{turn}"}
+                    for turn in range(messages)
+                ],
+            }
+            for index in range(conversations)
+        ],
+    }
+    exports = {
+        "generic": generic,
+        "chatgpt": _chatgpt_export(conversations, messages),
+        "claude": _claude_export(conversations, messages),
+        "gemini": _gemini_export(conversations),
+    }
+    report: dict[str, ThroughputResult] = {}
+    for name, export in exports.items():
+        content = json.dumps(export)
+        start = time.perf_counter()
+        parsed = sum(1 for _ in iter_conversations(content))
+        elapsed = time.perf_counter() - start
+        report[name] = ThroughputResult(name=name, rows=parsed, seconds=elapsed)
+    return report
+
+
 def format_report(results: Iterable[BenchmarkResult]) -> str:
     """Pretty-print benchmark results for CLI usage."""
     lines = ["Benchmark Report"]
@@ -151,6 +449,26 @@ def format_report(results: Iterable[BenchmarkResult]) -> str:
     return "\n".join(lines)
 
 
+def format_throughput_report(
+    results: Mapping[str, ThroughputResult],
+    *,
+    title: str = "Write Throughput Report",
+    baseline: str = "orm_add_all",
+) -> str:
+    """Pretty-print throughput, relative to the ``baseline`` result when present."""
+    lines = [title]
+    reference = results.get(baseline)
+    for result in results.values():
+        line = (
+            f"- {result.name}: {result.rows_per_second:,.0f} rows/s (n={result.rows})"
+        )
+        if reference is not None and reference.rows_per_second > 0:
+            speedup = result.rows_per_second / reference.rows_per_second
+            line += f" [{speedup:.1f}x]"
+        lines.append(line)
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
     from nexus_knowledge.db.session import get_session_factory
 
@@ -0,0 +1,137 @@
+"""Fused pipeline that runs every processing stage for a payload in one pass."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from nexus_knowledge.analysis.pipeline import analyze_turns
+from nexus_knowledge.config import get_settings
+from nexus_knowledge.config.settings import PIPELINE_STAGES
+from nexus_knowledge.correlation.pipeline import (
+    CandidateRef,
+    EntityRef,
+    fuse_candidates,
+    generate_candidates,
+)
+from nexus_knowledge.db.repository import get_raw_data
+from nexus_knowledge.ingestion.service import (
+    DEFAULT_NORMALIZE_BATCH_SIZE,
+    TurnRow,
+    normalize_raw_data,
+)
+
+
+@dataclass
+class PipelineResult:
+    """Row counts produced by each stage of a fused pipeline run."""
+
+    raw_data_id: uuid.UUID
+    turns: int = 0
+    analyzed: int = 0
+    entities: int = 0
+    candidates: int = 0
+    confirmed: int = 0
+    rejected: int = 0
+    checkpoints: list[str] = field(default_factory=list)
+
+
+def configured_checkpoints() -> frozenset[str]:
+    """Return the stages after which the fused pipeline commits."""
+    value = get_settings().pipeline_checkpoints
+    return frozenset(stage for stage in value.split(",") if stage)
+
+
+def run_full_pipeline(
+    session: Session,
+    raw_data_id: uuid.UUID,
+    *,
+    checkpoints: Collection[str] | None = None,
+    batch_size: int = DEFAULT_NORMALIZE_BATCH_SIZE,
+) -> PipelineResult:
+    """Normalize, analyze, correlate and fuse a raw payload in one session.
+
+    Turns written by normalization and entities written by analysis are kept in
+    memory and handed to the next stage, so no stage re-reads the raw payload or
+    re-streams turns from the database. Normalization is incremental: if the
+    payload adds nothing new, the later stages are skipped, and so are
+    correlation and fusion when analysis yields no sentiment entities (the
+    sentiment analyzer is disabled, or every turn already had a current or
+    cached result). Only candidates generated in this run are fused.
+
+    ``checkpoints`` names the stages after which the session is committed
+    (defaults to ``PIPELINE_CHECKPOINTS``), so a failure in a later stage keeps
+    the work of earlier ones. Work after the last checkpoint is left for the
+    caller to commit.
+    """
+    stops = configured_checkpoints() if checkpoints is None else set(checkpoints)
+    unknown = sorted(set(stops) - set(PIPELINE_STAGES))
+    if unknown:
+        raise ValueError(f"Unknown pipeline checkpoint stage(s): {unknown}")
+    result = PipelineResult(raw_data_id=raw_data_id)
+
+    def checkpoint(stage: str) -> None:
+        if stage in stops:
+            session.commit()
+            result.checkpoints.append(stage)
+
+    turns: list[TurnRow] = []
+    result.turns = normalize_raw_data(
+        session,
+        raw_data_id,
+        streaming=True,
+        incremental=True,
+        batch_size=batch_size,
+        turn_sink=turns,
+    )
+    checkpoint("normalize")
+    if not turns:
+        return result
+
+    record = get_raw_data(session, raw_data_id, include_content=False)
+    entities: list[dict[str, Any]] = []
+    result.analyzed = analyze_turns(
+        session,
+        raw_data_id,
+        ((turn["id"], turn["text"]) for turn in turns),
+        source_type=record.source_type if record is not None else "unknown",
+        entity_sink=entities,
+    )
+    result.entities = len(entities)
+    checkpoint("analyze")
+
+    sentiment = [
+        EntityRef(
+            entity["id"],
+            entity["conversation_turn_id"],
+            entity["value"],
+            entity["relevance"],
+        )
+        for entity in entities
+        if entity["type"] == "SENTIMENT"
+    ]
+    if not sentiment:
+        return result
+
+    candidates: list[CandidateRef] = []
+    result.candidates = generate_candidates(
+        session,
+        raw_data_id,
+        sentiment,
+        {turn["id"]: turn["conversation_id"] for turn in turns},
+        candidate_sink=candidates,
+    )
+    checkpoint("correlate")
+
+    fused = fuse_candidates(session, raw_data_id, candidates)
+    result.confirmed = fused["confirmed"]
+    result.rejected = fused["rejected"]
+    checkpoint("fuse")
+    return result
+
+
+__all__ = ["PipelineResult", "configured_checkpoints", "run_full_pipeline"]
@@ -1,5 +1,15 @@
 """Hybrid search utilities."""
 
-from .service import hybrid_search
+from .service import (
+    hybrid_search,
+    load_search_candidates,
+    rank_search_candidates,
+    search_tokens,
+)
 
-__all__ = ["hybrid_search"]
+__all__ = [
+    "hybrid_search",
+    "load_search_candidates",
+    "rank_search_candidates",
+    "search_tokens",
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 
 from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
@@ -40,10 +41,31 @@ def hybrid_search(
     limit: int = 10,
 ) -> list[dict[str, object]]:
     """Return ranked conversation turns using keyword + semantic heuristics."""
+    query_tokens = search_tokens(query)
+    turns, sentiments = load_search_candidates(session, query_tokens, limit=limit)
+    return rank_search_candidates(query_tokens, turns, sentiments, limit=limit)
+
+
+def search_tokens(query: str) -> list[str]:
+    """Tokenize ``query``, rejecting queries without any searchable token."""
     query_tokens = _tokenize(query)
     if not query_tokens:
         raise SearchError("Query must contain at least one alphanumeric token")
+    return query_tokens
+
 
+def load_search_candidates(
+    session: Session,
+    query_tokens: list[str],
+    *,
+    limit: int,
+) -> tuple[Sequence[ConversationTurn], dict[str, str]]:
+    """Fetch candidate turns for ``query_tokens`` and their sentiment labels.
+
+    This is the database half of :func:`hybrid_search`; the returned turns
+    have every column loaded, so :func:`rank_search_candidates` can score them
+    on another thread without touching the session.
+    """
     like_filters = [ConversationTurn.text.ilike(f"%{token}%") for token in query_tokens]
     stmt = (
         select(ConversationTurn)
@@ -53,17 +75,26 @@ def hybrid_search(
     )
     candidate_turns = session.scalars(stmt).all()
 
-    if not candidate_turns:
-        return []
-
     sentiments: dict[str, str] = {}
+    if not candidate_turns:
+        return candidate_turns, sentiments
     entity_stmt = select(Entity).where(
         Entity.type == "SENTIMENT",
         Entity.conversation_turn_id.in_([turn.id for turn in candidate_turns]),
     )
     for entity in session.scalars(entity_stmt):
         sentiments[str(entity.conversation_turn_id)] = entity.value
+    return candidate_turns, sentiments
+
 
+def rank_search_candidates(
+    query_tokens: list[str],
+    candidate_turns: Sequence[ConversationTurn],
+    sentiments: dict[str, str],
+    *,
+    limit: int,
+) -> list[dict[str, object]]:
+    """Score candidate turns against ``query_tokens`` and format the best ones."""
     scored_results: list[tuple[float, ConversationTurn, list[str]]] = []
     for turn in candidate_turns:
         text_tokens = _tokenize(turn.text)
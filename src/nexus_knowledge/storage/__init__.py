@@ -0,0 +1,17 @@
+"""Storage backends for large payloads."""
+
+from .blobs import (
+    SUPPORTED_CODECS,
+    BlobStore,
+    BlobStoreError,
+    get_blob_store,
+    reset_blob_store,
+)
+
+__all__ = [
+    "SUPPORTED_CODECS",
+    "BlobStore",
+    "BlobStoreError",
+    "get_blob_store",
+    "reset_blob_store",
+]
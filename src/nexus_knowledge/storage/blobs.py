@@ -0,0 +1,223 @@
+"""Content-addressed, compressed on-disk storage for raw payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from nexus_knowledge.config import BLOB_CODEC_MAX_LEVELS, get_settings
+
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+SUPPORTED_CODECS = ("zstd", "zlib")
+_EXTENSIONS = {"zstd": "zst", "zlib": "zz"}
+_DECOMPRESS_ERRORS: tuple[type[Exception], ...] = (zlib.error, ValueError)
+if zstandard is not None:
+    _DECOMPRESS_ERRORS += (zstandard.ZstdError,)
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class BlobStoreError(RuntimeError):
+    """Raised when a blob cannot be written, located or verified."""
+
+
+class BlobStore:
+    """Store payloads under ``root`` keyed by their SHA-256 content hash.
+
+    Blobs are immutable: writing a hash that already exists is a no-op, so
+    concurrent writers of the same payload never conflict. References have the
+    form ``<codec>:<content_hash>`` and remain readable after the configured
+    codec changes.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        codec: str = "zstd",
+        level: int = 3,
+    ) -> None:
+        if codec not in SUPPORTED_CODECS:
+            raise BlobStoreError(
+                f"Unsupported blob codec '{codec}' (expected one of {SUPPORTED_CODECS})",
+            )
+        if not 1 <= level <= BLOB_CODEC_MAX_LEVELS[codec]:
+            raise BlobStoreError(
+                f"Compression level {level} is out of range for the '{codec}' "
+                f"codec (1-{BLOB_CODEC_MAX_LEVELS[codec]})",
+            )
+        _require_codec(codec)
+        self.root = Path(root)
+        self.codec = codec
+        self.level = level
+
+    def put(self, content_hash: str, content: str) -> str:
+        """Persist ``content`` and return its reference."""
+        reference = f"{self.codec}:{content_hash}"
+        path = self._path(self.codec, content_hash)
+        if path.exists():
+            return reference
+
+        compressed = _compress(self.codec, content.encode("utf-8"), self.level)
+        self._install(path, lambda handle: handle.write(compressed))
+        return reference
+
+    def put_chunks(self, content_hash: str, chunks: Iterable[bytes]) -> str:
+        """Persist a payload delivered as UTF-8 ``chunks`` and return its reference.
+
+        The chunks are compressed as they are consumed, so the payload is never
+        held in memory as a whole. The blob is only installed when the chunks
+        hash to ``content_hash``.
+        """
+        reference = f"{self.codec}:{content_hash}"
+        path = self._path(self.codec, content_hash)
+        if path.exists():
+            return reference
+
+        def write(handle: BinaryIO) -> None:
+            compressor = _compressobj(self.codec, self.level)
+            hasher = hashlib.sha256()
+            for chunk in chunks:
+                hasher.update(chunk)
+                handle.write(compressor.compress(chunk))
+            handle.write(compressor.flush())
+            if hasher.hexdigest() != content_hash:
+                raise BlobStoreError(
+                    f"Streamed payload does not match content hash {content_hash}",
+                )
+
+        self._install(path, write)
+        return reference
+
+    def get(self, reference: str) -> str:
+        """Return the decompressed payload for ``reference``.
+
+        The payload is verified against the hash embedded in the reference.
+        """
+        codec, _, content_hash = reference.partition(":")
+        if codec not in SUPPORTED_CODECS or not content_hash:
+            raise BlobStoreError(f"Malformed blob reference '{reference}'")
+        _require_codec(codec)
+        path = self._path(codec, content_hash)
+        try:
+            compressed = path.read_bytes()
+        except FileNotFoundError as exc:
+            raise BlobStoreError(f"Blob {reference} not found in {self.root}") from exc
+
+        data = _decompress(codec, compressed)
+        if hashlib.sha256(data).hexdigest() != content_hash:
+            raise BlobStoreError(f"Blob {reference} failed checksum verification")
+        return data.decode("utf-8")
+
+    def _install(self, path: Path, write: Callable[[BinaryIO], object]) -> None:
+        """Write a blob through a temporary file and atomically move it in place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                write(handle)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _path(self, codec: str, content_hash: str) -> Path:
+        return (
+            self.root
+            / content_hash[:2]
+            / content_hash[2:4]
+            / f"{content_hash}.{_EXTENSIONS[codec]}"
+        )
+
+
+def _require_codec(codec: str) -> None:
+    if codec == "zstd" and zstandard is None:
+        raise BlobStoreError(
+            "The 'zstd' blob codec requires the optional 'zstandard' package "
+            "(pip install 'nexus_knowledge[storage]').",
+        )
+
+
+def _compress(codec: str, data: bytes, level: int) -> bytes:
+    if codec == "zstd":
+        compressed: bytes = zstandard.ZstdCompressor(level=level).compress(data)
+        return compressed
+    return zlib.compress(data, level)
+
+
+def _compressobj(codec: str, level: int) -> _Compressor:
+    if codec == "zstd":
+        compressor: _Compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        return compressor
+    return zlib.compressobj(level)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    try:
+        if codec == "zstd":
+            # Streamed blobs carry no content size in their frame header, which
+            # the one-shot ``decompress`` requires.
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            decompressed: bytes = decompressor.decompress(data)
+            return decompressed
+        return zlib.decompress(data)
+    except _DECOMPRESS_ERRORS as exc:
+        raise BlobStoreError(f"Corrupt {codec} blob: {exc}") from exc
+
+
+_STORE: BlobStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_blob_store() -> BlobStore | None:
+    """Return the configured blob store, or None when raw payloads stay inline."""
+    global _STORE  # noqa: PLW0603
+    settings = get_settings()
+    if not settings.raw_content_store_path:
+        return None
+    root = Path(settings.raw_content_store_path)
+    with _STORE_LOCK:
+        if (
+            _STORE is None
+            or _STORE.root != root
+            or _STORE.codec != settings.raw_content_store_codec
+            or _STORE.level != settings.raw_content_store_level
+        ):
+            _STORE = BlobStore(
+                root,
+                codec=settings.raw_content_store_codec,
+                level=settings.raw_content_store_level,
+            )
+        return _STORE
+
+
+def reset_blob_store() -> None:
+    """Drop the cached blob store (useful for tests)."""
+    global _STORE  # noqa: PLW0603
+    with _STORE_LOCK:
+        _STORE = None
+
+
+__all__ = [
+    "SUPPORTED_CODECS",
+    "BlobStore",
+    "BlobStoreError",
+    "get_blob_store",
+    "reset_blob_store",
+]
@@ -7,23 +7,32 @@ import uuid
 from typing import Any
 
 import mlflow
-from celery import Celery
+from celery import Celery, Task
+from celery.signals import worker_process_shutdown
 
+from nexus_knowledge.analysis.analyzers import get_analyzers
 from nexus_knowledge.analysis.pipeline import run_analysis_for_raw_data
 from nexus_knowledge.config import get_settings
 from nexus_knowledge.correlation import generate_candidates_for_raw
 from nexus_knowledge.correlation.pipeline import fuse_candidates_for_raw
-from nexus_knowledge.db.repository import create_user_feedback
+from nexus_knowledge.db.repository import create_user_feedback, get_raw_data_status
 from nexus_knowledge.db.session import session_scope
-from nexus_knowledge.experiment_tracking import log_task_artifact, mlflow_task_run
+from nexus_knowledge.experiment_tracking import (
+    buffered_task_run,
+    log_task_artifact,
+    mlflow_task_run,
+    shutdown_tracking_sink,
+)
 from nexus_knowledge.export import export_to_obsidian
-from nexus_knowledge.ingestion.service import normalize_raw_data
+from nexus_knowledge.ingestion.service import IngestionError, normalize_raw_data
+from nexus_knowledge.ingestion.uploads import get_upload_spool, ingest_spooled_upload
 from nexus_knowledge.observability import (
     configure_logging,
     pop_celery_context,
     push_celery_context,
     track_task_execution,
 )
+from nexus_knowledge.pipeline import run_full_pipeline
 
 settings = get_settings()
 
@@ -52,6 +61,22 @@ celery_app.conf.update(
 logger = logging.getLogger(__name__)
 
 
+def _flush_tracking_on_shutdown(**_kwargs: object) -> None:
+    # Prefork children leave via os._exit, which skips atexit handlers.
+    shutdown_tracking_sink()
+
+
+worker_process_shutdown.connect(_flush_tracking_on_shutdown)
+
+
+def _analyzer_params() -> dict[str, str]:
+    names = get_settings().analysis_analyzers.split(",")
+    return {
+        f"{analyzer.name}_version": analyzer.version
+        for analyzer in get_analyzers(names)
+    }
+
+
 def _bind_task_context(
     task: Any,
     correlation_id: str | None = None,
@@ -66,7 +91,7 @@ def _bind_task_context(
 
 @celery_app.task(bind=True)
 def persist_feedback(
-    self,
+    self: Task,
     feedback_id: str,
     payload: dict[str, Any],
     *,
@@ -108,7 +133,7 @@ def persist_feedback(
 
 @celery_app.task(bind=True)
 def normalize_raw_data_task(
-    self,
+    self: Task,
     raw_data_id: str,
     *,
     correlation_id: str | None = None,
@@ -124,15 +149,20 @@ def normalize_raw_data_task(
         raw_uuid = uuid.UUID(raw_data_id)
         with (
             track_task_execution(task_name),
-            mlflow_task_run(
+            buffered_task_run(
                 task_name,
                 raw_data_id=raw_uuid,
                 correlation_id=correlation_id,
-            ),
+            ) as tracking,
         ):
             with session_scope() as session:
-                processed = normalize_raw_data(session, raw_uuid)
-            mlflow.log_metric("turns_normalized", processed)
+                processed = normalize_raw_data(
+                    session,
+                    raw_uuid,
+                    streaming=True,
+                    incremental=get_settings().normalize_incremental,
+                )
+            tracking.log_metric("turns_normalized", processed)
     except Exception:
         logger.exception(
             "task.failed",
@@ -151,12 +181,12 @@ def normalize_raw_data_task(
 
 @celery_app.task(bind=True)
 def analyze_raw_data_task(
-    self,
+    self: Task,
     raw_data_id: str,
     *,
     correlation_id: str | None = None,
 ) -> str:
-    """Run sentiment analysis on normalized conversation turns."""
+    """Run the enabled analyzers on normalized conversation turns."""
     task_name = self.name or "nexus_knowledge.tasks.analyze_raw_data_task"
     task_id, task_token, correlation_token = _bind_task_context(self, correlation_id)
     logger.info(
@@ -167,16 +197,16 @@ def analyze_raw_data_task(
         raw_uuid = uuid.UUID(raw_data_id)
         with (
             track_task_execution(task_name),
-            mlflow_task_run(
+            buffered_task_run(
                 task_name,
                 raw_data_id=raw_uuid,
                 correlation_id=correlation_id,
-                params={"pipeline": "heuristic_sentiment"},
-            ),
+                params={"pipeline": "analysis", **_analyzer_params()},
+            ) as tracking,
         ):
             with session_scope() as session:
                 processed = run_analysis_for_raw_data(session, raw_uuid)
-            mlflow.log_metric("turns_analyzed", processed)
+            tracking.log_metric("turns_analyzed", processed)
     except Exception:
         logger.exception(
             "task.failed",
@@ -195,7 +225,7 @@ def analyze_raw_data_task(
 
 @celery_app.task(bind=True)
 def generate_correlation_candidates_task(
-    self,
+    self: Task,
     raw_data_id: str,
     *,
     correlation_id: str | None = None,
@@ -213,16 +243,16 @@ def generate_correlation_candidates_task(
         raw_uuid = uuid.UUID(raw_data_id)
         with (
             track_task_execution(task_name),
-            mlflow_task_run(
+            buffered_task_run(
                 task_name,
                 raw_data_id=raw_uuid,
                 correlation_id=correlation_id,
                 params={"pipeline": "correlation_generation"},
-            ),
+            ) as tracking,
         ):
             with session_scope() as session:
                 generated = generate_candidates_for_raw(session, raw_uuid)
-            mlflow.log_metric("candidates_generated", generated)
+            tracking.log_metric("candidates_generated", generated)
     except Exception:
         logger.exception(
             "task.failed",
@@ -241,7 +271,7 @@ def generate_correlation_candidates_task(
 
 @celery_app.task(bind=True)
 def fuse_correlation_candidates_task(
-    self,
+    self: Task,
     raw_data_id: str,
     *,
     correlation_id: str | None = None,
@@ -257,17 +287,17 @@ def fuse_correlation_candidates_task(
         raw_uuid = uuid.UUID(raw_data_id)
         with (
             track_task_execution(task_name),
-            mlflow_task_run(
+            buffered_task_run(
                 task_name,
                 raw_data_id=raw_uuid,
                 correlation_id=correlation_id,
                 params={"pipeline": "correlation_fusion"},
-            ),
+            ) as tracking,
         ):
             with session_scope() as session:
                 result = fuse_candidates_for_raw(session, raw_uuid)
             for key, value in result.items():
-                mlflow.log_metric(f"relationships_{key}", value)
+                tracking.log_metric(f"relationships_{key}", value)
     except Exception:
         logger.exception(
             "task.failed",
@@ -284,9 +314,120 @@ def fuse_correlation_candidates_task(
         pop_celery_context(task_token, correlation_token)
 
 
+@celery_app.task(bind=True)
+def run_full_pipeline_task(
+    self: Task,
+    raw_data_id: str,
+    *,
+    correlation_id: str | None = None,
+) -> str:
+    """Normalize, analyze, correlate and fuse a raw payload in a single task."""
+    task_name = self.name or "nexus_knowledge.tasks.run_full_pipeline_task"
+    task_id, task_token, correlation_token = _bind_task_context(self, correlation_id)
+    logger.info(
+        "task.started",
+        extra={"task_name": task_name, "task_id": task_id, "raw_data_id": raw_data_id},
+    )
+    try:
+        raw_uuid = uuid.UUID(raw_data_id)
+        with (
+            track_task_execution(task_name),
+            buffered_task_run(
+                task_name,
+                raw_data_id=raw_uuid,
+                correlation_id=correlation_id,
+                params={"pipeline": "fused"},
+            ) as tracking,
+        ):
+            with session_scope() as session:
+                result = run_full_pipeline(session, raw_uuid)
+            tracking.log_metrics(
+                {
+                    "turns_normalized": result.turns,
+                    "turns_analyzed": result.analyzed,
+                    "entities_created": result.entities,
+                    "candidates_generated": result.candidates,
+                    "relationships_confirmed": result.confirmed,
+                    "relationships_rejected": result.rejected,
+                },
+            )
+    except Exception:
+        logger.exception(
+            "task.failed",
+            extra={"task_name": task_name, "task_id": task_id},
+        )
+        raise
+    else:
+        logger.info(
+            "task.completed",
+            extra={"task_name": task_name, "task_id": task_id},
+        )
+        return raw_data_id
+    finally:
+        pop_celery_context(task_token, correlation_token)
+
+
+@celery_app.task(bind=True)
+def ingest_upload_task(
+    self: Task,
+    upload_id: str,
+    *,
+    correlation_id: str | None = None,
+) -> str:
+    """Ingest a completed chunked upload from the spool and schedule processing."""
+    task_name = self.name or "nexus_knowledge.tasks.ingest_upload_task"
+    task_id, task_token, correlation_token = _bind_task_context(self, correlation_id)
+    logger.info(
+        "task.started",
+        extra={"task_name": task_name, "task_id": task_id, "upload_id": upload_id},
+    )
+    spool = get_upload_spool()
+    try:
+        with (
+            track_task_execution(task_name),
+            buffered_task_run(
+                task_name,
+                correlation_id=correlation_id,
+                params={"upload_id": upload_id},
+            ) as tracking,
+        ):
+            try:
+                with session_scope() as session:
+                    raw_uuid = ingest_spooled_upload(session, spool, upload_id)
+                    # Duplicates of an already processed payload resolve to
+                    # its row; only rows still awaiting normalization need it.
+                    pending = get_raw_data_status(session, raw_uuid) == "INGESTED"
+            except IngestionError as exc:
+                spool.mark_failed(upload_id, str(exc))
+                raise
+            manifest = spool.mark_ingested(upload_id, raw_uuid)
+            tracking.log_metric("bytes_ingested", manifest.received_bytes)
+        if pending:
+            follow_up = (
+                run_full_pipeline_task
+                if manifest.run_full_pipeline
+                else normalize_raw_data_task
+            )
+            follow_up.delay(str(raw_uuid), correlation_id=correlation_id)
+    except Exception:
+        logger.exception(
+            "task.failed",
+            extra={"task_name": task_name, "task_id": task_id},
+        )
+        raise
+    else:
+        logger.info(
+            "task.completed",
+            extra={"task_name": task_name, "task_id": task_id},
+        )
+        return str(raw_uuid)
+    finally:
+        pop_celery_context(task_token, correlation_token)
+
+
 @celery_app.task(bind=True)
 def export_obsidian_task(
-    self,
+    self: Task,
     raw_data_id: str,
     export_path: str,
     *,
@@ -342,6 +483,8 @@ __all__ = [
     "export_obsidian_task",
     "fuse_correlation_candidates_task",
     "generate_correlation_candidates_task",
+    "ingest_upload_task",
     "normalize_raw_data_task",
     "persist_feedback",
+    "run_full_pipeline_task",
 ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+
+from nexus_knowledge.analysis import (
+    HeuristicSentimentModel,
+    SentimentAnalyzer,
+    get_analyzers,
+    register_analyzer,
+    run_analysis_for_raw_data,
+)
+from nexus_knowledge.analysis.analyzers import ReferenceAnalyzer, TurnText
+from nexus_knowledge.analysis.cache import reset_sentiment_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import ingest_raw_payload, normalize_raw_data
+
+TEXTS = [
+    "I love Python generators, generators are great",
+    "See https://example.com/docs, then run:\n```Python\nprint('hi')\n```",
+    "terrible flaky tests, flaky again",
+]
+
+
+def _normalized(session, source_id: str) -> object:
+    raw_id = ingest_raw_payload(
+        session,
+        source_type="deepseek_chat",
+        content={
+            "source_id": source_id,
+            "messages": [{"content": text} for text in TEXTS],
+        },
+    )
+    normalize_raw_data(session, raw_id)
+    return raw_id
+
+
+def test_analyzers_share_one_scan_and_tokenization(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, engine = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    reset_sentiment_cache()
+    tokenized: list[str] = []
+    tokenize = HeuristicSentimentModel.tokenize
+
+    def _tokenize(text: str) -> list[str]:
+        tokenized.append(text)
+        return tokenize(text)
+
+    monkeypatch.setattr(HeuristicSentimentModel, "tokenize", staticmethod(_tokenize))
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute", named=True)
+    def _capture(**kwargs) -> None:
+        statements.append(kwargs["statement"])
+
+    with session_factory.begin() as session:
+        raw_id = _normalized(session, "analyzers-1")
+        statements.clear()
+        analyzed = run_analysis_for_raw_data(
+            session,
+            raw_id,
+            analyzers=["sentiment", "keywords", "references"],
+        )
+        entities = repository.list_entities_for_raw(session, raw_id)
+
+    assert analyzed == len(TEXTS)
+    assert sorted(tokenized) == sorted(TEXTS)
+    turn_scans = [
+        statement
+        for statement in statements
+        if statement.lstrip().startswith("SELECT")
+        and "FROM conversation_turns" in statement
+    ]
+    assert len(turn_scans) == 1
+    entity_inserts = [s for s in statements if s.startswith("INSERT INTO entities")]
+    assert len(entity_inserts) == 1
+
+    values = {(entity.type, entity.value) for entity in entities}
+    assert ("KEYWORD", "generators") in values
+    assert ("KEYWORD", "flaky") in values
+    assert ("URL", "https://example.com/docs") in values
+    assert ("CODE_BLOCK", "python") in values
+    assert sum(entity.type == "SENTIMENT" for entity in entities) == len(TEXTS)
+
+
+def test_enabling_an_analyzer_only_runs_that_analyzer(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+
+    with session_factory.begin() as session:
+        raw_id = _normalized(session, "analyzers-2")
+        assert run_analysis_for_raw_data(session, raw_id) == len(TEXTS)
+        sentiment_ids = {
+            entity.id for entity in repository.list_entities_for_raw(session, raw_id)
+        }
+        assert run_analysis_for_raw_data(
+            session,
+            raw_id,
+            analyzers=["sentiment", "references"],
+        ) == len(TEXTS)
+        entities = repository.list_entities_for_raw(session, raw_id)
+
+    assert {
+        entity.id for entity in entities if entity.type == "SENTIMENT"
+    } == sentiment_ids
+    assert {entity.type for entity in entities} == {"SENTIMENT", "URL", "CODE_BLOCK"}
+
+
+def test_registry_and_reference_parsing() -> None:
+    with pytest.raises(ValueError, match="already registered"):
+        register_analyzer(SentimentAnalyzer())
+    with pytest.raises(ValueError, match="Unknown analyzer"):
+        get_analyzers(["sentiment", "missing"])
+
+    (rows,) = ReferenceAnalyzer().analyze(
+        [
+            TurnText(
+                "Links: http://a.io/x. and (https://b.io/y)! http://a.io/x\n```\nz\n```",
+            ),
+        ],
+    )
+    assert [(row["type"], row["value"]) for row in rows] == [
+        ("CODE_BLOCK", "text"),
+        ("URL", "http://a.io/x"),
+        ("URL", "https://b.io/y"),
+    ]
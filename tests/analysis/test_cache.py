@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import func, select, update
+
+from nexus_knowledge.analysis import run_analysis_for_raw_data
+from nexus_knowledge.analysis.cache import (
+    SentimentCache,
+    get_sentiment_cache,
+    reset_sentiment_cache,
+    sentiment_cache_key,
+)
+from nexus_knowledge.analysis.model import SentimentResult
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.db.models import AnalysisCacheEntry
+from nexus_knowledge.ingestion import ingest_raw_payload, normalize_raw_data
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_sentiment_cache()
+    yield
+    reset_sentiment_cache()
+
+
+def _lookups(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "nexus_analysis_cache_lookups_total",
+            {"result": result},
+        )
+        or 0.0
+    )
+
+
+def _analyze(session, source_id: str, texts: list[str]) -> list[str]:
+    raw_id = ingest_raw_payload(
+        session,
+        source_type="deepseek_chat",
+        content={
+            "source_id": source_id,
+            "messages": [{"content": text} for text in texts],
+        },
+    )
+    normalize_raw_data(session, raw_id)
+    run_analysis_for_raw_data(session, raw_id)
+    return [
+        entity.value for entity in repository.list_entities_for_raw(session, raw_id)
+    ]
+
+
+def test_repeated_turns_are_served_from_cache(sqlite_db, tmp_path, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    texts = ["Thanks!", "I love it", "thanks!", "Continue", "bad"]
+
+    misses = _lookups("miss")
+    with session_factory.begin() as session:
+        first = _analyze(session, "cache-1", texts)
+    assert _lookups("miss") - misses == len(texts)
+
+    memory, misses = _lookups("memory"), _lookups("miss")
+    with session_factory.begin() as session:
+        second = _analyze(session, "cache-2", [f"  {text.upper()} " for text in texts])
+    assert second == first
+    assert _lookups("memory") - memory == len(texts)
+    assert _lookups("miss") == misses
+
+    reset_sentiment_cache()
+    database = _lookups("database")
+    with session_factory.begin() as session:
+        third = _analyze(session, "cache-3", texts)
+    assert third == first
+    assert _lookups("database") - database == len(texts)
+    assert sentiment_cache_key("Thanks!") == sentiment_cache_key(" THANKS! ")
+
+
+def test_prune_keeps_most_recently_used_rows(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    cache = SentimentCache(2)
+    result = SentimentResult("NEUTRAL", 0.0, 0, 0)
+    keys = [sentiment_cache_key(text) for text in ("one", "two", "three")]
+    now = datetime.now(UTC)
+
+    with session_factory.begin() as session:
+        cache.put_many(session, "v1", dict.fromkeys(keys, result))
+        for age, key in enumerate(reversed(keys)):
+            session.execute(
+                update(AnalysisCacheEntry)
+                .where(AnalysisCacheEntry.text_hash == key)
+                .values(last_used_at=now - timedelta(minutes=age)),
+            )
+        cache.get_many(session, "v1", [keys[0]])
+        assert cache.prune(session) == 1
+        remaining = set(session.scalars(select(AnalysisCacheEntry.text_hash)))
+        assert remaining == {keys[0], keys[2]}
+        assert session.scalar(select(func.count()).select_from(AnalysisCacheEntry)) == 2
+
+
+def test_prune_removes_exactly_the_excess_rows_on_tied_timestamps(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    cache = SentimentCache(2)
+    result = SentimentResult("NEUTRAL", 0.0, 0, 0)
+    keys = [sentiment_cache_key(text) for text in ("one", "two", "three", "four")]
+
+    with session_factory.begin() as session:
+        cache.put_many(session, "v1", dict.fromkeys(keys, result))
+        session.execute(
+            update(AnalysisCacheEntry).values(last_used_at=datetime.now(UTC)),
+        )
+        assert cache.prune(session) == 2
+        assert session.scalar(select(func.count()).select_from(AnalysisCacheEntry)) == 2
+        assert cache.prune(session) == 0
+
+
+def test_cache_disabled_with_zero_rows(monkeypatch) -> None:
+    monkeypatch.setenv("ANALYSIS_CACHE_ROWS", "0")
+    clear_settings_cache()
+    try:
+        assert get_sentiment_cache() is None
+    finally:
+        monkeypatch.delenv("ANALYSIS_CACHE_ROWS")
+        clear_settings_cache()
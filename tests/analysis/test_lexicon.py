@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nexus_knowledge.analysis.analyzers import SentimentAnalyzer, TurnText
+from nexus_knowledge.analysis.lexicon import (
+    KIND_INTENSIFIER,
+    KIND_NEGATION,
+    KIND_TERM,
+    Lexicon,
+    LexiconError,
+    LexiconSentimentModel,
+    compile_lexicon,
+    get_sentiment_model,
+    parse_lexicon_source,
+    read_lexicon_version,
+    reset_sentiment_model,
+)
+from nexus_knowledge.analysis.model import HeuristicSentimentModel
+from nexus_knowledge.config import clear_settings_cache
+
+SOURCE = """\
+# term\tweight\tkind
+good\t1.0
+great\t2.0
+bad\t-1.5
+not\t0\tnegation
+very\t2\tintensifier
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model():
+    reset_sentiment_model()
+    yield
+    reset_sentiment_model()
+
+
+@pytest.fixture
+def lexicon_path(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    compile_lexicon(parse_lexicon_source(SOURCE.splitlines()), path)
+    return path
+
+
+def test_compiled_lexicon_is_memory_mapped(lexicon_path) -> None:
+    lexicon = Lexicon(lexicon_path)
+
+    assert len(lexicon) == 5
+    assert isinstance(lexicon.keys, np.memmap)
+    assert lexicon.version == read_lexicon_version(lexicon_path)
+    weights, kinds = lexicon.lookup(["great", "not", "very", "unknown"])
+    assert weights.tolist() == [2.0, 0.0, 2.0, 0.0]
+    assert kinds.tolist() == [KIND_TERM, KIND_NEGATION, KIND_INTENSIFIER, KIND_TERM]
+
+
+def test_version_follows_content(tmp_path, lexicon_path) -> None:
+    entries = parse_lexicon_source(SOURCE.splitlines())
+    assert (
+        compile_lexicon(entries, tmp_path / "copy.bin")
+        == Lexicon(
+            lexicon_path,
+        ).version
+    )
+    entries["good"] = (0.5, KIND_TERM)
+    assert (
+        compile_lexicon(entries, tmp_path / "copy.bin")
+        != Lexicon(
+            lexicon_path,
+        ).version
+    )
+
+
+def test_invalid_sources_and_files_are_rejected(tmp_path) -> None:
+    with pytest.raises(LexiconError, match="unknown kind"):
+        parse_lexicon_source(["good\t1\tbooster"])
+    with pytest.raises(LexiconError, match="invalid weight"):
+        parse_lexicon_source(["good\tvery"])
+    path = tmp_path / "lexicon.bin"
+    path.write_bytes(b"not a lexicon at all, really not at all")
+    with pytest.raises(LexiconError, match="not a compiled lexicon"):
+        Lexicon(path)
+
+
+def test_negations_and_intensifiers(lexicon_path) -> None:
+    model = LexiconSentimentModel(Lexicon(lexicon_path))
+
+    results = model.predict_batch(
+        [
+            "good",
+            "not good",
+            "not really good",
+            "very bad",
+            "",
+            "not",
+        ],
+    )
+
+    assert [result.label for result in results] == [
+        "POSITIVE",
+        "NEGATIVE",
+        "NEGATIVE",
+        "NEGATIVE",
+        "NEUTRAL",
+        "NEUTRAL",
+    ]
+    assert results[0].score == 1.0
+    assert results[3].score == pytest.approx(-1.5)
+    assert (results[1].positive_matches, results[1].negative_matches) == (0, 1)
+    # Negation only reaches turns it belongs to.
+    good, negated = model.predict_batch(["not", "good"])
+    assert good.label == "NEUTRAL"
+    assert negated.label == "POSITIVE"
+
+
+def test_registry_hot_swaps_on_version_change(monkeypatch, lexicon_path) -> None:
+    monkeypatch.delenv("ANALYSIS_LEXICON_PATH", raising=False)
+    clear_settings_cache()
+    try:
+        default = get_sentiment_model()
+        assert isinstance(default, HeuristicSentimentModel)
+        assert get_sentiment_model() is default
+
+        monkeypatch.setenv("ANALYSIS_LEXICON_PATH", str(lexicon_path))
+        clear_settings_cache()
+        analyzer = SentimentAnalyzer()
+        loaded = get_sentiment_model()
+        assert isinstance(loaded, LexiconSentimentModel)
+        assert analyzer.model is loaded
+        assert get_sentiment_model() is loaded
+
+        # Recompiling the same content keeps the loaded model.
+        compile_lexicon(parse_lexicon_source(SOURCE.splitlines()), lexicon_path)
+        assert get_sentiment_model() is loaded
+
+        compile_lexicon({"good": (-1.0, KIND_TERM)}, lexicon_path)
+        swapped = get_sentiment_model()
+        assert swapped is not loaded
+        assert swapped.version != loaded.version
+        assert analyzer.version == swapped.version
+        [[entity]] = analyzer.analyze([TurnText("good")])
+        assert entity["value"] == "NEGATIVE"
+    finally:
+        monkeypatch.delenv("ANALYSIS_LEXICON_PATH", raising=False)
+        clear_settings_cache()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from nexus_knowledge.analysis import HeuristicSentimentModel
+
+
+def test_predict_batch_matches_per_text_scoring() -> None:
+    model = HeuristicSentimentModel(
+        positive=["good", "Love", "mixed"],
+        negative=["bad", "mixed"],
+    )
+    texts = [
+        "I LOVE this, it's good",
+        "bad, bad and good",
+        "mixed feelings",
+        "",
+        "nothing to see here",
+    ]
+
+    results = model.predict_batch(texts)
+
+    assert [result.label for result in results] == [
+        "POSITIVE",
+        "NEGATIVE",
+        "NEUTRAL",
+        "NEUTRAL",
+        "NEUTRAL",
+    ]
+    assert [(r.positive_matches, r.negative_matches) for r in results] == [
+        (2, 0),
+        (1, 2),
+        (1, 1),
+        (0, 0),
+        (0, 0),
+    ]
+    assert results[0].score == 2 / 5
+    assert results[1].score == -1 / 4
+    assert results == [model.predict(text) for text in texts]
+    assert isinstance(results[0].positive_matches, int)
+    assert model.predict_batch([]) == []
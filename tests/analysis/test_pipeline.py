@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import multiprocessing
+
+import billiard
 import mlflow
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
-from nexus_knowledge.analysis import run_analysis_for_raw_data
+from nexus_knowledge.analysis import HeuristicSentimentModel, run_analysis_for_raw_data
+from nexus_knowledge.analysis import pipeline as analysis_pipeline
 from nexus_knowledge.analysis.pipeline import AnalysisError
 from nexus_knowledge.db import repository
+from nexus_knowledge.experiment_tracking import flush_tracking
 from nexus_knowledge.ingestion import ingest_raw_payload, normalize_raw_data
 
 
@@ -54,6 +61,7 @@ def test_run_analysis_logs_entities(sqlite_db, tmp_path, monkeypatch) -> None:
         assert record is not None
         assert record.status == "ANALYZED"
 
+    assert flush_tracking(timeout=10)
     mlflow.set_tracking_uri(tracking_uri)
     runs = mlflow.search_runs(experiment_names=["Analysis"])
     assert not runs.empty
@@ -81,3 +89,141 @@ def test_run_analysis_without_turns_marks_failure(
         record = repository.get_raw_data(session, raw_id)
         assert record is not None
         assert record.status in {"FAILED", "ANALYSIS_FAILED"}
+
+
+def test_parallel_analysis_matches_serial_output(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    monkeypatch.setattr(analysis_pipeline, "ANALYSIS_BATCH_SIZE", 4)
+    texts = ["I love it", "bad and sad", "plain", "great, good", "hate"] * 5
+
+    outputs = {}
+    with session_factory.begin() as session:
+        for workers in (1, 2):
+            raw_id = ingest_raw_payload(
+                session,
+                source_type="deepseek_chat",
+                content={
+                    "source_id": f"parallel-{workers}",
+                    "messages": [{"content": text} for text in texts],
+                },
+            )
+            normalize_raw_data(session, raw_id)
+            processed = run_analysis_for_raw_data(session, raw_id, workers=workers)
+            assert processed == len(texts)
+            outputs[workers] = [
+                (entity.value, entity.relevance, entity.metadata_)
+                for entity in repository.list_entities_for_raw(session, raw_id)
+            ]
+
+    assert outputs[2] == outputs[1]
+    assert [value for value, _, _ in outputs[1][:5]] == [
+        "POSITIVE",
+        "NEGATIVE",
+        "NEUTRAL",
+        "POSITIVE",
+        "NEGATIVE",
+    ]
+
+
+_pools: list[int] = []
+
+
+def _counting_pool(processes: int):
+    _pools.append(processes)
+    return billiard.Pool(processes=processes)
+
+
+def _analyze_in_daemon(database_url: str, raw_id, queue) -> None:
+    engine = create_engine(database_url)
+    try:
+        with sessionmaker(bind=engine).begin() as session:
+            processed = run_analysis_for_raw_data(session, raw_id, workers=2)
+        queue.put((processed, _pools))
+    except Exception as exc:
+        queue.put(repr(exc))
+    finally:
+        engine.dispose()
+
+
+def test_parallel_analysis_runs_in_daemonic_worker(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    # Celery prefork children are daemonic processes.
+    database_url, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    monkeypatch.setattr(analysis_pipeline, "ANALYSIS_BATCH_SIZE", 4)
+    monkeypatch.setattr(analysis_pipeline, "Pool", _counting_pool)
+    texts = ["I love it", "bad and sad", "plain", "great, good", "hate"] * 3
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content={
+                "source_id": "daemonic",
+                "messages": [{"content": text} for text in texts],
+            },
+        )
+        normalize_raw_data(session, raw_id)
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    worker = context.Process(
+        target=_analyze_in_daemon,
+        args=(database_url, raw_id, queue),
+        daemon=True,
+    )
+    worker.start()
+    assert queue.get(timeout=60) == (len(texts), [2])
+    worker.join(timeout=10)
+
+    with session_factory() as session:
+        entities = repository.list_entities_for_raw(session, raw_id)
+        assert [entity.value for entity in entities][:3] == [
+            "POSITIVE",
+            "NEGATIVE",
+            "NEUTRAL",
+        ]
+
+
+def test_rerun_only_scores_new_or_stale_turns(sqlite_db, tmp_path, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_sample_payload(),
+        )
+        normalize_raw_data(session, raw_id)
+        assert run_analysis_for_raw_data(session, raw_id) == 2
+        assert run_analysis_for_raw_data(session, raw_id) == 0
+        first, second = repository.list_turns_for_raw(session, raw_id)
+        first.text = "I hate this feature"
+        session.flush()
+        assert run_analysis_for_raw_data(session, raw_id) == 1
+
+        monkeypatch.setattr(HeuristicSentimentModel, "ALGORITHM_VERSION", 2)
+        assert run_analysis_for_raw_data(session, raw_id) == 2
+
+        entities = repository.list_entities_for_raw(session, raw_id)
+        assert len(entities) == 2
+        by_turn = {entity.conversation_turn_id: entity.value for entity in entities}
+        assert by_turn == {first.id: "NEGATIVE", second.id: "NEUTRAL"}
+        results = repository.get_analysis_results(
+            session,
+            [first.id, second.id],
+            analyzers=[analysis_pipeline.SENTIMENT_ANALYZER],
+        )
+        assert set(results) == {
+            (first.id, analysis_pipeline.SENTIMENT_ANALYZER),
+            (second.id, analysis_pipeline.SENTIMENT_ANALYZER),
+        }
+        assert len({result.model_version for result in results.values()}) == 1
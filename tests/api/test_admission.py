@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import importlib
+import uuid
+
+import redis
+from fastapi.testclient import TestClient
+
+from nexus_knowledge.api.admission import (
+    AdmissionController,
+    QueueDepthProbe,
+    get_admission_controller,
+    reset_admission_controller,
+)
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db.session import reset_session_factory
+from nexus_knowledge.observability import collect_metrics
+
+
+def test_queue_depth_probe_caches_and_fails_open() -> None:
+    samples = iter([7, redis.ConnectionError("broker down")])
+    calls: list[int] = []
+
+    def reader() -> int:
+        calls.append(1)
+        value = next(samples)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    probe = QueueDepthProbe(reader, queue="probe-test", ttl_seconds=60)
+    assert probe.depth() == 7
+    assert probe.depth() == 7
+    assert len(calls) == 1
+    assert b'nexus_celery_queue_depth{queue="probe-test"} 7.0' in collect_metrics()
+
+    probe.ttl_seconds = 0
+    assert probe.depth() is None
+    controller = AdmissionController(probe, {"ingest": 1})
+    assert controller.evaluate("ingest", None).admitted
+
+
+def test_admission_controller_watermarks() -> None:
+    probe = QueueDepthProbe(lambda: 0)
+    controller = AdmissionController(
+        probe,
+        {"ingest": 10, "analysis": 0},
+        retry_after_seconds=5,
+    )
+    assert controller.evaluate("ingest", 9).admitted
+    rejected = controller.evaluate("ingest", 25)
+    assert not rejected.admitted
+    assert rejected.retry_after_seconds == 15
+    assert controller.evaluate("analysis", 10_000).admitted
+
+
+def test_saturated_queue_returns_429(sqlite_db, monkeypatch) -> None:
+    monkeypatch.setenv("ADMISSION_INGEST_WATERMARK", "100")
+    monkeypatch.setenv("ADMISSION_ANALYSIS_WATERMARK", "500")
+    monkeypatch.setenv("ADMISSION_RETRY_AFTER_SECONDS", "10")
+    clear_settings_cache()
+    reset_session_factory()
+    reset_admission_controller()
+    module = importlib.reload(importlib.import_module("nexus_knowledge.api.main"))
+
+    depth = {"value": 200}
+    controller = get_admission_controller()
+    controller.probe = QueueDepthProbe(lambda: depth["value"], ttl_seconds=0)
+
+    client = TestClient(module.app)
+    try:
+        response = client.post(
+            "/api/v1/ingest",
+            json={"sourceType": "deepseek_chat", "content": {"messages": []}},
+        )
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+
+        analysis = client.post(
+            "/api/v1/analysis",
+            json={"rawDataId": str(uuid.uuid4())},
+        )
+        assert analysis.status_code != 429
+
+        depth["value"] = 10
+        response = client.post(
+            "/api/v1/ingest",
+            json={"sourceType": "deepseek_chat", "content": {"messages": []}},
+        )
+        assert response.status_code == 202
+        assert client.get("/api/v1/feedback").status_code == 200
+    finally:
+        reset_admission_controller()
+
+    metrics = collect_metrics().decode()
+    assert 'nexus_api_admission_rejections_total{workload="ingest"}' in metrics
+    assert 'nexus_celery_queue_depth{queue="default"} 10.0' in metrics
+
+
+def test_admission_control_can_be_disabled(monkeypatch) -> None:
+    monkeypatch.setenv("ADMISSION_CONTROL_ENABLED", "false")
+    clear_settings_cache()
+    try:
+        assert get_admission_controller() is None
+    finally:
+        clear_settings_cache()
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import importlib
+import json
 import uuid
 
 from fastapi.testclient import TestClient
 
 from nexus_knowledge.analysis import run_analysis_for_raw_data
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.correlation import generate_candidates_for_raw
 from nexus_knowledge.db import repository
-from nexus_knowledge.db.session import reset_session_factory
+from nexus_knowledge.db.session import reset_session_factory, session_scope
 from nexus_knowledge.ingestion import ingest_raw_payload
 from nexus_knowledge.ingestion.service import normalize_raw_data
 
@@ -175,6 +178,161 @@ def test_ingestion_endpoint_triggers_normalization(sqlite_db, monkeypatch) -> No
     assert data["rawDataId"] == captured["raw_data_id"]
 
 
+def test_ingestion_endpoint_can_schedule_full_pipeline(sqlite_db, monkeypatch) -> None:
+    reset_session_factory()
+    module = importlib.import_module("nexus_knowledge.api.main")
+    module = importlib.reload(module)
+
+    scheduled: dict[str, str] = {}
+
+    def _fake(task_name: str):
+        def fake_delay(raw_data_id, **_kwargs) -> None:
+            scheduled[task_name] = raw_data_id
+
+        return fake_delay
+
+    monkeypatch.setattr(module.normalize_raw_data_task, "delay", _fake("normalize"))
+    monkeypatch.setattr(module.run_full_pipeline_task, "delay", _fake("pipeline"))
+
+    client = TestClient(module.app)
+    response = client.post(
+        "/api/v1/ingest",
+        json={
+            "sourceType": "deepseek_chat",
+            "runFullPipeline": True,
+            "content": {"messages": [{"role": "user", "content": "Hello"}]},
+        },
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert scheduled == {"pipeline": data["rawDataId"]}
+    assert "full pipeline" in data["message"]
+
+
+def test_raw_body_ingestion_stores_bytes_verbatim(sqlite_db, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    reset_session_factory()
+    module = importlib.import_module("nexus_knowledge.api.main")
+    module = importlib.reload(module)
+
+    scheduled: list[str] = []
+    monkeypatch.setattr(
+        module.normalize_raw_data_task,
+        "delay",
+        lambda raw_data_id, **_kwargs: scheduled.append(raw_data_id),
+    )
+
+    body = b'{"messages": [{"role": "user", "content": "Raw body"}]}'
+    client = TestClient(module.app)
+    raw_ids = set()
+    for _ in range(2):
+        response = client.post(
+            "/api/v1/ingest/raw",
+            params={"sourceType": "deepseek_chat", "sourceId": "raw-1"},
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 202
+        raw_ids.add(response.json()["rawDataId"])
+    chunked = client.post(
+        "/api/v1/ingest/raw",
+        params={"sourceType": "deepseek_chat", "sourceId": "raw-1"},
+        content=iter([body[:10], body[10:]]),
+    )
+    assert chunked.status_code == 202
+    raw_ids.add(chunked.json()["rawDataId"])
+    (raw_id,) = raw_ids
+    assert set(scheduled) == {raw_id}
+
+    with session_factory() as session:
+        record = repository.get_raw_data(session, uuid.UUID(raw_id))
+        assert record.content == body.decode("utf-8")
+        assert record.source_id == "raw-1"
+
+    invalid = client.post(
+        "/api/v1/ingest/raw",
+        params={"sourceType": "deepseek_chat"},
+        content=b'{"messages": [',
+    )
+    assert invalid.status_code == 400
+
+    monkeypatch.setenv("INGEST_RAW_MAX_BYTES", "16")
+    clear_settings_cache()
+    try:
+        for content in (body, iter([body[:10], body[10:]])):
+            oversized = client.post(
+                "/api/v1/ingest/raw",
+                params={"sourceType": "deepseek_chat"},
+                content=content,
+            )
+            assert oversized.status_code == 413
+    finally:
+        monkeypatch.delenv("INGEST_RAW_MAX_BYTES")
+        clear_settings_cache()
+
+
+def test_batch_ingestion_deduplicates_and_enqueues_group(
+    sqlite_db,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    reset_session_factory()
+    module = importlib.import_module("nexus_knowledge.api.main")
+    module = importlib.reload(module)
+
+    scheduled = []
+
+    class FakeGroup:
+        def __init__(self, signatures):
+            self.signatures = list(signatures)
+
+        def apply_async(self):
+            scheduled.extend(signature.args[0] for signature in self.signatures)
+
+    monkeypatch.setattr(module, "group", FakeGroup)
+
+    def _item(index: int) -> dict:
+        return {
+            "sourceType": "deepseek_chat",
+            "content": {
+                "source_id": f"batch-{index}",
+                "messages": [{"role": "user", "content": f"Hi {index}"}],
+            },
+        }
+
+    client = TestClient(module.app)
+    body = "\n".join(json.dumps(_item(index)) for index in (0, 1, 0))
+    response = client.post(
+        "/api/v1/ingest/batch",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["created"] == 2
+    assert data["duplicates"] == 1
+    assert data["rawDataIds"][0] == data["rawDataIds"][2]
+    assert sorted(scheduled) == sorted(set(data["rawDataIds"]))
+
+    scheduled.clear()
+    response = client.post("/api/v1/ingest/batch", json=[_item(1), _item(2)])
+    assert response.status_code == 202
+    data = response.json()
+    assert data["created"] == 1
+    assert len(scheduled) == 2
+
+    with session_factory() as session:
+        for raw_data_id in data["rawDataIds"]:
+            record = repository.get_raw_data(session, uuid.UUID(raw_data_id))
+            assert record is not None
+            assert record.status == "INGESTED"
+
+    invalid = client.post("/api/v1/ingest/batch", json={"sourceType": "x"})
+    assert invalid.status_code == 400
+
+
 def test_ingestion_status_endpoint(sqlite_db, monkeypatch) -> None:
     _, session_factory, _ = sqlite_db
     reset_session_factory()
@@ -484,3 +642,65 @@ def test_obsidian_export_endpoint(sqlite_db, tmp_path, monkeypatch) -> None:
     )
     assert response.status_code == 202
     assert calls
+
+
+def test_reingested_export_of_known_conversations_skips_analysis(
+    sqlite_db,
+    monkeypatch,
+    tmp_path,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    reset_session_factory()
+    module = importlib.reload(importlib.import_module("nexus_knowledge.api.main"))
+    # Run each stage inline, as its Celery task would.
+    for task, stage in (
+        (module.normalize_raw_data_task, normalize_raw_data),
+        (module.analyze_raw_data_task, run_analysis_for_raw_data),
+        (module.generate_correlation_candidates_task, generate_candidates_for_raw),
+    ):
+
+        def _run_inline(raw_id: str, *, _stage=stage, **_kwargs) -> None:
+            with session_scope() as session:
+                _stage(session, uuid.UUID(raw_id))
+
+        monkeypatch.setattr(task, "delay", _run_inline)
+
+    conversation = {
+        "source_id": "reexported",
+        "messages": [
+            {"role": "user", "content": "I love this"},
+            {"role": "assistant", "content": "Glad to hear it"},
+        ],
+    }
+    client = TestClient(module.app)
+    raw_ids = []
+    for exported_at in ("2025-01-01", "2025-02-01"):
+        response = client.post(
+            "/api/v1/ingest",
+            json={
+                "sourceType": "deepseek_chat",
+                "content": {
+                    "exported_at": exported_at,
+                    "conversations": [conversation],
+                },
+            },
+        )
+        assert response.status_code == 202
+        raw_ids.append(response.json()["rawDataId"])
+    first_id, second_id = raw_ids
+    assert first_id != second_id
+
+    for raw_id in raw_ids:
+        response = client.post("/api/v1/analysis", json={"rawDataId": raw_id})
+        assert response.status_code == 202
+    assert client.get(f"/api/v1/analysis/{second_id}").json()["status"] == "ANALYZED"
+
+    response = client.post("/api/v1/correlation", json={"rawDataId": second_id})
+    assert response.status_code == 202
+    with session_factory() as session:
+        second = uuid.UUID(second_id)
+        record = repository.get_raw_data(session, second, include_content=False)
+        assert record.status == "CORRELATION_SKIPPED"
+        assert repository.list_turns_for_raw(session, second) == []
+        assert len(repository.list_turns_for_raw(session, uuid.UUID(first_id))) == 2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from nexus_knowledge.db.repository import store_mlflow_runs
+from nexus_knowledge.db.session import reset_session_factory
+
+START = datetime(2026, 10, 17, 12, 0, tzinfo=UTC)
+
+
+def _run(task_name: str, minute: int, duration: float, status: str) -> dict:
+    return {
+        "run_id": uuid.uuid4(),
+        "experiment_id": "1",
+        "run_name": f"task::{task_name}",
+        "task_name": task_name,
+        "start_time": START + timedelta(minutes=minute),
+        "end_time": START + timedelta(minutes=minute, seconds=duration),
+        "status": status,
+        "duration_seconds": duration,
+        "params": {"minute": str(minute)},
+        "metrics": {"duration_seconds": duration},
+        "tracked": minute % 2 == 0,
+    }
+
+
+def test_task_run_endpoints_query_the_mirror(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    rows = [
+        _run("normalize", minute, float(minute), "FINISHED") for minute in range(10)
+    ]
+    rows.append(_run("normalize", 10, 30.0, "FAILED"))
+    rows.append(_run("analyze", 11, 5.0, "FINISHED"))
+    with session_factory() as session:
+        store_mlflow_runs(session, rows)
+        # Mirroring the same run again is a no-op.
+        store_mlflow_runs(session, rows[:1])
+        session.commit()
+
+    reset_session_factory()
+    module = importlib.reload(importlib.import_module("nexus_knowledge.api.main"))
+    client = TestClient(module.app)
+
+    response = client.get("/api/v1/runs", params={"task": "normalize", "limit": 3})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["params"]["minute"] for item in body] == ["10", "9", "8"]
+    assert body[0]["runId"] == rows[10]["run_id"].hex
+    assert body[0]["status"] == "FAILED"
+    assert body[0]["tracked"] is True
+    assert body[1]["tracked"] is False
+
+    response = client.get(
+        "/api/v1/runs",
+        params={"status": "FINISHED", "since": "2026-10-17T12:09:00+00:00"},
+    )
+    assert [item["taskName"] for item in response.json()] == ["analyze", "normalize"]
+
+    response = client.get(
+        "/api/v1/runs/durations",
+        params={"task": "normalize", "status": "FINISHED"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "taskName": "normalize",
+        "status": "FINISHED",
+        "runs": 10,
+        "percentiles": {"p50": 4.0, "p90": 8.0, "p99": 9.0},
+    }
+
+    response = client.get(
+        "/api/v1/runs/durations",
+        params=[("task", "normalize"), ("percentile", "100"), ("percentile", "0")],
+    )
+    assert response.status_code == 422
+
+    response = client.get("/api/v1/runs/durations", params={"task": "missing"})
+    assert response.json()["runs"] == 0
+    assert response.json()["percentiles"] == {"p50": None, "p90": None, "p99": None}
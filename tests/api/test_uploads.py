@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+
+from fastapi.testclient import TestClient
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db.session import reset_session_factory
+from nexus_knowledge.ingestion.uploads import reset_upload_spool
+
+
+def test_chunked_upload_round_trip(sqlite_db, tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("UPLOAD_SPOOL_PATH", str(tmp_path / "uploads"))
+    clear_settings_cache()
+    reset_upload_spool()
+    reset_session_factory()
+    module = importlib.reload(importlib.import_module("nexus_knowledge.api.main"))
+
+    scheduled: list[str] = []
+
+    class DummyResult:
+        id = "task-upload"
+
+    def fake_delay(upload_id: str, **_kwargs) -> DummyResult:
+        scheduled.append(upload_id)
+        return DummyResult()
+
+    monkeypatch.setattr(module.ingest_upload_task, "delay", fake_delay)
+
+    data = json.dumps(
+        {"messages": [{"role": "user", "content": "chunked " * 400}]},
+    ).encode("utf-8")
+    client = TestClient(module.app)
+
+    created = client.post(
+        "/api/v1/ingest/uploads",
+        json={"sourceType": "deepseek_chat", "totalBytes": len(data)},
+    )
+    assert created.status_code == 201
+    upload_id = created.json()["uploadId"]
+
+    first = client.put(
+        f"/api/v1/ingest/uploads/{upload_id}",
+        content=data[:1000],
+        headers={"Upload-Offset": "0"},
+    )
+    assert first.status_code == 200
+    assert first.headers["Upload-Offset"] == "1000"
+
+    stale = client.put(
+        f"/api/v1/ingest/uploads/{upload_id}",
+        content=data[:1000],
+        headers={"Upload-Offset": "0"},
+    )
+    assert stale.status_code == 409
+    assert stale.headers["Upload-Offset"] == "1000"
+
+    resume_at = client.get(f"/api/v1/ingest/uploads/{upload_id}").json()["offset"]
+    rest = client.put(
+        f"/api/v1/ingest/uploads/{upload_id}",
+        content=data[resume_at:],
+        headers={"Upload-Offset": str(resume_at)},
+    )
+    assert rest.json()["offset"] == len(data)
+
+    completed = client.post(
+        f"/api/v1/ingest/uploads/{upload_id}/complete",
+        json={"sha256": hashlib.sha256(data).hexdigest()},
+    )
+    assert completed.status_code == 202
+    assert completed.json()["status"] == "COMPLETE"
+    assert completed.json()["contentHash"] == hashlib.sha256(data).hexdigest()
+    assert scheduled == [upload_id]
+
+    missing = client.get(
+        "/api/v1/ingest/uploads/00000000-0000-0000-0000-000000000000",
+    )
+    assert missing.status_code == 404
@@ -67,6 +67,36 @@ def test_prod_requires_strong_secret(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "SECRET_KEY" in " ".join(exc.value.errors)
 
 
+def test_prod_requires_shared_upload_spool(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_base_env(monkeypatch)
+    monkeypatch.setenv("APP_ENV", "prod")
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg2://u:p@db:5432/nexus")
+    monkeypatch.delenv("UPLOAD_SPOOL_PATH", raising=False)
+
+    clear_settings_cache()
+    with pytest.raises(ConfigurationError) as exc:
+        get_settings()
+    (message,) = exc.value.errors
+    assert message.startswith("UPLOAD_SPOOL_PATH must point at a directory")
+
+    monkeypatch.setenv("UPLOAD_SPOOL_PATH", "/var/lib/nexus/uploads")
+    assert reload_settings().upload_spool_path == "/var/lib/nexus/uploads"
+
+
+def test_blob_level_is_validated_per_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_base_env(monkeypatch)
+    monkeypatch.setenv("RAW_CONTENT_STORE_CODEC", "zlib")
+    monkeypatch.setenv("RAW_CONTENT_STORE_LEVEL", "19")
+
+    clear_settings_cache()
+    with pytest.raises(ConfigurationError) as exc:
+        get_settings()
+    assert "at most 9 for the 'zlib' codec" in " ".join(exc.value.errors)
+
+    monkeypatch.setenv("RAW_CONTENT_STORE_CODEC", "zstd")
+    assert reload_settings().raw_content_store_level == 19
+
+
 def test_reload_settings_reflects_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     _set_base_env(monkeypatch)
     clear_settings_cache()
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from alembic import command
 from nexus_knowledge.config import clear_settings_cache
 from nexus_knowledge.db.session import reset_session_factory
+from nexus_knowledge.experiment_tracking import flush_tracking
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 
@@ -23,6 +24,9 @@ os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
 os.environ.setdefault("MLFLOW_TRACKING_URI", f"file://{ROOT_DIR}/mlruns")
 os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-purposes-only")
 os.environ.setdefault("APP_ENV", "test")
+# The tracking sink outlives each test's database; tests that check the local
+# run mirror enable it themselves.
+os.environ.setdefault("TRACKING_MIRROR_RUNS", "false")
 # Note: LOG_LEVEL is intentionally not set here to allow individual tests to control it
 
 
@@ -211,6 +215,8 @@ def clean_mlflow_context():
             mlflow.end_run()
     except Exception as e:
         logging.error(f"Error ending mlflow run: {e}")
+    # Deliver buffered tracking data while the test's tracking store still exists
+    flush_tracking(timeout=10)
 
 
 @pytest.fixture
@@ -249,3 +255,38 @@ def sqlite_db(
         engine.dispose()
         if db_path.exists():
             os.remove(db_path)
+
+
+@pytest.fixture
+def postgres_db(
+    monkeypatch,
+) -> Generator[tuple[str, sessionmaker[Session]], None, None]:
+    """Provide a migrated PostgreSQL database from ``TEST_POSTGRES_URL``.
+
+    Tests using this fixture are skipped when the variable is unset.
+    """
+    database_url = os.environ.get("TEST_POSTGRES_URL")
+    if not database_url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    reset_session_factory()
+    clear_settings_cache()
+
+    config = _alembic_config(database_url)
+    command.upgrade(config, "head")
+
+    engine = create_engine(database_url, future=True)
+    session_factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+
+    try:
+        yield database_url, session_factory, engine
+    finally:
+        engine.dispose()
+        command.downgrade(config, "base")
+        reset_session_factory()
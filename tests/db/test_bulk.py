@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from nexus_knowledge.db import repository
+from nexus_knowledge.db.bulk import (
+    BulkWriter,
+    CopyWriter,
+    ExecutemanyWriter,
+    _copy_text,
+    bulk_insert,
+    get_bulk_writer,
+)
+from nexus_knowledge.db.models import ConversationTurn, Entity, MLflowRun
+
+
+def test_bulk_insert_round_trips_mappings_and_instances(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    conversation_id = uuid.uuid4()
+    timestamp = datetime(2025, 1, 1, 12, 30, tzinfo=UTC)
+
+    with session_factory.begin() as session:
+        record = repository.create_raw_data(
+            session,
+            source_type="deepseek_chat",
+            content='{"messages": []}',
+        )
+        instance = ConversationTurn(
+            raw_data_id=record.id,
+            conversation_id=conversation_id,
+            turn_index=1,
+            speaker="ASSISTANT",
+            text="Second",
+            timestamp=timestamp,
+        )
+        turn_ids = repository.create_conversation_turns(
+            session,
+            [
+                {
+                    "raw_data_id": record.id,
+                    "conversation_id": conversation_id,
+                    "turn_index": 0,
+                    "speaker": "USER",
+                    "text": "tab\tand\nnewline",
+                    "timestamp": timestamp,
+                    "metadata_": {"role": "user", "nested": [1, 2]},
+                },
+                instance,
+            ],
+        )
+        assert instance.id == turn_ids[1]
+        assert instance not in session
+
+        entity_ids = repository.create_entities(
+            session,
+            [{"conversation_turn_id": turn_ids[0], "type": "SENTIMENT", "value": "X"}],
+        )
+        assert repository.create_entities(session, []) == []
+
+    with session_factory() as session:
+        turns = repository.list_turns_for_raw(session, record.id)
+        assert [turn.id for turn in turns] == turn_ids
+        assert turns[0].text == "tab\tand\nnewline"
+        assert turns[0].metadata_ == {"role": "user", "nested": [1, 2]}
+        assert turns[0].timestamp.replace(tzinfo=UTC) == timestamp
+        assert turns[1].metadata_ == {}
+
+        (entity,) = repository.list_entities_for_raw(session, record.id)
+        assert entity.id == entity_ids[0]
+        assert isinstance(entity, Entity)
+        assert entity.metadata_ == {}
+
+
+def test_bulk_writer_selection_and_copy_encoding(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    with session_factory() as session:
+        connection = session.connection()
+        assert isinstance(get_bulk_writer(connection), ExecutemanyWriter)
+        with pytest.raises(ValueError, match="COPY is not available"):
+            get_bulk_writer(connection, "copy")
+
+    with pytest.raises(TypeError):
+        BulkWriter()  # type: ignore[abstract]
+
+    assert _copy_text(None) == r"\N"
+    assert _copy_text(True) == "t"
+    assert _copy_text(False) == "f"
+    assert _copy_text("a\tb\nc\\d") == r"a\tb\nc\\d"
+    assert _copy_text(0.1) == "0.1"
+    assert _copy_text(datetime(2025, 1, 1, tzinfo=UTC)) == "2025-01-01T00:00:00+00:00"
+
+
+@pytest.mark.postgresql
+def test_copy_writer_round_trips_postgres_types(postgres_db) -> None:
+    _, session_factory, _ = postgres_db
+    started = datetime(2025, 1, 1, 12, 30, tzinfo=UTC)
+    rows = [
+        {
+            "experiment_id": "tab\tnew\nline\\slash",
+            "start_time": started,
+            "params": {"quote": 'a "b"', "nested": [1, None, True]},
+            "metrics": {},
+            "duration_seconds": 0.1,
+            "tracked": True,
+        },
+        {
+            "experiment_id": "plain",
+            "run_name": None,
+            "start_time": started,
+            "end_time": None,
+            "params": {"text": "line\nbreak\ttab"},
+            "tracked": False,
+        },
+    ]
+
+    with session_factory.begin() as session:
+        assert isinstance(get_bulk_writer(session.connection()), CopyWriter)
+        run_ids = bulk_insert(session, MLflowRun, rows, method="copy")
+
+    with session_factory() as session:
+        first, second = (session.get(MLflowRun, run_id) for run_id in run_ids)
+        assert first.experiment_id == "tab\tnew\nline\\slash"
+        assert first.params == {"quote": 'a "b"', "nested": [1, None, True]}
+        assert first.metrics == {}
+        assert first.duration_seconds == 0.1
+        assert first.tracked is True
+        assert first.start_time == started
+        assert second.run_name is None
+        assert second.end_time is None
+        assert second.duration_seconds is None
+        assert second.params == {"text": "line\nbreak\ttab"}
+        assert second.tracked is False
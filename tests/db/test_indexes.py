@@ -20,3 +20,14 @@ def test_performance_indexes_created(sqlite_db) -> None:
 
     candidate_indexes = _index_names(engine, "correlation_candidates")
     assert "idx_correlation_candidates_raw_status" in candidate_indexes
+
+
+def test_mlflow_run_query_indexes_created(sqlite_db) -> None:
+    _, _, engine = sqlite_db
+
+    assert {
+        "idx_mlflow_runs_start_time",
+        "idx_mlflow_runs_task_start",
+        "idx_mlflow_runs_status_start",
+        "idx_mlflow_runs_task_duration",
+    } <= _index_names(engine, "mlflow_runs")
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import math
 import uuid
 
-from nexus_knowledge.db import repository
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from nexus_knowledge.db import async_repository, repository
+from nexus_knowledge.db.models import MLflowRun
+from nexus_knowledge.db.session import get_async_database_url, get_async_session_factory
 
 
 def test_create_and_fetch_raw_data(sqlite_db) -> None:
@@ -67,3 +76,165 @@ def test_list_and_update_feedback(sqlite_db) -> None:
         )
         assert updated is not None
         assert updated.status == "IN_PROGRESS"
+
+
+def test_metadata_only_access_paths_skip_content(sqlite_db) -> None:
+    _, session_factory, engine = sqlite_db
+    with session_factory.begin() as session:
+        record = repository.create_raw_data(
+            session,
+            source_type="deepseek_chat",
+            content='{"messages": ["large payload"]}',
+        )
+        record_id = record.id
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute", named=True)
+    def _capture(**kwargs) -> None:
+        statements.append(kwargs["statement"])
+
+    with session_factory.begin() as session:
+        assert repository.get_raw_data_status(session, record_id) == "INGESTED"
+        assert repository.get_raw_data_status(session, uuid.uuid4()) is None
+
+        light = repository.get_raw_data(session, record_id, include_content=False)
+        assert light is not None
+        assert light.source_type == "deepseek_chat"
+        with pytest.raises(InvalidRequestError):
+            _ = light.content
+
+        new_status = repository.update_raw_data_status(
+            session,
+            record_id,
+            status="NORMALIZED",
+        )
+        assert new_status == "NORMALIZED"
+        assert light.status == "NORMALIZED"
+        assert light.processed_at is not None
+        assert (
+            repository.update_raw_data_status(session, uuid.uuid4(), status="X") is None
+        )
+
+    assert statements
+    assert not [stmt for stmt in statements if "raw_data.content," in stmt]
+
+    with session_factory() as session:
+        full = repository.get_raw_data(session, record_id)
+        assert full is not None
+        assert full.content == '{"messages": ["large payload"]}'
+        assert full.status == "NORMALIZED"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///./nexus.db", "sqlite+aiosqlite:///./nexus.db"),
+        ("postgresql://u:p@db:5432/nexus", "postgresql+asyncpg://u:p@db:5432/nexus"),
+        ("postgresql+psycopg2://u:p@db/nexus", "postgresql+asyncpg://u:p@db/nexus"),
+        ("postgresql+asyncpg://u:p@db/nexus", "postgresql+asyncpg://u:p@db/nexus"),
+    ],
+)
+def test_async_database_url(url: str, expected: str) -> None:
+    assert get_async_database_url(url) == expected
+
+
+def test_async_repository_reads_and_updates(sqlite_db) -> None:
+    url, session_factory, _ = sqlite_db
+    feedback_id = uuid.uuid4()
+    with session_factory.begin() as session:
+        record = repository.create_raw_data(
+            session,
+            source_type="deepseek_chat",
+            content='{"messages": []}',
+        )
+        repository.create_user_feedback(
+            session,
+            feedback_id=feedback_id,
+            feedback_type="bug",
+            message="Async path",
+        )
+
+    async def _exercise() -> None:
+        engine = create_async_engine(get_async_database_url(url))
+        factory = get_async_session_factory(engine)
+        try:
+            async with factory() as session:
+                status = await async_repository.get_raw_data_status(session, record.id)
+                assert status == "INGESTED"
+                assert (
+                    await async_repository.get_raw_data_status(session, uuid.uuid4())
+                    is None
+                )
+                assert (
+                    await async_repository.list_correlation_candidates(
+                        session,
+                        record.id,
+                    )
+                    == []
+                )
+                updated = await async_repository.update_feedback_status(
+                    session,
+                    feedback_id,
+                    status="TRIAGED",
+                )
+                assert updated is not None
+                await session.commit()
+                feedback = await async_repository.list_feedback(
+                    session,
+                    status="TRIAGED",
+                )
+                assert [item.id for item in feedback] == [feedback_id]
+        finally:
+            await engine.dispose()
+
+    asyncio.run(_exercise())
+
+    with session_factory() as session:
+        stored = repository.get_user_feedback(session, feedback_id)
+        assert stored is not None
+        assert stored.status == "TRIAGED"
+
+
+def test_duration_percentiles_match_nearest_rank(sqlite_db) -> None:
+    url, session_factory, _ = sqlite_db
+    durations = [7.0, 1.0, 3.0, 9.0, 5.0, 2.0, 8.0]
+    with session_factory.begin() as session:
+        session.add_all(
+            MLflowRun(experiment_id="0", task_name="normalize", duration_seconds=value)
+            for value in durations
+        )
+        session.add(MLflowRun(experiment_id="0", task_name="normalize"))
+        session.add(MLflowRun(experiment_id="0", task_name="other", duration_seconds=0))
+
+    percentiles = [0, 1, 25, 50, 90, 99.9, 100]
+    ordered = sorted(durations)
+    expected = {
+        percentile: ordered[max(math.ceil(percentile / 100 * len(ordered)), 1) - 1]
+        for percentile in percentiles
+    }
+    with session_factory() as session:
+        assert repository.get_mlflow_run_duration_percentiles(
+            session,
+            percentiles,
+            task_name="normalize",
+        ) == (len(durations), expected)
+        assert repository.get_mlflow_run_duration_percentiles(
+            session,
+            [50],
+            task_name="missing",
+        ) == (0, {50: None})
+
+    async def _exercise() -> tuple[int, dict[float, float | None]]:
+        engine = create_async_engine(get_async_database_url(url))
+        try:
+            async with get_async_session_factory(engine)() as session:
+                return await async_repository.get_mlflow_run_duration_percentiles(
+                    session,
+                    percentiles,
+                    task_name="normalize",
+                )
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(_exercise()) == (len(durations), expected)
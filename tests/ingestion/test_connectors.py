@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import (
+    ExportConnector,
+    detect_connector,
+    ingest_raw_payload,
+    normalize_raw_data,
+    register_connector,
+)
+from nexus_knowledge.ingestion.connectors import iter_conversations
+
+
+def _chatgpt_export() -> list[dict]:
+    def node(node_id, parent, children, message=None):
+        if message is not None:
+            role, text, created = message
+            message = {
+                "id": node_id,
+                "author": {"role": role},
+                "create_time": created,
+                "content": {"content_type": "text", "parts": [text]},
+            }
+        return {
+            "id": node_id,
+            "parent": parent,
+            "children": children,
+            "message": message,
+        }
+
+    return [
+        {
+            "title": "Branching",
+            "create_time": 1735689600.0,
+            "update_time": 1735689700.0,
+            "conversation_id": "chatgpt-1",
+            "current_node": "answer-2",
+            "mapping": {
+                "root": node("root", None, ["system"]),
+                "system": node("system", "root", ["question"], ("system", "", None)),
+                "question": node(
+                    "question",
+                    "system",
+                    ["answer-1", "answer-2"],
+                    ("user", "What is a fingerprint?", 1735689600.0),
+                ),
+                "answer-1": node(
+                    "answer-1",
+                    "question",
+                    [],
+                    ("assistant", "Draft", 1735689603.0),
+                ),
+                "answer-2": node(
+                    "answer-2",
+                    "question",
+                    [],
+                    ("assistant", "A content hash.", 1735689605.0),
+                ),
+            },
+        },
+    ]
+
+
+def _claude_export() -> list[dict]:
+    return [
+        {
+            "uuid": "claude-1",
+            "name": "Greeting",
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:10Z",
+            "chat_messages": [
+                {
+                    "uuid": "m1",
+                    "sender": "human",
+                    "text": "Hello",
+                    "created_at": "2025-01-01T00:00:00Z",
+                },
+                {
+                    "uuid": "m2",
+                    "sender": "assistant",
+                    "text": "",
+                    "content": [{"type": "text", "text": "Hi there"}],
+                    "created_at": "2025-01-01T00:00:05Z",
+                },
+            ],
+        },
+    ]
+
+
+def _gemini_export() -> list[dict]:
+    return [
+        {
+            "header": "Gemini Apps",
+            "title": "Prompted Summarise this",
+            "time": "2025-02-01T10:00:00.000Z",
+            "products": ["Gemini Apps"],
+            "safeHtmlItem": [{"html": "<p>A &amp; B</p><p>Done</p>"}],
+        },
+        {
+            "header": "Gemini Apps",
+            "title": "Used Gemini Apps",
+            "time": "2025-02-01T10:05:00.000Z",
+            "products": ["Gemini Apps"],
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    ("export", "name", "messages"),
+    [
+        (
+            _chatgpt_export,
+            "chatgpt",
+            [("user", "What is a fingerprint?"), ("assistant", "A content hash.")],
+        ),
+        (_claude_export, "claude", [("user", "Hello"), ("assistant", "Hi there")]),
+        (
+            _gemini_export,
+            "gemini",
+            [("user", "Summarise this"), ("assistant", "A & B\nDone")],
+        ),
+    ],
+)
+def test_connectors_detect_and_convert_exports(export, name, messages) -> None:
+    content = json.dumps(export())
+    connector = detect_connector(content)
+    assert connector is not None
+    assert connector.name == name
+
+    (conversation,) = iter_conversations(content)
+    assert conversation.metadata["source_platform"] == name
+    assert conversation.metadata["source_id"]
+    assert [
+        (message["role"], message["content"]) for message in conversation.messages
+    ] == messages
+    assert all(message["timestamp"] for message in conversation.messages)
+
+    (single,) = iter_conversations(json.dumps(export()[0]))
+    assert single.messages == conversation.messages
+
+
+def test_unknown_payloads_use_generic_walker_and_custom_connectors() -> None:
+    generic = json.dumps(
+        {"source_id": "root", "conversations": [{"messages": [{"content": "Hi"}]}]},
+    )
+    assert detect_connector(generic) is None
+    (conversation,) = iter_conversations(generic)
+    assert conversation.metadata == {"source_id": "root"}
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_connector(
+            ExportConnector(
+                name="chatgpt",
+                required_keys=frozenset({"mapping"}),
+                convert=lambda _record: None,
+            ),
+        )
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_conversations(json.dumps(_claude_export()) + " trailing"))
+
+
+def test_chatgpt_export_normalizes_active_branch(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="chatgpt_export",
+            content=_chatgpt_export(),
+        )
+        assert normalize_raw_data(session, raw_id, streaming=True) == 2
+        turns = repository.list_turns_for_raw(session, raw_id)
+        assert [turn.speaker for turn in turns] == ["USER", "ASSISTANT"]
+        assert turns[1].text == "A content hash."
+        assert turns[1].metadata_["source_platform"] == "chatgpt"
+        assert turns[0].timestamp.year == 2025
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from prometheus_client import REGISTRY
+from sqlalchemy import event, text
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.db.models import RawData
+from nexus_knowledge.ingestion import dedup_cache, ingest_raw_payload
+from nexus_knowledge.ingestion.dedup_cache import BloomFilter, get_dedup_cache
+
+
+def _payload(source_id: str = "dedup-1") -> dict:
+    return {
+        "source_platform": "deepseek",
+        "source_id": source_id,
+        "messages": [{"role": "user", "content": "Hello"}],
+    }
+
+
+def _lookups(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "nexus_ingest_dedup_cache_lookups_total",
+            {"result": result},
+        )
+        or 0.0
+    )
+
+
+def _record_statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute", named=True)
+    def _capture(**kwargs) -> None:
+        statements.append(kwargs["statement"])
+
+    return statements
+
+
+def test_committed_duplicate_needs_no_query(sqlite_db) -> None:
+    _, session_factory, engine = sqlite_db
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+            metadata={"dataset": "dedup"},
+        )
+
+    statements = _record_statements(engine)
+    hits_before = _lookups("hit")
+    with session_factory.begin() as session:
+        again = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+            metadata={"dataset": "dedup"},
+        )
+
+    assert again == raw_id
+    assert not [stmt for stmt in statements if "raw_data" in stmt]
+    assert _lookups("hit") == hits_before + 1
+
+    with session_factory.begin() as session:
+        ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+            metadata={"batch": 2},
+        )
+    with session_factory() as session:
+        record = repository.get_raw_data(session, raw_id)
+        assert record is not None
+        assert record.metadata_ == {"dataset": "dedup", "batch": 2}
+
+
+def test_deleted_rows_are_evicted(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    with session_factory.begin() as session:
+        session.delete(session.get(RawData, raw_id))
+
+    with session_factory.begin() as session:
+        recreated = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    assert recreated != raw_id
+    with session_factory() as session:
+        assert repository.get_raw_data(session, recreated) is not None
+
+
+def test_rows_deleted_outside_the_orm_expire_with_the_ttl(
+    sqlite_db,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    with session_factory.begin() as session:
+        session.execute(text("DELETE FROM raw_data"))
+
+    with session_factory.begin() as session:
+        cache = get_dedup_cache(session)
+        assert cache is not None
+        assert cache.ttl_seconds > 0
+        expired_at = time.monotonic() + cache.ttl_seconds + 1
+    monkeypatch.setattr(dedup_cache.time, "monotonic", lambda: expired_at)
+
+    misses_before = _lookups("miss")
+    with session_factory.begin() as session:
+        recreated = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    assert recreated != raw_id
+    assert _lookups("miss") == misses_before + 1
+    with session_factory() as session:
+        assert repository.get_raw_data(session, recreated) is not None
+
+
+def test_rolled_back_inserts_are_not_cached(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    session = session_factory()
+    rolled_back_id = ingest_raw_payload(
+        session,
+        source_type="deepseek_chat",
+        content=_payload(),
+    )
+    session.rollback()
+    session.close()
+
+    with session_factory.begin() as session:
+        assert get_dedup_cache(session) is not None
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    assert raw_id != rolled_back_id
+    with session_factory() as session:
+        assert repository.get_raw_data(session, raw_id) is not None
+
+
+def test_bloom_filter_skips_lookup_for_new_hashes(sqlite_db, monkeypatch) -> None:
+    monkeypatch.setenv("INGEST_DEDUP_BLOOM_CAPACITY", "1000")
+    clear_settings_cache()
+    _, session_factory, engine = sqlite_db
+    with session_factory.begin() as session:
+        ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload("seed"),
+        )
+
+    statements = _record_statements(engine)
+    absent_before = _lookups("bloom_absent")
+    with session_factory.begin() as session:
+        ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload("fresh"),
+        )
+
+    assert _lookups("bloom_absent") == absent_before + 1
+    assert not [stmt for stmt in statements if stmt.lstrip().startswith("SELECT")]
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(500)
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(500)]
+    for content_hash in hashes:
+        bloom.add(content_hash)
+
+    assert all(content_hash in bloom for content_hash in hashes)
+    unseen = [hashlib.sha256(f"x{i}".encode()).hexdigest() for i in range(1000)]
+    assert sum(content_hash in bloom for content_hash in unseen) < 50
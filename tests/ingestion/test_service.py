@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
+
+import pytest
 
 from nexus_knowledge.db import repository
+from nexus_knowledge.db.models import Entity
 from nexus_knowledge.ingestion import (
     IngestionError,
+    RawPayload,
     ingest_markdown_file,
+    ingest_prepared_payloads,
     ingest_raw_payload,
+    ingest_raw_payloads,
     normalize_raw_data,
+    prepare_raw_bytes,
 )
 
 
@@ -161,3 +170,251 @@ def test_normalize_handles_invalid_json(sqlite_db) -> None:
         record = repository.get_raw_data(session, raw_id)
         assert record is not None
         assert record.status == "FAILED"
+
+
+def test_streaming_normalization_matches_batch_mode(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    nested_payload = {
+        "username": "user",
+        "conversations": [
+            _conversation_payload(),
+            {
+                "source_platform": "deepseek",
+                "source_id": "deepseek-chat-2",
+                "messages": [
+                    {"role": "user", "content": f"Message {index}"}
+                    for index in range(7)
+                ],
+            },
+        ],
+    }
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=nested_payload,
+        )
+
+    with session_factory.begin() as session:
+        processed_count = normalize_raw_data(
+            session,
+            raw_id,
+            streaming=True,
+            batch_size=3,
+        )
+
+    assert processed_count == 9
+
+    with session_factory() as session:
+        turns = repository.list_turns_for_raw(session, raw_id)
+        assert len(turns) == 9
+        assert {turn.metadata_["source_platform"] for turn in turns} == {"deepseek"}
+        record = repository.get_raw_data(session, raw_id)
+        assert record is not None
+        assert record.status == "NORMALIZED"
+
+
+def test_streaming_normalization_rejects_trailing_data(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content='{"messages": []} trailing',
+        )
+
+    with session_factory.begin() as session, contextlib.suppress(IngestionError):
+        normalize_raw_data(session, raw_id, streaming=True)
+
+    with session_factory() as session:
+        record = repository.get_raw_data(session, raw_id)
+        assert record is not None
+        assert record.status == "FAILED"
+
+
+def test_ingest_raw_payloads_resolves_existing_and_repeated(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    first = _conversation_payload()
+    second = {**_conversation_payload(), "source_id": "deepseek-chat-2"}
+
+    with session_factory.begin() as session:
+        existing_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=first,
+        )
+
+    with session_factory.begin() as session:
+        result = ingest_raw_payloads(
+            session,
+            [
+                RawPayload(source_type="deepseek_chat", content=first),
+                RawPayload(
+                    source_type="deepseek_chat",
+                    content=second,
+                    metadata={"batch": 1},
+                ),
+                RawPayload(
+                    source_type="deepseek_chat",
+                    content=second,
+                    metadata={"batch": 2},
+                    source_id="second",
+                ),
+            ],
+        )
+
+    assert result.raw_data_ids[0] == existing_id
+    assert result.raw_data_ids[1] == result.raw_data_ids[2]
+    assert result.created_ids == [result.raw_data_ids[1]]
+    assert set(result.pending_normalization) == {existing_id, result.created_ids[0]}
+
+    with session_factory() as session:
+        record = repository.get_raw_data(session, result.created_ids[0])
+        assert record is not None
+        assert record.metadata_["batch"] == 2
+        assert record.source_id == "second"
+
+
+def test_incremental_normalization_writes_only_the_delta(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    first_export = _conversation_payload()
+    second_export = {
+        **_conversation_payload(),
+        "exported_at": "2025-01-02",
+        "messages": [
+            first_export["messages"][0],
+            {
+                "role": "assistant",
+                "content": "Hi! How can I help?",
+                "timestamp": "2025-01-01T00:00:05Z",
+            },
+            {"role": "user", "content": "Tell me more"},
+        ],
+    }
+
+    with session_factory.begin() as session:
+        first_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=first_export,
+        )
+        assert normalize_raw_data(session, first_id, incremental=True) == 2
+        first_turns = repository.list_turns_for_raw(session, first_id)
+        repository.create_entities(
+            session,
+            [
+                Entity(conversation_turn_id=turn.id, type="SENTIMENT", value="NEUTRAL")
+                for turn in first_turns
+            ],
+        )
+
+    with session_factory.begin() as session:
+        second_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=second_export,
+        )
+        assert normalize_raw_data(session, second_id, incremental=True) == 2
+
+    with session_factory.begin() as session:
+        delta = repository.list_turns_for_raw(session, second_id)
+        assert [turn.turn_index for turn in delta] == [1, 2]
+        assert delta[0].text == "Hi! How can I help?"
+        assert [
+            turn.turn_index for turn in repository.list_turns_for_raw(session, first_id)
+        ] == [0]
+        assert len(repository.list_entities_for_raw(session, first_id)) == 1
+        assert repository.list_entities_for_raw(session, second_id) == []
+
+        assert normalize_raw_data(session, second_id, incremental=True) == 0
+        record = repository.get_raw_data(session, second_id, include_content=False)
+        assert record is not None
+        assert record.status == "NORMALIZED"
+
+
+def test_prepare_raw_bytes_stores_body_verbatim(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+    body = json.dumps(_conversation_payload(), indent=2).encode("utf-8")
+
+    prepared = prepare_raw_bytes(body, source_type="deepseek_chat", source_id="a")
+    assert prepared.content == body.decode("utf-8")
+    assert prepared.content_hash == hashlib.sha256(body).hexdigest()
+    assert prepared.metadata == {"source_id": "a"}
+
+    with session_factory.begin() as session:
+        result = ingest_prepared_payloads(session, [prepared])
+        (raw_id,) = result.raw_data_ids
+        assert normalize_raw_data(session, raw_id, streaming=True) == 2
+        same_text = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=body.decode("utf-8"),
+        )
+        assert same_text == raw_id
+
+    for invalid in (b'{"messages": [}', b'{"a": 1} trailing', b"\xff{}", b""):
+        with pytest.raises(IngestionError, match="not a valid JSON document"):
+            prepare_raw_bytes(invalid, source_type="deepseek_chat")
+
+
+@pytest.mark.parametrize("mode", ["batch", "streaming", "incremental"])
+def test_duplicate_conversations_are_linked_not_renormalized(sqlite_db, mode) -> None:
+    _, session_factory, _ = sqlite_db
+    options = {mode: True} if mode != "batch" else {}
+    shared = _conversation_payload()
+    anonymous = {"messages": [{"role": "user", "content": "No source id"}]}
+    fresh = {**_conversation_payload(), "source_id": "deepseek-chat-2"}
+
+    with session_factory.begin() as session:
+        first_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content={"conversations": [shared, anonymous]},
+        )
+        assert normalize_raw_data(session, first_id, **options) == 3
+
+    with session_factory.begin() as session:
+        second_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content={"conversations": [anonymous, shared, fresh, shared]},
+        )
+        assert normalize_raw_data(session, second_id, **options) == 2
+
+    with session_factory() as session:
+        first_links = repository.list_raw_data_conversations(session, first_id)
+        second_links = repository.list_raw_data_conversations(session, second_id)
+        assert [link.linked for link in first_links] == [False, False]
+        assert {link.conversation_id for link in second_links if link.linked} == {
+            link.conversation_id for link in first_links
+        }
+        assert sum(not link.linked for link in second_links) == 1
+        assert len(repository.list_turns_for_raw(session, first_id)) == 3
+        assert len(repository.list_turns_for_raw(session, second_id)) == 2
+        record = repository.get_raw_data(session, second_id, include_content=False)
+        assert record is not None
+        assert record.status == "NORMALIZED"
+
+
+def test_fully_duplicated_payload_normalizes_without_turns(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+
+    with session_factory.begin() as session:
+        first_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_conversation_payload(),
+        )
+        normalize_raw_data(session, first_id)
+        second_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content={**_conversation_payload(), "exported_at": "2025-03-01"},
+        )
+        assert normalize_raw_data(session, second_id, streaming=True) == 0
+        assert repository.list_turns_for_raw(session, second_id) == []
+        record = repository.get_raw_data(session, second_id, include_content=False)
+        assert record is not None
+        assert record.status == "NORMALIZED"
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+import pytest
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import (
+    IngestionError,
+    ingest_raw_payload,
+    ingest_spooled_upload,
+)
+from nexus_knowledge.ingestion.uploads import (
+    UPLOAD_INGESTED,
+    UploadConflictError,
+    UploadError,
+    UploadNotFoundError,
+    UploadSpool,
+    UploadTooLargeError,
+)
+from nexus_knowledge.storage import reset_blob_store
+
+
+def _payload_bytes() -> bytes:
+    payload = {
+        "source_platform": "deepseek",
+        "messages": [{"role": "user", "content": "Große Datei " * 50}],
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _completed_upload(spool: UploadSpool, data: bytes) -> str:
+    upload_id = spool.create(source_type="deepseek_chat").upload_id
+    writer = spool.open_chunk(upload_id, 0)
+    writer.write(data)
+    writer.commit()
+    spool.complete(upload_id)
+    return upload_id
+
+
+def test_chunks_resume_and_hash_incrementally(tmp_path) -> None:
+    data = _payload_bytes()
+    spool = UploadSpool(tmp_path, max_bytes=10_000)
+    manifest = spool.create(source_type="deepseek_chat", total_bytes=len(data))
+    upload_id = manifest.upload_id
+
+    writer = spool.open_chunk(upload_id, 0)
+    writer.write(data[:100])
+    assert writer.commit().received_bytes == 100
+
+    with pytest.raises(UploadConflictError) as conflict:
+        spool.open_chunk(upload_id, 0)
+    assert conflict.value.offset == 100
+
+    # A chunk that fails part-way is rolled back to its starting offset.
+    writer = spool.open_chunk(upload_id, 100)
+    writer.write(data[100:200])
+    writer.abort()
+    assert spool.data_path(upload_id).stat().st_size == 100
+
+    # A fresh spool instance (e.g. another API process) re-hashes the prefix.
+    other = UploadSpool(tmp_path, max_bytes=10_000)
+    writer = other.open_chunk(upload_id, 100)
+    writer.write(data[100:])
+    writer.commit()
+
+    with pytest.raises(UploadError, match="SHA-256"):
+        other.complete(upload_id, expected_sha256="0" * 64)
+    expected = hashlib.sha256(data).hexdigest()
+    manifest = other.complete(upload_id, expected_sha256=expected)
+    assert manifest.content_hash == expected
+    assert spool.get(upload_id).status == "COMPLETE"
+    with pytest.raises(UploadConflictError):
+        spool.open_chunk(upload_id, len(data))
+
+
+def test_upload_size_limits(tmp_path) -> None:
+    spool = UploadSpool(tmp_path, max_bytes=10)
+    with pytest.raises(UploadTooLargeError):
+        spool.create(source_type="deepseek_chat", total_bytes=11)
+
+    upload_id = spool.create(source_type="deepseek_chat", total_bytes=4).upload_id
+    writer = spool.open_chunk(upload_id, 0)
+    with pytest.raises(UploadTooLargeError):
+        writer.write(b"12345")
+    writer.abort()
+
+    writer = spool.open_chunk(upload_id, 0)
+    writer.write(b"12")
+    writer.commit()
+    with pytest.raises(UploadConflictError, match="2 of 4"):
+        spool.complete(upload_id)
+
+
+def test_spooled_upload_deduplicates_with_direct_ingest(sqlite_db, tmp_path) -> None:
+    _, session_factory, _ = sqlite_db
+    data = _payload_bytes()
+    spool = UploadSpool(tmp_path / "spool", max_bytes=10_000)
+    upload_id = spool.create(
+        source_type="deepseek_chat",
+        metadata={"origin": "upload"},
+    ).upload_id
+    writer = spool.open_chunk(upload_id, 0)
+    writer.write(data)
+    writer.commit()
+    spool.complete(upload_id)
+
+    with session_factory.begin() as session:
+        raw_id = ingest_spooled_upload(session, spool, upload_id)
+    manifest = spool.mark_ingested(upload_id, raw_id)
+    assert manifest.status == UPLOAD_INGESTED
+    assert not spool.data_path(upload_id).exists()
+
+    with session_factory.begin() as session:
+        assert ingest_spooled_upload(session, spool, upload_id) == raw_id
+        direct_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=data.decode("utf-8"),
+        )
+        assert direct_id == raw_id
+        record = repository.get_raw_data(session, raw_id)
+        assert record.content_hash == hashlib.sha256(data).hexdigest()
+        assert record.metadata_["origin"] == "upload"
+
+
+def test_spooled_upload_streams_into_blob_store(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("RAW_CONTENT_STORE_PATH", str(tmp_path / "blobs"))
+    monkeypatch.setenv("RAW_CONTENT_STORE_CODEC", "zlib")
+    monkeypatch.setenv("RAW_CONTENT_STORE_MIN_BYTES", "256")
+    clear_settings_cache()
+    reset_blob_store()
+    data = _payload_bytes()
+    spool = UploadSpool(tmp_path / "spool", max_bytes=10_000)
+    try:
+        upload_id = _completed_upload(spool, data)
+        with session_factory.begin() as session:
+            raw_id = ingest_spooled_upload(session, spool, upload_id)
+        with session_factory() as session:
+            record = repository.get_raw_data(session, raw_id)
+            assert record.content == ""
+            assert record.content_ref == f"zlib:{record.content_hash}"
+            assert repository.read_raw_content(record) == data.decode("utf-8")
+
+        # A duplicate upload is resolved from its hash without reading the spool.
+        duplicate_id = _completed_upload(spool, data)
+        spool.data_path(duplicate_id).write_bytes(b"\xff")
+        with session_factory.begin() as session:
+            assert ingest_spooled_upload(session, spool, duplicate_id) == raw_id
+
+        invalid = _completed_upload(spool, b'{"content": "\xff"}' * 20)
+        with (
+            session_factory.begin() as session,
+            pytest.raises(
+                IngestionError,
+                match="UTF-8",
+            ),
+        ):
+            ingest_spooled_upload(session, spool, invalid)
+        assert not list((tmp_path / "blobs").rglob("*.tmp"))
+    finally:
+        monkeypatch.undo()
+        clear_settings_cache()
+        reset_blob_store()
+
+
+def test_sweep_removes_idle_uploads(tmp_path) -> None:
+    spool = UploadSpool(tmp_path, max_bytes=10_000, ttl_seconds=60)
+    idle = spool.create(source_type="deepseek_chat").upload_id
+    ingested = _completed_upload(spool, _payload_bytes())
+    spool.data_path(ingested).unlink()
+    busy = spool.create(source_type="deepseek_chat").upload_id
+    fresh = spool.create(source_type="deepseek_chat").upload_id
+
+    stale = time.time() - 120
+    for upload_id in (idle, ingested, busy):
+        os.utime(tmp_path / f"{upload_id}.json", (stale, stale))
+    writer = spool.open_chunk(busy, 0)
+    try:
+        assert spool.sweep() == 2
+    finally:
+        writer.abort()
+
+    with pytest.raises(UploadNotFoundError):
+        spool.get(idle)
+    with pytest.raises(UploadNotFoundError):
+        spool.get(ingested)
+    assert not spool.data_path(idle).exists()
+    assert spool.get(busy).status == "UPLOADING"
+    assert spool.get(fresh).status == "UPLOADING"
+    assert UploadSpool(tmp_path, max_bytes=10_000).sweep() == 0
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import import_markdown_vault
+from nexus_knowledge.ingestion import vault as vault_module
+from nexus_knowledge.ingestion.vault import MANIFEST_FILENAME
+
+
+def _write_vault(root) -> None:
+    (root / "projects").mkdir(parents=True)
+    (root / ".obsidian").mkdir()
+    (root / "inbox.md").write_text("# Inbox\nFirst note", encoding="utf-8")
+    (root / "projects" / "alpha.md").write_text("# Alpha\nPlans", encoding="utf-8")
+    (root / "projects" / "beta.markdown").write_text("Beta body", encoding="utf-8")
+    (root / "projects" / "image.png").write_bytes(b"\x89PNG")
+    (root / ".obsidian" / "workspace.md").write_text("ignored", encoding="utf-8")
+
+
+def test_vault_import_is_incremental(sqlite_db, tmp_path, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    root = tmp_path / "vault"
+    _write_vault(root)
+
+    first = import_markdown_vault(session_factory, root, workers=1, dataset="notes")
+
+    assert first.scanned == 3
+    assert first.imported == 3
+    assert len(first.created_ids) == 3
+    assert set(first.pending_normalization) == set(first.created_ids)
+    manifest = json.loads((root / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    assert sorted(manifest["files"]) == [
+        "inbox.md",
+        "projects/alpha.md",
+        "projects/beta.markdown",
+    ]
+    with session_factory() as session:
+        record = repository.get_raw_data(
+            session,
+            first.created_ids[0],
+        )
+        assert record is not None
+        assert record.source_type == "markdown"
+        assert record.metadata_["dataset"] == "notes"
+
+    def _unexpected_read(*_args, **_kwargs):
+        raise AssertionError("unchanged notes must not be read")
+
+    monkeypatch.setattr(vault_module, "_prepare_file", _unexpected_read)
+    second = import_markdown_vault(session_factory, root, workers=1)
+    assert second.unchanged == 3
+    assert second.imported == 0
+    monkeypatch.undo()
+
+    alpha = root / "projects" / "alpha.md"
+    alpha.write_text("# Alpha\nPlans, revised", encoding="utf-8")
+    stat = alpha.stat()
+    os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (root / "inbox.md").unlink()
+
+    third = import_markdown_vault(session_factory, root, workers=1)
+    assert third.unchanged == 1
+    assert third.imported == 1
+    assert third.removed == 1
+    assert len(third.created_ids) == 1
+    manifest = json.loads((root / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    assert manifest["files"]["projects/alpha.md"][3] == str(
+        third.created_ids[0],
+    )
+    assert "inbox.md" not in manifest["files"]
+
+
+def test_vault_import_uses_process_pool_and_batches(sqlite_db, tmp_path) -> None:
+    _, session_factory, _ = sqlite_db
+    root = tmp_path / "vault"
+    _write_vault(root)
+    (root / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+    manifest_path = tmp_path / "state" / "manifest.json"
+
+    result = import_markdown_vault(
+        session_factory,
+        root,
+        manifest_path=manifest_path,
+        workers=2,
+        batch_size=1,
+    )
+
+    assert result.imported == 3
+    assert len(result.created_ids) == 3
+    assert result.failed == ["broken.md"]
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert "broken.md" not in manifest["files"]
+    assert not (root / MANIFEST_FILENAME).exists()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import FolderWatcher
+from nexus_knowledge.ingestion.watcher import WATCH_CHECKPOINT_FILENAME
+
+
+def _export(source_id: str) -> str:
+    return json.dumps(
+        {
+            "source_platform": "deepseek",
+            "source_id": source_id,
+            "messages": [{"role": "user", "content": f"Hello from {source_id}"}],
+        },
+    )
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_watcher_debounces_batches_and_checkpoints(sqlite_db, tmp_path) -> None:
+    _, session_factory, _ = sqlite_db
+    inbox = tmp_path / "inbox"
+    (inbox / "nested").mkdir(parents=True)
+    (inbox / "a.json").write_text(_export("a"), encoding="utf-8")
+    (inbox / "nested" / "b.json").write_text(_export("b"), encoding="utf-8")
+    (inbox / "note.md").write_text("# Note\nBody", encoding="utf-8")
+    (inbox / "c.json.part").write_text("{", encoding="utf-8")
+    (inbox / "broken.json").write_text("{", encoding="utf-8")
+    clock = _Clock(os.stat(inbox / "a.json").st_mtime + 10)
+    dispatched: list[list] = []
+
+    def _watcher() -> FolderWatcher:
+        return FolderWatcher(
+            session_factory,
+            [inbox],
+            settle_seconds=5,
+            batch_size=2,
+            dispatch=lambda ids: dispatched.append(list(ids)),
+            clock=clock,
+        )
+
+    watcher = _watcher()
+    first = watcher.poll()
+    assert first.scanned == 4
+    assert first.settling == 4
+    assert first.ingested == 0
+
+    second = watcher.poll()
+    assert second.ingested == 3
+    assert second.failed == [str(inbox / "broken.json")]
+    assert len(second.created_ids) == 3
+    assert [len(batch) for batch in dispatched] == [2, 1]
+    with session_factory() as session:
+        sources = {
+            repository.get_raw_data(session, raw_id).source_type
+            for raw_id in second.created_ids
+        }
+    assert sources == {"watch_folder", "markdown"}
+
+    third = watcher.poll()
+    assert third.unchanged == 3
+    assert third.ingested == 0
+    assert third.failed == []
+
+    growing = inbox / "d.json"
+    growing.write_text(_export("d")[:10], encoding="utf-8")
+    assert watcher.poll().settling == 1
+    growing.write_text(_export("d"), encoding="utf-8")
+    stat = growing.stat()
+    os.utime(growing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert watcher.poll().settling == 1
+    clock.now = stat.st_mtime + 10
+    assert watcher.poll().ingested == 1
+
+    (inbox / "a.json").unlink()
+    restarted = _watcher()
+    assert restarted.poll().removed == 1
+    after_restart = restarted.poll()
+    assert after_restart.unchanged == 3
+    assert after_restart.ingested == 0
+    checkpoint = json.loads((inbox / WATCH_CHECKPOINT_FILENAME).read_text())
+    assert str(inbox / "a.json") not in checkpoint["files"]
+    assert len(checkpoint["files"]) == 3
+
+
+def test_watcher_retries_batch_when_dispatch_fails(sqlite_db, tmp_path) -> None:
+    _, session_factory, _ = sqlite_db
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "a.json").write_text(_export("a"), encoding="utf-8")
+    clock = _Clock(os.stat(inbox / "a.json").st_mtime + 10)
+    dispatched: list[list] = []
+
+    def _dispatch(ids) -> None:
+        if not dispatched:
+            dispatched.append([])
+            raise RuntimeError("broker unavailable")
+        dispatched.append(list(ids))
+
+    watcher = FolderWatcher(
+        session_factory,
+        [inbox],
+        settle_seconds=5,
+        dispatch=_dispatch,
+        clock=clock,
+    )
+    watcher.poll()
+    with pytest.raises(RuntimeError, match="broker unavailable"):
+        watcher.poll()
+    assert not (inbox / WATCH_CHECKPOINT_FILENAME).exists()
+
+    retried = watcher.poll()
+    assert retried.ingested == 1
+    assert retried.created_ids == []
+    assert dispatched[1] == retried.pending_normalization
+    assert len(dispatched[1]) == 1
+    assert watcher.poll().unchanged == 1
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import contextlib
 import uuid
 
 import mlflow
 from mlflow.tracking import MlflowClient
+from prometheus_client import REGISTRY
 
-from nexus_knowledge.experiment_tracking import log_task_artifact, mlflow_task_run
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db.repository import (
+    get_mlflow_run_duration_percentiles,
+    list_mlflow_runs,
+)
+from nexus_knowledge.experiment_tracking import (
+    TrackingSink,
+    buffered_run,
+    buffered_task_run,
+    flush_tracking,
+    get_tracking_policy,
+    get_tracking_sink,
+    log_task_artifact,
+    mlflow_task_run,
+    reset_tracking_policy,
+)
+from nexus_knowledge.mlflow_utils import get_tracking_uri
 
 
 def test_mlflow_task_run_logs_metadata(tmp_path, monkeypatch) -> None:
@@ -37,3 +55,187 @@ def test_mlflow_task_run_logs_metadata(tmp_path, monkeypatch) -> None:
 
     artifacts = MlflowClient().list_artifacts(run_id)
     assert any(item.path == "artifact.txt" for item in artifacts)
+
+
+def _sample(name: str, labels: dict[str, str] | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_buffered_task_run_logs_metadata_in_batches(tmp_path, monkeypatch) -> None:
+    tracking_uri = tmp_path.as_uri()
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", tracking_uri)
+    batches: list[int] = []
+    log_batch = MlflowClient.log_batch
+
+    def counting_log_batch(self, run_id, metrics=(), params=(), tags=(), **kwargs):
+        batches.append(len(metrics) + len(params) + len(tags))
+        return log_batch(self, run_id, metrics, params, tags, **kwargs)
+
+    monkeypatch.setattr(MlflowClient, "log_batch", counting_log_batch)
+
+    raw_id = uuid.uuid4()
+    with buffered_task_run(
+        "sample_task",
+        raw_data_id=raw_id,
+        correlation_id="corr-123",
+        params={"foo": "bar"},
+    ) as task_run:
+        task_run.log_metric("custom_metric", 1.0)
+        with buffered_run("Nested", "child") as child:
+            child.log_params({"depth": 1})
+    assert flush_tracking(timeout=10)
+
+    assert task_run.run_id is not None
+    mlflow.set_tracking_uri(tracking_uri)
+    run = mlflow.get_run(task_run.run_id)
+    assert run.info.status == "FINISHED"
+    assert run.data.metrics["custom_metric"] == 1.0
+    assert "duration_seconds" in run.data.metrics
+    assert run.data.params == {"foo": "bar", "raw_data_id": str(raw_id)}
+    assert run.data.tags["correlation_id"] == "corr-123"
+    assert run.data.tags["status"] == "succeeded"
+    nested = mlflow.get_run(child.run_id)
+    assert nested.data.tags["mlflow.parentRunId"] == task_run.run_id
+    assert nested.data.params == {"depth": "1"}
+    # One request per run for all of its params, metrics and tags.
+    assert len(batches) == 2
+
+
+def test_buffered_run_survives_tracking_outage(tmp_path, monkeypatch) -> None:
+    tracking_uri = tmp_path.as_uri()
+    sink = TrackingSink(max_pending=3, flush_seconds=0.01)
+    failures_before = _sample("nexus_tracking_flush_failures_total")
+    dropped_before = _sample("nexus_tracking_records_total", {"result": "dropped"})
+    log_batch = MlflowClient.log_batch
+    calls: list[str] = []
+
+    def flaky_log_batch(self, run_id, *args, **kwargs):
+        calls.append(run_id)
+        if len(calls) == 1:
+            raise ConnectionError("tracking server down")
+        return log_batch(self, run_id, *args, **kwargs)
+
+    monkeypatch.setattr(MlflowClient, "log_batch", flaky_log_batch)
+
+    run = sink.start_run("Outage", "outage", tracking_uri=tracking_uri)
+    run.log_metrics({"a": 1.0, "b": 2.0})
+    run.log_params({"x": 1, "y": 2})  # beyond max_pending: dropped
+    sink.end_run(run)
+    assert sink.close(timeout=10)
+
+    assert len(calls) == 2
+    assert _sample("nexus_tracking_flush_failures_total") == failures_before + 1
+    assert (
+        _sample("nexus_tracking_records_total", {"result": "dropped"})
+        == dropped_before + 2
+    )
+    mlflow.set_tracking_uri(tracking_uri)
+    stored = mlflow.get_run(run.run_id)
+    assert stored.data.metrics == {"a": 1.0, "b": 2.0}
+    assert stored.data.params == {}
+    assert stored.info.status == "FINISHED"
+
+
+def test_tracking_policy_samples_runs_and_summarizes_the_rest(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    tracking_uri = tmp_path.as_uri()
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", tracking_uri)
+    monkeypatch.setenv("TRACKING_SAMPLE_EVERY", "3")
+    monkeypatch.setenv("TRACKING_SAMPLE_OVERRIDES", "other_task=1")
+    monkeypatch.setenv("TRACKING_SUMMARY_SECONDS", "3600")
+    clear_settings_cache()
+    reset_tracking_policy()
+    try:
+        policy = get_tracking_policy()
+        assert policy.rate_for("nexus_knowledge.tasks.other_task") == 1
+        for index in range(6):
+            with (
+                contextlib.suppress(RuntimeError),
+                buffered_task_run(
+                    "sample_task",
+                ) as task_run,
+            ):
+                task_run.log_metric("turns", index)
+                with buffered_run("Nested", f"child-{index}"):
+                    if index == 5:
+                        raise RuntimeError("boom")
+        policy.flush_summaries(get_tracking_sink())
+        assert flush_tracking(timeout=10)
+    finally:
+        reset_tracking_policy()
+        clear_settings_cache()
+
+    mlflow.set_tracking_uri(tracking_uri)
+    runs = mlflow.search_runs(experiment_names=["CeleryTasks"], output_format="list")
+    task_runs = {
+        int(run.data.metrics["turns"]): run
+        for run in runs
+        if run.info.run_name == "task::sample_task"
+    }
+    # Runs 0 and 3 are sampled; run 5 is kept because it failed.
+    assert sorted(task_runs) == [0, 3, 5]
+    assert task_runs[5].data.tags["status"] == "failed"
+    children = mlflow.search_runs(experiment_names=["Nested"], output_format="list")
+    assert sorted(run.info.run_name for run in children) == [
+        "child-0",
+        "child-3",
+        "child-5",
+    ]
+    [summary] = [run for run in runs if run.info.run_name == "summary::sample_task"]
+    assert summary.data.metrics["runs"] == 3
+    assert summary.data.metrics["turns_sum"] == 1 + 2 + 4
+    assert summary.data.tags["sample_every"] == "3"
+
+
+def test_task_runs_are_mirrored_locally(sqlite_db, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("TRACKING_MIRROR_RUNS", "true")
+    monkeypatch.setenv("TRACKING_SAMPLE_EVERY", "2")
+    monkeypatch.setenv("TRACKING_SLOW_TASK_SECONDS", "0")
+    clear_settings_cache()
+    reset_tracking_policy()
+    try:
+        for index in range(4):
+            with (
+                contextlib.suppress(RuntimeError),
+                buffered_task_run("mirror_task", params={"batch": index}) as run,
+            ):
+                run.log_metric("turns", index)
+                if index == 3:
+                    raise RuntimeError("boom")
+        with buffered_run("Analysis", "not-a-task"):
+            pass
+        assert flush_tracking(timeout=10)
+    finally:
+        reset_tracking_policy()
+        monkeypatch.setenv("TRACKING_MIRROR_RUNS", "false")
+        clear_settings_cache()
+
+    with session_factory() as session:
+        runs = list_mlflow_runs(session, task_name="mirror_task")
+        failed = list_mlflow_runs(session, status="FAILED")
+        count, percentiles = get_mlflow_run_duration_percentiles(
+            session,
+            [50, 100],
+            task_name="mirror_task",
+        )
+
+    # Runs 0 and 2 are sampled, 3 is kept because it failed; 1 is only mirrored.
+    by_turns = {int(run.metrics["turns"]): run for run in runs}
+    assert sorted(by_turns) == [0, 1, 2, 3]
+    assert [run.metrics["turns"] for run in runs] == [3, 2, 1, 0]
+    assert {turns for turns, run in by_turns.items() if not run.tracked} == {1}
+    assert [run.run_id for run in failed] == [by_turns[3].run_id]
+    assert by_turns[0].params == {"batch": "0"}
+    assert by_turns[0].status == "FINISHED"
+    assert by_turns[0].duration_seconds == by_turns[0].metrics["duration_seconds"]
+
+    client = MlflowClient(tracking_uri=get_tracking_uri())
+    tracked = client.get_run(by_turns[2].run_id.hex)
+    assert by_turns[2].experiment_id == tracked.info.experiment_id
+    assert by_turns[2].artifacts_uri == tracked.info.artifact_uri
+    durations = sorted(run.duration_seconds for run in runs)
+    assert count == 4
+    assert percentiles == {50: durations[1], 100: durations[3]}
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from nexus_knowledge.performance.benchmarks import run_single_user_benchmark
+from sqlalchemy import func, select
+
+from nexus_knowledge.db.models import ConversationTurn
+from nexus_knowledge.performance.benchmarks import (
+    format_throughput_report,
+    run_bulk_write_benchmark,
+    run_connector_parse_benchmark,
+    run_payload_preparation_benchmark,
+    run_single_user_benchmark,
+    run_tracking_overhead_benchmark,
+)
 
 
 def test_single_user_benchmark_runs(sqlite_db) -> None:
@@ -14,3 +24,46 @@ def test_single_user_benchmark_runs(sqlite_db) -> None:
         assert result.average_ms >= 0
         assert result.max_ms >= 0
         assert isinstance(result.passed, bool)
+
+
+def test_bulk_write_benchmark_reports_throughput(sqlite_db) -> None:
+    _, session_factory, _ = sqlite_db
+
+    report = run_bulk_write_benchmark(session_factory, rows=50)
+    assert set(report) == {"orm_add_all", "bulk_insert"}
+    for result in report.values():
+        assert result.rows == 100
+        assert result.rows_per_second > 0
+    assert "rows/s" in format_throughput_report(report)
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count(ConversationTurn.id))) == 0
+
+
+def test_payload_preparation_benchmark_reports_both_paths() -> None:
+    report = run_payload_preparation_benchmark(conversations=20)
+    assert set(report) == {"parse_and_serialise", "raw_bytes"}
+    text = format_throughput_report(
+        report,
+        title="Payload Preparation Report",
+        baseline="parse_and_serialise",
+    )
+    assert text.startswith("Payload Preparation Report")
+    assert "[1.0x]" in text
+
+
+def test_connector_parse_benchmark_covers_each_format() -> None:
+    report = run_connector_parse_benchmark(conversations=5, messages=3)
+    assert set(report) == {"generic", "chatgpt", "claude", "gemini"}
+    for result in report.values():
+        assert result.rows == 5
+        assert result.rows_per_second > 0
+
+
+def test_tracking_overhead_benchmark_compares_logging_modes(tmp_path) -> None:
+    report = run_tracking_overhead_benchmark(tmp_path.as_uri(), tasks=2)
+    assert set(report) == {"synchronous", "buffered", "buffered_flushed"}
+    for result in report.values():
+        assert result.rows == 2
+        assert result.rows_per_second > 0
+    assert report["buffered_flushed"].seconds >= report["buffered"].seconds
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import ingest_raw_payload, normalize_raw_data
+from nexus_knowledge.storage import BlobStore, BlobStoreError, reset_blob_store
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def blob_settings(tmp_path, monkeypatch):
+    store_path = tmp_path / "blobs"
+    monkeypatch.setenv("RAW_CONTENT_STORE_PATH", str(store_path))
+    monkeypatch.setenv("RAW_CONTENT_STORE_CODEC", "zlib")
+    monkeypatch.setenv("RAW_CONTENT_STORE_MIN_BYTES", "256")
+    clear_settings_cache()
+    reset_blob_store()
+    yield store_path
+    monkeypatch.undo()
+    clear_settings_cache()
+    reset_blob_store()
+
+
+def test_blob_store_round_trip_and_verification(tmp_path) -> None:
+    store = BlobStore(tmp_path, codec="zlib")
+    content = json.dumps({"messages": [{"content": "hello " * 200}]})
+    content_hash = _hash(content)
+
+    reference = store.put(content_hash, content)
+    assert reference == f"zlib:{content_hash}"
+    assert store.put(content_hash, content) == reference
+    assert store.get(reference) == content
+
+    (blob_path,) = tmp_path.rglob("*.zz")
+    assert blob_path.stat().st_size < len(content) / 5
+    blob_path.write_bytes(b"not compressed")
+    with pytest.raises(BlobStoreError):
+        store.get(reference)
+    with pytest.raises(BlobStoreError):
+        store.get("zlib:" + "0" * 64)
+
+
+def test_zstd_blob_store_round_trip(tmp_path) -> None:
+    pytest.importorskip("zstandard")
+    store = BlobStore(tmp_path, codec="zstd", level=5)
+    content = "payload " * 500
+    reference = store.put(_hash(content), content)
+    assert reference.startswith("zstd:")
+    assert store.get(reference) == content
+
+    (blob_path,) = tmp_path.rglob("*.zst")
+    blob_path.write_bytes(b"not compressed")
+    with pytest.raises(BlobStoreError, match="Corrupt zstd blob"):
+        store.get(reference)
+
+    streamed = "streamed " * 500
+    reference = store.put_chunks(
+        _hash(streamed),
+        [streamed.encode()[:100], streamed.encode()[100:]],
+    )
+    assert store.get(reference) == streamed
+
+
+def test_blob_store_rejects_levels_outside_codec_range(tmp_path) -> None:
+    with pytest.raises(BlobStoreError, match="out of range"):
+        BlobStore(tmp_path, codec="zlib", level=10)
+    with pytest.raises(BlobStoreError, match="out of range"):
+        BlobStore(tmp_path, codec="zlib", level=0)
+    assert BlobStore(tmp_path, codec="zlib", level=9).level == 9
+
+
+def test_blob_store_streams_chunks(tmp_path) -> None:
+    store = BlobStore(tmp_path, codec="zlib")
+    content = "Große Datei " * 1000
+    data = content.encode("utf-8")
+    chunks = [data[i : i + 777] for i in range(0, len(data), 777)]
+
+    with pytest.raises(BlobStoreError, match="does not match"):
+        store.put_chunks(_hash(content), chunks[:-1])
+    assert not list(tmp_path.rglob("*.zz"))
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    reference = store.put_chunks(_hash(content), iter(chunks))
+    assert reference == f"zlib:{_hash(content)}"
+    assert store.get(reference) == content
+
+
+def test_large_payloads_are_offloaded_transparently(sqlite_db, blob_settings) -> None:
+    _, session_factory, _ = sqlite_db
+    large = {
+        "source_platform": "deepseek",
+        "messages": [
+            {"role": "user", "content": f"Question {i} " * 10} for i in range(20)
+        ],
+    }
+    small = {"source_platform": "deepseek", "messages": [{"content": "hi"}]}
+
+    with session_factory.begin() as session:
+        large_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=large,
+        )
+        small_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=small,
+        )
+
+    with session_factory() as session:
+        large_record = repository.get_raw_data(session, large_id)
+        small_record = repository.get_raw_data(session, small_id)
+        assert large_record is not None
+        assert small_record is not None
+        assert large_record.content == ""
+        assert large_record.content_ref == f"zlib:{large_record.content_hash}"
+        assert json.loads(repository.read_raw_content(large_record)) == large
+        assert small_record.content_ref is None
+        assert json.loads(repository.read_raw_content(small_record)) == small
+    assert list(blob_settings.rglob("*.zz"))
+
+    with session_factory.begin() as session:
+        assert normalize_raw_data(session, large_id) == 20
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from nexus_knowledge.config import clear_settings_cache
 from nexus_knowledge.db import repository
 from nexus_knowledge.ingestion import ingest_raw_payload
 from nexus_knowledge.ingestion.service import normalize_raw_data
@@ -45,6 +46,45 @@ def test_normalize_raw_data_task(sqlite_db) -> None:
         assert record.status == "NORMALIZED"
 
 
+def test_normalize_raw_data_task_incremental_opt_in(sqlite_db, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    first = _payload()
+    second = _payload()
+    second["messages"].append(
+        {
+            "role": "user",
+            "content": "One more thing",
+            "timestamp": "2025-01-01T00:00:10Z",
+        },
+    )
+
+    monkeypatch.setenv("NORMALIZE_INCREMENTAL", "true")
+    clear_settings_cache()
+    try:
+        with session_factory.begin() as session:
+            first_id = ingest_raw_payload(
+                session,
+                source_type="deepseek_chat",
+                content=first,
+            )
+        normalize_raw_data_task.apply(args=(str(first_id),)).get()
+        with session_factory.begin() as session:
+            second_id = ingest_raw_payload(
+                session,
+                source_type="deepseek_chat",
+                content=second,
+            )
+        normalize_raw_data_task.apply(args=(str(second_id),)).get()
+    finally:
+        clear_settings_cache()
+
+    with session_factory() as session:
+        old_turns = repository.list_turns_for_raw(session, first_id)
+        new_turns = repository.list_turns_for_raw(session, second_id)
+        assert [turn.turn_index for turn in old_turns] == [0, 1]
+        assert [turn.text for turn in new_turns] == ["One more thing"]
+
+
 def test_analyze_raw_data_task(sqlite_db, tmp_path, monkeypatch) -> None:
     _, session_factory, _ = sqlite_db
     monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import ingest_raw_payload
+from nexus_knowledge.pipeline import run_full_pipeline
+from nexus_knowledge.tasks import run_full_pipeline_task
+
+
+def _payload() -> dict:
+    return {
+        "source_platform": "deepseek",
+        "source_id": "fused-pipeline",
+        "messages": [
+            {
+                "role": "user",
+                "content": "I love this product",
+                "timestamp": "2025-01-01T00:00:00Z",
+            },
+            {
+                "role": "assistant",
+                "content": "That is great!",
+                "timestamp": "2025-01-01T00:00:02Z",
+            },
+            {
+                "role": "user",
+                "content": "I love this feature",
+                "timestamp": "2025-01-01T00:00:04Z",
+            },
+        ],
+    }
+
+
+def test_run_full_pipeline_task(sqlite_db, tmp_path, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        assert run_full_pipeline_task.apply(args=(str(raw_id),)).get() == str(raw_id)
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+    turn_reads = [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith("SELECT")
+        and "FROM conversation_turns" in statement
+    ]
+    # Only the incremental-normalization delta lookup touches stored turns.
+    assert len(turn_reads) == 1
+
+    with session_factory() as session:
+        record = repository.get_raw_data(session, raw_id, include_content=False)
+        assert record.status == "CORRELATED"
+        assert len(repository.list_turns_for_raw(session, raw_id)) == 3
+        assert len(repository.list_entities_for_raw(session, raw_id)) == 3
+        assert repository.list_relationships_for_raw(session, raw_id)
+        assert (
+            repository.list_correlation_candidates(session, raw_id, status="PENDING")
+            == []
+        )
+
+
+def test_full_pipeline_checkpoints_survive_later_failures(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+
+    def _fail(*_args, **_kwargs):
+        raise RuntimeError("fusion unavailable")
+
+    monkeypatch.setattr("nexus_knowledge.pipeline.fuse_candidates", _fail)
+    with session_factory() as session, pytest.raises(RuntimeError):
+        run_full_pipeline(session, raw_id, checkpoints={"normalize", "analyze"})
+
+    with session_factory() as session:
+        record = repository.get_raw_data(session, raw_id, include_content=False)
+        assert record.status == "ANALYZED"
+        assert len(repository.list_entities_for_raw(session, raw_id)) == 3
+        assert repository.list_correlation_candidates(session, raw_id) == []
+
+    monkeypatch.undo()
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    with session_factory.begin() as session:
+        result = run_full_pipeline(session, raw_id, checkpoints=())
+    # Normalization is incremental, so a re-run over unchanged turns stops early.
+    assert result.turns == 0
+    assert result.checkpoints == []
+
+    with session_factory() as session, pytest.raises(ValueError, match="checkpoint"):
+        run_full_pipeline(session, raw_id, checkpoints={"publish"})
+
+
+def test_full_pipeline_skips_correlation_without_sentiment(
+    sqlite_db,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    monkeypatch.setenv("ANALYSIS_ANALYZERS", "keywords")
+    clear_settings_cache()
+
+    with session_factory.begin() as session:
+        raw_id = ingest_raw_payload(
+            session,
+            source_type="deepseek_chat",
+            content=_payload(),
+        )
+    try:
+        with session_factory() as session:
+            result = run_full_pipeline(session, raw_id)
+            session.commit()
+    finally:
+        monkeypatch.delenv("ANALYSIS_ANALYZERS")
+        clear_settings_cache()
+
+    assert (result.turns, result.analyzed, result.candidates) == (3, 3, 0)
+    assert result.entities > 0
+    with session_factory() as session:
+        record = repository.get_raw_data(session, raw_id, include_content=False)
+        assert record.status == "ANALYZED"
+        assert repository.list_correlation_candidates(session, raw_id) == []
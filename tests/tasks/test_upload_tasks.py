@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+
+from nexus_knowledge.config import clear_settings_cache
+from nexus_knowledge.db import repository
+from nexus_knowledge.ingestion import IngestionError
+from nexus_knowledge.ingestion.uploads import get_upload_spool, reset_upload_spool
+from nexus_knowledge.tasks import ingest_upload_task
+
+
+def _spooled_upload(data: bytes) -> str:
+    spool = get_upload_spool()
+    upload_id = spool.create(source_type="deepseek_chat").upload_id
+    writer = spool.open_chunk(upload_id, 0)
+    writer.write(data)
+    writer.commit()
+    spool.complete(upload_id)
+    return upload_id
+
+
+def test_ingest_upload_task(sqlite_db, tmp_path, monkeypatch) -> None:
+    _, session_factory, _ = sqlite_db
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", (tmp_path / "mlruns").as_uri())
+    monkeypatch.setenv("UPLOAD_SPOOL_PATH", str(tmp_path / "uploads"))
+    clear_settings_cache()
+    reset_upload_spool()
+
+    scheduled: list[str] = []
+    monkeypatch.setattr(
+        "nexus_knowledge.tasks.normalize_raw_data_task.delay",
+        lambda raw_data_id, **_kwargs: scheduled.append(raw_data_id),
+    )
+
+    payload = {"messages": [{"role": "user", "content": "Spooled export"}]}
+    upload_id = _spooled_upload(json.dumps(payload).encode("utf-8"))
+    raw_id = ingest_upload_task.apply(args=(upload_id,)).get()
+
+    assert scheduled == [raw_id]
+    manifest = get_upload_spool().get(upload_id)
+    assert manifest.status == "INGESTED"
+    assert manifest.raw_data_id == raw_id
+    with session_factory() as session:
+        record = repository.get_raw_data(session, uuid.UUID(raw_id))
+        assert json.loads(record.content) == payload
+
+    # A duplicate of an already normalized payload is not queued again.
+    with session_factory.begin() as session:
+        repository.update_raw_data_status(
+            session,
+            uuid.UUID(raw_id),
+            status="NORMALIZED",
+        )
+    duplicate_id = _spooled_upload(json.dumps(payload).encode("utf-8"))
+    assert ingest_upload_task.apply(args=(duplicate_id,)).get() == raw_id
+    assert scheduled == [raw_id]
+
+    bad_id = _spooled_upload(b"\xff\xfe not utf-8")
+    with pytest.raises(IngestionError, match="UTF-8"):
+        ingest_upload_task.apply(args=(bad_id,)).get()
+    assert get_upload_spool().get(bad_id).status == "FAILED"